@@ -0,0 +1,914 @@
+"""
+Benchmark suite for the O.C.D. File Editor.
+
+    python benchmark.py names --sizes 1000 100000 1000000 --output results.json
+
+    python benchmark.py folders --depth 3 --fanout 4 --files 50 --collision-density 0.2 --output results.json
+    python benchmark.py title --size 100000 --output results.json
+    python benchmark.py duplicates --groups 200 --size-kib 256 --output results.json
+
+The "names" benchmark generates synthetic corpora of media file names (unicode, symbols, artists and collisions), times
+each Name Normalizer stage and the end-to-end normalization, and writes machine-readable JSON results that can be
+compared across versions.
+
+The "folders" benchmark builds fixture trees of configurable depth, fan-out and collision density on a local temporary
+filesystem (tmpfs when available) and runs the folder walking, renaming and artist directory paths headless, reporting
+wall time, filesystem calls (stat/scandir/rename counts) and peak memory.
+
+The "title" benchmark checks the title case against a golden-output corpus and times it against the reference
+implementation it replaced.
+
+The "duplicates" benchmark times the duplicate finder with a cold and a warm hash cache on a fixture of duplicate
+groups and near-duplicates (files sharing their first and last bytes), and checks the groups found, including after
+duplicate_partial_hash_kib changes while the cache is kept.
+"""
+
+import os  # Operating System module for interacting with the operating system
+import queue  # Queue module for the history results of the headless Name Normalizer
+import shutil  # Module for removing the fixture trees
+import tracemalloc  # Module for measuring peak memory
+import sys  # Module for the interpreter version
+import json  # JSON module for reading the dictionary file and writing the results
+import time  # Import the time module for timing the stages
+import random  # Module for generating reproducible synthetic corpora
+import argparse  # Module for parsing the command line
+import platform  # Module for describing the machine the benchmark ran on
+import subprocess  # Module for reading the git revision of the results
+import tempfile  # Module for writing the synthetic artist list
+import configparser  # Module for reading the configured file paths
+from typing import Union  # Module for type hinting support
+from contextlib import contextmanager  # Module for the filesystem call counter context manager
+from gui import (OCDFileRenamer, NameNormalizerSnapshot, SnapshotValue, StageProfiler,  # The Tk-free pipeline
+                 TitleCaser, PathValidator, FileHashCache)
+
+
+# Words used to build synthetic titles
+TITLE_WORDS = ["love", "night", "dance", "heart", "fire", "summer", "dream", "light", "rain", "city", "road", "home",
+               "baby", "don't", "won't", "I'm", "you're", "forever", "tonight", "golden", "river", "moon", "wild",
+               "electric", "paradise", "memories", "shadow", "echo", "thunder", "ocean"]
+
+# Decorations commonly found in downloaded media file names
+DECORATIONS = ["(Official Video)", "(Official Music Video)", "[HD]", "[4K]", "(Lyrics)", "(Live)", "#shorts",
+               "(Remastered 2011)", "{Remix}", "- Topic", "| Audio", "feat. Someone", "ft. Guest", "@channel",
+               "100% Pure", "$weet", "50/50", "A&B", "x_y", "Q&A?", "<Edit>", "*NEW*", "+1", "=EQ=", "^up^",
+               "a; b", "c: d", "\"quoted\"", "'single'", "1999", "Vol. 2"]
+
+# Non-ASCII fragments (accents, non-latin scripts, symbols and slashes)
+UNICODE_FRAGMENTS = ["Beyoncé", "Sigur Rós", "Motörhead", "Mötley Crüe", "Björk", "Café del Mar", "Déjà Vu", "naïve",
+                     "東京", "Ñandú", "Zoë", "Łódź", "Ελλάδα", "Москва", "–", "—", "⁄", "／", "★", "♫"]
+
+# Syllables used to build synthetic artist names
+SYLLABLES = ["ka", "lo", "mi", "ra", "ven", "tor", "sha", "dex", "ly", "no", "zen", "qua", "bel", "ix", "ro", "sa"]
+
+# File extensions used when no dictionary file is available
+DEFAULT_EXTENSIONS = [".mp4", ".mkv", ".mp3", ".flac", ".webm", ".m4a", ".avi", ".mov"]
+
+# Golden outputs of the title case without exceptions (brackets, contractions, whitespace and unicode)
+TITLE_GOLDEN_CORPUS = [
+    ("hello world", "Hello World"),
+    ("HELLO WORLD", "Hello World"),
+    ("don't stop me now", "Don't Stop Me Now"),
+    ("ROCK 'N' ROLL", "Rock 'n' Roll"),
+    ("i'M here", "I'm Here"),
+    ("'twas the night", "'twas The Night"),
+    ("(official video)", "(Official Video)"),
+    ("[hd] remaster", "[Hd] Remaster"),
+    ("{remix} edit", "{Remix} Edit"),
+    ("song (feat. someone)", "Song (Feat. Someone)"),
+    ("live(at wembley)", "live(At Wembley)"),
+    ("((double) brackets)", "((Double) Brackets)"),
+    ("(1st take)", "(1St Take)"),
+    ("[4k60] upload", "[4K60] Upload"),
+    ("(-_-) face", "(-_-) Face"),
+    ("  extra   spaces  here ", "Extra Spaces Here"),
+    ("tab\tseparated\nnewline", "Tab Separated Newline"),
+    ("artist - the song of the year", "Artist - The Song Of The Year"),
+    ("beyoncé déjà vu", "Beyoncé Déjà Vu"),
+    ("ÉCOLE élève", "École Élève"),
+    ("straße groß", "Straße Groß"),
+    ("mcdonald's o'neil", "Mcdonald's O'neil"),
+    ("ABC-def ghi_JKL", "Abc-def Ghi_jkl"),
+    ("x(y)z", "x(Y)z"),
+    ("[", "["),
+    (")(a", ")(A"),
+    ("(²nd)", "(²Nd)"),
+    ("ǆemal", "ǅemal"),
+    ("vol.2 part-three", "Vol.2 Part-three"),
+    ("feat. guest", "Feat. Guest"),
+    ("the end of the world (remastered 2011)", "The End Of The World (Remastered 2011)"),
+    ("AC/DC back in black", "Ac/dc Back In Black"),
+    ("50% off!", "50% Off!"),
+    ("a&b c@d", "A&b C@d"),
+    ("", ""),
+]
+
+# Small words used for the golden outputs with title exceptions
+TITLE_GOLDEN_EXCEPTIONS = ["of", "the", "a", "feat."]
+
+# Golden outputs of the title case with the exceptions above
+TITLE_GOLDEN_EXCEPTIONS_CORPUS = [
+    ("the end of the world", "The End of the World"),
+    ("artist - the song of a lifetime (feat. the band)", "Artist - The Song of a Lifetime (Feat. the Band)"),
+    ("song FEAT. guest", "Song feat. Guest"),
+    ("A tale OF two", "A Tale of Two"),
+    ("- the dash starts a clause", "- The Dash Starts a Clause"),
+]
+
+
+def legacy_title_the_name(name: str) -> str:
+    """
+    The title case before the TitleCaser, kept as the reference for the golden corpus and the timings.
+
+    Args:
+        name (str): The original name.
+
+    Returns:
+        str: The title-cased name.
+    """
+    formatted_words = []
+    for word in name.split():
+        if any(char in word for char in ['[', '{', '(']):
+            new_word = ''
+            capitalize_next = False
+            for char in word:
+                if char in ['[', '{', '(']:
+                    capitalize_next = True
+                    new_word += char
+                elif char.isalpha() and capitalize_next:
+                    new_word += char.upper()
+                    capitalize_next = False
+                else:
+                    new_word += char
+            formatted_word = new_word
+        elif "'" in word:
+            parts = word.split("'")
+            formatted_word = "'".join([parts[0].capitalize()] + [part.lower() for part in parts[1:]])
+        else:
+            formatted_word = word.capitalize()
+        formatted_words.append(formatted_word)
+    return ' '.join(formatted_words)
+
+
+def synthetic_artists(count: int, rng: random.Random) -> list:
+    """
+    Generate a list of unique synthetic artist names.
+
+    Args:
+        count (int): The number of artists.
+        rng (random.Random): The random number generator.
+
+    Returns:
+        list: The artist names.
+    """
+    artists = set()
+    while len(artists) < count:
+        words = ["".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 3))).capitalize()
+                 for _ in range(rng.randint(1, 2))]
+        artists.add(" ".join(words))
+    return sorted(artists)
+
+
+def synthetic_custom_text(rng: random.Random) -> dict:
+    """
+    Generate a synthetic custom_text_to_replace dictionary.
+
+    Args:
+        rng (random.Random): The random number generator.
+
+    Returns:
+        dict: The text to replace mapped to its replacement.
+    """
+    replacements = {decoration: "" for decoration in rng.sample(DECORATIONS, 12)}
+    replacements.update({"ft.": "feat.", "Vol.": "Volume", "&": "and"})
+    return replacements
+
+
+def generate_corpus(size: int, artists: list, extensions: list, collision_rate: float, rng: random.Random) -> list:
+    """
+    Generate a corpus of realistic media file paths.
+
+    Args:
+        size (int): The number of file paths.
+        artists (list): The artist names to draw from.
+        extensions (list): The file extensions to draw from.
+        collision_rate (float): The fraction of names that repeat an earlier name with different case or symbols.
+        rng (random.Random): The random number generator.
+
+    Returns:
+        list: The file paths, spread over a handful of synthetic directories.
+    """
+    directories = [os.path.join("media", f"folder {index}") for index in range(16)]
+    names = []
+    for _ in range(size):
+        if names and rng.random() < collision_rate:
+            # Repeat an earlier name with a variation that normalizes to the same result
+            name = rng.choice(names)
+            name = rng.choice([name.upper(), name.lower(), name.replace(" ", "_"), f"{name} #dup"])
+        else:
+            parts = []
+            if rng.random() < 0.7:
+                parts.append(f"{rng.choice(artists)} -")
+            parts.extend(rng.choice(TITLE_WORDS) for _ in range(rng.randint(1, 6)))
+            if rng.random() < 0.3:
+                parts.insert(rng.randint(0, len(parts)), rng.choice(UNICODE_FRAGMENTS))
+            if rng.random() < 0.5:
+                parts.append(rng.choice(DECORATIONS))
+            if rng.random() < 0.2:
+                # Repeat an artist or word to exercise the duplicate removal stages
+                parts.append(rng.choice(artists) if rng.random() < 0.5 else parts[-1])
+            name = " ".join(parts)
+        names.append(name)
+
+    return [os.path.join(rng.choice(directories), f"{name}{rng.choice(extensions)}") for name in names]
+
+
+def pipeline_stages(snapshot: NameNormalizerSnapshot) -> list:
+    """
+    List the Name Normalizer stages in the order construct_nn_name applies them.
+
+    Args:
+        snapshot (NameNormalizerSnapshot): The snapshot providing the stages.
+
+    Returns:
+        list: (stage name, callable taking a name) tuples.
+    """
+    all_symbols = ",;:@$%^&#*+=(){}[]|\\<>\'\"?_-–—"
+    most_symbols = ",;:@$%^&*+={}[]|\\<>\"?-–—"
+    return [
+        ("remove_custom_user_text", snapshot.remove_custom_user_text),
+        ("replace_user_text", snapshot.replace_user_text),
+        ("remove_non_ascii_symbols", snapshot.remove_non_ascii_symbols),
+        ("remove_all_symbols", lambda name: snapshot.remove_symbols(name, all_symbols)),
+        ("remove_most_symbols", lambda name: snapshot.remove_symbols(name, most_symbols)),
+        ("remove_numbers", snapshot.remove_numbers),
+        ("remove_hashtag_trail", lambda name: snapshot.remove_text_trailing(name, "#")),
+        ("remove_parenthesis_trail", lambda name: snapshot.remove_text_trailing(name, "(")),
+        ("remove_dashes", snapshot.remove_dashes),
+        ("remove_endashes", snapshot.remove_endashes),
+        ("remove_emdashes", snapshot.remove_emdashes),
+        ("remove_ampersands", snapshot.remove_ampersands),
+        ("remove_at_symbols", snapshot.remove_at_symbols),
+        ("remove_underscores", snapshot.remove_underscores),
+        ("remove_commas", snapshot.remove_commas),
+        ("remove_single_quotes", snapshot.remove_single_quotes),
+        ("remove_double_quotes", snapshot.remove_double_quotes),
+        ("remove_colons", snapshot.remove_colons),
+        ("remove_semicolons", snapshot.remove_semicolons),
+        ("remove_percents", snapshot.remove_percents),
+        ("remove_carets", snapshot.remove_carets),
+        ("remove_parenthesis", snapshot.remove_parenthesis),
+        ("remove_hashtags", snapshot.remove_hashtags),
+        ("remove_dollar_signs", snapshot.remove_dollar_signs),
+        ("remove_asterisks", snapshot.remove_asterisks),
+        ("remove_plus_signs", snapshot.remove_plus_signs),
+        ("remove_equal_signs", snapshot.remove_equal_signs),
+        ("remove_curly_braces", snapshot.remove_curly_braces),
+        ("remove_square_brackets", snapshot.remove_square_brackets),
+        ("remove_pipes", snapshot.remove_pipes),
+        ("remove_backslashes", snapshot.remove_backslashes),
+        ("remove_angle_brackets", snapshot.remove_angle_brackets),
+        ("remove_question_marks", snapshot.remove_question_marks),
+        ("title_the_name", snapshot.title_the_name),
+        ("replace_custom_text", snapshot.replace_custom_text),
+        ("artist_identifier", snapshot.artist_identifier),
+        ("remove_artist_duplicates", snapshot.remove_artist_duplicates_from_filename),
+        ("remove_word_duplicates", snapshot.remove_word_duplicates_from_filename),
+        ("remove_extra_whitespace", snapshot.remove_extra_whitespace),
+        ("add_prefix", snapshot.add_prefix),
+        ("add_suffix", snapshot.add_suffix),
+    ]
+
+
+def time_call(function, items: list, repeat: int) -> dict:
+    """
+    Time a function over every item, keeping the best of several runs.
+
+    Args:
+        function (callable): The function to call with each item.
+        items (list): The items.
+        repeat (int): The number of runs.
+
+    Returns:
+        dict: The best wall time in seconds, the nanoseconds per item and the items per second.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for item in items:
+            function(item)
+        best = min(best, time.perf_counter() - start)
+
+    count = max(len(items), 1)
+    return {"seconds": round(best, 6),
+            "ns_per_item": round(best * 1e9 / count, 1),
+            "items_per_second": round(count / best, 1) if best else None}
+
+
+def load_dictionary(dictionary_path: str) -> Union[dict, None]:
+    """
+    Load the Name Normalizer dictionaries from a dictionary file.
+
+    Args:
+        dictionary_path (str): The path of the dictionary file.
+
+    Returns:
+        Union[dict, None]: The file_extensions and custom_text_to_replace entries, or None if the file is missing.
+    """
+    if not os.path.isfile(dictionary_path):
+        return None
+
+    with open(dictionary_path, "r") as json_file:
+        data = json.load(json_file)
+
+    return {"file_extensions": data.get("file_extensions", []),
+            "custom_text_to_replace": data.get("custom_text_to_replace", {})}
+
+
+def git_revision() -> Union[str, None]:
+    """
+    Get the git revision of the working tree, used to compare results across versions.
+
+    Returns:
+        Union[str, None]: The output of git describe, or None outside a git checkout.
+    """
+    try:
+        return subprocess.run(["git", "describe", "--always", "--dirty"], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_names_benchmark(args) -> dict:
+    """
+    Run the Name Normalizer benchmark for every corpus size and dictionary source.
+
+    Args:
+        args (argparse.Namespace): The parsed command line.
+
+    Returns:
+        dict: The results.
+    """
+    rng = random.Random(args.seed)
+
+    # Synthetic dictionaries and artist list
+    artists = synthetic_artists(args.artists, rng)
+    sources = {"synthetic": {"file_extensions": DEFAULT_EXTENSIONS,
+                             "custom_text_to_replace": synthetic_custom_text(rng)}}
+
+    # The real dictionary file, if available
+    real_dictionary = load_dictionary(args.dictionary)
+    if real_dictionary is None:
+        print(f"Dictionary file not found, skipping: {args.dictionary}")
+    else:
+        sources["dictionary"] = real_dictionary
+
+    results = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Write the synthetic artist list
+        artist_file = os.path.join(temp_dir, "list_of_artists.txt")
+        with open(artist_file, "w") as file:
+            file.write("\n".join(artists))
+
+        for source_name, source in sources.items():
+            extensions = source["file_extensions"] or DEFAULT_EXTENSIONS
+
+            # Enable every stage, with case-insensitive replacements
+            snapshot = NameNormalizerSnapshot(
+                flags={flag_name: True for flag_name in NameNormalizerSnapshot.FLAG_NAMES},
+                entries={"custom_text_removal_entry": "Official", "original_entry": "ft.", "replace_entry": "feat.",
+                         "prefix_entry": "", "suffix_entry": ""},
+                file_extensions=extensions, custom_text_to_replace=source["custom_text_to_replace"],
+                artist_file=artist_file)
+
+            for size in args.sizes:
+                corpus = generate_corpus(size, artists, extensions, args.collision_rate, random.Random(args.seed))
+                names = [os.path.splitext(os.path.basename(path))[0] for path in corpus]
+
+                # Time each stage on the raw names
+                stages = {stage_name: time_call(stage, names, args.repeat)
+                          for stage_name, stage in pipeline_stages(snapshot)}
+
+                # Time the end-to-end normalization (without touching the disk for conflicts)
+                end_to_end = time_call(lambda path: snapshot.construct_nn_name(path, quiet=True,
+                                                                              resolve_conflicts=False),
+                                       corpus, args.repeat)
+
+                results.append({"source": source_name, "size": size, "stages": stages, "end_to_end": end_to_end})
+                print(f"{source_name:>10} {size:>9,} names: {end_to_end['seconds']:.3f}s end-to-end "
+                      f"({end_to_end['ns_per_item']:,.0f} ns/name)")
+
+    return {"benchmark": "names",
+            "revision": git_revision(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "artists": args.artists,
+            "collision_rate": args.collision_rate,
+            "results": results}
+
+
+class HeadlessNameNormalizer(NameNormalizerSnapshot):
+    """
+    Run the GUI's folder walking, renaming and artist directory methods without a Tk root.
+
+    Args:
+        artist_directory (str): The artist directory used by update_cache and suggest_output_directory.
+        deep_walk (bool, optional): Include subdirectories when walking folders. Default is True.
+        workers (int, optional): The processes computing names (0 uses every CPU core). Default is 0.
+        parallel_threshold (int, optional): The number of files from which the process pool is used. Default is 2000.
+        io_limit (int, optional): The renames in flight (the fixture filesystem is not tuned). Default is 1.
+        **kwargs: The NameNormalizerSnapshot settings.
+    """
+
+    # Folder and artist directory methods shared with the GUI
+    process_folder = OCDFileRenamer.process_folder
+    compute_nn_names = OCDFileRenamer.compute_nn_names
+    apply_nn_renames = OCDFileRenamer.apply_nn_renames
+    apply_nn_renames_concurrently = OCDFileRenamer.apply_nn_renames_concurrently
+    plan_nn_destinations = OCDFileRenamer.plan_nn_destinations
+    get_filesystem_type = OCDFileRenamer.get_filesystem_type
+    get_io_limit = OCDFileRenamer.get_io_limit
+    dump_profile_report = OCDFileRenamer.dump_profile_report
+    rename_and_move_file = OCDFileRenamer.rename_and_move_file
+    move_file = OCDFileRenamer.move_file
+    copy_file_across_devices = OCDFileRenamer.copy_file_across_devices
+    transfer_file_data = OCDFileRenamer.transfer_file_data
+    hash_file = OCDFileRenamer.hash_file
+    iter_nn_input_files = OCDFileRenamer.iter_nn_input_files
+    iter_nn_folder_files = OCDFileRenamer.iter_nn_folder_files
+    validate_nn_targets = OCDFileRenamer.validate_nn_targets
+    find_duplicates = OCDFileRenamer.find_duplicates
+    group_files_by_hash = OCDFileRenamer.group_files_by_hash
+    hash_file_ends = OCDFileRenamer.hash_file_ends
+    update_cache = OCDFileRenamer.update_cache
+    suggest_output_directory = OCDFileRenamer.suggest_output_directory
+
+    def __init__(self, artist_directory: str, deep_walk: bool = True, workers: int = 0,
+                 parallel_threshold: int = 2000, io_limit: int = 1, **kwargs):
+        super().__init__(**kwargs)
+
+        # Name Normalizer state used by process_folder and rename_and_move_file
+        self.deep_walk_var = SnapshotValue(deep_walk)
+        self.reset_nn_var = SnapshotValue(False)
+        self.queue = queue.Queue()
+        self.interrupt_name_processing_thread_var = False
+        self.name_normalizer_output_directory = ""
+        self.name_normalizer_last_used_file = ""
+        self.progressbar = None
+        self.slider_progressbar_frame = None
+        self.nn_worker_processes = workers
+        self.nn_parallel_threshold = parallel_threshold
+        self.io_max_in_flight = io_limit
+        self.io_filesystem_limits = {}
+        self.move_chunk_kib = 1024
+        self.verify_cross_device_moves = True
+        self.path_validator = PathValidator(self.get_filesystem_type)
+        self.duplicate_hash_workers = 4
+        self.duplicate_partial_hash_kib = 64
+        self.hash_cache = None
+        self.stage_profiler = StageProfiler()
+        self.profiled_methods = ()
+
+        # Artist directory state used by update_cache and suggest_output_directory
+        self.artist_directory = artist_directory
+        self.excluded_folders = []
+        self.cached_artist_files = []
+        self.last_cache_update = 0
+        self.cache_duration = 0
+        self.file_renamer_selected_file = ""
+
+    # GUI callbacks handed to run_on_main, which skips them
+    start_progress = stop_progress = clear_selection = after = check_queue = None
+
+    def run_on_main(self, callback, *args, **kwargs):
+        """Skip the GUI updates (progress bars, selection resets and scheduling)."""
+
+    def report_progress(self, progress_bar_name, tracker, force=False):
+        """Skip the progress reports."""
+
+    def get_hash_cache(self) -> FileHashCache:
+        """Use a non-persistent hash cache (set hash_cache to share one between runs)."""
+        if self.hash_cache is None:
+            self.hash_cache = FileHashCache(":memory:")
+        return self.hash_cache
+
+
+# Filesystem calls counted by the folders benchmark (os.path.exists, isdir and getsize go through os.stat)
+COUNTED_CALLS = ("stat", "lstat", "scandir", "listdir", "rename", "replace")
+
+
+@contextmanager
+def count_filesystem_calls():
+    """
+    Count the filesystem calls made through the os module while the context is active.
+
+    Yields:
+        dict: The number of calls by function name, filled in as the calls are made.
+    """
+    counts = {name: 0 for name in COUNTED_CALLS}
+    originals = {name: getattr(os, name) for name in COUNTED_CALLS}
+
+    def counted(name, original):
+        def wrapper(*args, **kwargs):
+            counts[name] += 1
+            return original(*args, **kwargs)
+        return wrapper
+
+    for name, original in originals.items():
+        setattr(os, name, counted(name, original))
+    try:
+        yield counts
+    finally:
+        for name, original in originals.items():
+            setattr(os, name, original)
+
+
+def default_fixture_root() -> Union[str, None]:
+    """
+    Get the tmpfs directory used for fixture trees, if the system has one.
+
+    Returns:
+        Union[str, None]: /dev/shm when writable, otherwise None (the default temporary directory).
+    """
+    return "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+
+def build_fixture_tree(root: str, snapshot: NameNormalizerSnapshot, depth: int, fanout: int, files: int,
+                       collision_density: float, rng: random.Random) -> int:
+    """
+    Build a fixture tree of media files to normalize.
+
+    Every directory holds the given number of files named like 'artist_-_title_words_1.mp4'. For a fraction of the
+    files, the normalized name already exists, so renaming them goes through get_non_conflicting_filename.
+
+    Args:
+        root (str): The root directory of the tree. The top-level folders double as the artist directory.
+        snapshot (NameNormalizerSnapshot): The settings used to compute the normalized names.
+        depth (int): The number of directory levels below the root.
+        fanout (int): The number of subdirectories per directory.
+        files (int): The number of files per directory.
+        collision_density (float): The fraction of files whose normalized name already exists.
+        rng (random.Random): The random number generator.
+
+    Returns:
+        int: The number of files created, including the colliding ones.
+    """
+    artists = synthetic_artists(max(fanout, 1) * 4, rng)
+    created = 0
+    directories = [(root, 0)]
+    while directories:
+        directory, level = directories.pop()
+        os.makedirs(directory, exist_ok=True)
+
+        for index in range(files):
+            artist = rng.choice(artists)
+            words = "_".join(rng.choice(TITLE_WORDS).replace("'", "") for _ in range(rng.randint(1, 4)))
+            file_path = os.path.join(directory, f"{artist.lower().replace(' ', '_')}_-_{words}_{index}.mp4")
+            open(file_path, "wb").close()
+            created += 1
+
+            # Create the normalized name up front to force a conflict
+            if rng.random() < collision_density:
+                target = snapshot.construct_nn_name(file_path, quiet=True, resolve_conflicts=False)
+                if target:
+                    open(target, "wb").close()
+                    created += 1
+
+        if level < depth:
+            # Name the subdirectories after artists so suggest_output_directory finds matches at the top level
+            for child in rng.sample(artists, min(fanout, len(artists))):
+                directories.append((os.path.join(directory, child), level + 1))
+
+    return created
+
+
+def measure(function, repeat_setup=None) -> dict:
+    """
+    Run a function once for wall time and filesystem calls, and once more under tracemalloc for peak memory.
+
+    Args:
+        function (callable): The function to measure.
+        repeat_setup (callable, optional): Restores the state before the memory run (e.g. rebuilds the fixture tree).
+
+    Returns:
+        dict: The wall time in seconds, the filesystem call counts and the peak traced memory in KiB.
+    """
+    with count_filesystem_calls() as counts:
+        start = time.perf_counter()
+        function()
+        seconds = time.perf_counter() - start
+
+    if repeat_setup:
+        repeat_setup()
+
+    # Separate run, since tracing allocations slows the code down
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"seconds": round(seconds, 6), "calls": counts, "peak_memory_kib": round(peak / 1024, 1)}
+
+
+def run_folders_benchmark(args) -> dict:
+    """
+    Run the folder walking, renaming and artist directory benchmarks on a fixture tree.
+
+    Args:
+        args (argparse.Namespace): The parsed command line.
+
+    Returns:
+        dict: The results.
+    """
+    # Normalize the underscore-separated, lowercase fixture names into titles
+    settings = {"flags": {"remove_underscore_var": True, "title_var": True, "remove_extra_whitespace_var": True},
+                "file_extensions": [".mp4"]}
+    work_dir = tempfile.mkdtemp(prefix="ocd_benchmark_", dir=args.root)
+    tree = os.path.join(work_dir, "tree")
+
+    def build():
+        shutil.rmtree(tree, ignore_errors=True)
+        return build_fixture_tree(tree, NameNormalizerSnapshot(**settings), args.depth, args.fanout, args.files,
+                                  args.collision_density, random.Random(args.seed))
+
+    try:
+        file_count = build()
+        normalizer = HeadlessNameNormalizer(artist_directory=tree, workers=args.workers,
+                                            parallel_threshold=args.parallel_threshold, io_limit=args.io_limit,
+                                            **settings)
+        file_paths = list(normalizer.iter_nn_folder_files(tree))
+        top_level_folders = sorted(os.listdir(tree))
+        print(f"Fixture tree: {file_count:,} files in {work_dir}")
+
+        results = {}
+
+        # Walk the tree the way the Name Normalizer does
+        results["walk"] = measure(lambda: list(normalizer.iter_nn_folder_files(tree)))
+
+        # Resolve a conflict for every existing file (each one is taken)
+        results["get_non_conflicting_filename"] = measure(
+            lambda: [normalizer.get_non_conflicting_filename(path, quiet=True) for path in file_paths])
+
+        # Rebuild the Artist Search cache from the tree
+        def update_cache():
+            normalizer.last_cache_update = 0
+            normalizer.update_cache()
+        results["update_cache"] = measure(update_cache)
+
+        # Suggest an output directory for every top-level folder name
+        def suggest_output_directories():
+            for folder in top_level_folders:
+                normalizer.file_renamer_selected_file = os.path.join(work_dir, f"{folder} - title.mp4")
+                normalizer.suggest_output_directory()
+        results["suggest_output_directory"] = measure(suggest_output_directories)
+
+        # Normalize (rename) the whole tree, rebuilding it before the memory run
+        results["process_folder"] = measure(lambda: normalizer.process_folder(tree), repeat_setup=build)
+
+        for name, result in results.items():
+            print(f"{name:>28}: {result['seconds']:.3f}s, {sum(result['calls'].values()):,} filesystem calls, "
+                  f"{result['peak_memory_kib']:,.0f} KiB peak")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {"benchmark": "folders",
+            "revision": git_revision(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": args.seed,
+            "root": args.root or tempfile.gettempdir(),
+            "depth": args.depth,
+            "fanout": args.fanout,
+            "files_per_directory": args.files,
+            "collision_density": args.collision_density,
+            "workers": args.workers,
+            "parallel_threshold": args.parallel_threshold,
+            "io_limit": args.io_limit,
+            "files": file_count,
+            "results": results}
+
+
+def run_title_benchmark(args) -> dict:
+    """
+    Check the title case against the golden corpus and time it against the reference implementation.
+
+    Args:
+        args (argparse.Namespace): The parsed command line.
+
+    Returns:
+        dict: The results, including any golden outputs that do not match.
+    """
+    title_caser = TitleCaser()
+    exceptions_caser = TitleCaser(TITLE_GOLDEN_EXCEPTIONS)
+
+    # Compare with the golden outputs
+    mismatches = [{"input": name, "expected": expected, "actual": title_caser.title(name)}
+                  for name, expected in TITLE_GOLDEN_CORPUS if title_caser.title(name) != expected]
+    mismatches += [{"input": name, "expected": expected, "actual": exceptions_caser.title(name),
+                    "exceptions": TITLE_GOLDEN_EXCEPTIONS}
+                   for name, expected in TITLE_GOLDEN_EXCEPTIONS_CORPUS if exceptions_caser.title(name) != expected]
+    print(f"Golden corpus: {len(mismatches)} mismatch(es)")
+
+    # Time both implementations on the golden inputs and on a synthetic corpus of media names
+    rng = random.Random(args.seed)
+    corpus = [os.path.splitext(os.path.basename(path))[0]
+              for path in generate_corpus(args.size, synthetic_artists(200, rng), DEFAULT_EXTENSIONS, 0.05, rng)]
+    corpora = {"golden": [name for name, _ in TITLE_GOLDEN_CORPUS], "synthetic": corpus}
+
+    timings = {}
+    for corpus_name, names in corpora.items():
+        timings[corpus_name] = {"reference": time_call(legacy_title_the_name, names, args.repeat),
+                                "title_caser": time_call(title_caser.title, names, args.repeat),
+                                "title_caser_exceptions": time_call(exceptions_caser.title, names, args.repeat)}
+        speedup = timings[corpus_name]["reference"]["seconds"] / max(timings[corpus_name]["title_caser"]["seconds"],
+                                                                     1e-9)
+        print(f"{corpus_name:>10} {len(names):>9,} names: {speedup:.1f}x faster than the reference")
+
+    return {"benchmark": "title",
+            "revision": git_revision(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "mismatches": mismatches,
+            "results": timings}
+
+
+def build_duplicates_fixture(root: str, groups: int, size_kib: int, rng: random.Random) -> list:
+    """
+    Write groups of identical files and near-duplicates: pairs sharing their first and last quarter but not their
+    middle, which only a hash covering the middle tells apart.
+
+    Args:
+        root (str): The directory to write the files in.
+        groups (int): The number of duplicate groups (and of near-duplicate pairs).
+        size_kib (int): The size of each file.
+        rng (random.Random): The random generator.
+
+    Returns:
+        list: The expected duplicate groups, each sorted.
+    """
+    os.makedirs(root, exist_ok=True)
+    size = size_kib * 1024
+    expected = []
+    for group in range(groups):
+        # Two or three copies of the same content
+        content = rng.randbytes(size)
+        copies = [os.path.join(root, f"group_{group}_copy_{copy}.bin") for copy in range(rng.randint(2, 3))]
+        for path in copies:
+            with open(path, "wb") as file:
+                file.write(content)
+        expected.append(sorted(copies))
+
+        # Two files with the same ends and different middles
+        ends = rng.randbytes(size)
+        for near in range(2):
+            with open(os.path.join(root, f"group_{group}_near_{near}.bin"), "wb") as file:
+                file.write(ends[:size // 4] + rng.randbytes(size - size // 2) + ends[size - size // 4:])
+    return sorted(expected)
+
+
+def run_duplicates_benchmark(args) -> dict:
+    """
+    Time the duplicate finder with a cold and a warm hash cache and check the groups it finds.
+
+    The warm runs change duplicate_partial_hash_kib so the near-duplicates are covered by the ends: partial hashes
+    cached with the other size must not be reused, or the near-duplicates are reported without a full hash.
+
+    Args:
+        args (argparse.Namespace): The parsed command line.
+
+    Returns:
+        dict: The results, including any runs whose groups do not match.
+    """
+    work_dir = tempfile.mkdtemp(prefix="ocd_benchmark_", dir=args.root)
+    normalizer = None
+    try:
+        expected = build_duplicates_fixture(work_dir, args.groups, args.size_kib, random.Random(args.seed))
+        normalizer = HeadlessNameNormalizer(artist_directory=work_dir)
+        print(f"Fixture: {len(expected):,} duplicate groups of {args.size_kib} KiB files in {work_dir}")
+
+        # Cold cache with ends smaller than the near-duplicates' shared ends, then warm caches with ends covering them
+        runs = [("cold", args.size_kib // 8), ("warm", args.size_kib // 8), ("warm_resized", args.size_kib // 2)]
+        results = {}
+        mismatches = []
+        for run_name, partial_kib in runs:
+            normalizer.duplicate_partial_hash_kib = partial_kib
+            found = []
+            results[run_name] = measure(lambda: found.append(normalizer.find_duplicates(work_dir, False)))
+            groups = sorted(sorted(group) for group in found[-1])
+            if groups != expected:
+                mismatches.append({"run": run_name, "partial_kib": partial_kib,
+                                   "unexpected": [group for group in groups if group not in expected],
+                                   "missing": [group for group in expected if group not in groups]})
+            print(f"{run_name:>14} ({partial_kib} KiB ends): {results[run_name]['seconds']:.3f}s, "
+                  f"{len(groups)} group(s), {'ok' if groups == expected else 'MISMATCH'}")
+    finally:
+        if normalizer and normalizer.hash_cache:
+            normalizer.hash_cache.close()
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {"benchmark": "duplicates",
+            "revision": git_revision(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": args.seed,
+            "root": args.root or tempfile.gettempdir(),
+            "groups": args.groups,
+            "size_kib": args.size_kib,
+            "mismatches": mismatches,
+            "results": results}
+
+
+def default_dictionary_path() -> str:
+    """
+    Get the dictionary file configured in config.ini.
+
+    Returns:
+        str: The configured dictionary file, or dictionary.json.
+    """
+    config = configparser.ConfigParser()
+    config.read("config.ini")
+    return config.get("Filepaths", "dictionary_file", fallback="dictionary.json")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="O.C.D. File Editor benchmark suite")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    # Name Normalizer pipeline benchmark
+    names_parser = subparsers.add_parser("names", help="Time each Name Normalizer stage and the end-to-end pipeline")
+    names_parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000, 1000000],
+                              help="Corpus sizes (default: 1000 100000 1000000)")
+    names_parser.add_argument("--artists", type=int, default=500, help="Synthetic artists (default: 500)")
+    names_parser.add_argument("--collision-rate", type=float, default=0.05,
+                              help="Fraction of names that collide with an earlier name (default: 0.05)")
+    names_parser.add_argument("--dictionary", default=default_dictionary_path(),
+                              help="The real dictionary file (default: the configured dictionary_file)")
+    names_parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement, best kept (default: 3)")
+    names_parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    names_parser.add_argument("--output", help="Write the JSON results to this file instead of standard output")
+    names_parser.set_defaults(run=run_names_benchmark)
+
+    # Folder walking and bulk rename benchmark
+    folders_parser = subparsers.add_parser("folders", help="Time folder walks and bulk renames on a fixture tree")
+    folders_parser.add_argument("--depth", type=int, default=3, help="Directory levels below the root (default: 3)")
+    folders_parser.add_argument("--fanout", type=int, default=4, help="Subdirectories per directory (default: 4)")
+    folders_parser.add_argument("--files", type=int, default=50, help="Files per directory (default: 50)")
+    folders_parser.add_argument("--collision-density", type=float, default=0.2,
+                                help="Fraction of files whose normalized name already exists (default: 0.2)")
+    folders_parser.add_argument("--root", default=default_fixture_root(),
+                                help="Where to build the fixture tree (default: /dev/shm if available)")
+    folders_parser.add_argument("--workers", type=int, default=0,
+                                help="Processes computing names (default: 0, every CPU core)")
+    folders_parser.add_argument("--parallel-threshold", type=int, default=2000,
+                                help="Files from which names are computed in the process pool (default: 2000)")
+    folders_parser.add_argument("--io-limit", type=int, default=1, help="Renames in flight (default: 1)")
+    folders_parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    folders_parser.add_argument("--output", help="Write the JSON results to this file instead of standard output")
+    folders_parser.set_defaults(run=run_folders_benchmark)
+
+    # Title case benchmark and golden corpus check
+    title_parser = subparsers.add_parser("title", help="Check the title case golden corpus and time the title case")
+    title_parser.add_argument("--size", type=int, default=100000, help="Synthetic corpus size (default: 100000)")
+    title_parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement, best kept (default: 3)")
+    title_parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    title_parser.add_argument("--output", help="Write the JSON results to this file instead of standard output")
+    title_parser.set_defaults(run=run_title_benchmark)
+
+    # Duplicate finder benchmark and hash cache check
+    duplicates_parser = subparsers.add_parser("duplicates",
+                                              help="Time the duplicate finder and check the groups it finds")
+    duplicates_parser.add_argument("--groups", type=int, default=200, help="Duplicate groups (default: 200)")
+    duplicates_parser.add_argument("--size-kib", type=int, default=256, help="Size of each file (default: 256)")
+    duplicates_parser.add_argument("--root", default=default_fixture_root(),
+                                   help="Where to build the fixture (default: /dev/shm if available)")
+    duplicates_parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    duplicates_parser.add_argument("--output", help="Write the JSON results to this file instead of standard output")
+    duplicates_parser.set_defaults(run=run_duplicates_benchmark)
+
+    args = parser.parse_args()
+    results = args.run(args)
+
+    # Write the machine-readable results
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+        print(f"Results written to {args.output}")
+    else:
+        print(json.dumps(results, indent=2))
+
+    # Fail when the golden corpus or the duplicate groups do not match
+    if results.get("mismatches"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,36 @@
 import os  # Operating System module for interacting with the operating system
-import sys  # Handling standard error and output redirects
+import errno  # Error codes for detecting cross-device moves
+import urllib.parse  # Decoding the paths recorded in the trash
+import hashlib  # Hashing for verifying cross-device copies and finding duplicate files
+import mmap  # Memory-mapped reads for hashing large files
 import re  # Regular expression module for pattern matching in strings
 import json  # JSON module for working with JSON data
+import bisect  # Module for binary searching sorted lists (category search prefix index)
 import send2trash  # Module for sending files to the trash instead of permanently deleting them
 import subprocess  # Module for running external processes
 import configparser  # Module for working with configuration files
 import shutil  # Module for high-level file operations (copying, moving, etc.)
-import string  # Module for various string manipulation functions and constants
+import tempfile  # Uniquely named temporary files for cross-device copies
+import sqlite3  # Module for the persistent rename history database
 import customtkinter as ctk  # Customtkinter for a modern gui
 import threading  # Importing threading module for concurrent execution
+import concurrent.futures  # Process pools for computing Name Normalizer names across CPU cores
 import queue  # Importing queue module for implementing a simple FIFO queue
 import time  # Import the time module for handling time-related functionality
 import atexit  # Module for registering functions to be called when the program is closing
+import contextlib  # Module for the stage profiler's timing blocks
+import functools  # Module for wrapping profiled methods
 import logging  # Logging module for capturing log messages
-from logging.handlers import TimedRotatingFileHandler, RotatingFileHandler  # Module to rotate logs
-from collections import OrderedDict  # Module to track order of list entries
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener  # Rotating, asynchronous logging
+from collections import OrderedDict, deque  # Ordered dictionaries and bounded ring buffers
 from typing import Union  # Module for type hinting support
 from tkinter import filedialog, messagebox  # Tkinter modules for GUI file dialogs and message boxes
 from tkinterdnd2 import DND_FILES, TkinterDnD  # Drag-and-drop functionality
 from unidecode import unidecode  # Method that transliterates Unicode characters to their closest ASCII equivalents
 from moviepy.editor import VideoFileClip  # Video editing module for working with video files
 from moviepy.video.fx import all as vfx  # Importing all video effects (vfx) from the moviepy library
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos  # Reading video durations without decoding
+from proglog import ProgressBarLogger  # MoviePy's progress logger interface for per-job output capture
 
 
 # Create a custom window class named SelectOptionWindow, inheriting from ctk.CTkToplevel
@@ -171,284 +181,1606 @@ class ScrollableRadiobuttonFrame(ctk.CTkScrollableFrame):
         return self.radiobutton_variable.get()
 
 
-class OCDFileRenamer(ctk.CTk, TkinterDnD.DnDWrapper):
-    def __init__(self, *args, **kwargs):
-        # Call the __init__ method of the parent class (TkinterDnD) with the given arguments
-        super().__init__(*args, **kwargs)
+# Create a search index for type-ahead category lookups
+class CategorySearchIndex:
+    """A sorted prefix index with an optional fuzzy n-gram index over category names.
 
-        # Determine TkinterDnD version and store it in the TkdndVersion attribute
-        # noinspection PyProtectedMember
-        self.TkdndVersion = TkinterDnD._require(self)
+    Args:
+        categories (iterable): The category names to be indexed.
+        fuzzy (bool, optional): Build the n-gram index used for fuzzy matching. Default is False.
+        ngram_size (int, optional): The size of the n-grams used for fuzzy matching. Default is 3.
+    """
 
-        # Set the window title
-        self.title("O.C.D. File Editor")
+    def __init__(self, categories, fuzzy=False, ngram_size=3):
+        # Store the fuzzy matching settings
+        self.fuzzy = fuzzy
+        self.ngram_size = ngram_size
 
-        """Load Configuration"""
-        # Check if configuration file exists
-        self.config_file_path = 'config.ini'
+        # Sort the categories case-insensitively and keep the lowercase keys in a parallel list for bisect
+        self.entries = sorted((category.lower(), category) for category in categories)
+        self.keys = [key for key, _ in self.entries]
 
-        if not os.path.exists(self.config_file_path):
-            # Display a message to the console if the configuration file does not exist
-            print(f"Error: {self.config_file_path} not found. Please create the config file and try again.")
-            # Quit the program
-            quit()
+        # Map each n-gram to the positions of the categories containing it
+        self.ngram_index = {}
 
-        # Load the configuration from the config.ini file
-        config = configparser.ConfigParser()
-        config.read(self.config_file_path)
+        if self.fuzzy:
+            for position, key in enumerate(self.keys):
+                for ngram in self.get_ngrams(key):
+                    self.ngram_index.setdefault(ngram, []).append(position)
 
-        # GUI
-        self.geometry(config.get('GUI', 'geometry', fallback='1280x850'))
-        self.scaling = config.get('GUI', 'scaling', fallback='100')
-        self.default_frame = config.get('GUI', 'default_frame', fallback="file_renamer_window")
+    def __len__(self):
+        # Return the number of indexed categories
+        return len(self.keys)
 
-        # File Renamer
-        self.default_cat_tab = config.get('File Renamer', 'default_cat_tab', fallback="All")
-        self.default_most_number = int(config.get('File Renamer', 'default_most_number', fallback=9))
-        self.column_numbers = int(config.get('File Renamer', 'column_numbers', fallback=7))
-        self.default_placement_var = config.get("File Renamer", "default_placement_var", fallback="special_character")
-        self.special_character_var = config.get("File Renamer", "special_character_var", fallback="-")
-        self.reset_output_directory_var = ctk.BooleanVar(
-            value=config.getboolean("File Renamer", "reset_output_directory_var", fallback=True))
-        self.suggest_output_directory_var = ctk.BooleanVar(
-            value=config.getboolean("File Renamer", "suggest_output_directory_var", fallback=False))
-        self.move_up_directory_var = ctk.BooleanVar(
-            value=config.getboolean("File Renamer", "move_up_directory_var", fallback=False))
-        self.move_text_var = ctk.BooleanVar(value=config.getboolean('File Renamer', 'move_text_var', fallback=False))
-        self.artist_common_categories_var = ctk.BooleanVar(
-            value=config.getboolean("File Renamer", "artist_common_categories_var", fallback=False))
+    def get_ngrams(self, text: str) -> set:
+        """Split the text into a set of n-grams, padded so short words still produce n-grams.
 
-        # Name Normalizer
-        self.artist_identifier_var = ctk.BooleanVar(
-            value=config.getboolean("Name Normalizer", "artist_identifier_var", fallback=False))
-        self.deep_walk_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "deep_walk_var", fallback=False))
-        self.remove_all_symbols_var = ctk.BooleanVar(
-            value=config.getboolean("Name Normalizer", "remove_all_symbols_var", fallback=False))
-        self.remove_ampersand_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "remove_ampersand_var",
-                                                                           fallback=False))
-        self.remove_angle_bracket_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer",
-                                                                               "remove_angle_bracket_var",
-                                                                               fallback=False))
-        self.remove_asterisk_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "remove_asterisk_var",
-                                                                          fallback=False))
-        self.remove_at_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "remove_at_var", fallback=False))
-        self.remove_backslash_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "remove_backslash_var",
-                                                                           fallback=False))
-        self.remove_caret_var = ctk.BooleanVar(
-            value=config.getboolean("Name Normalizer", "remove_caret_var", fallback=False))
-        self.remove_colon_var = ctk.BooleanVar(
-            value=config.getboolean("Name Normalizer", "remove_colon_var", fallback=False))
-        self.remove_comma_var = ctk.BooleanVar(
-            value=config.getboolean("Name Normalizer", "remove_comma_var", fallback=False))
-        self.remove_curly_brace_var = ctk.BooleanVar(
-            value=config.getboolean("Name Normalizer", "remove_curly_brace_var", fallback=False))
-        self.remove_dash_var = ctk.BooleanVar(
-            value=config.getboolean("Name Normalizer", "remove_dash_var", fallback=False))
-        self.remove_dollar_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "remove_dollar_var",
-                                                                        fallback=False))
-        self.remove_double_quote_var = ctk.BooleanVar(
-            value=config.getboolean("Name Normalizer", "remove_double_quote_var", fallback=False))
-        self.remove_emdash_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "remove_emdash_var",
-                                                                        fallback=False))
+        Args:
+            text (str): The lowercase text to split.
 
-        self.remove_endash_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "remove_endash_var",
-                                                                        fallback=False))
-        self.remove_equal_var = ctk.BooleanVar(
-            value=config.getboolean("Name Normalizer", "remove_equal_var", fallback=False))
-        self.remove_extra_whitespace_var = ctk.BooleanVar(
-            value=config.getboolean("Name Normalizer", "remove_extra_whitespace_var", fallback=False))
-        self.remove_hashtag_trail_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer",
-                                                                               "remove_hashtag_trail_var",
-                                                                               fallback=False))
+        Returns:
+            set: The n-grams found in the text.
+        """
+        # Pad the text with spaces to weight the start and end of words
+        padded = f" {text} "
+        return {padded[i:i + self.ngram_size] for i in range(max(len(padded) - self.ngram_size + 1, 1))}
 
-        self.remove_hashtag_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "remove_hashtag_var",
-                                                                         fallback=False))
-        self.remove_most_symbols_var = ctk.BooleanVar(
-            value=config.getboolean("Name Normalizer", "remove_most_symbols_var", fallback=False))
+    def search(self, query: str, limit: int = 10) -> list:
+        """Search the index for categories matching the query.
 
-        self.remove_non_ascii_symbols_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer",
-                                                                                   "remove_non_ascii_symbols_var",
-                                                                                   fallback=False))
+        Prefix matches are returned first in alphabetical order, followed by fuzzy matches
+        (if enabled) ranked by the number of shared n-grams.
 
-        self.remove_number_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "remove_number_var",
-                                                                        fallback=False))
+        Args:
+            query (str): The text to search for.
+            limit (int, optional): The maximum number of results. Default is 10.
 
-        self.remove_parenthesis_trail_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer",
-                                                                                   "remove_parenthesis_trail_var",
-                                                                                   fallback=False))
+        Returns:
+            list: The matching category names.
+        """
+        # Normalize the query the same way as the keys
+        query = query.strip().lower()
 
-        self.remove_parenthesis_var = ctk.BooleanVar(
-            value=config.getboolean("Name Normalizer", "remove_parenthesis_var", fallback=False))
-        self.remove_percent_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "remove_percent_var",
-                                                                         fallback=False))
-        self.remove_pipe_var = ctk.BooleanVar(
-            value=config.getboolean("Name Normalizer", "remove_pipe_var", fallback=False))
-        self.remove_plus_var = ctk.BooleanVar(
-            value=config.getboolean("Name Normalizer", "remove_plus_var", fallback=False))
-        self.remove_question_mark_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer",
-                                                                               "remove_question_mark_var",
-                                                                               fallback=False))
-        self.remove_semicolon_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "remove_semicolon_var",
-                                                                           fallback=False))
-        self.remove_single_quote_var = ctk.BooleanVar(
-            value=config.getboolean("Name Normalizer", "remove_single_quote_var", fallback=False))
+        if not query or limit <= 0:
+            return []
 
-        self.remove_underscore_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "remove_underscore_var",
-                                                                            fallback=False))
+        # Locate the first key that could start with the query and walk forward while it still matches
+        results = []
+        position = bisect.bisect_left(self.keys, query)
+        while position < len(self.keys) and self.keys[position].startswith(query) and len(results) < limit:
+            results.append(self.entries[position][1])
+            position += 1
 
-        self.remove_square_bracket_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer",
-                                                                                "remove_square_bracket_var",
-                                                                                fallback=False))
-        self.replace_custom_text_var = ctk.BooleanVar(
-            value=config.getboolean("Name Normalizer", "replace_custom_text_var", fallback=False))
+        # Fill the remaining slots with fuzzy matches
+        if self.fuzzy and len(results) < limit:
+            query_ngrams = self.get_ngrams(query)
 
-        self.replace_mode_var = ctk.BooleanVar(
-            value=config.getboolean("Name Normalizer", "replace_mode_var", fallback=False))
+            # Count the shared n-grams for each candidate
+            scores = {}
+            for ngram in query_ngrams:
+                for candidate in self.ngram_index.get(ngram, ()):
+                    scores[candidate] = scores.get(candidate, 0) + 1
 
-        self.reset_nn_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "reset_nn_var", fallback=True))
-        self.title_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "title_var", fallback=False))
+            # Require at least half of the query's n-grams to match
+            threshold = max(1, len(query_ngrams) // 2)
+            seen = set(results)
 
-        # Video Editor
-        self.default_rotation_var = config.get("Video Editor", "default_rotation_var", fallback="none")
-        self.default_decibel = config.get('Video Editor', 'default_decibel', fallback=0.0)
-        self.default_audio_normalization = config.get('Video Editor', 'default_audio_normalization', fallback=0.0)
-        self.default_hour = config.get('Video Editor', 'default_hour', fallback=0)
-        self.default_minute = config.get('Video Editor', 'default_minute', fallback=0)
-        self.default_second = config.get('Video Editor', 'default_second', fallback=0)
-        self.remove_successful_lines_var = ctk.BooleanVar(value=config.getboolean("Video Editor",
-                                                                                  "remove_successful_lines_var",
-                                                                                  fallback=False))
-        self.reset_video_entries_var = ctk.BooleanVar(
-            value=config.getboolean("Video Editor", "reset_video_entries_var", fallback=True))
+            # Rank by score (highest first), then alphabetically
+            for candidate, score in sorted(scores.items(), key=lambda item: (-item[1], item[0])):
+                if score < threshold or len(results) >= limit:
+                    break
+                category = self.entries[candidate][1]
+                if category not in seen:
+                    results.append(category)
 
-        # Add/Remove
-        self.default_add_remove_tab = config.get('Add/Remove', 'default_add_remove_tab', fallback="Artist")
-        self.auto_add_acc_record_var = ctk.BooleanVar(value=config.getboolean("Add/Remove", "auto_add_acc_record_var",
-                                                                              fallback=False))
-        self.default_weight = config.get('Add/Remove', 'default_weight', fallback=9)
-        self.default_ctn_weight = config.get('Add/Remove', 'default_ctn_weight', fallback=1)
-        self.reset_add_remove_var = ctk.BooleanVar(value=config.getboolean("Add/Remove", "reset_add_remove_var",
-                                                                           fallback=True))
+        return results
 
-        # Settings
-        self.artist_search_var = ctk.BooleanVar(value=config.getboolean("Settings", "artist_search_var",
-                                                                        fallback=False))
-        self.ignore_known_artists_var = ctk.BooleanVar(
-            value=config.getboolean("Settings", "ignore_known_artists_var", fallback=False))
-        self.remove_artist_duplicates_var = ctk.BooleanVar(
-            value=config.getboolean("Settings", "remove_artist_duplicates_var", fallback=False))
-        self.remove_word_duplicates_var = ctk.BooleanVar(
-            value=config.getboolean("Settings", "remove_word_duplicates_var", fallback=False))
-        self.activate_logging_var = ctk.BooleanVar(
-            value=config.getboolean("Settings", "activate_logging_var", fallback=False))
-        self.suppress_var = ctk.BooleanVar(value=config.getboolean("Settings", "suppress_var", fallback=False))
-        self.show_messageboxes_var = ctk.BooleanVar(
-            value=config.getboolean("Settings", "show_messageboxes_var", fallback=True))
-        self.show_confirmation_messageboxes_var = ctk.BooleanVar(
-            value=config.getboolean("Settings", "show_confirmation_messageboxes_var", fallback=True))
-        self.fallback_confirmation_var = ctk.BooleanVar(value=config.getboolean("Settings", "fallback_confirmation_var",
-                                                                                fallback=False))
-        self.truncate_var = ctk.BooleanVar(value=config.getboolean("Settings", "truncate_var", fallback=True))
-        self.open_on_file_drop_var = ctk.BooleanVar(
-            value=config.getboolean("Settings", "open_on_file_drop_var", fallback=False))
-        self.validate_entries = ctk.BooleanVar(value=config.getboolean("Settings", "validate_entries", fallback=False))
-        self.preview_mode_var = ctk.BooleanVar(value=config.getboolean("Settings", "preview_mode_var", fallback=False))
-        self.double_check_var = ctk.BooleanVar(value=config.getboolean("Settings", "double_check_var", fallback=False))
-        self.use_custom_tab_names_var = ctk.BooleanVar(
-            value=config.getboolean("Settings", "use_custom_tab_names_var", fallback=False))
-        self.sort_tab_names_var = ctk.BooleanVar(
-            value=config.getboolean("Settings", "sort_tab_names_var", fallback=False))
-        self.sort_reverse_order_var = ctk.BooleanVar(
-            value=config.getboolean("Settings", "sort_reverse_order_var", fallback=False))
 
-        # Filepaths/Directories
-        self.initial_directory = config.get('Filepaths', 'initial_directory', fallback='/path/to/folder')
-        self.initial_output_directory = config.get('Filepaths', 'initial_output_directory', fallback='/path/to/folder')
-        self.double_check_directory = config.get('Filepaths', 'double_check_directory',
-                                                 fallback='double_check_reminders')
-        self.no_go_directory = config.get('Filepaths', 'no_go_directory', fallback='no_go_reminders')
-        self.artist_directory = config.get('Filepaths', 'artist_directory', fallback='artist_directory')
-        self.artist_file = config.get('Filepaths', 'artist_file', fallback='list_of_artists.txt')
-        self.no_go_artist_file = config.get('Filepaths', 'no_go_artist_file', fallback='list_of_no_go_artists.txt')
-        self.dictionary_file = config.get('Filepaths', 'dictionary_file', fallback='dictionary.json')
+# Create a persistent rename history store for undo operations
+class RenameHistoryStore:
+    """A persistent, bounded rename history backed by SQLite.
 
-        # Logs
-        self.file_renamer_log = config.get('Logs', 'file_renamer_log', fallback="file_renamer.log")
+    Each operation is a list of (original_path, new_path) pairs recorded for a module. Directories are interned
+    in their own table, so each entry only stores two directory ids and two basenames.
 
-        """Cache"""
-        # Set the cache duration to 10 minutes (600 seconds)
-        self.cache_duration = 600
-        self.last_cache_update = 0
-        self.cached_artist_files = []
-        """End Cache"""
+    Args:
+        database_path (str): The path of the SQLite database file (':memory:' for a non-persistent store).
+        retention_limit (int, optional): The maximum number of operations kept per module. Default is 1000.
+        cache_kib (int, optional): The SQLite page cache size in KiB, capping the store's memory use. Default is 2048.
+        directory_cache_size (int, optional): The number of interned directory ids kept in memory. Default is 1024.
+    """
 
-        # Initialize instance variables for selected files, output directories, queue, and last used files
-        self.file_renamer_selected_file = ""
-        self.file_renamer_last_used_file = ""
-        self.output_directory = ""
-        self.history = []
-        self.nn_history = []
-        self.file_renamer_queue = []
-        self.cat_tabs = {}
-        self.add_remove_tabs = {}
-        self.settings_tabs = {}
-        self.excluded_folders = []
-        self.custom_text_to_replace = {}
-        self.file_extensions = []
-        self.valid_extensions = []
-        self.weight_to_tab_name = {}
-        self.categories = {}
-        self.artist_common_categories = {}
-        self.name_normalizer_selected_file = ""
-        self.name_normalizer_last_used_file = ""
-        self.name_normalizer_output_directory = ""
-        self.video_editor_selected_file = ""
-        self.video_editor_last_used_file = ""
-        self.video_editor_output_directory = ""
-        self.acc_selected_artist = ""
+    def __init__(self, database_path: str, retention_limit: int = 1000, cache_kib: int = 2048,
+                 directory_cache_size: int = 1024):
+        # Store the limits
+        self.retention_limit = retention_limit
+        self.directory_cache_size = directory_cache_size
+
+        # Map of directory path to interned id, in least recently used order
+        self.directory_cache = OrderedDict()
+
+        # Serialize access since the connection may be shared with worker threads
+        self.lock = threading.Lock()
+
+        # Open the database and create the schema
+        self.connection = sqlite3.connect(database_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.execute(f"PRAGMA cache_size=-{int(cache_kib)}")
+        with self.connection:
+            self.connection.executescript("""
+                CREATE TABLE IF NOT EXISTS directories (
+                    id INTEGER PRIMARY KEY,
+                    path TEXT NOT NULL UNIQUE
+                );
+                CREATE TABLE IF NOT EXISTS operations (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    module TEXT NOT NULL,
+                    created REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS entries (
+                    operation_id INTEGER NOT NULL REFERENCES operations(id) ON DELETE CASCADE,
+                    position INTEGER NOT NULL,
+                    original_dir INTEGER NOT NULL REFERENCES directories(id),
+                    original_name TEXT NOT NULL,
+                    new_dir INTEGER NOT NULL REFERENCES directories(id),
+                    new_name TEXT NOT NULL,
+                    PRIMARY KEY (operation_id, position)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS operations_module ON operations(module, id);
+            """)
+
+    def get_directory_id(self, directory: str) -> int:
+        """Get the interned id of a directory, inserting it if needed.
 
-        # Initialize the queue for FIFO queue module functionality
-        self.queue = queue.Queue()
+        Args:
+            directory (str): The directory path.
 
-        # Initialize the list of open windows for selection_window
-        self.open_windows = []
+        Returns:
+            int: The directory id.
+        """
+        # Return the cached id and mark it as most recently used
+        if directory in self.directory_cache:
+            self.directory_cache.move_to_end(directory)
+            return self.directory_cache[directory]
 
-        """Threading"""
-        self.name_processing_thread_single = ""
-        self.name_processing_thread_multiple = ""
-        self.video_processing_thread = ""
+        # Insert the directory if it is new and look up its id
+        self.connection.execute("INSERT OR IGNORE INTO directories (path) VALUES (?)", (directory,))
+        directory_id = self.connection.execute("SELECT id FROM directories WHERE path = ?",
+                                               (directory,)).fetchone()[0]
 
-        # Flag to indicate whether processing should be interrupted
-        self.interrupt_name_processing_thread_var = False
-        self.interrupt_video_processing_thread_var = False
+        # Cache the id and evict the least recently used directories
+        self.directory_cache[directory] = directory_id
+        while len(self.directory_cache) > self.directory_cache_size:
+            self.directory_cache.popitem(last=False)
 
-        """Tab Names"""
-        # List of tab names for the add_remove_tabview
-        self.add_remove_tab_names = ["Artist", "Category", "Custom Tab Name", "Custom Text to Replace", "Exclude",
-                                     "File Extensions", "NO GO", "Valid Extensions"]
+        return directory_id
 
-        # List of tab names for the settings_tabview
-        self.settings_tab_names = ["Appearance", "Artist", "Logging", "Misc", "Messaging", "Reminders", "Tabs"]
+    def push(self, module: str, pairs: list) -> Union[int, None]:
+        """Record an operation and trim the module's history to the retention limit.
 
-        # Initialize the standard output and error variables (Fix for MoviePy overriding user's logging choice)
-        self.original_stdout = sys.stdout
-        self.original_stderr = sys.stderr
+        Args:
+            module (str): The module the operation belongs to (e.g. 'file_renamer').
+            pairs (list): The (original_path, new_path) pairs of the operation.
 
-        # Initialize buttons
-        self.cat_tabview = None
-        self.buttons = None
-        self.most_buttons = None
-        self.all_buttons = None
+        Returns:
+            int or None: The operation id, or None if there was nothing to record.
+        """
+        # Skip pairs without a change
+        pairs = [(original, new) for original, new in pairs if new is not None and original != new]
+        if not pairs:
+            return None
 
-        # Initialize Main GUI elements
-        # Housekeeping Note: Some attributes are initialized as None and later assigned specific GUI elements
-        self.navigation_frame = None
-        self.navigation_frame_label = None
-        self.file_renamer_button = None
-        self.name_normalizer_button = None
-        self.video_editor_button = None
-        self.add_remove_button = None
-        self.settings_button = None
+        with self.lock, self.connection:
+            operation_id = self.connection.execute("INSERT INTO operations (module, created) VALUES (?, ?)",
+                                                   (module, time.time())).lastrowid
+
+            # Store the interned directories and basenames of each pair
+            rows = []
+            for position, (original_path, new_path) in enumerate(pairs):
+                original_dir, original_name = os.path.split(original_path)
+                new_dir, new_name = os.path.split(new_path)
+                rows.append((operation_id, position, self.get_directory_id(original_dir), original_name,
+                             self.get_directory_id(new_dir), new_name))
+            self.connection.executemany("INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+            # Drop the oldest operations beyond the retention limit
+            trimmed = self.connection.execute(
+                "DELETE FROM operations WHERE id IN (SELECT id FROM operations WHERE module = ? "
+                "ORDER BY id DESC LIMIT -1 OFFSET ?)", (module, self.retention_limit)).rowcount
+
+            if trimmed:
+                # Remove directories no longer referenced and forget their cached ids
+                self.connection.execute(
+                    "DELETE FROM directories WHERE id NOT IN (SELECT original_dir FROM entries "
+                    "UNION SELECT new_dir FROM entries)")
+                self.directory_cache.clear()
+
+        return operation_id
+
+    def peek(self, module: str) -> Union[tuple, None]:
+        """Get the most recent operation of a module without removing it.
+
+        Args:
+            module (str): The module the operation belongs to.
+
+        Returns:
+            tuple or None: The operation id and its (original_path, new_path) pairs, or None if the history is empty.
+        """
+        with self.lock:
+            row = self.connection.execute("SELECT id FROM operations WHERE module = ? ORDER BY id DESC LIMIT 1",
+                                          (module,)).fetchone()
+            if row is None:
+                return None
+
+            # Rebuild the full paths from the interned directories
+            rows = self.connection.execute(
+                "SELECT original.path, entries.original_name, new.path, entries.new_name FROM entries "
+                "JOIN directories AS original ON original.id = entries.original_dir "
+                "JOIN directories AS new ON new.id = entries.new_dir "
+                "WHERE entries.operation_id = ? ORDER BY entries.position", (row[0],)).fetchall()
+
+        return row[0], [(os.path.join(original_dir, original_name), os.path.join(new_dir, new_name))
+                        for original_dir, original_name, new_dir, new_name in rows]
+
+    def remove(self, operation_id: int) -> None:
+        """Remove an operation (and its entries) from the history.
+
+        Args:
+            operation_id (int): The id of the operation to remove.
+        """
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM operations WHERE id = ?", (operation_id,))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self.lock:
+            self.connection.close()
+
+
+# Create a persistent cache of file content hashes for the duplicate finder
+class FileHashCache:
+    """A persistent cache of partial and full file hashes backed by SQLite.
+
+    Entries are keyed by device and inode and are only used while the file's size and modification time are
+    unchanged, so renamed or moved files keep their hashes and modified files are hashed again. Partial hashes also
+    record the size of the ends they were computed from and are only used with the same size.
+
+    Args:
+        database_path (str): The path of the SQLite database file (':memory:' for a non-persistent store).
+    """
+
+    # The hash columns
+    COLUMNS = ("partial_hash", "full_hash")
+
+    def __init__(self, database_path: str):
+        # Serialize access since the hashing workers share the connection
+        self.lock = threading.Lock()
+
+        # Open the database and create the schema
+        self.connection = sqlite3.connect(database_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        with self.connection:
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS hashes (
+                    device INTEGER NOT NULL,
+                    inode INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    partial_hash BLOB,
+                    full_hash BLOB,
+                    partial_kib INTEGER,
+                    PRIMARY KEY (device, inode)
+                ) WITHOUT ROWID
+            """)
+
+            # Add the partial hash size to caches created without it (their partial hashes are never matched)
+            columns = [row[1] for row in self.connection.execute("PRAGMA table_info(hashes)")]
+            if "partial_kib" not in columns:
+                self.connection.execute("ALTER TABLE hashes ADD COLUMN partial_kib INTEGER")
+
+    def get_many(self, column: str, stat_results: dict, partial_kib: int = None) -> dict:
+        """Look up the cached hashes of several files.
+
+        Args:
+            column (str): The hash to look up ('partial_hash' or 'full_hash').
+            stat_results (dict): The os.stat_result of each file, keyed by path.
+            partial_kib (int, optional): The size of the ends a partial hash must have been computed from.
+
+        Returns:
+            dict: The cached hashes keyed by path (files without a current entry are left out).
+        """
+        if column not in self.COLUMNS:
+            raise ValueError(f"Unknown hash column: {column}")
+
+        # Partial hashes only match when computed from ends of the same size
+        query = f"SELECT {column} FROM hashes WHERE device = ? AND inode = ? AND size = ? AND mtime_ns = ?"
+        if column == "partial_hash":
+            query += " AND partial_kib IS ?"
+
+        hashes = {}
+        with self.lock:
+            for path, stat_result in stat_results.items():
+                parameters = (stat_result.st_dev, stat_result.st_ino, stat_result.st_size, stat_result.st_mtime_ns)
+                if column == "partial_hash":
+                    parameters += (partial_kib,)
+                row = self.connection.execute(query, parameters).fetchone()
+                if row and row[0] is not None:
+                    hashes[path] = row[0]
+        return hashes
+
+    def put_many(self, column: str, entries: list, partial_kib: int = None) -> None:
+        """Store the hashes of several files in one transaction.
+
+        Args:
+            column (str): The hash to store ('partial_hash' or 'full_hash').
+            entries (list): The (os.stat_result, hash) pairs to store.
+            partial_kib (int, optional): The size of the ends the partial hashes were computed from.
+        """
+        if column not in self.COLUMNS:
+            raise ValueError(f"Unknown hash column: {column}")
+        other_column = self.COLUMNS[1 - self.COLUMNS.index(column)]
+
+        # Record the size of the ends with a partial hash (a full hash keeps the size of the entry's partial hash)
+        partial_kib_update = ("excluded.partial_kib" if column == "partial_hash" else
+                              "CASE WHEN size = excluded.size AND mtime_ns = excluded.mtime_ns THEN partial_kib END")
+
+        # Keep the other hash of a current entry and drop it from a stale one (the file changed)
+        with self.lock, self.connection:
+            self.connection.executemany(
+                f"INSERT INTO hashes (device, inode, size, mtime_ns, {column}, partial_kib) VALUES (?, ?, ?, ?, ?, ?) "
+                f"ON CONFLICT (device, inode) DO UPDATE SET "
+                f"{other_column} = CASE WHEN size = excluded.size AND mtime_ns = excluded.mtime_ns "
+                f"THEN {other_column} END, "
+                f"partial_kib = {partial_kib_update}, "
+                f"size = excluded.size, mtime_ns = excluded.mtime_ns, {column} = excluded.{column}",
+                [(stat_result.st_dev, stat_result.st_ino, stat_result.st_size, stat_result.st_mtime_ns, digest,
+                  partial_kib if column == "partial_hash" else None)
+                 for stat_result, digest in entries])
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self.lock:
+            self.connection.close()
+
+
+# Create an event bus for passing UI updates from worker threads to the Tk main thread
+class UIEventBus:
+    """A thread-safe queue of UI events posted by worker threads and drained by the Tk main thread.
+
+    Workers never touch widgets directly. They post events (messages, callbacks) and the main thread drains them
+    in batches on a timer.
+    """
+
+    def __init__(self):
+        # SimpleQueue is unbounded and lock-free for producers
+        self.events = queue.SimpleQueue()
+
+    def post(self, kind: str, **payload) -> None:
+        """Post an event to the bus.
+
+        Args:
+            kind (str): The type of event (e.g. 'message' or 'call').
+            **payload: The event data.
+        """
+        self.events.put((kind, payload))
+
+    def drain(self, limit: int) -> list:
+        """Remove and return up to limit pending events in the order they were posted.
+
+        Args:
+            limit (int): The maximum number of events to return.
+
+        Returns:
+            list: The (kind, payload) tuples of the drained events.
+        """
+        drained = []
+        try:
+            while len(drained) < limit:
+                drained.append(self.events.get_nowait())
+        except queue.Empty:
+            pass
+        return drained
+
+
+# Create a progress tracker for determinate progress with throughput and ETA
+class ProgressTracker:
+    """A thread-safe progress model counting items, weighted work units and bytes against planned totals.
+
+    Args:
+        total_items (int): The number of items (files, videos) planned.
+        total_units (float, optional): The planned work in units (e.g. seconds of video). Defaults to total_items.
+        total_bytes (int, optional): The planned number of bytes. Default is 0.
+        item_name (str, optional): The name shown for items (e.g. 'files'). Default is 'files'.
+        report_interval (float, optional): The minimum number of seconds between progress reports. Default is 0.1.
+    """
+
+    def __init__(self, total_items: int, total_units: float = None, total_bytes: int = 0, item_name: str = "files",
+                 report_interval: float = 0.1):
+        # Store the planned totals
+        self.total_items = total_items
+        self.total_units = total_units if total_units is not None else total_items
+        self.total_bytes = total_bytes
+        self.item_name = item_name
+        self.report_interval = report_interval
+
+        # Completed work
+        self.items_done = 0
+        self.units_done = 0.0
+        self.bytes_done = 0
+
+        # Work in progress on the current item (e.g. frames written of the current video)
+        self.partial_units = 0.0
+
+        # Timing
+        self.start_time = time.monotonic()
+        self.last_report = 0.0
+
+        # Workers may advance the tracker from several threads
+        self.lock = threading.Lock()
+
+    def advance(self, items: int = 1, units: float = None, nbytes: int = 0) -> None:
+        """Record completed work.
+
+        Args:
+            items (int, optional): The number of completed items. Default is 1.
+            units (float, optional): The completed work units. Defaults to items.
+            nbytes (int, optional): The number of bytes processed. Default is 0.
+        """
+        with self.lock:
+            self.items_done += items
+            self.units_done += units if units is not None else items
+            self.bytes_done += nbytes
+            self.partial_units = 0.0
+
+    def set_partial(self, units: float) -> None:
+        """Record the work done so far on the current item.
+
+        Args:
+            units (float): The work units completed on the current item.
+        """
+        with self.lock:
+            self.partial_units = units
+
+    def due(self) -> bool:
+        """Check whether enough time has passed since the last report, and start a new interval if so.
+
+        Returns:
+            bool: True if a progress report should be sent.
+        """
+        now = time.monotonic()
+        with self.lock:
+            if now - self.last_report < self.report_interval and self.items_done < self.total_items:
+                return False
+            self.last_report = now
+            return True
+
+    def snapshot(self) -> dict:
+        """Get the current progress.
+
+        Returns:
+            dict: The completed fraction (0-1) and a status text with counts, files/s, bytes/s and ETA.
+        """
+        with self.lock:
+            elapsed = max(time.monotonic() - self.start_time, 1e-6)
+            units_done = min(self.units_done + self.partial_units, self.total_units)
+            fraction = units_done / self.total_units if self.total_units else 1.0
+            items_per_second = self.items_done / elapsed
+            bytes_per_second = self.bytes_done / elapsed
+            items_done = self.items_done
+
+        # Estimate the remaining time from the average rate so far
+        if 0 < fraction < 1:
+            eta = time.strftime("%H:%M:%S", time.gmtime(elapsed * (1 - fraction) / fraction))
+        else:
+            eta = "--:--:--"
+
+        status = (f"{items_done}/{self.total_items} {self.item_name} ({fraction:.0%}) | "
+                  f"{items_per_second:.1f} {self.item_name}/s | {bytes_per_second / 1048576:.1f} MB/s | ETA {eta}")
+
+        return {"fraction": fraction, "status": status}
+
+
+# Create a formatter for structured JSON lines logs
+class JsonLinesFormatter(logging.Formatter):
+    """A logging formatter that writes each record as a single JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record as a JSON line.
+
+        Args:
+            record (logging.LogRecord): The record to format.
+
+        Returns:
+            str: The JSON encoded record.
+        """
+        return json.dumps({
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "thread": record.threadName,
+            "message": record.getMessage()
+        }, ensure_ascii=False)
+
+
+# Create a per-job MoviePy logger that captures encoder output instead of printing it
+class VideoProgressLogger(ProgressBarLogger):
+    """A MoviePy progress logger that keeps the encoder's messages in a bounded ring buffer and reports
+    frame progress through a callback, without touching sys.stdout or sys.stderr.
+
+    Args:
+        on_progress (callable, optional): Called with the completed fraction (0-1) of the frames being written.
+        on_message (callable, optional): Called with each message MoviePy logs (e.g. 'Moviepy - Building video').
+        max_lines (int, optional): The number of messages kept in the ring buffer. Default is 200.
+    """
+
+    def __init__(self, on_progress=None, on_message=None, max_lines: int = 200):
+        super().__init__()
+
+        # Callbacks for progress and messages
+        self.on_progress = on_progress
+        self.on_message = on_message
+
+        # Ring buffer of the latest messages and bar updates
+        self.lines = deque(maxlen=max_lines)
+
+    def callback(self, **changes):
+        """Record the messages logged by MoviePy.
+
+        Args:
+            **changes: The logger state changes.
+        """
+        message = changes.get("message")
+        if message:
+            self.lines.append(message)
+            if self.on_message:
+                self.on_message(message)
+
+    def bars_callback(self, bar, attr, value, old_value=None):
+        """Report the frame progress of the video bar.
+
+        Args:
+            bar (str): The name of the bar ('t' for video frames, 'chunk' for audio).
+            attr (str): The updated attribute of the bar ('index', 'total' or 'message').
+            value: The new value.
+            old_value: The previous value.
+        """
+        if attr != "index":
+            return
+
+        total = self.bars[bar].get("total")
+        if total:
+            # Keep the latest position of each bar in the ring buffer for troubleshooting
+            self.lines.append(f"{bar}: {value}/{total}")
+
+            # Only the video frames bar drives the progress model
+            if bar == "t" and self.on_progress:
+                self.on_progress(min(value / total, 1.0))
+
+
+# Create an opt-in profiler that records per-stage timings
+class StageProfiler:
+    """Record counts, cumulative and percentile timings per pipeline stage.
+
+    Methods are timed by wrapping them on an instance (instrument), so wrapped code paths run untouched while
+    profiling is disabled. Disk and encoder operations are timed with stage() blocks, which are no-ops when disabled.
+
+    Args:
+        max_samples (int, optional): The number of latest timings kept per stage for percentiles. Default is 10000.
+    """
+
+    def __init__(self, max_samples: int = 10000):
+        self.enabled = False
+        self.max_samples = max_samples
+        self.lock = threading.Lock()
+
+        # Stage name -> [count, total seconds, max seconds, latest timings]
+        self.stats = {}
+
+        # Instances and method names wrapped by instrument
+        self.instrumented = []
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record one timing of a stage.
+
+        Args:
+            name (str): The stage name.
+            seconds (float): The duration of the stage.
+        """
+        with self.lock:
+            stat = self.stats.get(name)
+            if stat is None:
+                stat = self.stats[name] = [0, 0.0, 0.0, deque(maxlen=self.max_samples)]
+            stat[0] += 1
+            stat[1] += seconds
+            stat[2] = max(stat[2], seconds)
+            stat[3].append(seconds)
+
+    def stage(self, name: str):
+        """Time a block as a stage.
+
+        Args:
+            name (str): The stage name.
+
+        Returns:
+            A context manager timing the block, or a no-op context manager when disabled.
+        """
+        if not self.enabled:
+            return contextlib.nullcontext()
+        return self.timed(name)
+
+    @contextlib.contextmanager
+    def timed(self, name: str):
+        """Time a block as a stage, regardless of the enabled state.
+
+        Args:
+            name (str): The stage name.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def wrap(self, name: str, method):
+        """Wrap a callable so each call is recorded as a stage.
+
+        Args:
+            name (str): The stage name.
+            method (callable): The callable to time.
+
+        Returns:
+            callable: The timed callable.
+        """
+        @functools.wraps(method)
+        def timed_method(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.record(name, time.perf_counter() - start)
+        return timed_method
+
+    def instrument(self, instance, method_names) -> None:
+        """Time the given methods of an instance, shadowing them with timed wrappers.
+
+        Args:
+            instance: The object whose methods are timed.
+            method_names (iterable): The method names, also used as the stage names. Missing methods are skipped.
+        """
+        names = [name for name in method_names if hasattr(instance, name) and name not in vars(instance)]
+        for name in names:
+            setattr(instance, name, self.wrap(name, getattr(instance, name)))
+        self.instrumented.append((instance, names))
+
+    def uninstrument(self, instance=None) -> None:
+        """Remove the timed wrappers added by instrument.
+
+        Args:
+            instance (optional): Only remove the wrappers of this object (and stop referencing it). Default is every
+                instrumented object.
+        """
+        remaining = []
+        for instrumented_instance, names in self.instrumented:
+            if instance is not None and instrumented_instance is not instance:
+                remaining.append((instrumented_instance, names))
+                continue
+            for name in names:
+                instrumented_instance.__dict__.pop(name, None)
+        self.instrumented = remaining
+
+    def reset(self) -> None:
+        """Discard the recorded timings."""
+        with self.lock:
+            self.stats = {}
+
+    def report(self, reset: bool = False) -> dict:
+        """Summarize the recorded timings.
+
+        Args:
+            reset (bool, optional): Discard the timings after summarizing them. Default is False.
+
+        Returns:
+            dict: Per stage, the count, total, mean, p50, p90, p99 and max in milliseconds, slowest total first.
+        """
+        with self.lock:
+            stats = self.stats
+            if reset:
+                self.stats = {}
+
+        def percentile(samples, fraction):
+            # Nearest-rank percentile of the sorted samples
+            return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+        report = {}
+        for name, (count, total, longest, samples) in sorted(stats.items(), key=lambda item: -item[1][1]):
+            samples = sorted(samples)
+            report[name] = {"count": count,
+                            "total_ms": round(total * 1000, 3),
+                            "mean_ms": round(total * 1000 / count, 4),
+                            "p50_ms": round(percentile(samples, 0.50) * 1000, 4),
+                            "p90_ms": round(percentile(samples, 0.90) * 1000, 4),
+                            "p99_ms": round(percentile(samples, 0.99) * 1000, 4),
+                            "max_ms": round(longest * 1000, 4)}
+        return report
+
+
+# Create a memoized per-codepoint transliteration table for str.translate
+class TransliterationTable(dict):
+    """A str.translate table that transliterates each code point to ASCII with unidecode on first use.
+
+    ASCII code points map to themselves, and the fraction and fullwidth slashes map to spaces so transliterated names
+    never gain a path separator.
+    """
+
+    # Slashes replaced by a space instead of being transliterated
+    SLASHES = {ord('⁄'): ' ', ord('／'): ' '}
+
+    def __init__(self):
+        super().__init__(self.SLASHES)
+
+    def __missing__(self, codepoint: int) -> str:
+        character = chr(codepoint)
+        translation = character if codepoint < 128 else unidecode(character)
+        self[codepoint] = translation
+        return translation
+
+
+# Transliteration table shared by every Name Normalizer pipeline
+TRANSLITERATION_TABLE = TransliterationTable()
+
+# Runs of whitespace collapsed to a single space after text replacements
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+# Create a replacer that rewrites many literal strings in a single scan
+class LiteralReplacer:
+    """Replace every occurrence of many literal strings in one scan of the text.
+
+    The rules are compiled into a single trie-shaped alternation (shared prefixes are matched once), preferring longer
+    rules, so at each position the longest matching rule wins (leftmost-longest). Tries nesting more than
+    MAX_TRIE_DEPTH groups (e.g. many rules extending each other) use a flat alternation of the rules, longest first,
+    which matches the same way. Replaced text is not rescanned, so one rule's output is never rewritten by another
+    rule.
+
+    Args:
+        replacements (dict): The text to replace mapped to its replacement. Empty keys are ignored.
+        ignore_case (bool, optional): Match the rules case-insensitively. Default is False.
+    """
+
+    # The deepest nesting of trie groups compiled into the pattern
+    MAX_TRIE_DEPTH = 100
+
+    def __init__(self, replacements: dict, ignore_case: bool = False):
+        self.ignore_case = ignore_case
+
+        # Index the rules by their lookup key (the first rule wins when rules only differ in case)
+        self.replacements = {}
+        for text, replacement in replacements.items():
+            if text:
+                self.replacements.setdefault(text.lower() if ignore_case else text, replacement)
+
+        # Build a character trie of the rules ('' marks the end of a rule)
+        trie = {}
+        for text in self.replacements:
+            node = trie
+            for character in text:
+                node = node.setdefault(character, {})
+            node[''] = {}
+
+        # Compile the trie into one alternation (or the rules longest first if the trie nests too deeply)
+        alternation = self.trie_pattern(trie) if self.replacements else None
+        if alternation is None and self.replacements:
+            alternation = '|'.join(re.escape(text) for text in sorted(self.replacements, key=len, reverse=True))
+        self.pattern = re.compile(alternation, re.IGNORECASE if ignore_case else 0) if alternation else None
+
+    @classmethod
+    def trie_pattern(cls, trie: dict) -> Union[str, None]:
+        """Convert a trie into a regular expression, trying longer rules before a rule ending at the same node.
+
+        The trie is walked with an explicit stack, so rules longer than the recursion limit are supported.
+
+        Args:
+            trie (dict): The trie root (character -> child node, '' marks the end of a rule).
+
+        Returns:
+            Union[str, None]: The regular expression matching the rules, or None if it would nest more than
+            MAX_TRIE_DEPTH groups.
+        """
+        # Pattern and group depth of each finished node, keyed by id (children finish before their parent)
+        finished = {}
+        stack = [(trie, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if not children_done:
+                stack.append((node, True))
+                stack.extend((child, False) for character, child in node.items() if character)
+                continue
+
+            branches = []
+            depth = 0
+            for character, child in node.items():
+                if character:
+                    child_pattern, child_depth = finished.pop(id(child))
+                    branches.append(re.escape(character) + child_pattern)
+                    depth = max(depth, child_depth)
+            if '' in node and branches:
+                # An empty last branch lets a shorter rule match when no longer rule does
+                branches.append('')
+
+            if not branches:
+                finished[id(node)] = ('', 0)
+            elif len(branches) == 1:
+                finished[id(node)] = (branches[0], depth)
+            else:
+                finished[id(node)] = ('(?:' + '|'.join(branches) + ')', depth + 1)
+
+        pattern, depth = finished[id(trie)]
+        return pattern if depth <= cls.MAX_TRIE_DEPTH else None
+
+    def replacement_for(self, match) -> str:
+        """Get the replacement of a matched rule.
+
+        Args:
+            match (re.Match): The match of one of the rules.
+
+        Returns:
+            str: The replacement text.
+        """
+        text = match.group(0)
+        if not self.ignore_case:
+            return self.replacements[text]
+
+        replacement = self.replacements.get(text.lower())
+        if replacement is None:
+            # Case folding that changes the length (e.g. 'İ') does not round-trip through lower()
+            replacement = next(value for key, value in self.replacements.items()
+                               if re.fullmatch(re.escape(key), text, re.IGNORECASE))
+        return replacement
+
+    def sub(self, text: str) -> str:
+        """Replace every rule in the text.
+
+        Args:
+            text (str): The text to rewrite.
+
+        Returns:
+            str: The rewritten text.
+        """
+        if self.pattern is None:
+            return text
+        return self.pattern.sub(self.replacement_for, text)
+
+
+# Create a title caser for the Name Normalizer
+class TitleCaser:
+    """Title-case names word by word.
+
+    Plain words are capitalized (the rest of the word is lowercased, so contractions like "don't" keep a lowercase
+    letter after the apostrophe). Words containing [, { or ( are left as they are, except that the first letter after
+    each bracket is capitalized. Small words from the exceptions list are lowercased unless they start the name or
+    follow a ' - ' separator.
+
+    Args:
+        exceptions (iterable, optional): Small words kept lowercase (e.g. "of", "the", "feat."). Default is none.
+    """
+
+    # A bracket and the text up to the next bracket
+    BRACKET_SEGMENT_PATTERN = re.compile(r'[\[{(][^\[{(]*')
+
+    def __init__(self, exceptions=()):
+        self.exceptions = frozenset(exception.lower() for exception in exceptions)
+
+    @staticmethod
+    def capitalize_bracket_segment(match) -> str:
+        """Capitalize the first letter of a bracket segment.
+
+        Args:
+            match (re.Match): The bracket segment.
+
+        Returns:
+            str: The segment with its first letter capitalized.
+        """
+        segment = match.group(0)
+        for index, character in enumerate(segment):
+            if character.isalpha():
+                return segment[:index] + character.upper() + segment[index + 1:]
+        return segment
+
+    def title(self, name: str) -> str:
+        """Title-case a name, collapsing its whitespace to single spaces.
+
+        Args:
+            name (str): The original name.
+
+        Returns:
+            str: The title-cased name.
+        """
+        words = name.split()
+
+        # Fast path: no brackets and no exceptions to apply
+        if not self.exceptions and '(' not in name and '[' not in name and '{' not in name:
+            return ' '.join([word.capitalize() for word in words])
+
+        formatted_words = []
+        clause_start = True
+        for word in words:
+            if '(' in word or '[' in word or '{' in word:
+                formatted_words.append(self.BRACKET_SEGMENT_PATTERN.sub(self.capitalize_bracket_segment, word))
+            elif not clause_start and word.lower() in self.exceptions:
+                formatted_words.append(word.lower())
+            else:
+                formatted_words.append(word.capitalize())
+
+            # The word after the artist separator starts a new clause
+            clause_start = word == '-'
+
+        return ' '.join(formatted_words)
+
+
+# Create a bounded-concurrency executor that keeps tasks with the same key in order
+class KeyedIOExecutor:
+    """Run I/O tasks on a bounded thread pool, one at a time and in submission order per key.
+
+    Tasks with different keys (e.g. target directories) overlap their filesystem latency, while tasks sharing a key run
+    sequentially so conflict resolution inside a directory stays deterministic.
+
+    Args:
+        max_in_flight (int): The number of tasks running at once.
+        thread_name (str, optional): The name given to the pool threads (log messages are routed by thread name).
+        max_queued (int, optional): The number of submitted tasks not yet finished before submit blocks. Defaults to
+            four times max_in_flight.
+    """
+
+    def __init__(self, max_in_flight: int, thread_name: str = None, max_queued: int = None):
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_in_flight,
+            initializer=(lambda: setattr(threading.current_thread(), "name", thread_name)) if thread_name else None)
+        self.slots = threading.BoundedSemaphore(max_queued or max_in_flight * 4)
+        self.lock = threading.Lock()
+
+        # Key -> queued (future, function, args) of the key currently being drained
+        self.pending = {}
+
+    def submit(self, key, function, *args) -> concurrent.futures.Future:
+        """Queue a task behind the earlier tasks with the same key.
+
+        Args:
+            key: The ordering key.
+            function (callable): The task.
+            *args: The task arguments.
+
+        Returns:
+            concurrent.futures.Future: The future of the task's result.
+        """
+        self.slots.acquire()
+        future = concurrent.futures.Future()
+        with self.lock:
+            key_queue = self.pending.get(key)
+            start_drain = key_queue is None
+            if start_drain:
+                key_queue = self.pending[key] = deque()
+            key_queue.append((future, function, args))
+
+        # Only one drain runs per key
+        if start_drain:
+            self.executor.submit(self.drain, key)
+        return future
+
+    def drain(self, key) -> None:
+        """Run the queued tasks of a key in order until its queue is empty.
+
+        Args:
+            key: The ordering key.
+        """
+        while True:
+            with self.lock:
+                key_queue = self.pending[key]
+                if not key_queue:
+                    del self.pending[key]
+                    return
+                future, function, args = key_queue.popleft()
+
+            try:
+                # Skip cancelled tasks
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(function(*args))
+                    except BaseException as e:
+                        future.set_exception(e)
+            finally:
+                self.slots.release()
+
+    def cancel_pending(self) -> None:
+        """Cancel the tasks that have not started yet."""
+        with self.lock:
+            for key_queue in self.pending.values():
+                for future, _, _ in key_queue:
+                    future.cancel()
+
+    def shutdown(self) -> None:
+        """Wait for the running and queued tasks, then stop the threads."""
+        self.executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.shutdown()
+
+
+# Check planned paths against the limits and naming rules of the filesystems they will be written to
+class PathValidator:
+    """Check planned file names against their target filesystem before anything is renamed.
+
+    Names are measured in bytes against NAME_MAX and full paths against PATH_MAX, both read with os.pathconf from the
+    nearest existing directory. Windows rules (reserved characters and device names, trailing dots and spaces, 255
+    UTF-16 units per name) apply on Windows and to FAT, exFAT, NTFS and SMB targets mounted elsewhere. The limits of a
+    directory are looked up once and cached, so a whole plan is checked with a handful of system calls.
+
+    Args:
+        filesystem_type (callable, optional): Returns the filesystem type of a directory (e.g. 'vfat'), or None.
+        max_workers (int, optional): The threads looking up the limits of uncached directories. Default is 4.
+    """
+
+    # Filesystems that follow the Windows naming rules
+    WINDOWS_FILESYSTEMS = frozenset({"vfat", "msdos", "exfat", "ntfs", "ntfs3", "fuseblk", "cifs", "smb3", "smbfs"})
+
+    # Characters and device names Windows rejects in file names
+    WINDOWS_RESERVED_CHARACTERS = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+    WINDOWS_RESERVED_NAMES = frozenset(["CON", "PRN", "AUX", "NUL"] + [f"COM{number}" for number in range(1, 10)] +
+                                       [f"LPT{number}" for number in range(1, 10)])
+
+    # Limits used when the system does not report them
+    DEFAULT_NAME_MAX = 255
+    DEFAULT_PATH_MAX = 260 if os.name == "nt" else 4096
+
+    def __init__(self, filesystem_type=None, max_workers: int = 4):
+        self.filesystem_type = filesystem_type
+        self.max_workers = max(1, max_workers)
+
+        # Directory -> (name_max, path_max, windows_rules)
+        self.limits = {}
+
+    def get_limits(self, directory: str) -> tuple:
+        """Get the naming limits of a directory (cached).
+
+        Args:
+            directory (str): The target directory. It does not need to exist yet.
+
+        Returns:
+            tuple: NAME_MAX in bytes, PATH_MAX in bytes (including the terminating null) and whether the Windows rules
+            apply.
+        """
+        directory = os.path.abspath(directory)
+        limits = self.limits.get(directory)
+        if limits is not None:
+            return limits
+
+        # Read the limits from the nearest existing directory
+        existing = directory
+        while not os.path.isdir(existing) and os.path.dirname(existing) != existing:
+            existing = os.path.dirname(existing)
+
+        try:
+            name_max = os.pathconf(existing, "PC_NAME_MAX")
+        except (AttributeError, OSError, ValueError):
+            name_max = self.DEFAULT_NAME_MAX
+        try:
+            path_max = os.pathconf(existing, "PC_PATH_MAX")
+        except (AttributeError, OSError, ValueError):
+            path_max = self.DEFAULT_PATH_MAX
+
+        windows_rules = os.name == "nt" or bool(
+            self.filesystem_type and (self.filesystem_type(existing) or "").lower() in self.WINDOWS_FILESYSTEMS)
+
+        limits = self.limits[directory] = (name_max, path_max, windows_rules)
+        return limits
+
+    @classmethod
+    def check_name(cls, path: str, name_max: int, path_max: int, windows_rules: bool) -> Union[str, None]:
+        """Check an absolute path against a set of limits.
+
+        Args:
+            path (str): The absolute path.
+            name_max (int): NAME_MAX in bytes.
+            path_max (int): PATH_MAX in bytes, including the terminating null.
+            windows_rules (bool): Whether the Windows rules apply.
+
+        Returns:
+            Union[str, None]: Why the path cannot be used, or None if it can.
+        """
+        name = os.path.basename(path)
+        if name in ("", ".", ".."):
+            return "the name is empty"
+        if "\0" in name:
+            return "the name contains a null character"
+
+        # Limits are in bytes, so multibyte characters count several times
+        name_bytes = len(os.fsencode(name))
+        if name_bytes > name_max:
+            return f"the name is {name_bytes} bytes, over the limit of {name_max}"
+        path_bytes = len(os.fsencode(path))
+        if path_bytes >= path_max:
+            return f"the path is {path_bytes} bytes, over the limit of {path_max - 1}"
+
+        if windows_rules:
+            name_units = len(name.encode("utf-16-le", "surrogatepass")) // 2
+            if name_units > 255:
+                return f"the name is {name_units} characters, over the limit of 255"
+            match = cls.WINDOWS_RESERVED_CHARACTERS.search(name)
+            if match:
+                return f"the name contains the reserved character {match.group()!r}"
+            if name.split(".")[0].rstrip(" ").upper() in cls.WINDOWS_RESERVED_NAMES:
+                return f"'{name.split('.')[0]}' is a reserved name"
+            if name[-1] in ". ":
+                return "the name ends with a dot or a space"
+        return None
+
+    def check(self, path: str) -> Union[str, None]:
+        """Check a planned path.
+
+        Args:
+            path (str): The planned path.
+
+        Returns:
+            Union[str, None]: Why the path cannot be used, or None if it can.
+        """
+        path = os.path.abspath(path)
+        return self.check_name(path, *self.get_limits(os.path.dirname(path)))
+
+    def check_many(self, paths: list) -> list:
+        """Check a whole plan, looking up the limits of each target directory once (in parallel for new ones).
+
+        Args:
+            paths (list): The planned paths.
+
+        Returns:
+            list: Why each path cannot be used, or None for the paths that can.
+        """
+        paths = [os.path.abspath(path) for path in paths]
+        directories = {os.path.dirname(path) for path in paths}
+
+        # Look up the uncached directories concurrently (pathconf and the mount table may be slow on network shares)
+        uncached = [directory for directory in directories if directory not in self.limits]
+        if len(uncached) > 1 and self.max_workers > 1:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.max_workers, len(uncached))) as executor:
+                list(executor.map(self.get_limits, uncached))
+
+        limits = {directory: self.get_limits(directory) for directory in directories}
+        return [self.check_name(path, *limits[os.path.dirname(path)]) for path in paths]
+
+    def fit_name(self, directory: str, stem: str, suffix: str = "", reserve: int = 0) -> str:
+        """Shorten a name's stem so the name fits the limits of its directory.
+
+        Args:
+            directory (str): The target directory.
+            stem (str): The part of the name that may be shortened.
+            suffix (str, optional): The part of the name kept whole (e.g. '_EDITED.mp4'). Default is empty.
+            reserve (int, optional): Bytes left free for a conflict counter added later. Default is 0.
+
+        Returns:
+            str: The name, with its stem shortened if needed.
+        """
+        name_max, path_max, windows_rules = self.get_limits(directory)
+
+        # The bytes and UTF-16 units left for the stem
+        byte_budget = min(name_max, path_max - 1 - len(os.fsencode(os.path.join(os.path.abspath(directory), ""))))
+        byte_budget -= len(os.fsencode(suffix)) + reserve
+        unit_budget = (255 - len(suffix.encode("utf-16-le", "surrogatepass")) // 2 - reserve) if windows_rules else None
+
+        if len(os.fsencode(stem)) <= byte_budget and (
+                unit_budget is None or len(stem.encode("utf-16-le", "surrogatepass")) // 2 <= unit_budget):
+            return stem + suffix
+
+        # Keep whole characters while they fit
+        kept = []
+        for character in stem:
+            byte_budget -= len(os.fsencode(character))
+            if unit_budget is not None:
+                unit_budget -= len(character.encode("utf-16-le", "surrogatepass")) // 2
+            if byte_budget < 0 or (unit_budget is not None and unit_budget < 0):
+                break
+            kept.append(character)
+        return "".join(kept).rstrip(" .") + suffix
+
+
+class OCDFileRenamer(ctk.CTk, TkinterDnD.DnDWrapper):
+    def __init__(self, *args, **kwargs):
+        # Call the __init__ method of the parent class (TkinterDnD) with the given arguments
+        super().__init__(*args, **kwargs)
+
+        # Determine TkinterDnD version and store it in the TkdndVersion attribute
+        # noinspection PyProtectedMember
+        self.TkdndVersion = TkinterDnD._require(self)
+
+        # Set the window title
+        self.title("O.C.D. File Editor")
+
+        """Load Configuration"""
+        # Check if configuration file exists
+        self.config_file_path = 'config.ini'
+
+        if not os.path.exists(self.config_file_path):
+            # Display a message to the console if the configuration file does not exist
+            print(f"Error: {self.config_file_path} not found. Please create the config file and try again.")
+            # Quit the program
+            quit()
+
+        # Load the configuration from the config.ini file
+        config = configparser.ConfigParser()
+        config.read(self.config_file_path)
+
+        # GUI
+        self.geometry(config.get('GUI', 'geometry', fallback='1280x850'))
+        self.scaling = config.get('GUI', 'scaling', fallback='100')
+        self.default_frame = config.get('GUI', 'default_frame', fallback="file_renamer_window")
+
+        # File Renamer
+        self.default_cat_tab = config.get('File Renamer', 'default_cat_tab', fallback="All")
+        self.default_most_number = int(config.get('File Renamer', 'default_most_number', fallback=9))
+        self.column_numbers = int(config.get('File Renamer', 'column_numbers', fallback=7))
+        self.default_placement_var = config.get("File Renamer", "default_placement_var", fallback="special_character")
+        self.special_character_var = config.get("File Renamer", "special_character_var", fallback="-")
+        self.reset_output_directory_var = ctk.BooleanVar(
+            value=config.getboolean("File Renamer", "reset_output_directory_var", fallback=True))
+        self.suggest_output_directory_var = ctk.BooleanVar(
+            value=config.getboolean("File Renamer", "suggest_output_directory_var", fallback=False))
+        self.move_up_directory_var = ctk.BooleanVar(
+            value=config.getboolean("File Renamer", "move_up_directory_var", fallback=False))
+        self.move_text_var = ctk.BooleanVar(value=config.getboolean('File Renamer', 'move_text_var', fallback=False))
+        self.artist_common_categories_var = ctk.BooleanVar(
+            value=config.getboolean("File Renamer", "artist_common_categories_var", fallback=False))
+        self.preview_debounce_ms = int(config.get('File Renamer', 'preview_debounce_ms', fallback=150))
+
+        # Name Normalizer
+        self.artist_identifier_var = ctk.BooleanVar(
+            value=config.getboolean("Name Normalizer", "artist_identifier_var", fallback=False))
+        self.deep_walk_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "deep_walk_var", fallback=False))
+        self.remove_all_symbols_var = ctk.BooleanVar(
+            value=config.getboolean("Name Normalizer", "remove_all_symbols_var", fallback=False))
+        self.remove_ampersand_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "remove_ampersand_var",
+                                                                           fallback=False))
+        self.remove_angle_bracket_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer",
+                                                                               "remove_angle_bracket_var",
+                                                                               fallback=False))
+        self.remove_asterisk_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "remove_asterisk_var",
+                                                                          fallback=False))
+        self.remove_at_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "remove_at_var", fallback=False))
+        self.remove_backslash_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "remove_backslash_var",
+                                                                           fallback=False))
+        self.remove_caret_var = ctk.BooleanVar(
+            value=config.getboolean("Name Normalizer", "remove_caret_var", fallback=False))
+        self.remove_colon_var = ctk.BooleanVar(
+            value=config.getboolean("Name Normalizer", "remove_colon_var", fallback=False))
+        self.remove_comma_var = ctk.BooleanVar(
+            value=config.getboolean("Name Normalizer", "remove_comma_var", fallback=False))
+        self.remove_curly_brace_var = ctk.BooleanVar(
+            value=config.getboolean("Name Normalizer", "remove_curly_brace_var", fallback=False))
+        self.remove_dash_var = ctk.BooleanVar(
+            value=config.getboolean("Name Normalizer", "remove_dash_var", fallback=False))
+        self.remove_dollar_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "remove_dollar_var",
+                                                                        fallback=False))
+        self.remove_double_quote_var = ctk.BooleanVar(
+            value=config.getboolean("Name Normalizer", "remove_double_quote_var", fallback=False))
+        self.remove_emdash_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "remove_emdash_var",
+                                                                        fallback=False))
+
+        self.remove_endash_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "remove_endash_var",
+                                                                        fallback=False))
+        self.remove_equal_var = ctk.BooleanVar(
+            value=config.getboolean("Name Normalizer", "remove_equal_var", fallback=False))
+        self.remove_extra_whitespace_var = ctk.BooleanVar(
+            value=config.getboolean("Name Normalizer", "remove_extra_whitespace_var", fallback=False))
+        self.remove_hashtag_trail_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer",
+                                                                               "remove_hashtag_trail_var",
+                                                                               fallback=False))
+
+        self.remove_hashtag_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "remove_hashtag_var",
+                                                                         fallback=False))
+        self.remove_most_symbols_var = ctk.BooleanVar(
+            value=config.getboolean("Name Normalizer", "remove_most_symbols_var", fallback=False))
+
+        self.remove_non_ascii_symbols_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer",
+                                                                                   "remove_non_ascii_symbols_var",
+                                                                                   fallback=False))
+
+        self.remove_number_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "remove_number_var",
+                                                                        fallback=False))
+
+        self.remove_parenthesis_trail_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer",
+                                                                                   "remove_parenthesis_trail_var",
+                                                                                   fallback=False))
+
+        self.remove_parenthesis_var = ctk.BooleanVar(
+            value=config.getboolean("Name Normalizer", "remove_parenthesis_var", fallback=False))
+        self.remove_percent_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "remove_percent_var",
+                                                                         fallback=False))
+        self.remove_pipe_var = ctk.BooleanVar(
+            value=config.getboolean("Name Normalizer", "remove_pipe_var", fallback=False))
+        self.remove_plus_var = ctk.BooleanVar(
+            value=config.getboolean("Name Normalizer", "remove_plus_var", fallback=False))
+        self.remove_question_mark_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer",
+                                                                               "remove_question_mark_var",
+                                                                               fallback=False))
+        self.remove_semicolon_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "remove_semicolon_var",
+                                                                           fallback=False))
+        self.remove_single_quote_var = ctk.BooleanVar(
+            value=config.getboolean("Name Normalizer", "remove_single_quote_var", fallback=False))
+
+        self.remove_underscore_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "remove_underscore_var",
+                                                                            fallback=False))
+
+        self.remove_square_bracket_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer",
+                                                                                "remove_square_bracket_var",
+                                                                                fallback=False))
+        self.replace_custom_text_var = ctk.BooleanVar(
+            value=config.getboolean("Name Normalizer", "replace_custom_text_var", fallback=False))
+
+        self.replace_mode_var = ctk.BooleanVar(
+            value=config.getboolean("Name Normalizer", "replace_mode_var", fallback=False))
+
+        self.reset_nn_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "reset_nn_var", fallback=True))
+        self.title_var = ctk.BooleanVar(value=config.getboolean("Name Normalizer", "title_var", fallback=False))
+        self.nn_preview_cache_size = int(config.get('Name Normalizer', 'nn_preview_cache_size', fallback=2048))
+        self.nn_preview_page_size = int(config.get('Name Normalizer', 'nn_preview_page_size', fallback=100))
+        self.nn_worker_processes = int(config.get('Name Normalizer', 'nn_worker_processes', fallback=0))
+        self.nn_parallel_threshold = int(config.get('Name Normalizer', 'nn_parallel_threshold', fallback=2000))
+        self.io_max_in_flight = int(config.get('Name Normalizer', 'io_max_in_flight', fallback=1))
+        self.io_filesystem_limits = {
+            filesystem.strip().lower(): int(limit)
+            for filesystem, limit in (pair.split(":", 1) for pair in config.get(
+                'Name Normalizer', 'io_filesystem_limits',
+                fallback="nfs:16, nfs4:16, cifs:16, smb3:16, fuse.sshfs:8").split(",") if ":" in pair)}
+        self.duplicate_hash_workers = int(config.get('Name Normalizer', 'duplicate_hash_workers', fallback=4))
+        self.duplicate_partial_hash_kib = int(config.get('Name Normalizer', 'duplicate_partial_hash_kib',
+                                                         fallback=64))
+
+        # Checks planned names against the limits and rules of their target filesystem
+        self.path_validator = PathValidator(self.get_filesystem_type)
+
+        # Video Editor
+        self.default_rotation_var = config.get("Video Editor", "default_rotation_var", fallback="none")
+        self.default_decibel = config.get('Video Editor', 'default_decibel', fallback=0.0)
+        self.default_audio_normalization = config.get('Video Editor', 'default_audio_normalization', fallback=0.0)
+        self.default_hour = config.get('Video Editor', 'default_hour', fallback=0)
+        self.default_minute = config.get('Video Editor', 'default_minute', fallback=0)
+        self.default_second = config.get('Video Editor', 'default_second', fallback=0)
+        self.remove_successful_lines_var = ctk.BooleanVar(value=config.getboolean("Video Editor",
+                                                                                  "remove_successful_lines_var",
+                                                                                  fallback=False))
+        self.reset_video_entries_var = ctk.BooleanVar(
+            value=config.getboolean("Video Editor", "reset_video_entries_var", fallback=True))
+        self.encoder_log_lines = int(config.get('Video Editor', 'encoder_log_lines', fallback=200))
+
+        # Add/Remove
+        self.default_add_remove_tab = config.get('Add/Remove', 'default_add_remove_tab', fallback="Artist")
+        self.auto_add_acc_record_var = ctk.BooleanVar(value=config.getboolean("Add/Remove", "auto_add_acc_record_var",
+                                                                              fallback=False))
+        self.default_weight = config.get('Add/Remove', 'default_weight', fallback=9)
+        self.default_ctn_weight = config.get('Add/Remove', 'default_ctn_weight', fallback=1)
+        self.reset_add_remove_var = ctk.BooleanVar(value=config.getboolean("Add/Remove", "reset_add_remove_var",
+                                                                           fallback=True))
+
+        # Settings
+        self.artist_search_var = ctk.BooleanVar(value=config.getboolean("Settings", "artist_search_var",
+                                                                        fallback=False))
+        self.ignore_known_artists_var = ctk.BooleanVar(
+            value=config.getboolean("Settings", "ignore_known_artists_var", fallback=False))
+        self.remove_artist_duplicates_var = ctk.BooleanVar(
+            value=config.getboolean("Settings", "remove_artist_duplicates_var", fallback=False))
+        self.remove_word_duplicates_var = ctk.BooleanVar(
+            value=config.getboolean("Settings", "remove_word_duplicates_var", fallback=False))
+        self.activate_logging_var = ctk.BooleanVar(
+            value=config.getboolean("Settings", "activate_logging_var", fallback=False))
+        self.json_logging_var = ctk.BooleanVar(value=config.getboolean("Settings", "json_logging_var", fallback=False))
+        self.profiling_var = ctk.BooleanVar(value=config.getboolean("Settings", "profiling_var", fallback=False))
+        self.suppress_var = ctk.BooleanVar(value=config.getboolean("Settings", "suppress_var", fallback=False))
+        self.show_messageboxes_var = ctk.BooleanVar(
+            value=config.getboolean("Settings", "show_messageboxes_var", fallback=True))
+        self.show_confirmation_messageboxes_var = ctk.BooleanVar(
+            value=config.getboolean("Settings", "show_confirmation_messageboxes_var", fallback=True))
+        self.fallback_confirmation_var = ctk.BooleanVar(value=config.getboolean("Settings", "fallback_confirmation_var",
+                                                                                fallback=False))
+        self.truncate_var = ctk.BooleanVar(value=config.getboolean("Settings", "truncate_var", fallback=True))
+        self.open_on_file_drop_var = ctk.BooleanVar(
+            value=config.getboolean("Settings", "open_on_file_drop_var", fallback=False))
+        self.validate_entries = ctk.BooleanVar(value=config.getboolean("Settings", "validate_entries", fallback=False))
+        self.preview_mode_var = ctk.BooleanVar(value=config.getboolean("Settings", "preview_mode_var", fallback=False))
+        self.double_check_var = ctk.BooleanVar(value=config.getboolean("Settings", "double_check_var", fallback=False))
+        self.use_custom_tab_names_var = ctk.BooleanVar(
+            value=config.getboolean("Settings", "use_custom_tab_names_var", fallback=False))
+        self.sort_tab_names_var = ctk.BooleanVar(
+            value=config.getboolean("Settings", "sort_tab_names_var", fallback=False))
+        self.sort_reverse_order_var = ctk.BooleanVar(
+            value=config.getboolean("Settings", "sort_reverse_order_var", fallback=False))
+        self.history_retention_limit = int(config.get('Settings', 'history_retention_limit', fallback=1000))
+        self.history_cache_kib = int(config.get('Settings', 'history_cache_kib', fallback=2048))
+        self.ui_event_interval_ms = int(config.get('Settings', 'ui_event_interval_ms', fallback=50))
+        self.log_view_max_lines = int(config.get('Settings', 'log_view_max_lines', fallback=1000))
+        self.move_chunk_kib = int(config.get('Settings', 'move_chunk_kib', fallback=1024))
+        self.trash_batch_size = int(config.get('Settings', 'trash_batch_size', fallback=100))
+        self.verify_cross_device_moves = config.getboolean("Settings", "verify_cross_device_moves", fallback=True)
+        self.fuzzy_category_search_var = ctk.BooleanVar(
+            value=config.getboolean("Settings", "fuzzy_category_search_var", fallback=True))
+        self.render_category_buttons_var = ctk.BooleanVar(
+            value=config.getboolean("Settings", "render_category_buttons_var", fallback=True))
+
+        # Filepaths/Directories
+        self.initial_directory = config.get('Filepaths', 'initial_directory', fallback='/path/to/folder')
+        self.initial_output_directory = config.get('Filepaths', 'initial_output_directory', fallback='/path/to/folder')
+        self.double_check_directory = config.get('Filepaths', 'double_check_directory',
+                                                 fallback='double_check_reminders')
+        self.no_go_directory = config.get('Filepaths', 'no_go_directory', fallback='no_go_reminders')
+        self.artist_directory = config.get('Filepaths', 'artist_directory', fallback='artist_directory')
+        self.artist_file = config.get('Filepaths', 'artist_file', fallback='list_of_artists.txt')
+        self.no_go_artist_file = config.get('Filepaths', 'no_go_artist_file', fallback='list_of_no_go_artists.txt')
+        self.dictionary_file = config.get('Filepaths', 'dictionary_file', fallback='dictionary.json')
+        self.history_file = config.get('Filepaths', 'history_file', fallback='rename_history.db')
+        self.hash_cache_file = config.get('Filepaths', 'hash_cache_file', fallback='hash_cache.db')
+
+        # Logs
+        self.file_renamer_log = config.get('Logs', 'file_renamer_log', fallback="file_renamer.log")
+        self.log_max_bytes = int(config.get('Logs', 'log_max_bytes', fallback=10 * 1024 * 1024))
+        self.log_backup_count = int(config.get('Logs', 'log_backup_count', fallback=5))
+        self.profile_directory = config.get('Logs', 'profile_directory', fallback="profiles")
+
+        # Asynchronous logging pipeline (callers enqueue records, a listener thread writes them to the log file)
+        self.log_queue = queue.Queue(-1)
+        self.log_queue_handler = None
+        self.log_file_handler = None
+        self.log_listener = None
+
+        """Cache"""
+        # Set the cache duration to 10 minutes (600 seconds)
+        self.cache_duration = 600
+        self.last_cache_update = 0
+        self.cached_artist_files = []
+
+        # Artist list cache, reloaded only when the artist file's modification time or size changes
+        self.artist_file_signature = None
+        self.cached_artist_list = []
+        self.cached_artist_patterns = []
+
+        # Cleaned File Renamer base name, recomputed only when the selected file or cleanup settings change
+        self.file_renamer_base_name_key = None
+        self.file_renamer_base_name = ""
+
+        # Files of a File Renamer batch (the first one is the selected file shown in the preview)
+        self.file_renamer_batch_files = []
+
+        # Pending debounced File Renamer preview update
+        self.file_display_update_id = None
+
+        # Name Normalizer preview cache (LRU) keyed by file path, settings fingerprint and directory modification time
+        self.nn_preview_cache = OrderedDict()
+
+        # Version of the loaded dictionaries, bumped whenever dictionary.json is loaded or updated
+        self.dictionary_version = 0
+
+        # Compiled custom_text_to_replace rules and the (dictionary version, replace mode) they were built for
+        self.custom_text_replacer = None
+        self.custom_text_replacer_key = None
+
+        # Name Normalizer folder preview, computed page by page in a background worker
+        self.nn_plan_key = None
+        self.nn_plan_generation = 0
+        self.nn_plan_pages = []
+        self.nn_plan_page_index = 0
+        self.nn_plan_counts = {"changed": 0, "unchanged": 0, "colliding": 0}
+        self.nn_plan_done = True
+        self.nn_plan_queue = queue.Queue()
+        self.nn_plan_polling = False
+        """End Cache"""
+
+        # Initialize instance variables for selected files, output directories, queue, and last used files
+        self.file_renamer_selected_file = ""
+        self.file_renamer_last_used_file = ""
+        self.output_directory = ""
+        self.history_store = None
+        self.hash_cache = None
+        self.file_renamer_queue = []
+        self.cat_tabs = {}
+        self.add_remove_tabs = {}
+        self.settings_tabs = {}
+        self.excluded_folders = []
+        self.custom_text_to_replace = {}
+        self.title_exceptions = []
+        self.title_caser = TitleCaser()
+        self.file_extensions = []
+        self.valid_extensions = []
+        self.weight_to_tab_name = {}
+        self.categories = {}
+        self.artist_common_categories = {}
+        self.name_normalizer_selected_file = ""
+        self.name_normalizer_batch_paths = []
+        self.name_normalizer_last_used_file = ""
+        self.name_normalizer_output_directory = ""
+        self.video_editor_selected_file = ""
+        self.video_editor_batch_paths = []
+        self.video_editor_last_used_file = ""
+        self.video_editor_output_directory = ""
+        self.acc_selected_artist = ""
+
+        # Initialize the queue for FIFO queue module functionality
+        self.queue = queue.Queue()
+
+        # Initialize the event bus for UI updates posted by worker threads
+        self.ui_event_bus = UIEventBus()
+
+        # Initialize the stage profiler and the methods it times when profiling is active
+        self.stage_profiler = StageProfiler()
+        self.profiled_methods = (
+            # Name Normalizer
+            "construct_nn_name", "rename_and_move_file", "remove_custom_user_text", "replace_user_text",
+            "remove_non_ascii_symbols", "remove_symbols", "remove_numbers", "remove_text_trailing", "remove_dashes",
+            "remove_endashes", "remove_emdashes", "remove_ampersands", "remove_at_symbols", "remove_underscores",
+            "remove_commas", "remove_single_quotes", "remove_double_quotes", "remove_colons", "remove_semicolons",
+            "remove_percents", "remove_carets", "remove_parenthesis", "remove_hashtags", "remove_dollar_signs",
+            "remove_asterisks", "remove_plus_signs", "remove_equal_signs", "remove_curly_braces",
+            "remove_square_brackets", "remove_pipes", "remove_backslashes", "remove_angle_brackets",
+            "remove_question_marks", "title_the_name", "replace_custom_text", "artist_identifier",
+            "remove_artist_duplicates_from_filename", "remove_word_duplicates_from_filename",
+            "remove_extra_whitespace", "add_prefix", "add_suffix", "get_non_conflicting_filename",
+            # File Renamer
+            "gather_and_sort", "construct_new_name", "suggest_output_directory", "artist_search",
+            "handle_rename_success",
+            # Video Editor
+            "get_video_duration", "rotate_video", "increase_volume", "normalize_audio",
+            "trim_video")
+
+        # Initialize the list of open windows for selection_window
+        self.open_windows = []
+
+        """Threading"""
+        self.name_processing_thread_single = ""
+        self.name_processing_thread_multiple = ""
+        self.video_processing_thread = ""
+        self.background_move_thread = None
+        # Bulk trash workers and their interrupt flags, per frame
+        self.trash_threads = {}
+        self.trash_cancel_events = {"file_renamer_window": threading.Event(),
+                                    "name_normalizer_window": threading.Event()}
+
+        # File Renamer background task (one rename at a time; the job holds the settings snapshot of the rename)
+        self.file_renamer_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1,
+                                                                           thread_name_prefix="file_renamer_window")
+        self.file_renamer_future = None
+        self.file_renamer_job = None
+
+        # Flag to indicate whether processing should be interrupted
+        self.interrupt_name_processing_thread_var = False
+        self.interrupt_video_processing_thread_var = False
+
+        """Tab Names"""
+        # List of tab names for the add_remove_tabview
+        self.add_remove_tab_names = ["Artist", "Category", "Custom Tab Name", "Custom Text to Replace", "Exclude",
+                                     "File Extensions", "NO GO", "Valid Extensions"]
+
+        # List of tab names for the settings_tabview
+        self.settings_tab_names = ["Appearance", "Artist", "Logging", "Misc", "Messaging", "Reminders", "Tabs"]
+
+        # Initialize buttons
+        self.cat_tabview = None
+        self.buttons = None
+        self.most_buttons = None
+        self.all_buttons = None
+
+        # Initialize the category search index and the reusable result buttons
+        self.category_search_index = None
+        self.category_search_results = []
+        self.category_search_buttons = []
+
+        # Initialize Main GUI elements
+        # Housekeeping Note: Some attributes are initialized as None and later assigned specific GUI elements
+        self.navigation_frame = None
+        self.navigation_frame_label = None
+        self.file_renamer_button = None
+        self.name_normalizer_button = None
+        self.video_editor_button = None
+        self.add_remove_button = None
+        self.settings_button = None
 
         # Initialize File Renamer GUI elements
         self.file_renamer_frame = None
@@ -458,3985 +1790,5845 @@ class OCDFileRenamer(ctk.CTk, TkinterDnD.DnDWrapper):
         self.file_renamer_scrollable_frame_window = None
         self.file_renamer_top_frame = None
         self.browse_file_button = None
+        self.browse_batch_button = None
         self.file_display_text = None
         self.file_display_entry = None
         self.name_length_text = None
         self.name_length_label = None
         self.cat_button_frame = None
+        self.category_search_frame = None
+        self.category_search_entry = None
+        self.category_search_results_frame = None
         self.custom_text_frame = None
 
-        self.output_directory_browse_button = None
-        self.output_directory_entry = None
-        self.prefix_text_entry = None
-        self.custom_text_entry = None
-        self.rename_button = None
-        self.button_group_frame = None
-        self.undo_button = None
-        self.undo_file_rename_button = None
-        self.clear_button = None
-        self.trash_button = None
-        self.file_renamer_last_used_file_button = None
-        self.last_used_frame = None
-        self.last_used_display_label = None
-        self.last_used_display = None
-        self.file_renamer_message_label_frame = None
-        self.file_renamer_message_label = None
-        self.folder_operations_frame = None
-        self.reset_output_directory_switch = None
-        self.suggest_output_directory_switch = None
-        self.move_up_directory_switch = None
-        self.move_text_switch = None
-        self.artist_common_categories_switch = None
-        self.send_to_module_frame = None
-        self.send_to_video_editor_button = None
-        self.send_to_name_normalizer_button = None
-        self.placement_frame = None
-        self.placement_label = None
-        self.placement_choice = None
-        self.prefix_radio = None
-        self.special_character_radio = None
-        self.suffix_radio = None
+        self.output_directory_browse_button = None
+        self.output_directory_entry = None
+        self.prefix_text_entry = None
+        self.custom_text_entry = None
+        self.rename_button = None
+        self.button_group_frame = None
+        self.undo_button = None
+        self.undo_file_rename_button = None
+        self.clear_button = None
+        self.trash_button = None
+        self.file_renamer_last_used_file_button = None
+        self.interrupt_button2 = None
+        self.last_used_frame = None
+        self.last_used_display_label = None
+        self.last_used_display = None
+        self.file_renamer_message_label_frame = None
+        self.file_renamer_message_label = None
+        self.file_renamer_progressbar_frame = None
+        self.progressbar2 = "file_renamer_progressbar"
+        self.folder_operations_frame = None
+        self.reset_output_directory_switch = None
+        self.suggest_output_directory_switch = None
+        self.move_up_directory_switch = None
+        self.move_text_switch = None
+        self.artist_common_categories_switch = None
+        self.send_to_module_frame = None
+        self.send_to_video_editor_button = None
+        self.send_to_name_normalizer_button = None
+        self.placement_frame = None
+        self.placement_label = None
+        self.placement_choice = None
+        self.prefix_radio = None
+        self.special_character_radio = None
+        self.suffix_radio = None
+
+        # Initialize Name Normalizer GUI elements
+        self.name_normalizer_frame = None
+        self.name_normalizer_top_frame = None
+        self.name_normalizer_label = None
+        self.checkbox_frame1 = None
+        self.nn_browse_button = None
+        self.nn_display_text = None
+        self.nn_path_entry = None
+        self.tail_checkbox = None
+        self.remove_all_symbols_checkbox = None
+        self.remove_most_symbols_checkbox = None
+        self.remove_non_ascii_symbols_checkbox = None
+        self.remove_numbers_checkbox = None
+        self.checkbox_frame2 = None
+        self.remove_dash_checkbox = None
+        self.remove_endash_checkbox = None
+        self.remove_emdash_checkbox = None
+        self.remove_hashtag_checkbox = None
+        self.checkbox_frame3 = None
+        self.remove_ampersand_checkbox = None
+        self.remove_at_checkbox = None
+        self.remove_underscore_checkbox = None
+        self.remove_comma_checkbox = None
+        self.remove_dollar_checkbox = None
+        self.checkbox_frame4 = None
+        self.title_checkbox = None
+        self.remove_single_quote_checkbox = None
+        self.remove_double_quote_checkbox = None
+        self.remove_colon_checkbox = None
+        self.remove_semicolon_checkbox = None
+        self.remove_percent_checkbox = None
+        self.remove_caret_checkbox = None
+        self.checkbox_frame5 = None
+        self.remove_asterisk_checkbox = None
+        self.remove_parenthesis_checkbox = None
+        self.remove_plus_checkbox = None
+        self.remove_equal_checkbox = None
+        self.remove_curly_brace_checkbox = None
+        self.remove_square_bracket_checkbox = None
+        self.checkbox_frame6 = None
+        self.remove_pipe_checkbox = None
+        self.remove_backslash_checkbox = None
+        self.remove_angle_bracket_checkbox = None
+        self.remove_question_mark_checkbox = None
+        self.checkbox_frame7 = None
+        self.remove_parenthesis_trail_checkbox = None
+        self.remove_hashtag_trail_checkbox = None
+        self.replace_custom_text_checkbox = None
+        self.replace_mode_switch = None
+        self.remove_extra_whitespace_checkbox = None
+        self.artist_identifier_checkbox = None
+        self.deep_walk_checkbox = None
+        self.reset_nn_checkbox = None
+        self.string_frame = None
+        self.prefix_label = None
+        self.prefix_entry = None
+        self.suffix_label = None
+        self.suffix_entry = None
+        self.replace_label = None
+        self.original_entry = None
+        self.replace_entry = None
+        self.output_directory_frame = None
+        self.browse_move_directory_button = None
+        self.move_directory_entry = None
+        self.custom_text_label = None
+        self.custom_text_removal_entry = None
+        self.normalize_folder_frame = None
+        self.interrupt_button = None
+        self.normalize_button = None
+        self.find_duplicates_button = None
+        self.send_to_module_frame1 = None
+        self.send_to_file_renamer_button1 = None
+        self.send_to_video_editor_button1 = None
+        self.clear_name_normalizer_selection_button = None
+        self.undo_nn_button = None
+        self.name_normalizer_last_used_file_button = None
+        self.name_normalizer_message_label_frame = None
+        self.name_normalizer_message_label = None
+        self.slider_progressbar_frame = None
+        self.progressbar = "name_normalizer_progressbar"
+        self.nn_output_tabview = None
+        self.name_normalizer_log_textbox = None
+        self.nn_preview_textbox = None
+        self.nn_preview_controls_frame = None
+        self.nn_preview_previous_button = None
+        self.nn_preview_page_label = None
+        self.nn_preview_next_button = None
+        self.nn_preview_counts_label = None
+
+        # Initialize Video Editor GUI elements
+        self.video_editor_frame = None
+        self.video_editor_top_frame = None
+        self.video_editor_label = None
+        self.browse_input_method_button = None
+        self.input_method_entry = None
+        self.rotation_frame = None
+        self.rotation_label = None
+        self.rotation_var = None
+        self.left_radio = None
+        self.right_radio = None
+        self.flip_radio = None
+        self.mirror_radio = None
+        self.no_rotation_radio = None
+        self.decibel_frame = None
+        self.decibel_label = None
+        self.decibel_var = None
+        self.decibel_entry = None
+        self.audio_normalization_frame = None
+        self.audio_normalization_label = None
+        self.audio_normalization_var = None
+        self.audio_normalization_entry = None
+        self.trim_frame = None
+        self.trim_label = None
+        self.hour_var = None
+        self.hour_entry = None
+        self.colon_label = None
+        self.minute_var = None
+        self.minute_entry = None
+        self.colon_label1 = None
+        self.second_var = None
+        self.second_entry = None
+        self.trim_label1 = None
+        self.hour_var1 = None
+        self.hour_entry1 = None
+        self.colon_label2 = None
+        self.minute_var1 = None
+        self.minute_entry1 = None
+        self.colon_label3 = None
+        self.second_var1 = None
+        self.second_entry1 = None
+        self.video_editor_output_directory_frame = None
+        self.browse_video_editor_output_directory_button = None
+        self.video_editor_output_directory_entry = None
+        self.process_video_editor_frame = None
+        self.clear_video_editor_values_button = None
+        self.clear_video_editor_entries_button = None
+        self.video_editor_last_used_file_button = None
+        self.interrupt_button1 = None
+        self.process_video_edits_button = None
+        self.video_editor_checkbox_frame = None
+        self.remove_successful_lines_switch = None
+        self.validate_entries_switch = None
+        self.preview_mode_switch = None
+        self.reset_video_switch = None
+        self.video_editor_message_label_frame = None
+        self.video_editor_message_label = None
+        self.send_to_module_frame2 = None
+        self.send_to_file_renamer_button = None
+        self.send_to_name_normalizer_button1 = None
+        self.slider_progressbar_frame1 = None
+        self.progressbar1 = "video_editor_progressbar"
+        self.video_editor_log_textbox = None
+
+        # Initialize Add/Remove GUI elements
+        self.add_remove_frame = None
+        self.add_remove_label = None
+        self.add_remove_tabview = None
+        self.add_remove_artist_top_frame = None
+        self.add_remove_artist_label_frame = None
+        self.add_remove_artist_label = None
+        self.add_remove_artist_entry_frame = None
+        self.add_artist_button = None
+        self.add_artist_entry = None
+        self.remove_artist_button = None
+        self.remove_artist_entry = None
+        self.auto_add_acc_record_frame = None
+        self.auto_add_acc_record_checkbox = None
+        self.add_remove_acc_record_label_frame = None
+        self.add_remove_acc_record_label = None
+        self.add_remove_acc_record_entry_frame = None
+        self.add_acc_record_button = None
+        self.add_acc_record_entry = None
+        self.remove_acc_record_button = None
+        self.remove_acc_record_entry = None
+        self.add_remove_acc_label_frame = None
+        self.add_remove_acc_label = None
+        self.acc_browse_frame = None
+        self.browse_artist_button = None
+        self.acc_display_text = None
+        self.acc_display_entry = None
+        self.detect_artist_button = None
+        self.add_remove_acc_entry_frame = None
+        self.add_acc_button = None
+        self.add_acc_entry = None
+        self.remove_acc_button = None
+        self.remove_acc_entry = None
+        self.category_frame = None
+        self.add_category_button = None
+        self.category_entry = None
+        self.weight_label = None
+        self.weight_var = None
+        self.weight_entry = None
+        self.remove_category_button = None
+        self.remove_category_entry = None
+        self.ctn_frame = None
+        self.add_ctn_button = None
+        self.custom_tab_name_entry = None
+        self.weight_label1 = None
+        self.weight_var1 = None
+        self.weight_entry1 = None
+        self.remove_ctn_button = None
+        self.remove_custom_tab_name_entry = None
+        self.ctr_entry_frame = None
+        self.add_ctr_button = None
+        self.add_ctr_name_entry = None
+        self.replacement_label = None
+        self.replacement_text_entry = None
+        self.remove_ctr_button = None
+        self.remove_ctr_name_entry = None
+        self.exclude_entry_frame = None
+        self.add_exclude_button = None
+        self.add_exclude_name_entry = None
+        self.remove_exclude_button = None
+        self.remove_exclude_name_entry = None
+        self.file_extension_entry_frame = None
+        self.add_file_extension_button = None
+        self.add_file_extension_entry = None
+        self.remove_file_extension_button = None
+        self.remove_file_extension_entry = None
+        self.no_go_entry_frame = None
+        self.add_no_go_button = None
+        self.add_no_go_name_entry = None
+        self.remove_no_go_button = None
+        self.remove_no_go_name_entry = None
+        self.valid_extension_entry_frame = None
+        self.add_valid_extension_button = None
+        self.add_valid_extension_entry = None
+        self.remove_valid_extension_button = None
+        self.remove_valid_extension_entry = None
+        self.clear_add_remove_frame = None
+        self.clear_add_remove_button = None
+        self.reset_add_remove_frame = None
+        self.reset_add_remove_switch = None
+        self.add_remove_message_label_frame = None
+        self.add_remove_message_label = None
+
+        # Initialize Settings GUI elements
+        self.settings_frame = None
+        self.settings_label = None
+        self.settings_tabview = None
+        self.remove_duplicates_switch = None
+        self.duplicate_removal_label = None
+        self.remove_word_duplicates_switch = None
+        self.artist_switch_frame = None
+        self.artist_search_label = None
+        self.artist_search_switch = None
+        self.ignore_known_artists_switch = None
+        self.artist_identifier_label = None
+        self.misc_frame = None
+        self.file_ops_switch_frame = None
+        self.open_on_file_drop_switch = None
+        self.reminders_frame = None
+        self.double_check_switch = None
+        self.logging_switch_frame = None
+        self.activate_logging_switch = None
+        self.suppress_switch = None
+        self.json_logging_switch = None
+        self.show_messageboxes_switch = None
+        self.confirmation_frame = None
+        self.show_confirmation_messageboxes_switch = None
+        self.fallback_confirmation_label = None
+        self.true_radio = None
+        self.false_radio = None
+        self.truncate_text_switch = None
+        self.tab_name_frame = None
+        self.use_custom_tab_names_switch = None
+        self.sort_tab_names_switch = None
+        self.sort_tab_names_reverse_switch = None
+        self.fuzzy_category_search_switch = None
+        self.render_category_buttons_switch = None
+        self.gui_settings_frame = None
+        self.appearance_mode_label = None
+        self.appearance_mode_menu = None
+        self.scaling_label = None
+        self.scaling_optionemenu = None
+        self.master_entry_frame = None
+        self.initial_directory_frame = None
+        self.browse_initial_directory_button = None
+        self.initial_directory_entry = None
+        self.browse_initial_output_directory_button = None
+        self.initial_output_directory_entry = None
+        self.double_check_reminder_directory_frame = None
+        self.browse_reminder_directory_button = None
+        self.double_check_reminder_directory_entry = None
+        self.browse_no_go_directory_button = None
+        self.no_go_reminder_directory_entry = None
+        self.open_artist_file_button = None
+        self.artist_directory_frame = None
+        self.browse_artist_directory_button = None
+        self.artist_directory_entry = None
+        self.browse_artist_file_button = None
+        self.artist_file_entry = None
+        self.configuration_file_frame = None
+        self.open_configuration_file_button = None
+        self.configuration_file_entry = None
+        self.dictionary_file_frame = None
+        self.open_dictionary_file_button = None
+        self.dictionary_file_entry = None
+        self.open_log_file_button = None
+        self.log_file_entry = None
+        self.logging_browse_frame = None
+        self.logging_frame = None
+        self.artist_frame = None
+        self.artist_browse_frame = None
+
+        # Enable drag-and-drop functionality for files
+        self.drop_target_register(DND_FILES)
+        self.dnd_bind('<<Drop>>', self.on_file_drop)
+
+        # Initial check for activate logging state prior to application launch
+        self.handle_logging_activation()
+
+        # Initial check for the stage profiling state prior to application launch
+        self.handle_profiling_activation()
+
+        # Register the cleanup method to be called on program exit
+        atexit.register(self.cleanup_on_exit)
+
+        # Initialize frame name to default frame
+        self.frame_name = self.default_frame
+
+        # Initialize the json file dictionaries
+        self.initialize_json()
+
+        # Create the GUI elements
+        self.create_gui()
+
+        # Open the persistent rename history (after the GUI so failures can be displayed)
+        self.initialize_history()
+
+        # Start draining UI events posted by worker threads
+        self.after(self.ui_event_interval_ms, self.process_ui_events)
+
+        # Select default frame
+        self.select_frame_by_name(self.default_frame)
+
+        # Set scaling at the start
+        self.change_scaling_event(self.scaling)
+
+    def create_gui(self):
+        # Set up grid layout with 1 row and 2 columns, configuring weights for resizing
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(1, weight=1)
+
+        # Create navigation frame (Buttons on the left hand side)
+        self.navigation_frame = ctk.CTkFrame(self, corner_radius=0)
+        self.navigation_frame.grid(row=0, column=0, sticky="nsew")
+        self.navigation_frame.grid_rowconfigure(5, weight=1)  # Index number is responsible for floating
+
+        # Create label for the navigation frame
+        self.navigation_frame_label = ctk.CTkLabel(self.navigation_frame, text="  O.C.D. \nFile Editor",
+                                                   compound="left",
+                                                   font=ctk.CTkFont(size=15, weight="bold"))
+        self.navigation_frame_label.grid(row=0, column=0, padx=5, pady=5)
+
+        # Create file renamer button with specific styling and command
+        self.file_renamer_button = ctk.CTkButton(self.navigation_frame, corner_radius=0, height=40, border_spacing=10,
+                                                 text="File Renamer",
+                                                 fg_color="transparent", text_color=("gray10", "gray90"),
+                                                 hover_color=("gray70", "gray30"),
+                                                 anchor="w", command=self.file_renamer_button_event)
+        self.file_renamer_button.grid(row=1, column=0, sticky="ew")
+
+        # Create button for Name Normalizer with specific styling and command
+        self.name_normalizer_button = ctk.CTkButton(self.navigation_frame, corner_radius=0, height=40,
+                                                    border_spacing=10, text="Name Normalizer",
+                                                    fg_color="transparent", text_color=("gray10", "gray90"),
+                                                    hover_color=("gray70", "gray30"),
+                                                    anchor="w",
+                                                    command=self.name_normalizer_button_event)
+        self.name_normalizer_button.grid(row=2, column=0, sticky="ew")
+
+        # Create button for Video Editor with specific styling and command
+        self.video_editor_button = ctk.CTkButton(self.navigation_frame, corner_radius=0, height=40,
+                                                 border_spacing=10, text="Video Editor",
+                                                 fg_color="transparent", text_color=("gray10", "gray90"),
+                                                 hover_color=("gray70", "gray30"),
+                                                 anchor="w",
+                                                 command=self.video_editor_button_event)
+        self.video_editor_button.grid(row=3, column=0, sticky="ew")
+
+        # Create Add/Remove button with specific styling and command
+        self.add_remove_button = ctk.CTkButton(self.navigation_frame, corner_radius=0, height=40, border_spacing=10,
+                                               text="Add/Remove",
+                                               fg_color="transparent", text_color=("gray10", "gray90"),
+                                               hover_color=("gray70", "gray30"),
+                                               anchor="w",
+                                               command=self.add_remove_button_event)
+        self.add_remove_button.grid(row=4, column=0, sticky="ew")
+
+        # Create Settings button with specific styling and command
+        self.settings_button = ctk.CTkButton(self.navigation_frame, corner_radius=0, height=40, border_spacing=10,
+                                             text="Settings",
+                                             fg_color="transparent", text_color=("gray10", "gray90"),
+                                             hover_color=("gray70", "gray30"),
+                                             anchor="w",
+                                             command=self.settings_button_event)
+        self.settings_button.grid(row=5, column=0, sticky="ew")
+
+        """
+        file_renamer_window
+        """
+        # Create file renamer frame
+        self.file_renamer_frame = ctk.CTkFrame(self, corner_radius=0, fg_color="transparent")
+        self.file_renamer_frame.grid(row=0, column=1, sticky="nsew")
+        self.file_renamer_frame.grid_columnconfigure(0, weight=1)
+        self.file_renamer_frame.grid_rowconfigure(0, weight=1)
+
+        # Create a canvas and a scrollbar
+        self.file_renamer_canvas = ctk.CTkCanvas(self.file_renamer_frame, highlightthickness=0)
+        self.file_renamer_scrollbar = ctk.CTkScrollbar(self.file_renamer_frame, command=self.file_renamer_canvas.yview)
+        self.file_renamer_canvas.configure(yscrollcommand=self.file_renamer_scrollbar.set)
+
+        # Set default background color based on system mode
+        self.update_background_color()
+
+        # Place the canvas and the scrollbar in the grid
+        self.file_renamer_canvas.grid(row=0, column=0, sticky="nsew")
+        self.file_renamer_scrollbar.grid(row=0, column=1, sticky="ns")
+
+        # Create a frame inside the canvas for scrollable content
+        self.file_renamer_scrollable_frame = ctk.CTkFrame(self.file_renamer_canvas, corner_radius=0,
+                                                          bg_color="transparent")
+        self.file_renamer_scrollable_frame_window = (self.file_renamer_canvas.create_window(
+            (0, 0),
+            window=self.file_renamer_scrollable_frame,
+            anchor="nw"))
+
+        # Bind canvas and frame for scrolling functionality
+        self.file_renamer_canvas.bind('<Configure>', self.on_canvas_configure)
+        self.file_renamer_scrollable_frame.bind('<Configure>', self.on_frame_configure)
+
+        # Top frame in the file renamer window
+        self.file_renamer_top_frame = ctk.CTkFrame(self.file_renamer_scrollable_frame, corner_radius=0,
+                                                   fg_color="transparent")
+        self.file_renamer_top_frame.grid(row=0, column=0, padx=10, pady=10)
+
+        # Browse file button
+        self.browse_file_button = ctk.CTkButton(self.file_renamer_top_frame, text="Browse File",
+                                                command=self.browse_input)
+        self.browse_file_button.grid(row=0, column=0, padx=5)
+
+        # Selected File Display
+        self.file_display_text = ctk.StringVar()
+        self.file_display_text.set("Select a file using the 'Browse File' button or drag and drop it into the "
+                                   "program...")
+        self.file_display_entry = ctk.CTkEntry(self.file_renamer_top_frame, width=850,
+                                               textvariable=self.file_display_text)
+        self.file_display_entry.grid(row=0, column=1, padx=5)
+
+        # Name Length Display
+        self.name_length_text = ctk.IntVar()
+        self.name_length_label = ctk.CTkLabel(self.file_renamer_top_frame, textvariable=self.name_length_text)
+        self.name_length_label.grid(row=0, column=2, padx=5)
+
+        # Browse batch button (several files, or a folder's files)
+        self.browse_batch_button = ctk.CTkButton(self.file_renamer_top_frame, text="Browse Batch",
+                                                 command=self.browse_batch)
+        self.browse_batch_button.grid(row=0, column=3, padx=5)
+
+        # Categories button frame
+        self.cat_button_frame = ctk.CTkFrame(self.file_renamer_scrollable_frame,
+                                             corner_radius=0, fg_color="transparent")
+        self.cat_button_frame.grid(row=1, column=0, padx=10, pady=5)
+
+        # Category search frame above the cat_tabview
+        self.category_search_frame = ctk.CTkFrame(self.cat_button_frame, corner_radius=0, fg_color="transparent")
+        self.category_search_frame.grid(row=0, column=0, padx=5, pady=(5, 0), sticky="w")
+
+        # Category search entry
+        self.category_search_entry = ctk.CTkEntry(self.category_search_frame, width=250,
+                                                  placeholder_text="Search categories...")
+        self.category_search_entry.grid(row=0, column=0, padx=5, pady=5)
+
+        # Bind the search to each keystroke, Enter to queue the top result and Escape to clear the search
+        self.category_search_entry.bind("<KeyRelease>", self.update_category_search)
+        self.category_search_entry.bind("<Return>", self.queue_top_category_search_result)
+        self.category_search_entry.bind("<Escape>", self.clear_category_search)
+
+        # Frame holding the category search result buttons
+        self.category_search_results_frame = ctk.CTkFrame(self.category_search_frame, corner_radius=0,
+                                                          fg_color="transparent")
+        self.category_search_results_frame.grid(row=0, column=1, padx=5, pady=5)
+
+        # Create the result buttons once and reuse them on every keystroke (gridded only when needed)
+        self.category_search_buttons = [ctk.CTkButton(self.category_search_results_frame, text="")
+                                        for _ in range(self.column_numbers)]
+
+        # Create a cat_tabview and initialize category buttons on cat_button_frame
+        self.create_cat_tabview()
+
+        # Frame to group custom text entry and output directory
+        self.custom_text_frame = ctk.CTkFrame(self.file_renamer_scrollable_frame, corner_radius=0,
+                                              fg_color="transparent")
+        self.custom_text_frame.grid(row=2, column=0, padx=10)
+
+        # Output Directory Browse Button
+        self.output_directory_browse_button = ctk.CTkButton(self.custom_text_frame,
+                                                            text="Output Directory",
+                                                            command=self.browse_output_directory)
+        self.output_directory_browse_button.grid(row=0, column=0, padx=5, pady=5)
+
+        # Output Directory Entry
+        self.output_directory_entry = ctk.CTkEntry(self.custom_text_frame, width=340)
+        self.output_directory_entry.grid(row=0, column=1, padx=5, pady=5)
+
+        # Prefix Text Entry
+        self.prefix_text_entry = ctk.CTkEntry(self.custom_text_frame, width=70)
+        self.prefix_text_entry.insert(0, "Prefix...")
+        self.prefix_text_entry.grid(row=0, column=2, padx=10, pady=10)
+
+        # Bind the debounced update_file_display function to the prefix text entry change event
+        self.prefix_text_entry.bind("<KeyRelease>", self.schedule_file_display_update)
+
+        # Custom Text Entry
+        self.custom_text_entry = ctk.CTkEntry(self.custom_text_frame, width=290)
+        self.custom_text_entry.insert(0, "Enter your custom text here...")
+        self.custom_text_entry.grid(row=0, column=3, padx=10, pady=10)
+
+        # Bind the debounced update_file_display function to the custom text entry change event
+        self.custom_text_entry.bind("<KeyRelease>", self.schedule_file_display_update)
+
+        # Rename File Button
+        self.rename_button = ctk.CTkButton(self.custom_text_frame, text="Rename",
+                                           command=self.rename_files)
+        self.rename_button.grid(row=0, column=4, padx=5, pady=5)
+
+        # Frame to group miscellaneous buttons
+        self.button_group_frame = ctk.CTkFrame(self.file_renamer_scrollable_frame, corner_radius=0,
+                                               fg_color="transparent")
+        self.button_group_frame.grid(row=3, column=0, padx=10)
+
+        # Undo Button
+        self.undo_button = ctk.CTkButton(self.button_group_frame, text="Undo", command=self.undo_last)
+        self.undo_button.grid(row=0, column=0, padx=10, pady=10)
+
+        # Undo File Rename Button
+        self.undo_file_rename_button = ctk.CTkButton(self.button_group_frame,
+                                                     text="Undo File Rename",
+                                                     command=self.undo_file_rename)
+        self.undo_file_rename_button.grid(row=0, column=1, padx=10, pady=10)
+
+        # Clear Button
+        self.clear_button = ctk.CTkButton(self.button_group_frame, text="Clear",
+                                          command=lambda: self.clear_selection(frame_name="file_renamer_window"))
+        self.clear_button.grid(row=0, column=2, padx=10, pady=10)
+
+        # Move to Trash Button
+        self.trash_button = ctk.CTkButton(self.button_group_frame, text="Move to Trash",
+                                          command=self.move_file_to_trash)
+        self.trash_button.grid(row=0, column=3, padx=10, pady=10)
+
+        # Select File Renamer Last Used File Button
+        self.file_renamer_last_used_file_button = ctk.CTkButton(self.button_group_frame, text="Reload Last File",
+                                                                command=self.load_last_used_file)
+        self.file_renamer_last_used_file_button.grid(row=0, column=4, padx=10, pady=10)
+
+        # Interrupt button
+        self.interrupt_button2 = ctk.CTkButton(self.button_group_frame, text="Interrupt",
+                                               command=lambda: self.interrupt_processing("file_renamer_thread"))
+        self.interrupt_button2.grid(row=0, column=5, padx=10, pady=10)
+
+        # Frame to display the last used file
+        self.last_used_frame = ctk.CTkFrame(self.file_renamer_scrollable_frame, corner_radius=0, fg_color="transparent")
+        self.last_used_frame.grid(row=4, column=0, padx=5)
+
+        # Last Used File Label
+        self.last_used_display_label = ctk.CTkLabel(self.last_used_frame, text="Last used file:")
+        self.last_used_display_label.grid(row=0, column=0, padx=5, pady=5)
+
+        # Last Used File Display
+        self.last_used_display = ctk.CTkLabel(self.last_used_frame, text="")
+        self.last_used_display.grid(row=0, column=1, padx=5, pady=5)
+
+        # Frame to display messages
+        self.file_renamer_message_label_frame = ctk.CTkFrame(self.file_renamer_scrollable_frame, corner_radius=0,
+                                                             fg_color="transparent")
+        self.file_renamer_message_label_frame.grid(row=5, column=0, padx=10)
+
+        # Message Label
+        self.file_renamer_message_label = ctk.CTkLabel(self.file_renamer_message_label_frame, text="")
+        self.file_renamer_message_label.grid(row=0, column=0, padx=10, pady=10)
+
+        # Progressbar frame (cross-device moves)
+        self.file_renamer_progressbar_frame = ctk.CTkFrame(self.file_renamer_message_label_frame, corner_radius=0,
+                                                           fg_color="transparent")
+        self.file_renamer_progressbar_frame.grid(row=1, column=0, padx=10)
+        self.file_renamer_progressbar_frame.grid_columnconfigure(0, weight=1)
+
+        # Frame to group placement frame
+        self.placement_frame = ctk.CTkFrame(self.file_renamer_scrollable_frame, corner_radius=0, fg_color="transparent")
+        self.placement_frame.grid(row=6, column=0, padx=10, pady=10)
+
+        # Placement Label
+        self.placement_label = ctk.CTkLabel(self.placement_frame, text="Placement:")
+        self.placement_label.grid(row=0, column=0, padx=10)
+
+        # Variable to track the user's placement choice (prefix, suffix, or special_character)
+        self.placement_choice = ctk.StringVar()
+        self.placement_choice.set(self.default_placement_var)
+
+        # Trace the changes in the StringVar
+        self.placement_choice.trace_add("write", self.update_file_display)
+
+        # Radio button for prefix
+        self.prefix_radio = ctk.CTkRadioButton(self.placement_frame, text="Prefix",
+                                               variable=self.placement_choice,
+                                               value="prefix")
+        self.prefix_radio.grid(row=0, column=1, padx=10)
+
+        # Radio button for special_character
+        self.special_character_radio = ctk.CTkRadioButton(self.placement_frame,
+                                                          text=f"Special Character: {self.special_character_var}",
+                                                          variable=self.placement_choice,
+                                                          value="special_character")
+        self.special_character_radio.grid(row=0, column=2, padx=10)
+
+        # Radio button for suffix
+        self.suffix_radio = ctk.CTkRadioButton(self.placement_frame, text="Suffix",
+                                               variable=self.placement_choice,
+                                               value="suffix")
+        self.suffix_radio.grid(row=0, column=3, padx=10)
+
+        # Frame to group folder operations
+        self.folder_operations_frame = ctk.CTkFrame(self.file_renamer_scrollable_frame, corner_radius=0,
+                                                    fg_color="transparent")
+        self.folder_operations_frame.grid(row=7, column=0, padx=10)
+
+        # Checkbox to enable/disable resetting the Output Directory
+        self.reset_output_directory_switch = ctk.CTkSwitch(self.folder_operations_frame,
+                                                               text="Reset Output Dir.",
+                                                               variable=self.reset_output_directory_var)
+        self.reset_output_directory_switch.grid(row=0, column=0, padx=10, pady=10)
+
+        # Checkbox to enable/disable suggesting an output directory
+        self.suggest_output_directory_switch = ctk.CTkSwitch(self.folder_operations_frame, text="Suggest Output "
+                                                                                                    "Dir.",
+                                                                 variable=self.suggest_output_directory_var)
+        self.suggest_output_directory_switch.grid(row=0, column=1, padx=5, pady=5)
+
+        # Checkbox to enable/disable moving the file up one folder
+        self.move_up_directory_switch = ctk.CTkSwitch(self.folder_operations_frame, text="Move Up One Dir.",
+                                                          variable=self.move_up_directory_var)
+        self.move_up_directory_switch.grid(row=0, column=2, padx=5, pady=5)
+
+        # Checkbox to enable/disable move text between - and __-__
+        self.move_text_switch = ctk.CTkSwitch(self.folder_operations_frame, text="Move Text",
+                                                  variable=self.move_text_var)
+        self.move_text_switch.grid(row=0, column=3, padx=5, pady=5)
+
+        # Checkbox to enable/disable add artist common categories
+        self.artist_common_categories_switch = ctk.CTkSwitch(self.folder_operations_frame,
+                                                                 text="Add Artist Common Categories",
+                                                                 variable=self.artist_common_categories_var)
+        self.artist_common_categories_switch.grid(row=0, column=4, padx=5, pady=5)
+
+        # Bind the callback function to the artist_common_categories_var variable
+        self.artist_common_categories_var.trace_add("write", self.handle_common_categories_state)
+
+        # Send to Module frame
+        self.send_to_module_frame = ctk.CTkFrame(self.file_renamer_scrollable_frame,
+                                                 corner_radius=0,
+                                                 fg_color="transparent")
+        self.send_to_module_frame.grid(row=8, column=0, padx=5)
+
+        # Send to Video Editor button
+        self.send_to_video_editor_button = ctk.CTkButton(self.send_to_module_frame, text="Send to Video Editor",
+                                                         command=lambda: self.send_to_module(
+                                                             destination="video_editor_module"))
+        self.send_to_video_editor_button.grid(row=0, column=0, padx=10, pady=10)
+
+        # Send to Name Normalizer button
+        self.send_to_name_normalizer_button = ctk.CTkButton(self.send_to_module_frame,
+                                                            text="Send to Name Normalizer",
+                                                            command=lambda: self.send_to_module(
+                                                                destination="name_normalizer_module"))
+        self.send_to_name_normalizer_button.grid(row=0, column=1, padx=10, pady=10)
+
+        """
+        name_normalizer_window
+        """
+        # Create Name Normalizer frame
+        self.name_normalizer_frame = ctk.CTkFrame(self, corner_radius=0, fg_color="transparent")
+        self.name_normalizer_frame.grid_columnconfigure(0, weight=1)
+
+        # Name Normalizer Label
+        self.name_normalizer_label = ctk.CTkLabel(self.name_normalizer_frame, text="Name Normalizer",
+                                                  font=ctk.CTkFont(size=15, weight="bold"))
+        self.name_normalizer_label.grid(row=0, column=0, padx=10, pady=10)
+
+        # Name Normalizer Top frame
+        self.name_normalizer_top_frame = ctk.CTkFrame(self.name_normalizer_frame, corner_radius=0,
+                                                      fg_color="transparent")
+        self.name_normalizer_top_frame.grid(row=1, column=0, padx=10, pady=5)
+
+        # Browse button
+        self.nn_browse_button = ctk.CTkButton(self.name_normalizer_top_frame, text="Browse",
+                                              command=self.browse_input)
+        self.nn_browse_button.grid(row=0, column=0, padx=5, pady=5)
+
+        # Name Normalizer Display
+        self.nn_display_text = ctk.StringVar()
+        self.nn_display_text.set("Select a folder or file to normalize using the 'Browse' button...")
+        self.nn_path_entry = ctk.CTkEntry(self.name_normalizer_top_frame, width=890, textvariable=self.nn_display_text)
+        self.nn_path_entry.grid(row=0, column=1, padx=10, pady=10)
+
+        # Button Frame 1
+        self.checkbox_frame1 = ctk.CTkFrame(self.name_normalizer_frame, corner_radius=0,
+                                            fg_color="transparent")
+        self.checkbox_frame1.grid(row=2, column=0, padx=10, pady=5)
+
+        # Checkbox to enable/disable Artist Identifier
+        self.artist_identifier_checkbox = ctk.CTkCheckBox(self.checkbox_frame1,
+                                                          text="Artist Identifier",
+                                                          variable=self.artist_identifier_var)
+        self.artist_identifier_checkbox.grid(row=0, column=0, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.artist_identifier_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable remove all symbols ,;:@$%^&#*+=(){}[]|\<>'"?_-–—
+        self.remove_all_symbols_checkbox = ctk.CTkCheckBox(self.checkbox_frame1,
+                                                           text="Remove all symbols",
+                                                           variable=self.remove_all_symbols_var)
+        self.remove_all_symbols_checkbox.grid(row=0, column=1, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_all_symbols_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable remove most symbols ,;:@$%^&*+={}[]|\<>"?-–—
+        self.remove_most_symbols_checkbox = ctk.CTkCheckBox(self.checkbox_frame1,
+                                                            text="Remove most symbols",
+                                                            variable=self.remove_most_symbols_var)
+        self.remove_most_symbols_checkbox.grid(row=0, column=2, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_most_symbols_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable remove non-ascii symbols
+        self.remove_non_ascii_symbols_checkbox = ctk.CTkCheckBox(self.checkbox_frame1,
+                                                                 text="Remove non-ASCII symbols",
+                                                                 variable=self.remove_non_ascii_symbols_var)
+        self.remove_non_ascii_symbols_checkbox.grid(row=0, column=3, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_non_ascii_symbols_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable remove numbers
+        self.remove_numbers_checkbox = ctk.CTkCheckBox(self.checkbox_frame1,
+                                                       text="Remove numbers",
+                                                       variable=self.remove_number_var)
+        self.remove_numbers_checkbox.grid(row=0, column=4, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_number_var.trace_add("write", self.update_nn_display)
+
+        # Button Frame 2
+        self.checkbox_frame2 = ctk.CTkFrame(self.name_normalizer_frame, corner_radius=0,
+                                            fg_color="transparent")
+        self.checkbox_frame2.grid(row=3, column=0, padx=10, pady=5)
+
+        # Checkbox to enable/disable remove dashes
+        self.remove_dash_checkbox = ctk.CTkCheckBox(self.checkbox_frame2,
+                                                    text="Remove dashes",
+                                                    variable=self.remove_dash_var)
+        self.remove_dash_checkbox.grid(row=0, column=0, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_dash_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable remove endashes
+        self.remove_endash_checkbox = ctk.CTkCheckBox(self.checkbox_frame2,
+                                                      text="Remove endashes",
+                                                      variable=self.remove_endash_var)
+        self.remove_endash_checkbox.grid(row=0, column=1, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_endash_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable remove emdashes
+        self.remove_emdash_checkbox = ctk.CTkCheckBox(self.checkbox_frame2,
+                                                      text="Remove emdashes",
+                                                      variable=self.remove_emdash_var)
+        self.remove_emdash_checkbox.grid(row=0, column=2, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_emdash_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable remove hashtags
+        self.remove_hashtag_checkbox = ctk.CTkCheckBox(self.checkbox_frame2,
+                                                       text="Remove hashtags",
+                                                       variable=self.remove_hashtag_var)
+        self.remove_hashtag_checkbox.grid(row=0, column=3, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_hashtag_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable remove commas
+        self.remove_comma_checkbox = ctk.CTkCheckBox(self.checkbox_frame2,
+                                                     text="Remove commas",
+                                                     variable=self.remove_comma_var)
+        self.remove_comma_checkbox.grid(row=0, column=4, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_comma_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable remove parenthesis and trailing text
+        self.remove_parenthesis_trail_checkbox = ctk.CTkCheckBox(self.checkbox_frame2,
+                                                                 text="( onward",
+                                                                 variable=self.remove_parenthesis_trail_var)
+        self.remove_parenthesis_trail_checkbox.grid(row=0, column=5, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_parenthesis_trail_var.trace_add("write", self.update_nn_display)
+
+        # Button Frame 3
+        self.checkbox_frame3 = ctk.CTkFrame(self.name_normalizer_frame, corner_radius=0,
+                                            fg_color="transparent")
+        self.checkbox_frame3.grid(row=4, column=0, padx=10, pady=5)
+
+        # Checkbox to enable/disable remove ampersands
+        self.remove_ampersand_checkbox = ctk.CTkCheckBox(self.checkbox_frame3,
+                                                         text="Remove &",
+                                                         variable=self.remove_ampersand_var)
+        self.remove_ampersand_checkbox.grid(row=0, column=0, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_ampersand_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable remove @
+        self.remove_at_checkbox = ctk.CTkCheckBox(self.checkbox_frame3,
+                                                  text="Remove @",
+                                                  variable=self.remove_at_var)
+        self.remove_at_checkbox.grid(row=0, column=1, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_at_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable remove underscores
+        self.remove_underscore_checkbox = ctk.CTkCheckBox(self.checkbox_frame3,
+                                                          text="Remove underscores",
+                                                          variable=self.remove_underscore_var)
+        self.remove_underscore_checkbox.grid(row=0, column=2, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_underscore_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable remove single quotes
+        self.remove_single_quote_checkbox = ctk.CTkCheckBox(self.checkbox_frame3,
+                                                            text="Remove single quotes",
+                                                            variable=self.remove_single_quote_var)
+        self.remove_single_quote_checkbox.grid(row=0, column=3, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_single_quote_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable remove double quotes
+        self.remove_double_quote_checkbox = ctk.CTkCheckBox(self.checkbox_frame3,
+                                                            text="Remove double quotes",
+                                                            variable=self.remove_double_quote_var)
+        self.remove_double_quote_checkbox.grid(row=0, column=4, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_double_quote_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable remove hashtag and trailing text
+        self.remove_hashtag_trail_checkbox = ctk.CTkCheckBox(self.checkbox_frame3,
+                                                             text="# onward",
+                                                             variable=self.remove_hashtag_trail_var)
+        self.remove_hashtag_trail_checkbox.grid(row=0, column=5, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_hashtag_trail_var.trace_add("write", self.update_nn_display)
+
+        # Button Frame 4
+        self.checkbox_frame4 = ctk.CTkFrame(self.name_normalizer_frame, corner_radius=0,
+                                            fg_color="transparent")
+        self.checkbox_frame4.grid(row=5, column=0, padx=10, pady=5)
+
+        # Checkbox to enable/disable remove dollars
+        self.remove_dollar_checkbox = ctk.CTkCheckBox(self.checkbox_frame4,
+                                                      text="Remove dollars",
+                                                      variable=self.remove_dollar_var)
+        self.remove_dollar_checkbox.grid(row=0, column=0, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_dollar_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable remove colons
+        self.remove_colon_checkbox = ctk.CTkCheckBox(self.checkbox_frame4,
+                                                     text="Remove colons",
+                                                     variable=self.remove_colon_var)
+        self.remove_colon_checkbox.grid(row=0, column=1, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_colon_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable semicolons
+        self.remove_semicolon_checkbox = ctk.CTkCheckBox(self.checkbox_frame4,
+                                                         text="Remove semicolons",
+                                                         variable=self.remove_semicolon_var)
+        self.remove_semicolon_checkbox.grid(row=0, column=2, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_semicolon_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable remove percents
+        self.remove_percent_checkbox = ctk.CTkCheckBox(self.checkbox_frame4,
+                                                       text="Remove percents",
+                                                       variable=self.remove_percent_var)
+        self.remove_percent_checkbox.grid(row=0, column=3, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_percent_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable remove carets
+        self.remove_caret_checkbox = ctk.CTkCheckBox(self.checkbox_frame4,
+                                                     text="Remove carets",
+                                                     variable=self.remove_caret_var)
+        self.remove_caret_checkbox.grid(row=0, column=4, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_caret_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable remove plus signs
+        self.remove_plus_checkbox = ctk.CTkCheckBox(self.checkbox_frame4,
+                                                    text="Remove plus signs",
+                                                    variable=self.remove_plus_var)
+        self.remove_plus_checkbox.grid(row=0, column=5, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_plus_var.trace_add("write", self.update_nn_display)
+
+        # Button Frame 5
+        self.checkbox_frame5 = ctk.CTkFrame(self.name_normalizer_frame, corner_radius=0,
+                                            fg_color="transparent")
+        self.checkbox_frame5.grid(row=6, column=0, padx=10, pady=5)
+
+        # Checkbox to enable/disable remove asterisks
+        self.remove_asterisk_checkbox = ctk.CTkCheckBox(self.checkbox_frame5,
+                                                        text="Remove asterisks",
+                                                        variable=self.remove_asterisk_var)
+        self.remove_asterisk_checkbox.grid(row=0, column=0, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_asterisk_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable remove parenthesis
+        self.remove_parenthesis_checkbox = ctk.CTkCheckBox(self.checkbox_frame5,
+                                                           text="Remove parenthesis",
+                                                           variable=self.remove_parenthesis_var)
+        self.remove_parenthesis_checkbox.grid(row=0, column=1, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_parenthesis_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable remove angle brackets
+        self.remove_angle_bracket_checkbox = ctk.CTkCheckBox(self.checkbox_frame5,
+                                                             text="Remove angle brackets",
+                                                             variable=self.remove_angle_bracket_var)
+        self.remove_angle_bracket_checkbox.grid(row=0, column=2, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_angle_bracket_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable remove curly braces
+        self.remove_curly_brace_checkbox = ctk.CTkCheckBox(self.checkbox_frame5,
+                                                           text="Remove curly braces",
+                                                           variable=self.remove_curly_brace_var)
+        self.remove_curly_brace_checkbox.grid(row=0, column=3, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_curly_brace_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable remove square brackets
+        self.remove_square_bracket_checkbox = ctk.CTkCheckBox(self.checkbox_frame5,
+                                                              text="Remove square brackets",
+                                                              variable=self.remove_square_bracket_var)
+        self.remove_square_bracket_checkbox.grid(row=0, column=4, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_square_bracket_var.trace_add("write", self.update_nn_display)
+
+        # Button Frame 6
+        self.checkbox_frame6 = ctk.CTkFrame(self.name_normalizer_frame, corner_radius=0,
+                                            fg_color="transparent")
+        self.checkbox_frame6.grid(row=7, column=0, padx=10, pady=5)
+
+        # Checkbox to enable/disable remove pipes
+        self.remove_pipe_checkbox = ctk.CTkCheckBox(self.checkbox_frame6,
+                                                    text="Remove pipes",
+                                                    variable=self.remove_pipe_var)
+        self.remove_pipe_checkbox.grid(row=0, column=0, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_pipe_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable remove backslashes
+        self.remove_backslash_checkbox = ctk.CTkCheckBox(self.checkbox_frame6,
+                                                         text="Remove backslashes",
+                                                         variable=self.remove_backslash_var)
+        self.remove_backslash_checkbox.grid(row=0, column=1, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_backslash_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable remove equal signs
+        self.remove_equal_checkbox = ctk.CTkCheckBox(self.checkbox_frame6,
+                                                     text="Remove equal signs",
+                                                     variable=self.remove_equal_var)
+        self.remove_equal_checkbox.grid(row=0, column=2, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_equal_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable remove question marks
+        self.remove_question_mark_checkbox = ctk.CTkCheckBox(self.checkbox_frame6,
+                                                             text="Remove question marks",
+                                                             variable=self.remove_question_mark_var)
+        self.remove_question_mark_checkbox.grid(row=0, column=3, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_question_mark_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable remove extra whitespace
+        self.remove_extra_whitespace_checkbox = ctk.CTkCheckBox(self.checkbox_frame6,
+                                                                text="Remove extra whitespace",
+                                                                variable=self.remove_extra_whitespace_var)
+        self.remove_extra_whitespace_checkbox.grid(row=0, column=4, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.remove_extra_whitespace_var.trace_add("write", self.update_nn_display)
+
+        # Button Frame 7
+        self.checkbox_frame7 = ctk.CTkFrame(self.name_normalizer_frame, corner_radius=0,
+                                            fg_color="transparent")
+        self.checkbox_frame7.grid(row=8, column=0, padx=10, pady=5)
+
+        # Checkbox to enable/disable Title the name
+        self.title_checkbox = ctk.CTkCheckBox(self.checkbox_frame7,
+                                              text="Title the name",
+                                              variable=self.title_var)
+        self.title_checkbox.grid(row=0, column=0, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.title_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable replace custom text
+        self.replace_custom_text_checkbox = ctk.CTkCheckBox(self.checkbox_frame7,
+                                                            text="Replace custom text",
+                                                            variable=self.replace_custom_text_var)
+        self.replace_custom_text_checkbox.grid(row=0, column=1, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.replace_custom_text_var.trace_add("write", self.update_nn_display)
+
+        # Switch to enable/disable replace mode (case-sensitive vs case-insensitive)
+        self.replace_mode_switch = ctk.CTkSwitch(self.checkbox_frame7, text="Case-sensitive "
+                                                                            "/ Case-insensitive",
+                                                 variable=self.replace_mode_var)
+        self.replace_mode_switch.grid(row=0, column=2, padx=10)
+
+        # Trace the changes in the variable
+        self.replace_mode_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable include subdirectories
+        self.deep_walk_checkbox = ctk.CTkCheckBox(self.checkbox_frame7,
+                                                  text="Include subdirectories",
+                                                  variable=self.deep_walk_var)
+        self.deep_walk_checkbox.grid(row=0, column=3, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.deep_walk_var.trace_add("write", self.update_nn_display)
+
+        # Checkbox to enable/disable reset Name Normalizer entries
+        self.reset_nn_checkbox = ctk.CTkCheckBox(self.checkbox_frame7,
+                                                 text="Reset entries",
+                                                 variable=self.reset_nn_var)
+        self.reset_nn_checkbox.grid(row=0, column=4, padx=10, pady=10)
+
+        # Trace the changes in the variable
+        self.reset_nn_var.trace_add("write", self.update_nn_display)
+
+        # String frame
+        self.string_frame = ctk.CTkFrame(self.name_normalizer_frame, corner_radius=0,
+                                         fg_color="transparent")
+        self.string_frame.grid(row=9, column=0, padx=10, pady=5)
+
+        # Prefix Label
+        self.prefix_label = ctk.CTkLabel(self.string_frame, text="Prefix:")
+        self.prefix_label.grid(row=1, column=0, padx=10, pady=10)
+
+        # Prefix Entry
+        self.prefix_entry = ctk.CTkEntry(self.string_frame, width=140)
+        self.prefix_entry.grid(row=1, column=1, padx=10, pady=10)
+
+        # Bind the update_file_display function to the entry change event
+        self.prefix_entry.bind("<KeyRelease>", self.update_nn_display)
+
+        # Suffix Label
+        self.suffix_label = ctk.CTkLabel(self.string_frame, text="Suffix:")
+        self.suffix_label.grid(row=1, column=2, padx=10, pady=10)
+
+        # Suffix Entry
+        self.suffix_entry = ctk.CTkEntry(self.string_frame, width=140)
+        self.suffix_entry.grid(row=1, column=3, padx=10, pady=10)
+
+        # Bind the update_nn_display function to the entry change event
+        self.suffix_entry.bind("<KeyRelease>", self.update_nn_display)
+
+        # Replace Label
+        self.replace_label = ctk.CTkLabel(self.string_frame, text="Replace (Original, Replacement):")
+        self.replace_label.grid(row=1, column=4, padx=10, pady=10)
+
+        # Original Entry
+        self.original_entry = ctk.CTkEntry(self.string_frame, width=150)
+        self.original_entry.grid(row=1, column=5, padx=10, pady=10)
+
+        # Bind the update_nn_display function to the entry change event
+        self.original_entry.bind("<KeyRelease>", self.update_nn_display)
+
+        # Replace Entry
+        self.replace_entry = ctk.CTkEntry(self.string_frame, width=150)
+        self.replace_entry.grid(row=1, column=10, pady=10)
+
+        # Bind the update_nn_display function to the entry change event
+        self.replace_entry.bind("<KeyRelease>", self.update_nn_display)
+
+        # Output directory move frame
+        self.output_directory_frame = ctk.CTkFrame(self.name_normalizer_frame, corner_radius=0,
+                                                   fg_color="transparent")
+        self.output_directory_frame.grid(row=10, column=0, padx=10, pady=5)
+
+        # Browse move directory folder button
+        self.browse_move_directory_button = ctk.CTkButton(self.output_directory_frame, text="Output Directory",
+                                                          command=self.browse_output_directory)
+        self.browse_move_directory_button.grid(row=0, column=0, padx=5, pady=5)
+
+        # Move directory entry
+        self.move_directory_entry = ctk.CTkEntry(self.output_directory_frame, width=400)
+        self.move_directory_entry.grid(row=0, column=1, padx=10, pady=10)
+
+        # Custom Text Removal Label
+        self.custom_text_label = ctk.CTkLabel(self.output_directory_frame, text="Remove:")
+        self.custom_text_label.grid(row=0, column=2, padx=10, pady=10)
+
+        # Custom Text Removal Entry
+        self.custom_text_removal_entry = ctk.CTkEntry(self.output_directory_frame, width=385)
+        self.custom_text_removal_entry.grid(row=0, column=3, padx=10, pady=10)
+
+        # Bind the update_nn_display function to the entry change event
+        self.custom_text_removal_entry.bind("<KeyRelease>", self.update_nn_display)
+
+        # Normalize Folder frame
+        self.normalize_folder_frame = ctk.CTkFrame(self.name_normalizer_frame, corner_radius=0,
+                                                   fg_color="transparent")
+        self.normalize_folder_frame.grid(row=11, column=0, padx=10, pady=5)
+
+        # Clear Name Normalizer Selection Button
+        self.clear_name_normalizer_selection_button = ctk.CTkButton(self.normalize_folder_frame,
+                                                                    text="Clear",
+                                                                    command=lambda: self.clear_selection(
+                                                                        frame_name="name_normalizer_window"))
+        self.clear_name_normalizer_selection_button.grid(row=0, column=0, padx=10, pady=10)
+
+        # Undo Name Normalizer Button
+        self.undo_nn_button = ctk.CTkButton(self.normalize_folder_frame,
+                                            text="Undo Name Normalizer",
+                                            command=self.undo_file_rename)
+        self.undo_nn_button.grid(row=0, column=1, padx=10, pady=10)
+
+        # Select Name Normalizer Last Used File Button
+        self.name_normalizer_last_used_file_button = ctk.CTkButton(self.normalize_folder_frame,
+                                                                   text="Reload Last File",
+                                                                   command=self.load_last_used_file)
+        self.name_normalizer_last_used_file_button.grid(row=0, column=2, padx=10, pady=10)
+
+        # Interrupt button
+        self.interrupt_button = ctk.CTkButton(self.normalize_folder_frame, text="Interrupt",
+                                              command=lambda: self.interrupt_processing("name_processing_thread"))
+        self.interrupt_button.grid(row=0, column=3, padx=5, pady=5)
+
+        # Normalize button
+        self.normalize_button = ctk.CTkButton(self.normalize_folder_frame, text="Normalize",
+                                              command=self.process_name_normalizer)
+        self.normalize_button.grid(row=0, column=4, padx=5, pady=5)
+
+        # Find Duplicates button
+        self.find_duplicates_button = ctk.CTkButton(self.normalize_folder_frame, text="Find Duplicates",
+                                                    command=self.find_duplicates_in_folder)
+        self.find_duplicates_button.grid(row=0, column=5, padx=5, pady=5)
+
+        # Send to Module frame
+        self.send_to_module_frame1 = ctk.CTkFrame(self.name_normalizer_frame,
+                                                  corner_radius=0,
+                                                  fg_color="transparent")
+        self.send_to_module_frame1.grid(row=12, column=0, padx=5)
+
+        # Send to File Renamer button
+        self.send_to_file_renamer_button1 = ctk.CTkButton(self.send_to_module_frame1, text="Send to File Renamer",
+                                                          command=lambda: self.send_to_module(
+                                                              destination="file_renamer_module"))
+        self.send_to_file_renamer_button1.grid(row=0, column=0, padx=10, pady=10)
+
+        # Send to Video Editor button
+        self.send_to_video_editor_button1 = ctk.CTkButton(self.send_to_module_frame1, text="Send to Video Editor",
+                                                          command=lambda: self.send_to_module(
+                                                              destination="video_editor_module"))
+        self.send_to_video_editor_button1.grid(row=0, column=1, padx=10, pady=10)
+
+        # Frame to display messages on the Name Normalizer frame
+        self.name_normalizer_message_label_frame = ctk.CTkFrame(self.name_normalizer_frame, corner_radius=0,
+                                                                fg_color="transparent")
+        self.name_normalizer_message_label_frame.grid(row=13, column=0, padx=10)
+
+        # Name Normalizer message Label
+        self.name_normalizer_message_label = ctk.CTkLabel(self.name_normalizer_message_label_frame, text="")
+        self.name_normalizer_message_label.grid(row=0, column=0, padx=10, pady=10)
+
+        # Progressbar frame
+        self.slider_progressbar_frame = ctk.CTkFrame(self.name_normalizer_message_label_frame,
+                                                     corner_radius=0,
+                                                     fg_color="transparent")
+        self.slider_progressbar_frame.grid(row=1, column=0, padx=10)
+        self.slider_progressbar_frame.grid_columnconfigure(0, weight=1)
+        self.slider_progressbar_frame.grid_rowconfigure(4, weight=1)
+
+        # Name Normalizer output tabview (folder preview and log)
+        self.nn_output_tabview = ctk.CTkTabview(self.name_normalizer_frame, height=200)
+        self.nn_output_tabview.grid(row=14, column=0, padx=10)
+        self.nn_output_tabview.add("Preview")
+        self.nn_output_tabview.add("Log")
+
+        # Name Normalizer preview textbox (proposed names for a selected folder, one page at a time)
+        self.nn_preview_textbox = ctk.CTkTextbox(self.nn_output_tabview.tab("Preview"), width=1000, height=110)
+        self.nn_preview_textbox.grid(row=0, column=0, padx=10)
+        self.nn_preview_textbox.configure(state="disabled")
+
+        # Name Normalizer preview controls frame
+        self.nn_preview_controls_frame = ctk.CTkFrame(self.nn_output_tabview.tab("Preview"), corner_radius=0,
+                                                      fg_color="transparent")
+        self.nn_preview_controls_frame.grid(row=1, column=0, padx=10)
+
+        # Previous page button
+        self.nn_preview_previous_button = ctk.CTkButton(self.nn_preview_controls_frame, text="<", width=40,
+                                                        command=lambda: self.change_nn_preview_page(-1))
+        self.nn_preview_previous_button.grid(row=0, column=0, padx=5, pady=5)
+
+        # Page label
+        self.nn_preview_page_label = ctk.CTkLabel(self.nn_preview_controls_frame, text="")
+        self.nn_preview_page_label.grid(row=0, column=1, padx=5, pady=5)
+
+        # Next page button
+        self.nn_preview_next_button = ctk.CTkButton(self.nn_preview_controls_frame, text=">", width=40,
+                                                    command=lambda: self.change_nn_preview_page(1))
+        self.nn_preview_next_button.grid(row=0, column=2, padx=5, pady=5)
+
+        # Changed/unchanged/colliding counts label
+        self.nn_preview_counts_label = ctk.CTkLabel(self.nn_preview_controls_frame, text="")
+        self.nn_preview_counts_label.grid(row=0, column=3, padx=10, pady=5)
+
+        # Name Normalizer log textbox (per-file messages from the worker thread)
+        self.name_normalizer_log_textbox = ctk.CTkTextbox(self.nn_output_tabview.tab("Log"), width=1000,
+                                                          height=150)
+        self.name_normalizer_log_textbox.grid(row=0, column=0, padx=10)
+        self.name_normalizer_log_textbox.configure(state="disabled")
+
+        """
+        video_editor_window
+        """
+        # Create Video Editor frame
+        self.video_editor_frame = ctk.CTkFrame(self, corner_radius=0, fg_color="transparent")
+        self.video_editor_frame.grid_columnconfigure(0, weight=1)
+
+        # Video Editor Label
+        self.video_editor_label = ctk.CTkLabel(self.video_editor_frame, text="Video Editor",
+                                               font=ctk.CTkFont(size=15, weight="bold"))
+        self.video_editor_label.grid(row=0, column=0, padx=10, pady=10)
+
+        # Video Editor Top frame
+        self.video_editor_top_frame = ctk.CTkFrame(self.video_editor_frame, corner_radius=0,
+                                                   fg_color="transparent")
+        self.video_editor_top_frame.grid(row=1, column=0, padx=10, pady=5)
+
+        # Video Editor browse input method button
+        self.browse_input_method_button = ctk.CTkButton(self.video_editor_top_frame, text="Browse",
+                                                        command=self.browse_input)
+        self.browse_input_method_button.grid(row=0, column=0, padx=5, pady=5)
+
+        # Input method entry for a file, directory, or .txt containing a line delimited list of files to process
+        self.input_method_entry = ctk.CTkEntry(self.video_editor_top_frame, width=890)
+        self.input_method_entry.insert(0, "Select a video to edit using the 'Browse' button...")
+        self.input_method_entry.grid(row=0, column=1, padx=10, pady=10)
+
+        # Rotation frame
+        self.rotation_frame = ctk.CTkFrame(self.video_editor_frame, corner_radius=0,
+                                           fg_color="transparent")
+        self.rotation_frame.grid(row=3, column=0, padx=10, pady=5)
+
+        # Rotate Video label
+        self.rotation_label = ctk.CTkLabel(self.rotation_frame, text="Rotate Video:")
+        self.rotation_label.grid(row=0, column=0, padx=10, pady=5)
+
+        # Variable to store rotation option
+        self.rotation_var = ctk.StringVar()
+        self.rotation_var.set(self.default_rotation_var)
+
+        # Left rotation radio button
+        self.left_radio = ctk.CTkRadioButton(self.rotation_frame, text="Left", variable=self.rotation_var, value="left")
+        self.left_radio.grid(row=0, column=1, padx=10, pady=5)
+
+        # Right rotation radio button
+        self.right_radio = ctk.CTkRadioButton(self.rotation_frame, text="Right", variable=self.rotation_var,
+                                              value="right")
+        self.right_radio.grid(row=0, column=2, padx=10, pady=5)
+
+        # Flip rotation radio button
+        self.flip_radio = ctk.CTkRadioButton(self.rotation_frame, text="Flip", variable=self.rotation_var,
+                                             value="flip")
+        self.flip_radio.grid(row=0, column=3, padx=10, pady=5)
+
+        # Mirror rotation radio button
+        self.mirror_radio = ctk.CTkRadioButton(self.rotation_frame, text="Mirror", variable=self.rotation_var,
+                                               value="mirror")
+        self.mirror_radio.grid(row=0, column=4, padx=10, pady=5)
+
+        # None rotation radio button
+        self.no_rotation_radio = ctk.CTkRadioButton(self.rotation_frame, text="None", variable=self.rotation_var,
+                                                    value="none")
+        self.no_rotation_radio.grid(row=0, column=5, padx=10, pady=5)
+
+        # Decibel frame
+        self.decibel_frame = ctk.CTkFrame(self.video_editor_frame, corner_radius=0,
+                                          fg_color="transparent")
+        self.decibel_frame.grid(row=4, column=0, padx=10, pady=5)
+
+        # Increase Audio (dB) label
+        self.decibel_label = ctk.CTkLabel(self.decibel_frame, text="Increase Audio (dB):")
+        self.decibel_label.grid(row=0, column=0, padx=10, pady=5)
+
+        # Initialize decibel variable
+        self.decibel_var = ctk.StringVar()
+        self.decibel_var.set(self.default_decibel)
+
+        # Trace the changes in the StringVar
+        self.decibel_var.trace_add("write",
+                                   lambda name, index, mode, var=self.decibel_var, default=self.default_decibel,
+                                          desired_type=float: self.validate_entry(var, default, desired_type))
+
+        # Decibel entry
+        self.decibel_entry = ctk.CTkEntry(self.decibel_frame, textvariable=self.decibel_var, width=50)
+        self.decibel_entry.grid(row=0, column=1, padx=10, pady=10)
+
+        # Audio Normalization frame
+        self.audio_normalization_frame = ctk.CTkFrame(self.video_editor_frame, corner_radius=0,
+                                                      fg_color="transparent")
+        self.audio_normalization_frame.grid(row=5, column=0, padx=10, pady=5)
+
+        # Normalize Audio label
+        self.audio_normalization_label = ctk.CTkLabel(self.audio_normalization_frame, text="Normalize Audio:")
+        self.audio_normalization_label.grid(row=0, column=0, padx=10, pady=5)
+
+        # Initialize audio normalization variable
+        self.audio_normalization_var = ctk.StringVar()
+        self.audio_normalization_var.set(self.default_audio_normalization)
+
+        # Trace the changes in the StringVar
+        self.audio_normalization_var.trace_add("write",
+                                               lambda name, index, mode, var=self.audio_normalization_var,
+                                                      default=self.default_audio_normalization,
+                                                      desired_type=float: self.validate_entry(var, default,
+                                                                                              desired_type))
+
+        # Audio Normalization entry
+        self.audio_normalization_entry = ctk.CTkEntry(self.audio_normalization_frame,
+                                                      textvariable=self.audio_normalization_var,
+                                                      width=50)
+        self.audio_normalization_entry.grid(row=0, column=1, padx=10, pady=10)
+
+        # Trim frame
+        self.trim_frame = ctk.CTkFrame(self.video_editor_frame, corner_radius=0,
+                                       fg_color="transparent")
+        self.trim_frame.grid(row=6, column=0, padx=10, pady=5)
+
+        # Trim label
+        self.trim_label = ctk.CTkLabel(self.trim_frame, text="Trim (Hours:Minutes:Seconds):")
+        self.trim_label.grid(row=0, column=0, padx=10, pady=5)
+
+        # Initialize hour variable
+        self.hour_var = ctk.StringVar()
+        self.hour_var.set(self.default_hour)
+
+        # Trace the changes in the StringVar
+        self.hour_var.trace_add("write",
+                                lambda name, index, mode, var=self.hour_var, default=self.default_hour,
+                                         desired_type=int: self.validate_entry(var, default, desired_type))
+
+        # Hour entry
+        self.hour_entry = ctk.CTkEntry(self.trim_frame, textvariable=self.hour_var, width=50)
+        self.hour_entry.grid(row=0, column=1, padx=10, pady=10)
+
+        # Trim label
+        self.colon_label = ctk.CTkLabel(self.trim_frame, text=":")
+        self.colon_label.grid(row=0, column=2)
+
+        # Initialize minute variable
+        self.minute_var = ctk.StringVar()
+        self.minute_var.set(self.default_minute)
+
+        # Trace the changes in the StringVar
+        self.minute_var.trace_add("write",
+                                  lambda name, index, mode, var=self.minute_var, default=self.default_minute,
+                                         desired_type=int: self.validate_entry(var, default, desired_type))
+
+        # Minute entry
+        self.minute_entry = ctk.CTkEntry(self.trim_frame, textvariable=self.minute_var, width=50)
+        self.minute_entry.grid(row=0, column=3, padx=10, pady=10)
+
+        # Trim label1
+        self.colon_label1 = ctk.CTkLabel(self.trim_frame, text=":")
+        self.colon_label1.grid(row=0, column=4)
+
+        # Initialize second variable
+        self.second_var = ctk.StringVar()
+        self.second_var.set(self.default_second)
+
+        # Trace the changes in the StringVar
+        self.second_var.trace_add("write",
+                                  lambda name, index, mode, var=self.second_var, default=self.default_second,
+                                         desired_type=int: self.validate_entry(var, default, desired_type))
+
+        # Second entry
+        self.second_entry = ctk.CTkEntry(self.trim_frame, textvariable=self.second_var, width=50)
+        self.second_entry.grid(row=0, column=5, padx=10, pady=10)
+
+        # Trim label
+        self.trim_label1 = ctk.CTkLabel(self.trim_frame, text="-")
+        self.trim_label1.grid(row=0, column=6, padx=10, pady=5)
+
+        # Initialize hour variable1
+        self.hour_var1 = ctk.StringVar()
+        self.hour_var1.set(self.default_hour)
+
+        # Trace the changes in the StringVar
+        self.hour_var1.trace_add("write",
+                                 lambda name, index, mode, var=self.hour_var1, default=self.default_hour,
+                                        desired_type=int: self.validate_entry(var, default, desired_type))
+
+        # Hour entry1
+        self.hour_entry1 = ctk.CTkEntry(self.trim_frame, textvariable=self.hour_var1, width=50)
+        self.hour_entry1.grid(row=0, column=7, padx=10, pady=10)
+
+        # Trim label2
+        self.colon_label2 = ctk.CTkLabel(self.trim_frame, text=":")
+        self.colon_label2.grid(row=0, column=8)
+
+        # Initialize minute variable1
+        self.minute_var1 = ctk.StringVar()
+        self.minute_var1.set(self.default_minute)
+
+        # Trace the changes in the StringVar
+        self.minute_var1.trace_add("write",
+                                   lambda name, index, mode, var=self.minute_var1, default=self.default_minute,
+                                          desired_type=int: self.validate_entry(var, default, desired_type))
+
+        # Minute entry1
+        self.minute_entry1 = ctk.CTkEntry(self.trim_frame, textvariable=self.minute_var1, width=50)
+        self.minute_entry1.grid(row=0, column=9, padx=10, pady=10)
+
+        # Trim label3
+        self.colon_label3 = ctk.CTkLabel(self.trim_frame, text=":")
+        self.colon_label3.grid(row=0, column=10)
+
+        # Initialize second variable
+        self.second_var1 = ctk.StringVar()
+        self.second_var1.set(self.default_second)
+
+        # Trace the changes in the StringVar
+        self.second_var1.trace_add("write",
+                                   lambda name, index, mode, var=self.second_var1, default=self.default_second,
+                                          desired_type=int: self.validate_entry(var, default, desired_type))
+
+        # Second entry1
+        self.second_entry1 = ctk.CTkEntry(self.trim_frame, textvariable=self.second_var1, width=50)
+        self.second_entry1.grid(row=0, column=11, padx=10, pady=10)
 
-        # Initialize Name Normalizer GUI elements
-        self.name_normalizer_frame = None
-        self.name_normalizer_top_frame = None
-        self.name_normalizer_label = None
-        self.checkbox_frame1 = None
-        self.nn_browse_button = None
-        self.nn_display_text = None
-        self.nn_path_entry = None
-        self.tail_checkbox = None
-        self.remove_all_symbols_checkbox = None
-        self.remove_most_symbols_checkbox = None
-        self.remove_non_ascii_symbols_checkbox = None
-        self.remove_numbers_checkbox = None
-        self.checkbox_frame2 = None
-        self.remove_dash_checkbox = None
-        self.remove_endash_checkbox = None
-        self.remove_emdash_checkbox = None
-        self.remove_hashtag_checkbox = None
-        self.checkbox_frame3 = None
-        self.remove_ampersand_checkbox = None
-        self.remove_at_checkbox = None
-        self.remove_underscore_checkbox = None
-        self.remove_comma_checkbox = None
-        self.remove_dollar_checkbox = None
-        self.checkbox_frame4 = None
-        self.title_checkbox = None
-        self.remove_single_quote_checkbox = None
-        self.remove_double_quote_checkbox = None
-        self.remove_colon_checkbox = None
-        self.remove_semicolon_checkbox = None
-        self.remove_percent_checkbox = None
-        self.remove_caret_checkbox = None
-        self.checkbox_frame5 = None
-        self.remove_asterisk_checkbox = None
-        self.remove_parenthesis_checkbox = None
-        self.remove_plus_checkbox = None
-        self.remove_equal_checkbox = None
-        self.remove_curly_brace_checkbox = None
-        self.remove_square_bracket_checkbox = None
-        self.checkbox_frame6 = None
-        self.remove_pipe_checkbox = None
-        self.remove_backslash_checkbox = None
-        self.remove_angle_bracket_checkbox = None
-        self.remove_question_mark_checkbox = None
-        self.checkbox_frame7 = None
-        self.remove_parenthesis_trail_checkbox = None
-        self.remove_hashtag_trail_checkbox = None
-        self.replace_custom_text_checkbox = None
-        self.replace_mode_switch = None
-        self.remove_extra_whitespace_checkbox = None
-        self.artist_identifier_checkbox = None
-        self.deep_walk_checkbox = None
-        self.reset_nn_checkbox = None
-        self.string_frame = None
-        self.prefix_label = None
-        self.prefix_entry = None
-        self.suffix_label = None
-        self.suffix_entry = None
-        self.replace_label = None
-        self.original_entry = None
-        self.replace_entry = None
-        self.output_directory_frame = None
-        self.browse_move_directory_button = None
-        self.move_directory_entry = None
-        self.custom_text_label = None
-        self.custom_text_removal_entry = None
-        self.normalize_folder_frame = None
-        self.interrupt_button = None
-        self.normalize_button = None
-        self.send_to_module_frame1 = None
-        self.send_to_file_renamer_button1 = None
-        self.send_to_video_editor_button1 = None
-        self.clear_name_normalizer_selection_button = None
-        self.undo_nn_button = None
-        self.name_normalizer_last_used_file_button = None
-        self.name_normalizer_message_label_frame = None
-        self.name_normalizer_message_label = None
-        self.slider_progressbar_frame = None
-        self.progressbar = ""
+        # Video Editor Output directory frame
+        self.video_editor_output_directory_frame = ctk.CTkFrame(self.video_editor_frame, corner_radius=0,
+                                                                fg_color="transparent")
+        self.video_editor_output_directory_frame.grid(row=8, column=0, padx=10, pady=5)
 
-        # Initialize Video Editor GUI elements
-        self.video_editor_frame = None
-        self.video_editor_top_frame = None
-        self.video_editor_label = None
-        self.browse_input_method_button = None
-        self.input_method_entry = None
-        self.rotation_frame = None
-        self.rotation_label = None
-        self.rotation_var = None
-        self.left_radio = None
-        self.right_radio = None
-        self.flip_radio = None
-        self.mirror_radio = None
-        self.no_rotation_radio = None
-        self.decibel_frame = None
-        self.decibel_label = None
-        self.decibel_var = None
-        self.decibel_entry = None
-        self.audio_normalization_frame = None
-        self.audio_normalization_label = None
-        self.audio_normalization_var = None
-        self.audio_normalization_entry = None
-        self.trim_frame = None
-        self.trim_label = None
-        self.hour_var = None
-        self.hour_entry = None
-        self.colon_label = None
-        self.minute_var = None
-        self.minute_entry = None
-        self.colon_label1 = None
-        self.second_var = None
-        self.second_entry = None
-        self.trim_label1 = None
-        self.hour_var1 = None
-        self.hour_entry1 = None
-        self.colon_label2 = None
-        self.minute_var1 = None
-        self.minute_entry1 = None
-        self.colon_label3 = None
-        self.second_var1 = None
-        self.second_entry1 = None
-        self.video_editor_output_directory_frame = None
-        self.browse_video_editor_output_directory_button = None
-        self.video_editor_output_directory_entry = None
-        self.process_video_editor_frame = None
-        self.clear_video_editor_values_button = None
-        self.clear_video_editor_entries_button = None
-        self.video_editor_last_used_file_button = None
-        self.interrupt_button1 = None
-        self.process_video_edits_button = None
-        self.video_editor_checkbox_frame = None
-        self.remove_successful_lines_switch = None
-        self.validate_entries_switch = None
-        self.preview_mode_switch = None
-        self.reset_video_switch = None
-        self.video_editor_message_label_frame = None
-        self.video_editor_message_label = None
-        self.send_to_module_frame2 = None
-        self.send_to_file_renamer_button = None
-        self.send_to_name_normalizer_button1 = None
-        self.slider_progressbar_frame1 = None
-        self.progressbar1 = ""
+        # Browse video editor output directory folder button
+        self.browse_video_editor_output_directory_button = ctk.CTkButton(self.video_editor_output_directory_frame,
+                                                                         text="Output Directory",
+                                                                         command=self.browse_output_directory)
+        self.browse_video_editor_output_directory_button.grid(row=0, column=0, padx=5, pady=5)
+
+        # Video editor output directory entry
+        self.video_editor_output_directory_entry = ctk.CTkEntry(self.video_editor_output_directory_frame, width=890)
+        self.video_editor_output_directory_entry.grid(row=0, column=1, padx=10, pady=10)
+
+        # Process video editor frame
+        self.process_video_editor_frame = ctk.CTkFrame(self.video_editor_frame, corner_radius=0,
+                                                       fg_color="transparent")
+        self.process_video_editor_frame.grid(row=9, column=0, padx=10, pady=5)
+
+        # Clear video editor values Button
+        self.clear_video_editor_values_button = ctk.CTkButton(self.process_video_editor_frame,
+                                                              text="Clear Values",
+                                                                 command=lambda: self.clear_selection(
+                                                                     frame_name="video_editor_window",
+                                                                     reset_all=False))
+        self.clear_video_editor_values_button.grid(row=0, column=0, padx=10, pady=10)
+
+        # Clear video editor entries Button
+        self.clear_video_editor_entries_button = ctk.CTkButton(self.process_video_editor_frame,
+                                                               text="Clear Everything",
+                                                               command=lambda: self.clear_selection(
+                                                                   frame_name="video_editor_window"))
+        self.clear_video_editor_entries_button.grid(row=0, column=1, padx=10, pady=10)
+
+        # Select Video Editor Last Used File Button
+        self.video_editor_last_used_file_button = ctk.CTkButton(self.process_video_editor_frame,
+                                                                text="Reload Last File",
+                                                                command=self.load_last_used_file)
+        self.video_editor_last_used_file_button.grid(row=0, column=2, padx=10, pady=10)
+
+        # Interrupt button1
+        self.interrupt_button1 = ctk.CTkButton(self.process_video_editor_frame, text="Interrupt",
+                                               command=lambda: self.interrupt_processing("video_processing_thread"))
+        self.interrupt_button1.grid(row=0, column=3, padx=5, pady=5)
+
+        # Process video button
+        self.process_video_edits_button = ctk.CTkButton(self.process_video_editor_frame, text="Process Video(s)",
+                                                        command=self.gather_and_validate_entries)
+        self.process_video_edits_button.grid(row=0, column=4, padx=5, pady=5)
+
+        # Frame to display messages on the video editor frame
+        self.send_to_module_frame2 = ctk.CTkFrame(self.video_editor_frame, corner_radius=0,
+                                                  fg_color="transparent")
+        self.send_to_module_frame2.grid(row=10, column=0, padx=10)
+
+        # Send to File Renamer button
+        self.send_to_file_renamer_button = ctk.CTkButton(self.send_to_module_frame2, text="Send to File Renamer",
+                                                         command=lambda: self.send_to_module(
+                                                             destination="file_renamer_module"))
+        self.send_to_file_renamer_button.grid(row=0, column=0, padx=10, pady=10)
+
+        # Send to Name Normalizer button
+        self.send_to_name_normalizer_button1 = ctk.CTkButton(self.send_to_module_frame2,
+                                                             text="Send to Name Normalizer",
+                                                             command=lambda: self.send_to_module(
+                                                                 destination="name_normalizer_module"))
+        self.send_to_name_normalizer_button1.grid(row=0, column=1, padx=10, pady=10)
+
+        # Video editor checkbox frame
+        self.video_editor_checkbox_frame = ctk.CTkFrame(self.video_editor_frame, corner_radius=0,
+                                                        fg_color="transparent")
+        self.video_editor_checkbox_frame.grid(row=11, column=0, padx=10, pady=5)
+
+        # Checkbox to enable/disable remove successful lines
+        self.remove_successful_lines_switch = ctk.CTkSwitch(self.video_editor_checkbox_frame,
+                                                                text="Remove successful lines from input file",
+                                                                variable=self.remove_successful_lines_var)
+        self.remove_successful_lines_switch.grid(row=0, column=0, padx=10, pady=10)
+
+        # Checkbox to enable/disable reset video editor entries
+        self.reset_video_switch = ctk.CTkSwitch(self.video_editor_checkbox_frame,
+                                                    text="Reset entries",
+                                                    variable=self.reset_video_entries_var)
+        self.reset_video_switch.grid(row=0, column=1, padx=10, pady=10)
 
-        # Initialize Add/Remove GUI elements
-        self.add_remove_frame = None
-        self.add_remove_label = None
-        self.add_remove_tabview = None
-        self.add_remove_artist_top_frame = None
-        self.add_remove_artist_label_frame = None
-        self.add_remove_artist_label = None
-        self.add_remove_artist_entry_frame = None
-        self.add_artist_button = None
-        self.add_artist_entry = None
-        self.remove_artist_button = None
-        self.remove_artist_entry = None
-        self.auto_add_acc_record_frame = None
-        self.auto_add_acc_record_checkbox = None
-        self.add_remove_acc_record_label_frame = None
-        self.add_remove_acc_record_label = None
-        self.add_remove_acc_record_entry_frame = None
-        self.add_acc_record_button = None
-        self.add_acc_record_entry = None
-        self.remove_acc_record_button = None
-        self.remove_acc_record_entry = None
-        self.add_remove_acc_label_frame = None
-        self.add_remove_acc_label = None
-        self.acc_browse_frame = None
-        self.browse_artist_button = None
-        self.acc_display_text = None
-        self.acc_display_entry = None
-        self.detect_artist_button = None
-        self.add_remove_acc_entry_frame = None
-        self.add_acc_button = None
-        self.add_acc_entry = None
-        self.remove_acc_button = None
-        self.remove_acc_entry = None
-        self.category_frame = None
-        self.add_category_button = None
-        self.category_entry = None
-        self.weight_label = None
-        self.weight_var = None
-        self.weight_entry = None
-        self.remove_category_button = None
-        self.remove_category_entry = None
-        self.ctn_frame = None
-        self.add_ctn_button = None
-        self.custom_tab_name_entry = None
-        self.weight_label1 = None
-        self.weight_var1 = None
-        self.weight_entry1 = None
-        self.remove_ctn_button = None
-        self.remove_custom_tab_name_entry = None
-        self.ctr_entry_frame = None
-        self.add_ctr_button = None
-        self.add_ctr_name_entry = None
-        self.replacement_label = None
-        self.replacement_text_entry = None
-        self.remove_ctr_button = None
-        self.remove_ctr_name_entry = None
-        self.exclude_entry_frame = None
-        self.add_exclude_button = None
-        self.add_exclude_name_entry = None
-        self.remove_exclude_button = None
-        self.remove_exclude_name_entry = None
-        self.file_extension_entry_frame = None
-        self.add_file_extension_button = None
-        self.add_file_extension_entry = None
-        self.remove_file_extension_button = None
-        self.remove_file_extension_entry = None
-        self.no_go_entry_frame = None
-        self.add_no_go_button = None
-        self.add_no_go_name_entry = None
-        self.remove_no_go_button = None
-        self.remove_no_go_name_entry = None
-        self.valid_extension_entry_frame = None
-        self.add_valid_extension_button = None
-        self.add_valid_extension_entry = None
-        self.remove_valid_extension_button = None
-        self.remove_valid_extension_entry = None
-        self.clear_add_remove_frame = None
-        self.clear_add_remove_button = None
-        self.reset_add_remove_frame = None
-        self.reset_add_remove_switch = None
-        self.add_remove_message_label_frame = None
-        self.add_remove_message_label = None
+        # Frame to display messages on the video editor frame
+        self.video_editor_message_label_frame = ctk.CTkFrame(self.video_editor_frame, corner_radius=0,
+                                                             fg_color="transparent")
+        self.video_editor_message_label_frame.grid(row=12, column=0, padx=10)
 
-        # Initialize Settings GUI elements
-        self.settings_frame = None
-        self.settings_label = None
-        self.settings_tabview = None
-        self.remove_duplicates_switch = None
-        self.duplicate_removal_label = None
-        self.remove_word_duplicates_switch = None
-        self.artist_switch_frame = None
-        self.artist_search_label = None
-        self.artist_search_switch = None
-        self.ignore_known_artists_switch = None
-        self.artist_identifier_label = None
-        self.misc_frame = None
-        self.file_ops_switch_frame = None
-        self.open_on_file_drop_switch = None
-        self.reminders_frame = None
-        self.double_check_switch = None
-        self.logging_switch_frame = None
-        self.activate_logging_switch = None
-        self.suppress_switch = None
-        self.show_messageboxes_switch = None
-        self.confirmation_frame = None
-        self.show_confirmation_messageboxes_switch = None
-        self.fallback_confirmation_label = None
-        self.true_radio = None
-        self.false_radio = None
-        self.truncate_text_switch = None
-        self.tab_name_frame = None
-        self.use_custom_tab_names_switch = None
-        self.sort_tab_names_switch = None
-        self.sort_tab_names_reverse_switch = None
-        self.gui_settings_frame = None
-        self.appearance_mode_label = None
-        self.appearance_mode_menu = None
-        self.scaling_label = None
-        self.scaling_optionemenu = None
-        self.master_entry_frame = None
-        self.initial_directory_frame = None
-        self.browse_initial_directory_button = None
-        self.initial_directory_entry = None
-        self.browse_initial_output_directory_button = None
-        self.initial_output_directory_entry = None
-        self.double_check_reminder_directory_frame = None
-        self.browse_reminder_directory_button = None
-        self.double_check_reminder_directory_entry = None
-        self.browse_no_go_directory_button = None
-        self.no_go_reminder_directory_entry = None
-        self.open_artist_file_button = None
-        self.artist_directory_frame = None
-        self.browse_artist_directory_button = None
-        self.artist_directory_entry = None
-        self.browse_artist_file_button = None
-        self.artist_file_entry = None
-        self.configuration_file_frame = None
-        self.open_configuration_file_button = None
-        self.configuration_file_entry = None
-        self.dictionary_file_frame = None
-        self.open_dictionary_file_button = None
-        self.dictionary_file_entry = None
-        self.open_log_file_button = None
-        self.log_file_entry = None
-        self.logging_browse_frame = None
-        self.logging_frame = None
-        self.artist_frame = None
-        self.artist_browse_frame = None
+        # Video editor message Label
+        self.video_editor_message_label = ctk.CTkLabel(self.video_editor_message_label_frame, text="")
+        self.video_editor_message_label.grid(row=0, column=0, padx=10, pady=10)
 
-        # Enable drag-and-drop functionality for files
-        self.drop_target_register(DND_FILES)
-        self.dnd_bind('<<Drop>>', self.on_file_drop)
+        # Progressbar frame1
+        self.slider_progressbar_frame1 = ctk.CTkFrame(self.video_editor_message_label_frame,
+                                                      corner_radius=0,
+                                                      fg_color="transparent")
+        self.slider_progressbar_frame1.grid(row=1, column=0, padx=10)
+        self.slider_progressbar_frame1.grid_columnconfigure(0, weight=1)
+        self.slider_progressbar_frame1.grid_rowconfigure(4, weight=1)
 
-        # Initial check for activate logging state prior to application launch
-        self.handle_logging_activation()
+        # Video editor log textbox (per-file messages from the worker thread)
+        self.video_editor_log_textbox = ctk.CTkTextbox(self.video_editor_frame, width=1000, height=150)
+        self.video_editor_log_textbox.grid(row=13, column=0, padx=10, pady=5)
+        self.video_editor_log_textbox.configure(state="disabled")
 
-        # Register the cleanup method to be called on program exit
-        atexit.register(self.cleanup_on_exit)
+        """
+        add_remove_window
+        """
+        # Create Add/Remove frame
+        self.add_remove_frame = ctk.CTkFrame(self, corner_radius=0, fg_color="transparent")
+        self.add_remove_frame.grid_columnconfigure(0, weight=1)
 
-        # Initialize frame name to default frame
-        self.frame_name = self.default_frame
+        # Add/Remove Label
+        self.add_remove_label = ctk.CTkLabel(self.add_remove_frame, text="Add/Remove",
+                                             font=ctk.CTkFont(size=15, weight="bold"))
+        self.add_remove_label.grid(row=0, column=0, padx=10, pady=10)
 
-        # Initialize the json file dictionaries
-        self.initialize_json()
+        # Create an add_remove_tabview on add_remove_frame row 1
+        self.add_remove_tabview, self.add_remove_tabs = self.create_tabview(self.add_remove_frame,
+                                                                            self.add_remove_tab_names,
+                                                                            self.default_add_remove_tab)
 
-        # Create the GUI elements
-        self.create_gui()
+        """Artist Tab"""
+        # Add and remove artist top frame
+        self.add_remove_artist_top_frame = ctk.CTkFrame(self.add_remove_tabs.get("Artist"), corner_radius=0,
+                                                        fg_color="transparent")
+        self.add_remove_artist_top_frame.grid(row=0, column=0, padx=10, pady=10)
 
-        # Select default frame
-        self.select_frame_by_name(self.default_frame)
+        # Add and remove artist label frame
+        self.add_remove_artist_label_frame = ctk.CTkFrame(self.add_remove_artist_top_frame, corner_radius=0,
+                                                          fg_color="transparent")
+        self.add_remove_artist_label_frame.grid(row=0, column=0, padx=10, pady=10)
 
-        # Set scaling at the start
-        self.change_scaling_event(self.scaling)
+        # Add/Remove Artist Label
+        self.add_remove_artist_label = ctk.CTkLabel(self.add_remove_artist_label_frame, text="Add/Remove Artist",
+                                                    font=ctk.CTkFont(size=15, weight="bold"))
+        self.add_remove_artist_label.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
 
-    def create_gui(self):
-        # Set up grid layout with 1 row and 2 columns, configuring weights for resizing
-        self.grid_rowconfigure(0, weight=1)
-        self.grid_columnconfigure(1, weight=1)
+        # Add and remove artist entry frame
+        self.add_remove_artist_entry_frame = ctk.CTkFrame(self.add_remove_artist_top_frame, corner_radius=0,
+                                                          fg_color="transparent")
+        self.add_remove_artist_entry_frame.grid(row=1, column=0, padx=10, pady=10)
 
-        # Create navigation frame (Buttons on the left hand side)
-        self.navigation_frame = ctk.CTkFrame(self, corner_radius=0)
-        self.navigation_frame.grid(row=0, column=0, sticky="nsew")
-        self.navigation_frame.grid_rowconfigure(5, weight=1)  # Index number is responsible for floating
+        # Add artist button
+        self.add_artist_button = ctk.CTkButton(self.add_remove_artist_entry_frame, text="Add Artist",
+                                               command=self.add_artist_to_file)
+        self.add_artist_button.grid(row=0, column=0, padx=5)
 
-        # Create label for the navigation frame
-        self.navigation_frame_label = ctk.CTkLabel(self.navigation_frame, text="  O.C.D. \nFile Editor",
-                                                   compound="left",
-                                                   font=ctk.CTkFont(size=15, weight="bold"))
-        self.navigation_frame_label.grid(row=0, column=0, padx=5, pady=5)
+        # Add artist entry
+        self.add_artist_entry = ctk.CTkEntry(self.add_remove_artist_entry_frame, width=370)
+        self.add_artist_entry.grid(row=0, column=1, padx=5)
 
-        # Create file renamer button with specific styling and command
-        self.file_renamer_button = ctk.CTkButton(self.navigation_frame, corner_radius=0, height=40, border_spacing=10,
-                                                 text="File Renamer",
-                                                 fg_color="transparent", text_color=("gray10", "gray90"),
-                                                 hover_color=("gray70", "gray30"),
-                                                 anchor="w", command=self.file_renamer_button_event)
-        self.file_renamer_button.grid(row=1, column=0, sticky="ew")
+        # Remove artist button
+        self.remove_artist_button = ctk.CTkButton(self.add_remove_artist_entry_frame, text="Remove Artist",
+                                                  command=self.remove_artist_from_file)
+        self.remove_artist_button.grid(row=0, column=2, padx=5, pady=5)
 
-        # Create button for Name Normalizer with specific styling and command
-        self.name_normalizer_button = ctk.CTkButton(self.navigation_frame, corner_radius=0, height=40,
-                                                    border_spacing=10, text="Name Normalizer",
-                                                    fg_color="transparent", text_color=("gray10", "gray90"),
-                                                    hover_color=("gray70", "gray30"),
-                                                    anchor="w",
-                                                    command=self.name_normalizer_button_event)
-        self.name_normalizer_button.grid(row=2, column=0, sticky="ew")
+        # Remove artist entry
+        self.remove_artist_entry = ctk.CTkEntry(self.add_remove_artist_entry_frame, width=370)
+        self.remove_artist_entry.grid(row=0, column=3, padx=5)
+
+        # Add and remove artist checkbox frame
+        self.auto_add_acc_record_frame = ctk.CTkFrame(self.add_remove_artist_top_frame, corner_radius=0,
+                                                      fg_color="transparent")
+        self.auto_add_acc_record_frame.grid(row=2, column=0, padx=10, pady=10)
 
-        # Create button for Video Editor with specific styling and command
-        self.video_editor_button = ctk.CTkButton(self.navigation_frame, corner_radius=0, height=40,
-                                                 border_spacing=10, text="Video Editor",
-                                                 fg_color="transparent", text_color=("gray10", "gray90"),
-                                                 hover_color=("gray70", "gray30"),
-                                                 anchor="w",
-                                                 command=self.video_editor_button_event)
-        self.video_editor_button.grid(row=3, column=0, sticky="ew")
+        # Checkbox to enable/disable automatically add artist record for common categories
+        self.auto_add_acc_record_checkbox = ctk.CTkCheckBox(self.auto_add_acc_record_frame,
+                                                            text="Automatically add record for Common Categories",
+                                                            variable=self.auto_add_acc_record_var)
+        self.auto_add_acc_record_checkbox.grid(row=0, column=0, padx=10, pady=10)
 
-        # Create Add/Remove button with specific styling and command
-        self.add_remove_button = ctk.CTkButton(self.navigation_frame, corner_radius=0, height=40, border_spacing=10,
-                                               text="Add/Remove",
-                                               fg_color="transparent", text_color=("gray10", "gray90"),
-                                               hover_color=("gray70", "gray30"),
-                                               anchor="w",
-                                               command=self.add_remove_button_event)
-        self.add_remove_button.grid(row=4, column=0, sticky="ew")
+        # Add and remove artist label frame
+        self.add_remove_acc_record_label_frame = ctk.CTkFrame(self.add_remove_artist_top_frame, corner_radius=0,
+                                                              fg_color="transparent")
+        self.add_remove_acc_record_label_frame.grid(row=3, column=0, padx=10, pady=10)
 
-        # Create Settings button with specific styling and command
-        self.settings_button = ctk.CTkButton(self.navigation_frame, corner_radius=0, height=40, border_spacing=10,
-                                             text="Settings",
-                                             fg_color="transparent", text_color=("gray10", "gray90"),
-                                             hover_color=("gray70", "gray30"),
-                                             anchor="w",
-                                             command=self.settings_button_event)
-        self.settings_button.grid(row=5, column=0, sticky="ew")
+        # Add/Remove Artist Label
+        self.add_remove_acc_record_label = ctk.CTkLabel(self.add_remove_acc_record_label_frame,
+                                                        text="Add/Remove Artist "
+                                                             "Common Categories "
+                                                             "Record",
+                                                        font=ctk.CTkFont(size=15, weight="bold"))
+        self.add_remove_acc_record_label.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
 
-        """
-        file_renamer_window
-        """
-        # Create file renamer frame
-        self.file_renamer_frame = ctk.CTkFrame(self, corner_radius=0, fg_color="transparent")
-        self.file_renamer_frame.grid(row=0, column=1, sticky="nsew")
-        self.file_renamer_frame.grid_columnconfigure(0, weight=1)
-        self.file_renamer_frame.grid_rowconfigure(0, weight=1)
+        # Add and remove artist entry frame
+        self.add_remove_acc_record_entry_frame = ctk.CTkFrame(self.add_remove_artist_top_frame, corner_radius=0,
+                                                              fg_color="transparent")
+        self.add_remove_acc_record_entry_frame.grid(row=4, column=0, padx=10, pady=10)
 
-        # Create a canvas and a scrollbar
-        self.file_renamer_canvas = ctk.CTkCanvas(self.file_renamer_frame, highlightthickness=0)
-        self.file_renamer_scrollbar = ctk.CTkScrollbar(self.file_renamer_frame, command=self.file_renamer_canvas.yview)
-        self.file_renamer_canvas.configure(yscrollcommand=self.file_renamer_scrollbar.set)
+        # Add artist button
+        self.add_acc_record_button = ctk.CTkButton(self.add_remove_acc_record_entry_frame, text="Add Artist C.C.",
+                                                   command=self.add_artist_to_common_categories_dictionary)
+        self.add_acc_record_button.grid(row=0, column=0, padx=5)
 
-        # Set default background color based on system mode
-        self.update_background_color()
+        # Add artist entry
+        self.add_acc_record_entry = ctk.CTkEntry(self.add_remove_acc_record_entry_frame, width=370)
+        self.add_acc_record_entry.grid(row=0, column=1, padx=5)
 
-        # Place the canvas and the scrollbar in the grid
-        self.file_renamer_canvas.grid(row=0, column=0, sticky="nsew")
-        self.file_renamer_scrollbar.grid(row=0, column=1, sticky="ns")
+        # Remove artist button
+        self.remove_acc_record_button = ctk.CTkButton(self.add_remove_acc_record_entry_frame, text="Remove Artist C.C.",
+                                                      command=self.remove_artist_from_common_categories_dictionary)
+        self.remove_acc_record_button.grid(row=0, column=2, padx=5, pady=5)
 
-        # Create a frame inside the canvas for scrollable content
-        self.file_renamer_scrollable_frame = ctk.CTkFrame(self.file_renamer_canvas, corner_radius=0,
-                                                          bg_color="transparent")
-        self.file_renamer_scrollable_frame_window = (self.file_renamer_canvas.create_window(
-            (0, 0),
-            window=self.file_renamer_scrollable_frame,
-            anchor="nw"))
+        # Remove artist entry
+        self.remove_acc_record_entry = ctk.CTkEntry(self.add_remove_acc_record_entry_frame, width=370)
+        self.remove_acc_record_entry.grid(row=0, column=3, padx=5)
 
-        # Bind canvas and frame for scrolling functionality
-        self.file_renamer_canvas.bind('<Configure>', self.on_canvas_configure)
-        self.file_renamer_scrollable_frame.bind('<Configure>', self.on_frame_configure)
+        # Add/Remove artist common categories label frame
+        self.add_remove_acc_label_frame = ctk.CTkFrame(self.add_remove_artist_top_frame, corner_radius=0,
+                                                       fg_color="transparent")
+        self.add_remove_acc_label_frame.grid(row=5, column=0, padx=10, pady=10)
 
-        # Top frame in the file renamer window
-        self.file_renamer_top_frame = ctk.CTkFrame(self.file_renamer_scrollable_frame, corner_radius=0,
-                                                   fg_color="transparent")
-        self.file_renamer_top_frame.grid(row=0, column=0, padx=10, pady=10)
+        # Add/Remove artist common categories Label
+        self.add_remove_acc_label = ctk.CTkLabel(self.add_remove_acc_label_frame, text="Add/Remove Artist "
+                                                                                       "Common Categories",
+                                                 font=ctk.CTkFont(size=15, weight="bold"))
+        self.add_remove_acc_label.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
 
-        # Browse file button
-        self.browse_file_button = ctk.CTkButton(self.file_renamer_top_frame, text="Browse File",
-                                                command=self.browse_input)
-        self.browse_file_button.grid(row=0, column=0, padx=5)
+        # Browse frame for artist common categories
+        self.acc_browse_frame = ctk.CTkFrame(self.add_remove_artist_top_frame, corner_radius=0,
+                                             fg_color="transparent")
+        self.acc_browse_frame.grid(row=6, column=0, padx=10, pady=10)
 
-        # Selected File Display
-        self.file_display_text = ctk.StringVar()
-        self.file_display_text.set("Select a file using the 'Browse File' button or drag and drop it into the "
-                                   "program...")
-        self.file_display_entry = ctk.CTkEntry(self.file_renamer_top_frame, width=850,
-                                               textvariable=self.file_display_text)
-        self.file_display_entry.grid(row=0, column=1, padx=5)
+        # Browse artist common categories button
+        self.browse_artist_button = ctk.CTkButton(self.acc_browse_frame, text="Browse Artist",
+                                                  command=lambda: self.browse_artist(mode="Browse"))
+        self.browse_artist_button.grid(row=0, column=0, padx=5)
 
-        # Name Length Display
-        self.name_length_text = ctk.IntVar()
-        self.name_length_label = ctk.CTkLabel(self.file_renamer_top_frame, textvariable=self.name_length_text)
-        self.name_length_label.grid(row=0, column=2, padx=5)
+        # Artist Common Categories Display
+        self.acc_display_text = ctk.StringVar()
+        self.acc_display_text.set("Select an Artist using the 'Browse Artist' button...")
+        self.acc_display_entry = ctk.CTkEntry(self.acc_browse_frame, width=900,
+                                              textvariable=self.acc_display_text)
+        self.acc_display_entry.grid(row=0, column=1, padx=5)
 
-        # Categories button frame
-        self.cat_button_frame = ctk.CTkFrame(self.file_renamer_scrollable_frame,
-                                             corner_radius=0, fg_color="transparent")
-        self.cat_button_frame.grid(row=1, column=0, padx=10, pady=5)
+        # Detect artist button
+        self.detect_artist_button = ctk.CTkButton(self.acc_browse_frame, text="Detect Artist",
+                                                  command=lambda: self.browse_artist(mode="Detect"))
+        self.detect_artist_button.grid(row=1, column=0, padx=5, pady=10)
 
-        # Create a cat_tabview and initialize category buttons on cat_button_frame
-        self.create_cat_tabview()
+        # Add and remove artist common categories entry frame
+        self.add_remove_acc_entry_frame = ctk.CTkFrame(self.add_remove_artist_top_frame, corner_radius=0,
+                                                       fg_color="transparent")
+        self.add_remove_acc_entry_frame.grid(row=7, column=0, padx=10, pady=10)
 
-        # Frame to group custom text entry and output directory
-        self.custom_text_frame = ctk.CTkFrame(self.file_renamer_scrollable_frame, corner_radius=0,
-                                              fg_color="transparent")
-        self.custom_text_frame.grid(row=2, column=0, padx=10)
+        # Add artist common categories button
+        self.add_acc_button = ctk.CTkButton(self.add_remove_acc_entry_frame, text="Add A.C.C.",
+                                            command=self.add_artist_common_category)
+        self.add_acc_button.grid(row=0, column=0, padx=5)
 
-        # Output Directory Browse Button
-        self.output_directory_browse_button = ctk.CTkButton(self.custom_text_frame,
-                                                            text="Output Directory",
-                                                            command=self.browse_output_directory)
-        self.output_directory_browse_button.grid(row=0, column=0, padx=5, pady=5)
+        # Add artist common categories entry
+        self.add_acc_entry = ctk.CTkEntry(self.add_remove_acc_entry_frame, width=370)
+        self.add_acc_entry.grid(row=0, column=1, padx=5)
 
-        # Output Directory Entry
-        self.output_directory_entry = ctk.CTkEntry(self.custom_text_frame, width=340)
-        self.output_directory_entry.grid(row=0, column=1, padx=5, pady=5)
+        # Remove artist common categories button
+        self.remove_acc_button = ctk.CTkButton(self.add_remove_acc_entry_frame, text="Remove A.C.C.",
+                                               command=self.remove_artist_common_category)
+        self.remove_acc_button.grid(row=0, column=2, padx=5, pady=5)
 
-        # Prefix Text Entry
-        self.prefix_text_entry = ctk.CTkEntry(self.custom_text_frame, width=70)
-        self.prefix_text_entry.insert(0, "Prefix...")
-        self.prefix_text_entry.grid(row=0, column=2, padx=10, pady=10)
+        # Remove artist common categories entry
+        self.remove_acc_entry = ctk.CTkEntry(self.add_remove_acc_entry_frame, width=370)
+        self.remove_acc_entry.grid(row=0, column=3, padx=5)
 
-        # Bind the update_file_display function to the prefix text entry change event
-        self.prefix_text_entry.bind("<KeyRelease>", self.update_file_display)
+        """Category Tab"""
+        self.category_frame = ctk.CTkFrame(self.add_remove_tabs.get("Category"), corner_radius=0,
+                                           fg_color="transparent")
+        self.category_frame.grid(row=0, column=0, padx=10, pady=10)
 
-        # Custom Text Entry
-        self.custom_text_entry = ctk.CTkEntry(self.custom_text_frame, width=290)
-        self.custom_text_entry.insert(0, "Enter your custom text here...")
-        self.custom_text_entry.grid(row=0, column=3, padx=10, pady=10)
+        # Add Category Button
+        self.add_category_button = ctk.CTkButton(self.category_frame, text="Add Category", command=self.add_category)
+        self.add_category_button.grid(row=0, column=0, padx=5)
 
-        # Bind the update_file_display function to the custom text entry change event
-        self.custom_text_entry.bind("<KeyRelease>", self.update_file_display)
+        # Add Category Entry
+        self.category_entry = ctk.CTkEntry(self.category_frame, width=310)
+        self.category_entry.grid(row=0, column=1, padx=5)
 
-        # Rename File Button
-        self.rename_button = ctk.CTkButton(self.custom_text_frame, text="Rename",
-                                           command=self.rename_files)
-        self.rename_button.grid(row=0, column=4, padx=5, pady=5)
+        # Weight Label
+        self.weight_label = ctk.CTkLabel(self.category_frame, text="Weight:")
+        self.weight_label.grid(row=0, column=2, padx=5)
 
-        # Frame to group miscellaneous buttons
-        self.button_group_frame = ctk.CTkFrame(self.file_renamer_scrollable_frame, corner_radius=0,
-                                               fg_color="transparent")
-        self.button_group_frame.grid(row=3, column=0, padx=10)
+        # Initialize weight variable
+        self.weight_var = ctk.StringVar()
+        self.weight_var.set(self.default_weight)
 
-        # Undo Button
-        self.undo_button = ctk.CTkButton(self.button_group_frame, text="Undo", command=self.undo_last)
-        self.undo_button.grid(row=0, column=0, padx=10, pady=10)
+        # Trace the changes in the StringVar
+        self.weight_var.trace_add("write",
+                                  lambda name, index, mode, var=self.weight_var, default=self.default_weight,
+                                         desired_type=int: self.validate_entry(var, default, desired_type))
 
-        # Undo File Rename Button
-        self.undo_file_rename_button = ctk.CTkButton(self.button_group_frame,
-                                                     text="Undo File Rename",
-                                                     command=self.undo_file_rename)
-        self.undo_file_rename_button.grid(row=0, column=1, padx=10, pady=10)
+        # Weight Entry
+        self.weight_entry = ctk.CTkEntry(self.category_frame, textvariable=self.weight_var, width=50)
+        self.weight_entry.grid(row=0, column=3, padx=5)
 
-        # Clear Button
-        self.clear_button = ctk.CTkButton(self.button_group_frame, text="Clear",
-                                          command=lambda: self.clear_selection(frame_name="file_renamer_window"))
-        self.clear_button.grid(row=0, column=2, padx=10, pady=10)
+        # Remove Category Button
+        self.remove_category_button = ctk.CTkButton(self.category_frame, text="Remove Category",
+                                                    command=self.remove_category)
+        self.remove_category_button.grid(row=0, column=4, padx=5)
 
-        # Move to Trash Button
-        self.trash_button = ctk.CTkButton(self.button_group_frame, text="Move to Trash",
-                                          command=self.move_file_to_trash)
-        self.trash_button.grid(row=0, column=3, padx=10, pady=10)
+        # Remove Category Entry
+        self.remove_category_entry = ctk.CTkEntry(self.category_frame, width=310)
+        self.remove_category_entry.grid(row=0, column=5, padx=5)
 
-        # Select File Renamer Last Used File Button
-        self.file_renamer_last_used_file_button = ctk.CTkButton(self.button_group_frame, text="Reload Last File",
-                                                                command=self.load_last_used_file)
-        self.file_renamer_last_used_file_button.grid(row=0, column=4, padx=10, pady=10)
+        """Custom Tab Name Tab"""
+        self.ctn_frame = ctk.CTkFrame(self.add_remove_tabs.get("Custom Tab Name"), corner_radius=0,
+                                      fg_color="transparent")
+        self.ctn_frame.grid(row=0, column=0, padx=10, pady=10)
 
-        # Frame to display the last used file
-        self.last_used_frame = ctk.CTkFrame(self.file_renamer_scrollable_frame, corner_radius=0, fg_color="transparent")
-        self.last_used_frame.grid(row=4, column=0, padx=5)
+        # Add Custom Tab Name Button
+        self.add_ctn_button = ctk.CTkButton(self.ctn_frame, text="Add Custom Tab", command=self.add_custom_tab_name)
+        self.add_ctn_button.grid(row=0, column=0, padx=5)
 
-        # Last Used File Label
-        self.last_used_display_label = ctk.CTkLabel(self.last_used_frame, text="Last used file:")
-        self.last_used_display_label.grid(row=0, column=0, padx=5, pady=5)
+        # Add Custom Tab Name Entry
+        self.custom_tab_name_entry = ctk.CTkEntry(self.ctn_frame, width=310)
+        self.custom_tab_name_entry.grid(row=0, column=1, padx=5)
+
+        # Weight1 Label
+        self.weight_label1 = ctk.CTkLabel(self.ctn_frame, text="Weight:")
+        self.weight_label1.grid(row=0, column=2, padx=5)
 
-        # Last Used File Display
-        self.last_used_display = ctk.CTkLabel(self.last_used_frame, text="")
-        self.last_used_display.grid(row=0, column=1, padx=5, pady=5)
+        # Initialize weight variable
+        self.weight_var1 = ctk.StringVar()
+        self.weight_var1.set(self.default_ctn_weight)
 
-        # Frame to display messages
-        self.file_renamer_message_label_frame = ctk.CTkFrame(self.file_renamer_scrollable_frame, corner_radius=0,
-                                                             fg_color="transparent")
-        self.file_renamer_message_label_frame.grid(row=5, column=0, padx=10)
+        # Trace the changes in the StringVar
+        self.weight_var1.trace_add("write",
+                                   lambda name, index, mode, var=self.weight_var1, default=self.default_ctn_weight,
+                                          desired_type=int: self.validate_entry(var, default, desired_type))
 
-        # Message Label
-        self.file_renamer_message_label = ctk.CTkLabel(self.file_renamer_message_label_frame, text="")
-        self.file_renamer_message_label.grid(row=0, column=0, padx=10, pady=10)
+        # Weight Entry1
+        self.weight_entry1 = ctk.CTkEntry(self.ctn_frame, textvariable=self.weight_var1, width=50)
+        self.weight_entry1.grid(row=0, column=3, padx=5)
 
-        # Frame to group placement frame
-        self.placement_frame = ctk.CTkFrame(self.file_renamer_scrollable_frame, corner_radius=0, fg_color="transparent")
-        self.placement_frame.grid(row=6, column=0, padx=10, pady=10)
+        # Remove Custom Tab Name Button
+        self.remove_ctn_button = ctk.CTkButton(self.ctn_frame, text="Remove Custom Tab",
+                                               command=self.remove_custom_tab_name)
+        self.remove_ctn_button.grid(row=0, column=4, padx=5)
 
-        # Placement Label
-        self.placement_label = ctk.CTkLabel(self.placement_frame, text="Placement:")
-        self.placement_label.grid(row=0, column=0, padx=10)
+        # Remove Custom Tab Name Entry
+        self.remove_custom_tab_name_entry = ctk.CTkEntry(self.ctn_frame, width=310)
+        self.remove_custom_tab_name_entry.grid(row=0, column=5, padx=5)
 
-        # Variable to track the user's placement choice (prefix, suffix, or special_character)
-        self.placement_choice = ctk.StringVar()
-        self.placement_choice.set(self.default_placement_var)
+        """Custom Text to Replace Tab"""
+        # Custom Text to Replace frame
+        self.ctr_entry_frame = ctk.CTkFrame(self.add_remove_tabs.get("Custom Text to Replace"), corner_radius=0,
+                                            fg_color="transparent")
+        self.ctr_entry_frame.grid(row=0, column=0, padx=10, pady=10)
 
-        # Trace the changes in the StringVar
-        self.placement_choice.trace_add("write", self.update_file_display)
+        # Add ctr button
+        self.add_ctr_button = ctk.CTkButton(self.ctr_entry_frame, text="Add CTR",
+                                            command=self.add_custom_text_to_replace)
+        self.add_ctr_button.grid(row=0, column=0, padx=5)
 
-        # Radio button for prefix
-        self.prefix_radio = ctk.CTkRadioButton(self.placement_frame, text="Prefix",
-                                               variable=self.placement_choice,
-                                               value="prefix")
-        self.prefix_radio.grid(row=0, column=1, padx=10)
+        # Add ctr entry
+        self.add_ctr_name_entry = ctk.CTkEntry(self.ctr_entry_frame, width=370)
+        self.add_ctr_name_entry.grid(row=0, column=1, padx=5, pady=10)
 
-        # Radio button for special_character
-        self.special_character_radio = ctk.CTkRadioButton(self.placement_frame,
-                                                          text=f"Special Character: {self.special_character_var}",
-                                                          variable=self.placement_choice,
-                                                          value="special_character")
-        self.special_character_radio.grid(row=0, column=2, padx=10)
+        # Replacement Label
+        self.replacement_label = ctk.CTkLabel(self.ctr_entry_frame, text="Replace with:")
+        self.replacement_label.grid(row=0, column=2, padx=5, pady=10)
 
-        # Radio button for suffix
-        self.suffix_radio = ctk.CTkRadioButton(self.placement_frame, text="Suffix",
-                                               variable=self.placement_choice,
-                                               value="suffix")
-        self.suffix_radio.grid(row=0, column=3, padx=10)
+        # Replacement text entry
+        self.replacement_text_entry = ctk.CTkEntry(self.ctr_entry_frame, width=100)
+        self.replacement_text_entry.grid(row=0, column=3, padx=5, pady=10)
 
-        # Frame to group folder operations
-        self.folder_operations_frame = ctk.CTkFrame(self.file_renamer_scrollable_frame, corner_radius=0,
-                                                    fg_color="transparent")
-        self.folder_operations_frame.grid(row=7, column=0, padx=10)
+        # Remove ctr button
+        self.remove_ctr_button = ctk.CTkButton(self.ctr_entry_frame, text="Remove CTR",
+                                               command=self.remove_custom_text_to_replace)
+        self.remove_ctr_button.grid(row=1, column=0, padx=5)
 
-        # Checkbox to enable/disable resetting the Output Directory
-        self.reset_output_directory_switch = ctk.CTkSwitch(self.folder_operations_frame,
-                                                               text="Reset Output Dir.",
-                                                               variable=self.reset_output_directory_var)
-        self.reset_output_directory_switch.grid(row=0, column=0, padx=10, pady=10)
+        # Remove ctr entry
+        self.remove_ctr_name_entry = ctk.CTkEntry(self.ctr_entry_frame, width=370)
+        self.remove_ctr_name_entry.grid(row=1, column=1, padx=5)
 
-        # Checkbox to enable/disable suggesting an output directory
-        self.suggest_output_directory_switch = ctk.CTkSwitch(self.folder_operations_frame, text="Suggest Output "
-                                                                                                    "Dir.",
-                                                                 variable=self.suggest_output_directory_var)
-        self.suggest_output_directory_switch.grid(row=0, column=1, padx=5, pady=5)
+        """Exclude Tab"""
+        # Exclude frame
+        self.exclude_entry_frame = ctk.CTkFrame(self.add_remove_tabs.get("Exclude"), corner_radius=0,
+                                                fg_color="transparent")
+        self.exclude_entry_frame.grid(row=0, column=0, padx=10, pady=10)
 
-        # Checkbox to enable/disable moving the file up one folder
-        self.move_up_directory_switch = ctk.CTkSwitch(self.folder_operations_frame, text="Move Up One Dir.",
-                                                          variable=self.move_up_directory_var)
-        self.move_up_directory_switch.grid(row=0, column=2, padx=5, pady=5)
+        # Add Exclude button
+        self.add_exclude_button = ctk.CTkButton(self.exclude_entry_frame, text="Add Exclude",
+                                                command=self.add_folder_to_excluded_folders)
+        self.add_exclude_button.grid(row=0, column=0, padx=5)
 
-        # Checkbox to enable/disable move text between - and __-__
-        self.move_text_switch = ctk.CTkSwitch(self.folder_operations_frame, text="Move Text",
-                                                  variable=self.move_text_var)
-        self.move_text_switch.grid(row=0, column=3, padx=5, pady=5)
+        # Add Exclude entry
+        self.add_exclude_name_entry = ctk.CTkEntry(self.exclude_entry_frame, width=370)
+        self.add_exclude_name_entry.grid(row=0, column=1, padx=5)
 
-        # Checkbox to enable/disable add artist common categories
-        self.artist_common_categories_switch = ctk.CTkSwitch(self.folder_operations_frame,
-                                                                 text="Add Artist Common Categories",
-                                                                 variable=self.artist_common_categories_var)
-        self.artist_common_categories_switch.grid(row=0, column=4, padx=5, pady=5)
+        # Remove Exclude button
+        self.remove_exclude_button = ctk.CTkButton(self.exclude_entry_frame, text="Remove Exclude",
+                                                   command=self.remove_folder_from_excluded_folders)
+        self.remove_exclude_button.grid(row=0, column=3, padx=5)
 
-        # Bind the callback function to the artist_common_categories_var variable
-        self.artist_common_categories_var.trace_add("write", self.handle_common_categories_state)
+        # Remove Exclude entry
+        self.remove_exclude_name_entry = ctk.CTkEntry(self.exclude_entry_frame, width=370)
+        self.remove_exclude_name_entry.grid(row=0, column=4, padx=5)
 
-        # Send to Module frame
-        self.send_to_module_frame = ctk.CTkFrame(self.file_renamer_scrollable_frame,
-                                                 corner_radius=0,
-                                                 fg_color="transparent")
-        self.send_to_module_frame.grid(row=8, column=0, padx=5)
+        """File Extensions Tab"""
+        # File Extension frame
+        self.file_extension_entry_frame = ctk.CTkFrame(self.add_remove_tabs.get("File Extensions"), corner_radius=0,
+                                                       fg_color="transparent")
+        self.file_extension_entry_frame.grid(row=0, column=0, padx=10, pady=10)
 
-        # Send to Video Editor button
-        self.send_to_video_editor_button = ctk.CTkButton(self.send_to_module_frame, text="Send to Video Editor",
-                                                         command=lambda: self.send_to_module(
-                                                             destination="video_editor_module"))
-        self.send_to_video_editor_button.grid(row=0, column=0, padx=10, pady=10)
+        # Add File Extension button
+        self.add_file_extension_button = ctk.CTkButton(self.file_extension_entry_frame, text="Add File Ext.",
+                                                       command=self.add_file_extension)
+        self.add_file_extension_button.grid(row=0, column=0, padx=5)
 
-        # Send to Name Normalizer button
-        self.send_to_name_normalizer_button = ctk.CTkButton(self.send_to_module_frame,
-                                                            text="Send to Name Normalizer",
-                                                            command=lambda: self.send_to_module(
-                                                                destination="name_normalizer_module"))
-        self.send_to_name_normalizer_button.grid(row=0, column=1, padx=10, pady=10)
+        # Add File Extension entry
+        self.add_file_extension_entry = ctk.CTkEntry(self.file_extension_entry_frame, width=370)
+        self.add_file_extension_entry.grid(row=0, column=1, padx=5)
 
-        """
-        name_normalizer_window
-        """
-        # Create Name Normalizer frame
-        self.name_normalizer_frame = ctk.CTkFrame(self, corner_radius=0, fg_color="transparent")
-        self.name_normalizer_frame.grid_columnconfigure(0, weight=1)
+        # Remove File Extension button
+        self.remove_file_extension_button = ctk.CTkButton(self.file_extension_entry_frame, text="Remove File Ext.",
+                                                          command=self.remove_file_extension)
+        self.remove_file_extension_button.grid(row=0, column=3, padx=5)
 
-        # Name Normalizer Label
-        self.name_normalizer_label = ctk.CTkLabel(self.name_normalizer_frame, text="Name Normalizer",
-                                                  font=ctk.CTkFont(size=15, weight="bold"))
-        self.name_normalizer_label.grid(row=0, column=0, padx=10, pady=10)
+        # Remove File Extension entry
+        self.remove_file_extension_entry = ctk.CTkEntry(self.file_extension_entry_frame, width=370)
+        self.remove_file_extension_entry.grid(row=0, column=4, padx=5)
 
-        # Name Normalizer Top frame
-        self.name_normalizer_top_frame = ctk.CTkFrame(self.name_normalizer_frame, corner_radius=0,
-                                                      fg_color="transparent")
-        self.name_normalizer_top_frame.grid(row=1, column=0, padx=10, pady=5)
+        """NO-GO Tab"""
+        # NO-GO frame
+        self.no_go_entry_frame = ctk.CTkFrame(self.add_remove_tabs.get("NO GO"), corner_radius=0,
+                                              fg_color="transparent")
+        self.no_go_entry_frame.grid(row=0, column=0, padx=10, pady=10)
 
-        # Browse button
-        self.nn_browse_button = ctk.CTkButton(self.name_normalizer_top_frame, text="Browse",
-                                              command=self.browse_input)
-        self.nn_browse_button.grid(row=0, column=0, padx=5, pady=5)
+        # Add NO-GO button
+        self.add_no_go_button = ctk.CTkButton(self.no_go_entry_frame, text="Add NO GO",
+                                              command=self.no_go_creation)
+        self.add_no_go_button.grid(row=0, column=0, padx=5)
 
-        # Name Normalizer Display
-        self.nn_display_text = ctk.StringVar()
-        self.nn_display_text.set("Select a folder or file to normalize using the 'Browse' button...")
-        self.nn_path_entry = ctk.CTkEntry(self.name_normalizer_top_frame, width=890, textvariable=self.nn_display_text)
-        self.nn_path_entry.grid(row=0, column=1, padx=10, pady=10)
+        # Add NO-GO entry
+        self.add_no_go_name_entry = ctk.CTkEntry(self.no_go_entry_frame, width=370)
+        self.add_no_go_name_entry.grid(row=0, column=1, padx=5)
 
-        # Button Frame 1
-        self.checkbox_frame1 = ctk.CTkFrame(self.name_normalizer_frame, corner_radius=0,
-                                            fg_color="transparent")
-        self.checkbox_frame1.grid(row=2, column=0, padx=10, pady=5)
+        # Remove NO-GO button
+        self.remove_no_go_button = ctk.CTkButton(self.no_go_entry_frame, text="Remove NO GO",
+                                                 command=self.no_go_removal)
+        self.remove_no_go_button.grid(row=0, column=3, padx=5)
 
-        # Checkbox to enable/disable Artist Identifier
-        self.artist_identifier_checkbox = ctk.CTkCheckBox(self.checkbox_frame1,
-                                                          text="Artist Identifier",
-                                                          variable=self.artist_identifier_var)
-        self.artist_identifier_checkbox.grid(row=0, column=0, padx=10, pady=10)
+        # Remove NO-GO entry
+        self.remove_no_go_name_entry = ctk.CTkEntry(self.no_go_entry_frame, width=370)
+        self.remove_no_go_name_entry.grid(row=0, column=4, padx=5)
 
-        # Trace the changes in the variable
-        self.artist_identifier_var.trace_add("write", self.update_nn_display)
+        """Valid Extensions Tab"""
+        # Valid Extension frame
+        self.valid_extension_entry_frame = ctk.CTkFrame(self.add_remove_tabs.get("Valid Extensions"), corner_radius=0,
+                                                        fg_color="transparent")
+        self.valid_extension_entry_frame.grid(row=0, column=0, padx=10, pady=10)
 
-        # Checkbox to enable/disable remove all symbols ,;:@$%^&#*+=(){}[]|\<>'"?_-–—
-        self.remove_all_symbols_checkbox = ctk.CTkCheckBox(self.checkbox_frame1,
-                                                           text="Remove all symbols",
-                                                           variable=self.remove_all_symbols_var)
-        self.remove_all_symbols_checkbox.grid(row=0, column=1, padx=10, pady=10)
+        # Add Valid Extension button
+        self.add_valid_extension_button = ctk.CTkButton(self.valid_extension_entry_frame, text="Add Valid Ext.",
+                                                        command=self.add_valid_extension)
+        self.add_valid_extension_button.grid(row=0, column=0, padx=5)
 
-        # Trace the changes in the variable
-        self.remove_all_symbols_var.trace_add("write", self.update_nn_display)
+        # Add Valid Extension entry
+        self.add_valid_extension_entry = ctk.CTkEntry(self.valid_extension_entry_frame, width=370)
+        self.add_valid_extension_entry.grid(row=0, column=1, padx=5)
 
-        # Checkbox to enable/disable remove most symbols ,;:@$%^&*+={}[]|\<>"?-–—
-        self.remove_most_symbols_checkbox = ctk.CTkCheckBox(self.checkbox_frame1,
-                                                            text="Remove most symbols",
-                                                            variable=self.remove_most_symbols_var)
-        self.remove_most_symbols_checkbox.grid(row=0, column=2, padx=10, pady=10)
+        # Remove Valid Extension button
+        self.remove_valid_extension_button = ctk.CTkButton(self.valid_extension_entry_frame, text="Remove Valid Ext.",
+                                                           command=self.remove_valid_extension)
+        self.remove_valid_extension_button.grid(row=0, column=3, padx=5)
 
-        # Trace the changes in the variable
-        self.remove_most_symbols_var.trace_add("write", self.update_nn_display)
+        # Remove Valid Extension entry
+        self.remove_valid_extension_entry = ctk.CTkEntry(self.valid_extension_entry_frame, width=370)
+        self.remove_valid_extension_entry.grid(row=0, column=4, padx=5)
 
-        # Checkbox to enable/disable remove non-ascii symbols
-        self.remove_non_ascii_symbols_checkbox = ctk.CTkCheckBox(self.checkbox_frame1,
-                                                                 text="Remove non-ASCII symbols",
-                                                                 variable=self.remove_non_ascii_symbols_var)
-        self.remove_non_ascii_symbols_checkbox.grid(row=0, column=3, padx=10, pady=10)
+        # Frame for clear add/remove button
+        self.clear_add_remove_frame = ctk.CTkFrame(self.add_remove_frame, corner_radius=0,
+                                                   fg_color="transparent")
+        self.clear_add_remove_frame.grid(row=2, column=0, padx=10)
 
-        # Trace the changes in the variable
-        self.remove_non_ascii_symbols_var.trace_add("write", self.update_nn_display)
+        # Clear add/remove Button
+        self.clear_add_remove_button = ctk.CTkButton(self.clear_add_remove_frame,
+                                                     text="Clear",
+                                                     command=lambda: self.clear_selection(
+                                                         frame_name="add_remove_window"))
+        self.clear_add_remove_button.grid(row=0, column=0, padx=10, pady=10)
 
-        # Checkbox to enable/disable remove numbers
-        self.remove_numbers_checkbox = ctk.CTkCheckBox(self.checkbox_frame1,
-                                                       text="Remove numbers",
-                                                       variable=self.remove_number_var)
-        self.remove_numbers_checkbox.grid(row=0, column=4, padx=10, pady=10)
+        # Frame for reset add/remove checkbox
+        self.reset_add_remove_frame = ctk.CTkFrame(self.add_remove_frame, corner_radius=0,
+                                                   fg_color="transparent")
+        self.reset_add_remove_frame.grid(row=3, column=0, padx=10, pady=10)
 
-        # Trace the changes in the variable
-        self.remove_number_var.trace_add("write", self.update_nn_display)
+        # Checkbox to enable/disable reset add/remove entries
+        self.reset_add_remove_switch = ctk.CTkSwitch(self.reset_add_remove_frame,
+                                                         text="Reset entries",
+                                                         variable=self.reset_add_remove_var)
+        self.reset_add_remove_switch.grid(row=0, column=1, padx=10, pady=10)
 
-        # Button Frame 2
-        self.checkbox_frame2 = ctk.CTkFrame(self.name_normalizer_frame, corner_radius=0,
-                                            fg_color="transparent")
-        self.checkbox_frame2.grid(row=3, column=0, padx=10, pady=5)
+        # Frame to display messages on the add/remove frame
+        self.add_remove_message_label_frame = ctk.CTkFrame(self.add_remove_frame, corner_radius=0,
+                                                           fg_color="transparent")
+        self.add_remove_message_label_frame.grid(row=13, column=0, padx=10)
 
-        # Checkbox to enable/disable remove dashes
-        self.remove_dash_checkbox = ctk.CTkCheckBox(self.checkbox_frame2,
-                                                    text="Remove dashes",
-                                                    variable=self.remove_dash_var)
-        self.remove_dash_checkbox.grid(row=0, column=0, padx=10, pady=10)
+        # Add/Remove Message Label
+        self.add_remove_message_label = ctk.CTkLabel(self.add_remove_message_label_frame, text="")
+        self.add_remove_message_label.grid(row=0, column=0, padx=10, pady=10)
 
-        # Trace the changes in the variable
-        self.remove_dash_var.trace_add("write", self.update_nn_display)
+        """
+        settings_window
+        """
+        # Create settings frame
+        self.settings_frame = ctk.CTkFrame(self, corner_radius=0, fg_color="transparent")
+        self.settings_frame.grid_columnconfigure(0, weight=1)
 
-        # Checkbox to enable/disable remove endashes
-        self.remove_endash_checkbox = ctk.CTkCheckBox(self.checkbox_frame2,
-                                                      text="Remove endashes",
-                                                      variable=self.remove_endash_var)
-        self.remove_endash_checkbox.grid(row=0, column=1, padx=10, pady=10)
+        # Settings label
+        self.settings_label = ctk.CTkLabel(self.settings_frame, text="Settings",
+                                           font=ctk.CTkFont(size=15, weight="bold"))
+        self.settings_label.grid(row=0, column=0, padx=5, pady=5, columnspan=5)
 
-        # Trace the changes in the variable
-        self.remove_endash_var.trace_add("write", self.update_nn_display)
+        # Create a settings_tabview on settings_frame row 1
+        self.settings_tabview, self.settings_tabs = self.create_tabview(self.settings_frame,
+                                                                        self.settings_tab_names)
 
-        # Checkbox to enable/disable remove emdashes
-        self.remove_emdash_checkbox = ctk.CTkCheckBox(self.checkbox_frame2,
-                                                      text="Remove emdashes",
-                                                      variable=self.remove_emdash_var)
-        self.remove_emdash_checkbox.grid(row=0, column=2, padx=10, pady=10)
+        """Appearance Tab"""
+        # GUI settings frame
+        self.gui_settings_frame = ctk.CTkFrame(self.settings_tabs.get("Appearance"), corner_radius=0,
+                                               fg_color="transparent")
+        self.gui_settings_frame.grid(row=0, column=0, padx=10, pady=10)
 
-        # Trace the changes in the variable
-        self.remove_emdash_var.trace_add("write", self.update_nn_display)
+        # Select light or dark label
+        self.appearance_mode_label = ctk.CTkLabel(self.gui_settings_frame, text="Appearance:")
+        self.appearance_mode_label.grid(row=0, column=0, padx=10, pady=10)
 
-        # Checkbox to enable/disable remove hashtags
-        self.remove_hashtag_checkbox = ctk.CTkCheckBox(self.checkbox_frame2,
-                                                       text="Remove hashtags",
-                                                       variable=self.remove_hashtag_var)
-        self.remove_hashtag_checkbox.grid(row=0, column=3, padx=10, pady=10)
+        # Select light or dark mode
+        self.appearance_mode_menu = ctk.CTkOptionMenu(self.gui_settings_frame,
+                                                      values=["Light", "Dark"],
+                                                      command=self.change_appearance_mode_event)
+        self.appearance_mode_menu.grid(row=0, column=1, padx=10, pady=10)
 
-        # Trace the changes in the variable
-        self.remove_hashtag_var.trace_add("write", self.update_nn_display)
+        # Set default value for appearance
+        self.appearance_mode_menu.set("Dark")
 
-        # Checkbox to enable/disable remove commas
-        self.remove_comma_checkbox = ctk.CTkCheckBox(self.checkbox_frame2,
-                                                     text="Remove commas",
-                                                     variable=self.remove_comma_var)
-        self.remove_comma_checkbox.grid(row=0, column=4, padx=10, pady=10)
+        # Select scaling label
+        self.scaling_label = ctk.CTkLabel(self.gui_settings_frame, text="UI Scaling:")
+        self.scaling_label.grid(row=1, column=0, padx=10, pady=10)
 
-        # Trace the changes in the variable
-        self.remove_comma_var.trace_add("write", self.update_nn_display)
+        # Select scaling level
+        self.scaling_optionemenu = ctk.CTkOptionMenu(self.gui_settings_frame,
+                                                     values=["70%", "80%", "90%", "100%", "110%", "120%"],
+                                                     command=self.change_scaling_event)
+        self.scaling_optionemenu.grid(row=1, column=1, padx=10, pady=10)
 
-        # Checkbox to enable/disable remove parenthesis and trailing text
-        self.remove_parenthesis_trail_checkbox = ctk.CTkCheckBox(self.checkbox_frame2,
-                                                                 text="( onward",
-                                                                 variable=self.remove_parenthesis_trail_var)
-        self.remove_parenthesis_trail_checkbox.grid(row=0, column=5, padx=10, pady=10)
+        # Set default value for scaling
+        self.scaling_optionemenu.set(f"{self.scaling}%")
 
-        # Trace the changes in the variable
-        self.remove_parenthesis_trail_var.trace_add("write", self.update_nn_display)
+        """Artist Tab"""
+        # Artist frame
+        self.artist_frame = ctk.CTkFrame(self.settings_tabs.get("Artist"), corner_radius=0,
+                                         fg_color="transparent")
+        self.artist_frame.grid(row=0, column=0, padx=10, pady=10)
 
-        # Button Frame 3
-        self.checkbox_frame3 = ctk.CTkFrame(self.name_normalizer_frame, corner_radius=0,
-                                            fg_color="transparent")
-        self.checkbox_frame3.grid(row=4, column=0, padx=10, pady=5)
+        # Artist switch frame
+        self.artist_switch_frame = ctk.CTkFrame(self.artist_frame, corner_radius=0,
+                                                fg_color="transparent")
+        self.artist_switch_frame.grid(row=0, column=0, padx=10, pady=10)
 
-        # Checkbox to enable/disable remove ampersands
-        self.remove_ampersand_checkbox = ctk.CTkCheckBox(self.checkbox_frame3,
-                                                         text="Remove &",
-                                                         variable=self.remove_ampersand_var)
-        self.remove_ampersand_checkbox.grid(row=0, column=0, padx=10, pady=10)
+        # Artist Search label
+        self.artist_search_label = ctk.CTkLabel(self.artist_switch_frame, text="Artist Search")
+        self.artist_search_label.grid(row=0, column=0, padx=10, pady=5)
 
-        # Trace the changes in the variable
-        self.remove_ampersand_var.trace_add("write", self.update_nn_display)
+        # Switch to enable/disable artist search
+        self.artist_search_switch = ctk.CTkSwitch(self.artist_switch_frame, text="Artist Search",
+                                                  variable=self.artist_search_var)
+        self.artist_search_switch.grid(row=1, column=0, padx=10, pady=10)
 
-        # Checkbox to enable/disable remove @
-        self.remove_at_checkbox = ctk.CTkCheckBox(self.checkbox_frame3,
-                                                  text="Remove @",
-                                                  variable=self.remove_at_var)
-        self.remove_at_checkbox.grid(row=0, column=1, padx=10, pady=10)
+        # Switch to enable/disable ignore known artists for artist search
+        self.ignore_known_artists_switch = ctk.CTkSwitch(self.artist_switch_frame, text="Ignore Known Artists",
+                                                         variable=self.ignore_known_artists_var)
+        self.ignore_known_artists_switch.grid(row=1, column=1, padx=10, pady=10)
 
-        # Trace the changes in the variable
-        self.remove_at_var.trace_add("write", self.update_nn_display)
+        # Artist Identifier label
+        self.artist_identifier_label = ctk.CTkLabel(self.artist_switch_frame, text="Artist Identifier")
+        self.artist_identifier_label.grid(row=2, column=0, padx=10, pady=5)
 
-        # Checkbox to enable/disable remove underscores
-        self.remove_underscore_checkbox = ctk.CTkCheckBox(self.checkbox_frame3,
-                                                          text="Remove underscores",
-                                                          variable=self.remove_underscore_var)
-        self.remove_underscore_checkbox.grid(row=0, column=2, padx=10, pady=10)
+        # Switch to enable/disable remove duplicates
+        self.remove_duplicates_switch = ctk.CTkSwitch(self.artist_switch_frame,
+                                                      text="Remove Artist Duplicates From Filename",
+                                                      variable=self.remove_artist_duplicates_var)
+        self.remove_duplicates_switch.grid(row=3, column=0, padx=10, pady=10)
 
-        # Trace the changes in the variable
-        self.remove_underscore_var.trace_add("write", self.update_nn_display)
+        # Duplicate removal label
+        self.duplicate_removal_label = ctk.CTkLabel(self.artist_switch_frame, text="Duplicate Removal")
+        self.duplicate_removal_label.grid(row=4, column=0, padx=10, pady=5)
 
-        # Checkbox to enable/disable remove single quotes
-        self.remove_single_quote_checkbox = ctk.CTkCheckBox(self.checkbox_frame3,
-                                                            text="Remove single quotes",
-                                                            variable=self.remove_single_quote_var)
-        self.remove_single_quote_checkbox.grid(row=0, column=3, padx=10, pady=10)
+        # Switch to enable/disable remove word duplicates
+        self.remove_word_duplicates_switch = ctk.CTkSwitch(self.artist_switch_frame,
+                                                           text="Remove Word Duplicates From Filename",
+                                                           variable=self.remove_word_duplicates_var)
+        self.remove_word_duplicates_switch.grid(row=5, column=0, padx=10, pady=10)
 
-        # Trace the changes in the variable
-        self.remove_single_quote_var.trace_add("write", self.update_nn_display)
+        # Artist browse frame
+        self.artist_browse_frame = ctk.CTkFrame(self.artist_frame, corner_radius=0,
+                                                fg_color="transparent")
+        self.artist_browse_frame.grid(row=1, column=0, padx=10, pady=10)
 
-        # Checkbox to enable/disable remove double quotes
-        self.remove_double_quote_checkbox = ctk.CTkCheckBox(self.checkbox_frame3,
-                                                            text="Remove double quotes",
-                                                            variable=self.remove_double_quote_var)
-        self.remove_double_quote_checkbox.grid(row=0, column=4, padx=10, pady=10)
+        # Browse Artist Directory button
+        self.browse_artist_directory_button = ctk.CTkButton(self.artist_browse_frame, text="Artist Directory",
+                                                            command=lambda: self.browse_directory(
+                                                                self.artist_directory_entry, 'artist_directory'))
+        self.browse_artist_directory_button.grid(row=0, column=0, padx=10, pady=5)
 
-        # Trace the changes in the variable
-        self.remove_double_quote_var.trace_add("write", self.update_nn_display)
+        # Artist Directory entry
+        self.artist_directory_entry = ctk.CTkEntry(self.artist_browse_frame, width=890)
+        self.artist_directory_entry.insert(0, self.artist_directory)
+        self.artist_directory_entry.grid(row=0, column=1, padx=10, pady=10)
 
-        # Checkbox to enable/disable remove hashtag and trailing text
-        self.remove_hashtag_trail_checkbox = ctk.CTkCheckBox(self.checkbox_frame3,
-                                                             text="# onward",
-                                                             variable=self.remove_hashtag_trail_var)
-        self.remove_hashtag_trail_checkbox.grid(row=0, column=5, padx=10, pady=10)
+        # Browse Artist File button
+        self.browse_artist_file_button = ctk.CTkButton(self.artist_browse_frame, text="Artist File",
+                                                       command=self.browse_artist_file)
+        self.browse_artist_file_button.grid(row=1, column=0, padx=5, pady=5)
 
-        # Trace the changes in the variable
-        self.remove_hashtag_trail_var.trace_add("write", self.update_nn_display)
+        # Artist File entry
+        self.artist_file_entry = ctk.CTkEntry(self.artist_browse_frame, width=890)
+        self.artist_file_entry.insert(0, self.artist_file)
+        self.artist_file_entry.grid(row=1, column=1, padx=10, pady=10)
 
-        # Button Frame 4
-        self.checkbox_frame4 = ctk.CTkFrame(self.name_normalizer_frame, corner_radius=0,
-                                            fg_color="transparent")
-        self.checkbox_frame4.grid(row=5, column=0, padx=10, pady=5)
+        # Open Artist File button
+        self.open_artist_file_button = ctk.CTkButton(self.artist_browse_frame, text="Open Artist File",
+                                                     command=lambda: self.open_file(
+                                                         self.artist_file))
+        self.open_artist_file_button.grid(row=2, column=0, padx=5)
 
-        # Checkbox to enable/disable remove dollars
-        self.remove_dollar_checkbox = ctk.CTkCheckBox(self.checkbox_frame4,
-                                                      text="Remove dollars",
-                                                      variable=self.remove_dollar_var)
-        self.remove_dollar_checkbox.grid(row=0, column=0, padx=10, pady=10)
+        """Logging Tab"""
+        # Logging frame
+        self.logging_frame = ctk.CTkFrame(self.settings_tabs.get("Logging"), corner_radius=0,
+                                          fg_color="transparent")
+        self.logging_frame.grid(row=0, column=0, padx=10, pady=10)
 
-        # Trace the changes in the variable
-        self.remove_dollar_var.trace_add("write", self.update_nn_display)
+        # Logging switch frame
+        self.logging_switch_frame = ctk.CTkFrame(self.logging_frame, corner_radius=0,
+                                                 fg_color="transparent")
+        self.logging_switch_frame.grid(row=0, column=0, padx=10, pady=10)
 
-        # Checkbox to enable/disable remove colons
-        self.remove_colon_checkbox = ctk.CTkCheckBox(self.checkbox_frame4,
-                                                     text="Remove colons",
-                                                     variable=self.remove_colon_var)
-        self.remove_colon_checkbox.grid(row=0, column=1, padx=10, pady=10)
+        # Switch to enable/disable activate logging
+        self.activate_logging_switch = ctk.CTkSwitch(self.logging_switch_frame, text="Activate Logging",
+                                                     variable=self.activate_logging_var)
+        self.activate_logging_switch.grid(row=0, column=0, padx=10, pady=10)
+
+        # Bind the callback function to the activate logging variable
+        self.activate_logging_var.trace_add("write", self.handle_logging_activation)
 
-        # Trace the changes in the variable
-        self.remove_colon_var.trace_add("write", self.update_nn_display)
+        # Switch to enable/disable suppress standard outputs/errors
+        self.suppress_switch = ctk.CTkSwitch(self.logging_switch_frame, text="Suppress Standard Output/Error",
+                                             variable=self.suppress_var)
+        self.suppress_switch.grid(row=0, column=1, padx=10, pady=10)
 
-        # Checkbox to enable/disable semicolons
-        self.remove_semicolon_checkbox = ctk.CTkCheckBox(self.checkbox_frame4,
-                                                         text="Remove semicolons",
-                                                         variable=self.remove_semicolon_var)
-        self.remove_semicolon_checkbox.grid(row=0, column=2, padx=10, pady=10)
+        # Switch to enable/disable JSON lines logs
+        self.json_logging_switch = ctk.CTkSwitch(self.logging_switch_frame, text="JSON Lines Logs",
+                                                 variable=self.json_logging_var)
+        self.json_logging_switch.grid(row=0, column=2, padx=10, pady=10)
 
-        # Trace the changes in the variable
-        self.remove_semicolon_var.trace_add("write", self.update_nn_display)
+        # Bind the callback function to the JSON logging variable (switches the log format in place)
+        self.json_logging_var.trace_add("write", self.handle_logging_activation)
 
-        # Checkbox to enable/disable remove percents
-        self.remove_percent_checkbox = ctk.CTkCheckBox(self.checkbox_frame4,
-                                                       text="Remove percents",
-                                                       variable=self.remove_percent_var)
-        self.remove_percent_checkbox.grid(row=0, column=3, padx=10, pady=10)
+        # Switch to enable/disable stage profiling
+        self.profiling_switch = ctk.CTkSwitch(self.logging_switch_frame, text="Stage Profiling",
+                                              variable=self.profiling_var)
+        self.profiling_switch.grid(row=0, column=3, padx=10, pady=10)
 
-        # Trace the changes in the variable
-        self.remove_percent_var.trace_add("write", self.update_nn_display)
+        # Bind the callback function to the stage profiling variable
+        self.profiling_var.trace_add("write", self.handle_profiling_activation)
 
-        # Checkbox to enable/disable remove carets
-        self.remove_caret_checkbox = ctk.CTkCheckBox(self.checkbox_frame4,
-                                                     text="Remove carets",
-                                                     variable=self.remove_caret_var)
-        self.remove_caret_checkbox.grid(row=0, column=4, padx=10, pady=10)
+        # Logging browse frame
+        self.logging_browse_frame = ctk.CTkFrame(self.logging_frame, corner_radius=0,
+                                                 fg_color="transparent")
+        self.logging_browse_frame.grid(row=1, column=0, padx=10, pady=10)
 
-        # Trace the changes in the variable
-        self.remove_caret_var.trace_add("write", self.update_nn_display)
+        # Browse Log button
+        self.open_log_file_button = ctk.CTkButton(self.logging_browse_frame, text="Open Log File",
+                                                  command=lambda: self.open_file(
+                                                      self.file_renamer_log))
+        self.open_log_file_button.grid(row=0, column=0, padx=5)
 
-        # Checkbox to enable/disable remove plus signs
-        self.remove_plus_checkbox = ctk.CTkCheckBox(self.checkbox_frame4,
-                                                    text="Remove plus signs",
-                                                    variable=self.remove_plus_var)
-        self.remove_plus_checkbox.grid(row=0, column=5, padx=10, pady=10)
+        # log File entry
+        self.log_file_entry = ctk.CTkEntry(self.logging_browse_frame, width=890)
+        self.log_file_entry.insert(0, self.file_renamer_log)
+        self.log_file_entry.grid(row=0, column=1, padx=10, pady=10)
 
-        # Trace the changes in the variable
-        self.remove_plus_var.trace_add("write", self.update_nn_display)
+        """Messaging Tab"""
+        # Confirmation frame
+        self.confirmation_frame = ctk.CTkFrame(self.settings_tabs.get("Messaging"), corner_radius=0,
+                                               fg_color="transparent")
+        self.confirmation_frame.grid(row=0, column=0, padx=10)
 
-        # Button Frame 5
-        self.checkbox_frame5 = ctk.CTkFrame(self.name_normalizer_frame, corner_radius=0,
-                                            fg_color="transparent")
-        self.checkbox_frame5.grid(row=6, column=0, padx=10, pady=5)
+        # Switch to enable/disable show messageboxes
+        self.show_messageboxes_switch = ctk.CTkSwitch(self.confirmation_frame, text="Show Messageboxes",
+                                                      variable=self.show_messageboxes_var)
+        self.show_messageboxes_switch.grid(row=0, column=0, padx=10, pady=10)
 
-        # Checkbox to enable/disable remove asterisks
-        self.remove_asterisk_checkbox = ctk.CTkCheckBox(self.checkbox_frame5,
-                                                        text="Remove asterisks",
-                                                        variable=self.remove_asterisk_var)
-        self.remove_asterisk_checkbox.grid(row=0, column=0, padx=10, pady=10)
+        # Switch to enable/disable show confirmation messageboxes
+        self.show_confirmation_messageboxes_switch = ctk.CTkSwitch(self.confirmation_frame,
+                                                                   text="Show Confirmation Messageboxes",
+                                                                   variable=self.show_confirmation_messageboxes_var)
+        self.show_confirmation_messageboxes_switch.grid(row=0, column=1, padx=10, pady=10)
 
-        # Trace the changes in the variable
-        self.remove_asterisk_var.trace_add("write", self.update_nn_display)
+        # Fallback confirmation state when confirmation messageboxes are suppressed
+        self.fallback_confirmation_label = ctk.CTkLabel(self.confirmation_frame, text="Fallback confirmation state:")
+        self.fallback_confirmation_label.grid(row=1, column=0, padx=10, pady=5)
 
-        # Checkbox to enable/disable remove parenthesis
-        self.remove_parenthesis_checkbox = ctk.CTkCheckBox(self.checkbox_frame5,
-                                                           text="Remove parenthesis",
-                                                           variable=self.remove_parenthesis_var)
-        self.remove_parenthesis_checkbox.grid(row=0, column=1, padx=10, pady=10)
+        # Fallback true radio button
+        self.true_radio = ctk.CTkRadioButton(self.confirmation_frame, text="True",
+                                             variable=self.fallback_confirmation_var, value=True)
+        self.true_radio.grid(row=1, column=1, padx=10, pady=5)
 
-        # Trace the changes in the variable
-        self.remove_parenthesis_var.trace_add("write", self.update_nn_display)
+        # Fallback false radio button
+        self.false_radio = ctk.CTkRadioButton(self.confirmation_frame, text="False",
+                                              variable=self.fallback_confirmation_var,
+                                              value=False)
+        self.false_radio.grid(row=1, column=2, padx=10, pady=5)
 
-        # Checkbox to enable/disable remove angle brackets
-        self.remove_angle_bracket_checkbox = ctk.CTkCheckBox(self.checkbox_frame5,
-                                                             text="Remove angle brackets",
-                                                             variable=self.remove_angle_bracket_var)
-        self.remove_angle_bracket_checkbox.grid(row=0, column=2, padx=10, pady=10)
+        # Switch to enable/disable truncate text
+        self.truncate_text_switch = ctk.CTkSwitch(self.confirmation_frame, text="Truncate Text",
+                                                  variable=self.truncate_var)
+        self.truncate_text_switch.grid(row=2, column=0, padx=10, pady=5)
 
-        # Trace the changes in the variable
-        self.remove_angle_bracket_var.trace_add("write", self.update_nn_display)
+        """Misc Tab"""
+        # Misc frame
+        self.misc_frame = ctk.CTkFrame(self.settings_tabs.get("Misc"), corner_radius=0,
+                                       fg_color="transparent")
+        self.misc_frame.grid(row=0, column=0, padx=10, pady=10)
 
-        # Checkbox to enable/disable remove curly braces
-        self.remove_curly_brace_checkbox = ctk.CTkCheckBox(self.checkbox_frame5,
-                                                           text="Remove curly braces",
-                                                           variable=self.remove_curly_brace_var)
-        self.remove_curly_brace_checkbox.grid(row=0, column=3, padx=10, pady=10)
+        # File Operations switch frame
+        self.file_ops_switch_frame = ctk.CTkFrame(self.misc_frame, corner_radius=0,
+                                                  fg_color="transparent")
+        self.file_ops_switch_frame.grid(row=0, column=0, padx=10)
 
-        # Trace the changes in the variable
-        self.remove_curly_brace_var.trace_add("write", self.update_nn_display)
+        # Switch to enable/disable open on drop behavior
+        self.open_on_file_drop_switch = ctk.CTkSwitch(self.file_ops_switch_frame, text="Open File on Drag and Drop",
+                                                      variable=self.open_on_file_drop_var)
+        self.open_on_file_drop_switch.grid(row=0, column=0, padx=10, pady=10)
 
-        # Checkbox to enable/disable remove square brackets
-        self.remove_square_bracket_checkbox = ctk.CTkCheckBox(self.checkbox_frame5,
-                                                              text="Remove square brackets",
-                                                              variable=self.remove_square_bracket_var)
-        self.remove_square_bracket_checkbox.grid(row=0, column=4, padx=10, pady=10)
+        # Checkbox to enable/disable validate entries
+        self.validate_entries_switch = ctk.CTkSwitch(self.file_ops_switch_frame,
+                                                       text="Validate Entries",
+                                                       variable=self.validate_entries)
+        self.validate_entries_switch.grid(row=0, column=1, padx=10, pady=10)
+
+        # Checkbox to enable/disable preview mode switch
+        self.preview_mode_switch = ctk.CTkSwitch(self.file_ops_switch_frame,
+                                                 text="Preview Mode",
+                                                 variable=self.preview_mode_var)
+        self.preview_mode_switch.grid(row=0, column=2, padx=10, pady=10)
 
         # Trace the changes in the variable
-        self.remove_square_bracket_var.trace_add("write", self.update_nn_display)
+        self.preview_mode_var.trace_add("write", self.update_nn_display)
 
-        # Button Frame 6
-        self.checkbox_frame6 = ctk.CTkFrame(self.name_normalizer_frame, corner_radius=0,
-                                            fg_color="transparent")
-        self.checkbox_frame6.grid(row=7, column=0, padx=10, pady=5)
+        # Master Entry frame
+        self.master_entry_frame = ctk.CTkFrame(self.misc_frame, corner_radius=0, fg_color="transparent")
+        self.master_entry_frame.grid(row=1, column=0, padx=10, pady=10)
 
-        # Checkbox to enable/disable remove pipes
-        self.remove_pipe_checkbox = ctk.CTkCheckBox(self.checkbox_frame6,
-                                                    text="Remove pipes",
-                                                    variable=self.remove_pipe_var)
-        self.remove_pipe_checkbox.grid(row=0, column=0, padx=10, pady=10)
+        # Initial Directory frame
+        self.initial_directory_frame = ctk.CTkFrame(self.master_entry_frame, corner_radius=0, fg_color="transparent")
+        self.initial_directory_frame.grid(row=0, column=0, padx=10, pady=10)
 
-        # Trace the changes in the variable
-        self.remove_pipe_var.trace_add("write", self.update_nn_display)
+        # Browse Initial Directory button
+        self.browse_initial_directory_button = ctk.CTkButton(self.initial_directory_frame, text="Initial Directory",
+                                                             command=lambda: self.browse_directory(
+                                                                 self.initial_directory_entry, 'initial_directory'))
+        self.browse_initial_directory_button.grid(row=0, column=0, padx=5, pady=5)
 
-        # Checkbox to enable/disable remove backslashes
-        self.remove_backslash_checkbox = ctk.CTkCheckBox(self.checkbox_frame6,
-                                                         text="Remove backslashes",
-                                                         variable=self.remove_backslash_var)
-        self.remove_backslash_checkbox.grid(row=0, column=1, padx=10, pady=10)
+        # Initial Directory entry
+        self.initial_directory_entry = ctk.CTkEntry(self.initial_directory_frame, width=855)
+        self.initial_directory_entry.insert(0, self.initial_directory)
+        self.initial_directory_entry.grid(row=0, column=1, padx=10, pady=10)
 
-        # Trace the changes in the variable
-        self.remove_backslash_var.trace_add("write", self.update_nn_display)
+        # Browse Initial Output Directory button
+        self.browse_initial_output_directory_button = ctk.CTkButton(self.initial_directory_frame,
+                                                                    text="Initial Output Directory",
+                                                                    command=lambda:
+                                                                    self.browse_directory(
+                                                                        self.initial_output_directory_entry,
+                                                                        'initial_output_directory')
+                                                                    )
+        self.browse_initial_output_directory_button.grid(row=1, column=0, padx=5, pady=5)
 
-        # Checkbox to enable/disable remove equal signs
-        self.remove_equal_checkbox = ctk.CTkCheckBox(self.checkbox_frame6,
-                                                     text="Remove equal signs",
-                                                     variable=self.remove_equal_var)
-        self.remove_equal_checkbox.grid(row=0, column=2, padx=10, pady=10)
+        # Initial Directory entry
+        self.initial_output_directory_entry = ctk.CTkEntry(self.initial_directory_frame, width=855)
+        self.initial_output_directory_entry.insert(0, self.initial_output_directory)
+        self.initial_output_directory_entry.grid(row=1, column=1, padx=10, pady=10)
 
-        # Trace the changes in the variable
-        self.remove_equal_var.trace_add("write", self.update_nn_display)
+        # Configuration File Frame
+        self.configuration_file_frame = ctk.CTkFrame(self.master_entry_frame, corner_radius=0,
+                                                     fg_color="transparent")
+        self.configuration_file_frame.grid(row=1, column=0, padx=10, pady=10)
 
-        # Checkbox to enable/disable remove question marks
-        self.remove_question_mark_checkbox = ctk.CTkCheckBox(self.checkbox_frame6,
-                                                             text="Remove question marks",
-                                                             variable=self.remove_question_mark_var)
-        self.remove_question_mark_checkbox.grid(row=0, column=3, padx=10, pady=10)
+        # Browse Configuration File button
+        self.open_configuration_file_button = ctk.CTkButton(self.configuration_file_frame, text="Open Config File",
+                                                            command=lambda: self.open_file(
+                                                                self.config_file_path))
+        self.open_configuration_file_button.grid(row=0, column=0, padx=5)
 
-        # Trace the changes in the variable
-        self.remove_question_mark_var.trace_add("write", self.update_nn_display)
+        # Configuration File entry
+        self.configuration_file_entry = ctk.CTkEntry(self.configuration_file_frame, width=890)
+        self.configuration_file_entry.insert(0, self.config_file_path)
+        self.configuration_file_entry.grid(row=0, column=1, padx=10, pady=10)
 
-        # Checkbox to enable/disable remove extra whitespace
-        self.remove_extra_whitespace_checkbox = ctk.CTkCheckBox(self.checkbox_frame6,
-                                                                text="Remove extra whitespace",
-                                                                variable=self.remove_extra_whitespace_var)
-        self.remove_extra_whitespace_checkbox.grid(row=0, column=4, padx=10, pady=10)
+        # Dictionary File Frame
+        self.dictionary_file_frame = ctk.CTkFrame(self.master_entry_frame, corner_radius=0,
+                                                  fg_color="transparent")
+        self.dictionary_file_frame.grid(row=2, column=0, padx=10, pady=10)
 
-        # Trace the changes in the variable
-        self.remove_extra_whitespace_var.trace_add("write", self.update_nn_display)
+        # Browse Dictionary File button
+        self.open_dictionary_file_button = ctk.CTkButton(self.dictionary_file_frame, text="Open Dictionary File",
+                                                         command=lambda: self.open_file(
+                                                             self.dictionary_file))
+        self.open_dictionary_file_button.grid(row=0, column=0, padx=5)
 
-        # Button Frame 7
-        self.checkbox_frame7 = ctk.CTkFrame(self.name_normalizer_frame, corner_radius=0,
+        # Dictionary File entry
+        self.dictionary_file_entry = ctk.CTkEntry(self.dictionary_file_frame, width=890)
+        self.dictionary_file_entry.insert(0, self.dictionary_file)
+        self.dictionary_file_entry.grid(row=0, column=1, padx=10, pady=10)
+
+        """Reminders Tab"""
+        # Reminders frame
+        self.reminders_frame = ctk.CTkFrame(self.settings_tabs.get("Reminders"), corner_radius=0,
                                             fg_color="transparent")
-        self.checkbox_frame7.grid(row=8, column=0, padx=10, pady=5)
+        self.reminders_frame.grid(row=0, column=0, padx=10, pady=10)
 
-        # Checkbox to enable/disable Title the name
-        self.title_checkbox = ctk.CTkCheckBox(self.checkbox_frame7,
-                                              text="Title the name",
-                                              variable=self.title_var)
-        self.title_checkbox.grid(row=0, column=0, padx=10, pady=10)
+        # Switch to enable/disable create double check reminder
+        self.double_check_switch = ctk.CTkSwitch(self.reminders_frame, text="Create Double Check Reminder",
+                                                 variable=self.double_check_var)
+        self.double_check_switch.grid(row=0, column=0, padx=10, pady=10)
 
-        # Trace the changes in the variable
-        self.title_var.trace_add("write", self.update_nn_display)
+        # Double Check Directory frame
+        self.double_check_reminder_directory_frame = ctk.CTkFrame(self.reminders_frame, corner_radius=0,
+                                                                  fg_color="transparent")
+        self.double_check_reminder_directory_frame.grid(row=1, column=0, padx=10, pady=10)
 
-        # Checkbox to enable/disable replace custom text
-        self.replace_custom_text_checkbox = ctk.CTkCheckBox(self.checkbox_frame7,
-                                                            text="Replace custom text",
-                                                            variable=self.replace_custom_text_var)
-        self.replace_custom_text_checkbox.grid(row=0, column=1, padx=10, pady=10)
+        # Browse Double Check Directory button
+        self.browse_reminder_directory_button = ctk.CTkButton(self.double_check_reminder_directory_frame,
+                                                              text="Double Check Reminder Directory",
+                                                              command=lambda: self.browse_directory(
+                                                                  self.double_check_reminder_directory_entry,
+                                                                  'double_check_directory'))
+        self.browse_reminder_directory_button.grid(row=0, column=0, padx=5, pady=5)
 
-        # Trace the changes in the variable
-        self.replace_custom_text_var.trace_add("write", self.update_nn_display)
+        # Double Check Reminder entry
+        self.double_check_reminder_directory_entry = ctk.CTkEntry(self.double_check_reminder_directory_frame, width=775)
+        self.double_check_reminder_directory_entry.insert(0, self.double_check_directory)
+        self.double_check_reminder_directory_entry.grid(row=0, column=1, padx=10, pady=10)
 
-        # Switch to enable/disable replace mode (case-sensitive vs case-insensitive)
-        self.replace_mode_switch = ctk.CTkSwitch(self.checkbox_frame7, text="Case-sensitive "
-                                                                            "/ Case-insensitive",
-                                                 variable=self.replace_mode_var)
-        self.replace_mode_switch.grid(row=0, column=2, padx=10)
+        # Browse NO GO Directory button
+        self.browse_no_go_directory_button = ctk.CTkButton(self.double_check_reminder_directory_frame,
+                                                           text="NO GO Directory",
+                                                           command=lambda: self.browse_directory(
+                                                               self.no_go_reminder_directory_entry, 'no_go_directory'))
+        self.browse_no_go_directory_button.grid(row=1, column=0, padx=5, pady=5)
 
-        # Trace the changes in the variable
-        self.replace_mode_var.trace_add("write", self.update_nn_display)
+        # NO GO Reminder entry
+        self.no_go_reminder_directory_entry = ctk.CTkEntry(self.double_check_reminder_directory_frame, width=775)
+        self.no_go_reminder_directory_entry.insert(0, self.no_go_directory)
+        self.no_go_reminder_directory_entry.grid(row=1, column=1, padx=10, pady=10)
 
-        # Checkbox to enable/disable include subdirectories
-        self.deep_walk_checkbox = ctk.CTkCheckBox(self.checkbox_frame7,
-                                                  text="Include subdirectories",
-                                                  variable=self.deep_walk_var)
-        self.deep_walk_checkbox.grid(row=0, column=3, padx=10, pady=10)
+        # Open NO GO Artist File button
+        self.open_artist_file_button = ctk.CTkButton(self.double_check_reminder_directory_frame,
+                                                     text="Open NO GO Artist File",
+                                                     command=lambda: self.open_file(
+                                                         self.no_go_artist_file))
+        self.open_artist_file_button.grid(row=2, column=0, padx=10)
 
-        # Trace the changes in the variable
-        self.deep_walk_var.trace_add("write", self.update_nn_display)
+        """Tabs"""
+        # Tab name frame
+        self.tab_name_frame = ctk.CTkFrame(self.settings_tabs.get("Tabs"), corner_radius=0, fg_color="transparent")
+        self.tab_name_frame.grid(row=0, column=0, padx=10, pady=10)
 
-        # Checkbox to enable/disable reset Name Normalizer entries
-        self.reset_nn_checkbox = ctk.CTkCheckBox(self.checkbox_frame7,
-                                                 text="Reset entries",
-                                                 variable=self.reset_nn_var)
-        self.reset_nn_checkbox.grid(row=0, column=4, padx=10, pady=10)
+        # Switch to enable/disable use_custom_tab_names_var
+        self.use_custom_tab_names_switch = ctk.CTkSwitch(self.tab_name_frame, text="Use Custom Tab Names",
+                                                         variable=self.use_custom_tab_names_var)
+        self.use_custom_tab_names_switch.grid(row=0, column=0, padx=10)
 
-        # Trace the changes in the variable
-        self.reset_nn_var.trace_add("write", self.update_nn_display)
+        # Bind the callback function to use_custom_tab_names_var
+        self.use_custom_tab_names_var.trace_add("write", self.refresh_category_buttons)
 
-        # String frame
-        self.string_frame = ctk.CTkFrame(self.name_normalizer_frame, corner_radius=0,
-                                         fg_color="transparent")
-        self.string_frame.grid(row=9, column=0, padx=10, pady=5)
+        # Switch to enable/disable sort tab names
+        self.sort_tab_names_switch = ctk.CTkSwitch(self.tab_name_frame, text="Sort Tab Names",
+                                                   variable=self.sort_tab_names_var)
+        self.sort_tab_names_switch.grid(row=0, column=1, padx=10)
 
-        # Prefix Label
-        self.prefix_label = ctk.CTkLabel(self.string_frame, text="Prefix:")
-        self.prefix_label.grid(row=1, column=0, padx=10, pady=10)
+        # Bind the callback function to sort_tab_names_var
+        self.sort_tab_names_var.trace_add("write", self.refresh_buttons_and_tabs)
 
-        # Prefix Entry
-        self.prefix_entry = ctk.CTkEntry(self.string_frame, width=140)
-        self.prefix_entry.grid(row=1, column=1, padx=10, pady=10)
+        # Switch to enable/disable sort_reverse_order_var
+        self.sort_tab_names_reverse_switch = ctk.CTkSwitch(self.tab_name_frame, text="Sort Tab Names (A-Z / Z-A)",
+                                                           variable=self.sort_reverse_order_var)
+        self.sort_tab_names_reverse_switch.grid(row=0, column=2, padx=10)
 
-        # Bind the update_file_display function to the entry change event
-        self.prefix_entry.bind("<KeyRelease>", self.update_nn_display)
+        # Bind the callback function to sort_reverse_order_var
+        self.sort_reverse_order_var.trace_add("write", self.refresh_buttons_and_tabs)
 
-        # Suffix Label
-        self.suffix_label = ctk.CTkLabel(self.string_frame, text="Suffix:")
-        self.suffix_label.grid(row=1, column=2, padx=10, pady=10)
+        # Switch to enable/disable fuzzy_category_search_var
+        self.fuzzy_category_search_switch = ctk.CTkSwitch(self.tab_name_frame, text="Fuzzy Category Search",
+                                                          variable=self.fuzzy_category_search_var)
+        self.fuzzy_category_search_switch.grid(row=1, column=0, padx=10, pady=10)
 
-        # Suffix Entry
-        self.suffix_entry = ctk.CTkEntry(self.string_frame, width=140)
-        self.suffix_entry.grid(row=1, column=3, padx=10, pady=10)
+        # Bind the callback function to fuzzy_category_search_var
+        self.fuzzy_category_search_var.trace_add("write", self.refresh_category_buttons)
 
-        # Bind the update_nn_display function to the entry change event
-        self.suffix_entry.bind("<KeyRelease>", self.update_nn_display)
+        # Switch to enable/disable render_category_buttons_var
+        self.render_category_buttons_switch = ctk.CTkSwitch(self.tab_name_frame, text="Render Category Buttons",
+                                                            variable=self.render_category_buttons_var)
+        self.render_category_buttons_switch.grid(row=1, column=1, padx=10, pady=10)
 
-        # Replace Label
-        self.replace_label = ctk.CTkLabel(self.string_frame, text="Replace (Original, Replacement):")
-        self.replace_label.grid(row=1, column=4, padx=10, pady=10)
+        # Bind the callback function to render_category_buttons_var
+        self.render_category_buttons_var.trace_add("write", self.refresh_category_buttons)
 
-        # Original Entry
-        self.original_entry = ctk.CTkEntry(self.string_frame, width=150)
-        self.original_entry.grid(row=1, column=5, padx=10, pady=10)
+    def on_frame_configure(self, *_):
+        """
+        Callback function to handle the frame configuration for scrolling.
 
-        # Bind the update_nn_display function to the entry change event
-        self.original_entry.bind("<KeyRelease>", self.update_nn_display)
+        Args:
+        *_: Variable number of arguments. Ignored in the implementation.
+        """
+        # Reset the scroll region to encompass the inner frame
+        self.file_renamer_canvas.configure(scrollregion=self.file_renamer_canvas.bbox("all"))
 
-        # Replace Entry
-        self.replace_entry = ctk.CTkEntry(self.string_frame, width=150)
-        self.replace_entry.grid(row=1, column=10, pady=10)
+    def on_canvas_configure(self, event):
+        """
+        Callback function to handle the canvas configuration.
 
-        # Bind the update_nn_display function to the entry change event
-        self.replace_entry.bind("<KeyRelease>", self.update_nn_display)
+        Adjusts the width of the scrollable frame to match the canvas width.
 
-        # Output directory move frame
-        self.output_directory_frame = ctk.CTkFrame(self.name_normalizer_frame, corner_radius=0,
-                                                   fg_color="transparent")
-        self.output_directory_frame.grid(row=10, column=0, padx=10, pady=5)
+        Args:
+        event (tk.Event): The event object containing information about the canvas configuration change.
+        """
+        # Set the scrollable frame's width to match the canvas
+        canvas_width = event.width - self.file_renamer_scrollbar.winfo_width()
+        self.file_renamer_canvas.itemconfig(self.file_renamer_scrollable_frame_window, width=canvas_width)
 
-        # Browse move directory folder button
-        self.browse_move_directory_button = ctk.CTkButton(self.output_directory_frame, text="Output Directory",
-                                                          command=self.browse_output_directory)
-        self.browse_move_directory_button.grid(row=0, column=0, padx=5, pady=5)
+    def handle_logging_activation(self, *_):
+        """
+        Callback function to handle logging activation.
 
-        # Move directory entry
-        self.move_directory_entry = ctk.CTkEntry(self.output_directory_frame, width=400)
-        self.move_directory_entry.grid(row=0, column=1, padx=10, pady=10)
+        Activates or deactivates logging based on the value of the activate_logging_var variable.
 
-        # Custom Text Removal Label
-        self.custom_text_label = ctk.CTkLabel(self.output_directory_frame, text="Remove:")
-        self.custom_text_label.grid(row=0, column=2, padx=10, pady=10)
+        Args:
+        *_: Variable number of arguments. Ignored in the implementation.
+        """
+        # If logging is true, call the logging_setup function
+        if self.activate_logging_var.get():
+            try:
+                self.logging_setup()
+            except OSError as e:
+                print(f"Logging failed. Error: {e}")
+        else:
+            # If logging is false, call the stop_logging function
+            self.stop_logging()
 
-        # Custom Text Removal Entry
-        self.custom_text_removal_entry = ctk.CTkEntry(self.output_directory_frame, width=385)
-        self.custom_text_removal_entry.grid(row=0, column=3, padx=10, pady=10)
+    def handle_profiling_activation(self, *_):
+        """
+        Callback function to handle stage profiling activation.
 
-        # Bind the update_nn_display function to the entry change event
-        self.custom_text_removal_entry.bind("<KeyRelease>", self.update_nn_display)
+        Wraps the profiled methods with timers when profiling_var is set, and removes the timers otherwise so the
+        pipeline runs untouched.
 
-        # Normalize Folder frame
-        self.normalize_folder_frame = ctk.CTkFrame(self.name_normalizer_frame, corner_radius=0,
-                                                   fg_color="transparent")
-        self.normalize_folder_frame.grid(row=11, column=0, padx=10, pady=5)
+        Args:
+        *_: Variable number of arguments. Ignored in the implementation.
+        """
+        # Remove any timers and recorded timings before applying the new state
+        self.stage_profiler.uninstrument()
+        self.stage_profiler.reset()
 
-        # Clear Name Normalizer Selection Button
-        self.clear_name_normalizer_selection_button = ctk.CTkButton(self.normalize_folder_frame,
-                                                                    text="Clear",
-                                                                    command=lambda: self.clear_selection(
-                                                                        frame_name="name_normalizer_window"))
-        self.clear_name_normalizer_selection_button.grid(row=0, column=0, padx=10, pady=10)
+        self.stage_profiler.enabled = self.profiling_var.get()
+        if self.stage_profiler.enabled:
+            self.stage_profiler.instrument(self, self.profiled_methods)
+            self.log_and_show(f"Stage profiling activated. Reports are saved to '{self.profile_directory}'.",
+                              not_logging=True)
 
-        # Undo Name Normalizer Button
-        self.undo_nn_button = ctk.CTkButton(self.normalize_folder_frame,
-                                            text="Undo Name Normalizer",
-                                            command=self.undo_file_rename)
-        self.undo_nn_button.grid(row=0, column=1, padx=10, pady=10)
+    def dump_profile_report(self, run_name: str):
+        """
+        Save the stage timings recorded since the last report to a JSON report, if stage profiling is active.
 
-        # Select Name Normalizer Last Used File Button
-        self.name_normalizer_last_used_file_button = ctk.CTkButton(self.normalize_folder_frame,
-                                                                   text="Reload Last File",
-                                                                   command=self.load_last_used_file)
-        self.name_normalizer_last_used_file_button.grid(row=0, column=2, padx=10, pady=10)
+        Args:
+            run_name (str): The name of the run (e.g. 'name_normalizer'), used in the report file name.
+        """
+        if not self.stage_profiler.enabled:
+            return
 
-        # Interrupt button
-        self.interrupt_button = ctk.CTkButton(self.normalize_folder_frame, text="Interrupt",
-                                              command=lambda: self.interrupt_processing("name_processing_thread"))
-        self.interrupt_button.grid(row=0, column=3, padx=5, pady=5)
+        report = self.stage_profiler.report(reset=True)
+        if not report:
+            return
 
-        # Normalize button
-        self.normalize_button = ctk.CTkButton(self.normalize_folder_frame, text="Normalize",
-                                              command=self.process_name_normalizer)
-        self.normalize_button.grid(row=0, column=4, padx=5, pady=5)
+        try:
+            # Save the report as profiles/<run>_<timestamp>.json
+            os.makedirs(self.profile_directory, exist_ok=True)
+            report_path = os.path.join(self.profile_directory,
+                                       f"{run_name}_{time.strftime('%Y%m%d-%H%M%S')}.json")
+            with open(report_path, "w") as report_file:
+                json.dump({"run": run_name, "created": time.strftime("%Y-%m-%dT%H:%M:%S"), "stages": report},
+                          report_file, indent=2)
+
+            # Summarize the slowest stages
+            slowest = ", ".join(f"{name} ({stats['total_ms']:.1f} ms)" for name, stats in list(report.items())[:3])
+            self.log_and_show(f"Profile report saved to {report_path}\nSlowest stages: {slowest}")
+        except OSError as e:
+            self.log_and_show(f"Saving the profile report failed: {e}", error=True)
 
-        # Send to Module frame
-        self.send_to_module_frame1 = ctk.CTkFrame(self.name_normalizer_frame,
-                                                  corner_radius=0,
-                                                  fg_color="transparent")
-        self.send_to_module_frame1.grid(row=12, column=0, padx=5)
+    def cleanup_on_exit(self):
+        """
+        Cleanup method to be called on program exit.
 
-        # Send to File Renamer button
-        self.send_to_file_renamer_button1 = ctk.CTkButton(self.send_to_module_frame1, text="Send to File Renamer",
-                                                          command=lambda: self.send_to_module(
-                                                              destination="file_renamer_module"))
-        self.send_to_file_renamer_button1.grid(row=0, column=0, padx=10, pady=10)
+        Note: Ensure this method is appropriately connected to an exit event or cleanup routine.
+        """
+        # Interrupt threads that are processing
+        self.interrupt_processing("all")
+        self.file_renamer_executor.shutdown(wait=False)
 
-        # Send to Video Editor button
-        self.send_to_video_editor_button1 = ctk.CTkButton(self.send_to_module_frame1, text="Send to Video Editor",
-                                                          command=lambda: self.send_to_module(
-                                                              destination="video_editor_module"))
-        self.send_to_video_editor_button1.grid(row=0, column=1, padx=10, pady=10)
+        # Destroy any open selection windows
+        for window in self.open_windows:
+            window.destroy()
 
-        # Frame to display messages on the Name Normalizer frame
-        self.name_normalizer_message_label_frame = ctk.CTkFrame(self.name_normalizer_frame, corner_radius=0,
-                                                                fg_color="transparent")
-        self.name_normalizer_message_label_frame.grid(row=13, column=0, padx=10)
+        # Stop logging if currently running
+        if self.activate_logging_var.get():
+            self.stop_logging()
 
-        # Name Normalizer message Label
-        self.name_normalizer_message_label = ctk.CTkLabel(self.name_normalizer_message_label_frame, text="")
-        self.name_normalizer_message_label.grid(row=0, column=0, padx=10, pady=10)
+        # Close the rename history database
+        if self.history_store:
+            self.history_store.close()
 
-        # Progressbar frame
-        self.slider_progressbar_frame = ctk.CTkFrame(self.name_normalizer_message_label_frame,
-                                                     corner_radius=0,
-                                                     fg_color="transparent")
-        self.slider_progressbar_frame.grid(row=1, column=0, padx=10)
-        self.slider_progressbar_frame.grid_columnconfigure(0, weight=1)
-        self.slider_progressbar_frame.grid_rowconfigure(4, weight=1)
+        # Close the hash cache database
+        if self.hash_cache:
+            self.hash_cache.close()
 
+    def select_frame_by_name(self, frame_name: str):
         """
-        video_editor_window
-        """
-        # Create Video Editor frame
-        self.video_editor_frame = ctk.CTkFrame(self, corner_radius=0, fg_color="transparent")
-        self.video_editor_frame.grid_columnconfigure(0, weight=1)
+        Switches between frames based on the provided frame_name and sets button colors accordingly.
 
-        # Video Editor Label
-        self.video_editor_label = ctk.CTkLabel(self.video_editor_frame, text="Video Editor",
-                                               font=ctk.CTkFont(size=15, weight="bold"))
-        self.video_editor_label.grid(row=0, column=0, padx=10, pady=10)
+        Args:
+        frame_name (str): The name of the frame to be selected.
 
-        # Video Editor Top frame
-        self.video_editor_top_frame = ctk.CTkFrame(self.video_editor_frame, corner_radius=0,
-                                                   fg_color="transparent")
-        self.video_editor_top_frame.grid(row=1, column=0, padx=10, pady=5)
+        Note: Ensure this method is connected to a button press or navigation event.
+        """
+        # Set button color for the selected button
+        self.file_renamer_button.configure(
+            fg_color=("gray75", "gray25") if frame_name == "file_renamer_window" else "transparent")
+        self.name_normalizer_button.configure(
+            fg_color=("gray75", "gray25") if frame_name == "name_normalizer_window" else "transparent")
+        self.video_editor_button.configure(
+            fg_color=("gray75", "gray25") if frame_name == "video_editor_window" else "transparent")
+        self.add_remove_button.configure(
+            fg_color=("gray75", "gray25") if frame_name == "add_remove_window" else "transparent")
+        self.settings_button.configure(
+            fg_color=("gray75", "gray25") if frame_name == "settings_window" else "transparent")
 
-        # Video Editor browse input method button
-        self.browse_input_method_button = ctk.CTkButton(self.video_editor_top_frame, text="Browse",
-                                                        command=self.browse_input)
-        self.browse_input_method_button.grid(row=0, column=0, padx=5, pady=5)
+        # Show the selected frame and hide others, set the active frame_name
+        if frame_name == "file_renamer_window":
+            self.file_renamer_frame.grid(row=0, column=1, sticky="nsew")
+            self.frame_name = frame_name
+        else:
+            self.file_renamer_frame.grid_forget()
+        if frame_name == "name_normalizer_window":
+            self.name_normalizer_frame.grid(row=0, column=1, sticky="nsew")
+            self.frame_name = frame_name
+        else:
+            self.name_normalizer_frame.grid_forget()
+        if frame_name == "video_editor_window":
+            self.video_editor_frame.grid(row=0, column=1, sticky="nsew")
+            self.frame_name = frame_name
+        else:
+            self.video_editor_frame.grid_forget()
+        if frame_name == "add_remove_window":
+            self.add_remove_frame.grid(row=0, column=1, sticky="nsew")
+            self.frame_name = frame_name
+        else:
+            self.add_remove_frame.grid_forget()
+        if frame_name == "settings_window":
+            self.settings_frame.grid(row=0, column=1, sticky="nsew")
+            self.frame_name = frame_name
+        else:
+            self.settings_frame.grid_forget()
 
-        # Input method entry for a file, directory, or .txt containing a line delimited list of files to process
-        self.input_method_entry = ctk.CTkEntry(self.video_editor_top_frame, width=890)
-        self.input_method_entry.insert(0, "Select a video to edit using the 'Browse' button...")
-        self.input_method_entry.grid(row=0, column=1, padx=10, pady=10)
+    """
+    Event handlers for button clicks to switch frames
+    """
 
-        # Rotation frame
-        self.rotation_frame = ctk.CTkFrame(self.video_editor_frame, corner_radius=0,
-                                           fg_color="transparent")
-        self.rotation_frame.grid(row=3, column=0, padx=10, pady=5)
+    def file_renamer_button_event(self):
+        """
+        Event handler for the file renamer button.
 
-        # Rotate Video label
-        self.rotation_label = ctk.CTkLabel(self.rotation_frame, text="Rotate Video:")
-        self.rotation_label.grid(row=0, column=0, padx=10, pady=5)
+        Calls the select_frame_by_name method to switch to the 'file_renamer_window' frame.
+        """
+        self.select_frame_by_name("file_renamer_window")
 
-        # Variable to store rotation option
-        self.rotation_var = ctk.StringVar()
-        self.rotation_var.set(self.default_rotation_var)
+    def name_normalizer_button_event(self):
+        """
+        Event handler for the name normalizer button.
 
-        # Left rotation radio button
-        self.left_radio = ctk.CTkRadioButton(self.rotation_frame, text="Left", variable=self.rotation_var, value="left")
-        self.left_radio.grid(row=0, column=1, padx=10, pady=5)
+        Calls the select_frame_by_name method to switch to the 'name_normalizer_window' frame.
+        """
+        self.select_frame_by_name("name_normalizer_window")
 
-        # Right rotation radio button
-        self.right_radio = ctk.CTkRadioButton(self.rotation_frame, text="Right", variable=self.rotation_var,
-                                              value="right")
-        self.right_radio.grid(row=0, column=2, padx=10, pady=5)
+    def video_editor_button_event(self):
+        """
+        Event handler for the video editor button.
 
-        # Flip rotation radio button
-        self.flip_radio = ctk.CTkRadioButton(self.rotation_frame, text="Flip", variable=self.rotation_var,
-                                             value="flip")
-        self.flip_radio.grid(row=0, column=3, padx=10, pady=5)
+        Calls the select_frame_by_name method to switch to the 'video_editor_window' frame.
+        """
+        self.select_frame_by_name("video_editor_window")
 
-        # Mirror rotation radio button
-        self.mirror_radio = ctk.CTkRadioButton(self.rotation_frame, text="Mirror", variable=self.rotation_var,
-                                               value="mirror")
-        self.mirror_radio.grid(row=0, column=4, padx=10, pady=5)
+    def add_remove_button_event(self):
+        """
+        Event handler for the add/remove button.
 
-        # None rotation radio button
-        self.no_rotation_radio = ctk.CTkRadioButton(self.rotation_frame, text="None", variable=self.rotation_var,
-                                                    value="none")
-        self.no_rotation_radio.grid(row=0, column=5, padx=10, pady=5)
+        Calls the select_frame_by_name method to switch to the 'add_remove_window' frame.
+        """
+        self.select_frame_by_name("add_remove_window")
 
-        # Decibel frame
-        self.decibel_frame = ctk.CTkFrame(self.video_editor_frame, corner_radius=0,
-                                          fg_color="transparent")
-        self.decibel_frame.grid(row=4, column=0, padx=10, pady=5)
+    def settings_button_event(self):
+        """
+        Event handler for the settings button.
 
-        # Increase Audio (dB) label
-        self.decibel_label = ctk.CTkLabel(self.decibel_frame, text="Increase Audio (dB):")
-        self.decibel_label.grid(row=0, column=0, padx=10, pady=5)
+        Calls the select_frame_by_name method to switch to the 'settings_window' frame.
+        """
+        self.select_frame_by_name("settings_window")
 
-        # Initialize decibel variable
-        self.decibel_var = ctk.StringVar()
-        self.decibel_var.set(self.default_decibel)
+    def update_background_color(self):
+        """
+        Updates the canvas background color based on the current appearance mode.
 
-        # Trace the changes in the StringVar
-        self.decibel_var.trace_add("write",
-                                   lambda name, index, mode, var=self.decibel_var, default=self.default_decibel,
-                                          desired_type=float: self.validate_entry(var, default, desired_type))
+        Note: Ensure this method is called appropriately, such as in response to a mode change event.
+        """
+        # Update canvas background color based on the current appearance mode
+        current_mode = ctk.get_appearance_mode()
+        if current_mode == "Light":
+            self.file_renamer_canvas.configure(bg='#dbdbdb')
+        elif current_mode == "Dark":
+            self.file_renamer_canvas.configure(bg='#2B2B2B')
 
-        # Decibel entry
-        self.decibel_entry = ctk.CTkEntry(self.decibel_frame, textvariable=self.decibel_var, width=50)
-        self.decibel_entry.grid(row=0, column=1, padx=10, pady=10)
+    def change_appearance_mode_event(self, new_appearance_mode: str):
+        """
+        Event handler for changing the appearance mode.
 
-        # Audio Normalization frame
-        self.audio_normalization_frame = ctk.CTkFrame(self.video_editor_frame, corner_radius=0,
-                                                      fg_color="transparent")
-        self.audio_normalization_frame.grid(row=5, column=0, padx=10, pady=5)
+        Updates the appearance mode using ctk.set_appearance_mode() and calls update_background_color()
+        to adjust the background color based on the new appearance mode.
 
-        # Normalize Audio label
-        self.audio_normalization_label = ctk.CTkLabel(self.audio_normalization_frame, text="Normalize Audio:")
-        self.audio_normalization_label.grid(row=0, column=0, padx=10, pady=5)
+        Args:
+        new_appearance_mode (str): The new appearance mode ('Light' or 'Dark').
+        """
+        # Update background color when appearance mode changes
+        ctk.set_appearance_mode(new_appearance_mode)
+        self.update_background_color()
 
-        # Initialize audio normalization variable
-        self.audio_normalization_var = ctk.StringVar()
-        self.audio_normalization_var.set(self.default_audio_normalization)
+    @staticmethod
+    def change_scaling_event(new_scaling: str):
+        """
+        Event handler for changing widget scaling.
 
-        # Trace the changes in the StringVar
-        self.audio_normalization_var.trace_add("write",
-                                               lambda name, index, mode, var=self.audio_normalization_var,
-                                                      default=self.default_audio_normalization,
-                                                      desired_type=float: self.validate_entry(var, default,
-                                                                                              desired_type))
+        Converts the new_scaling percentage to a float, sets the widget scaling using ctk.set_widget_scaling().
 
-        # Audio Normalization entry
-        self.audio_normalization_entry = ctk.CTkEntry(self.audio_normalization_frame,
-                                                      textvariable=self.audio_normalization_var,
-                                                      width=50)
-        self.audio_normalization_entry.grid(row=0, column=1, padx=10, pady=10)
+        Args:
+        new_scaling (str): The new widget scaling percentage.
+        """
+        new_scaling_float = int(new_scaling.replace("%", "")) / 100
+        ctk.set_widget_scaling(new_scaling_float)
 
-        # Trim frame
-        self.trim_frame = ctk.CTkFrame(self.video_editor_frame, corner_radius=0,
-                                       fg_color="transparent")
-        self.trim_frame.grid(row=6, column=0, padx=10, pady=5)
+    """
+    Messaging
+    """
 
-        # Trim label
-        self.trim_label = ctk.CTkLabel(self.trim_frame, text="Trim (Hours:Minutes:Seconds):")
-        self.trim_label.grid(row=0, column=0, padx=10, pady=5)
+    def update_text_color(self):
+        """
+        Updates text color based on the current appearance mode.
 
-        # Initialize hour variable
-        self.hour_var = ctk.StringVar()
-        self.hour_var.set(self.default_hour)
+        Note: Ensure this method is called appropriately, such as in response to a mode change event.
+        """
+        # Update text color based on the current appearance mode
+        current_mode = ctk.get_appearance_mode()
+        if current_mode == "Light":
+            self.file_renamer_message_label.configure(text_color="#000000")
+            self.name_normalizer_message_label.configure(text_color="#000000")
+            self.video_editor_message_label.configure(text_color="#000000")
+            self.add_remove_message_label.configure(text_color="#000000")
+        elif current_mode == "Dark":
+            self.file_renamer_message_label.configure(text_color="#FFFFFF")
+            self.name_normalizer_message_label.configure(text_color="#FFFFFF")
+            self.video_editor_message_label.configure(text_color="#FFFFFF")
+            self.add_remove_message_label.configure(text_color="#FFFFFF")
 
-        # Trace the changes in the StringVar
-        self.hour_var.trace_add("write",
-                                lambda name, index, mode, var=self.hour_var, default=self.default_hour,
-                                         desired_type=int: self.validate_entry(var, default, desired_type))
+    def show_message(self, message, error=False, frame_name=None):
+        """
+        Displays a message on the actively selected frame or all frames.
 
-        # Hour entry
-        self.hour_entry = ctk.CTkEntry(self.trim_frame, textvariable=self.hour_var, width=50)
-        self.hour_entry.grid(row=0, column=1, padx=10, pady=10)
+        Args:
+        message (str): The message to be displayed.
+        error (bool): If True, formats the message with red text for error indication. Default is False.
+        frame_name (str or None): The name of the frame to display the message on. If None, displays on all frames.
 
-        # Trim label
-        self.colon_label = ctk.CTkLabel(self.trim_frame, text=":")
-        self.colon_label.grid(row=0, column=2)
+        Note: Ensure this method is called appropriately to show messages in your GUI.
+        """
+        # Update text color when displaying a message
+        self.update_text_color()
 
-        # Initialize minute variable
-        self.minute_var = ctk.StringVar()
-        self.minute_var.set(self.default_minute)
+        # Display the message with optional error formatting on the actively selected frame
+        if frame_name == "file_renamer_window":
+            labels = [self.file_renamer_message_label]
+        elif frame_name == "name_normalizer_window":
+            labels = [self.name_normalizer_message_label]
+        elif frame_name == "video_editor_window":
+            labels = [self.video_editor_message_label]
+        elif frame_name == "add_remove_window":
+            labels = [self.add_remove_message_label]
+        else:
+            # Default to all frame labels if no frame name is passed
+            labels = [self.file_renamer_message_label, self.name_normalizer_message_label,
+                      self.video_editor_message_label, self.add_remove_message_label]
 
-        # Trace the changes in the StringVar
-        self.minute_var.trace_add("write",
-                                  lambda name, index, mode, var=self.minute_var, default=self.default_minute,
-                                         desired_type=int: self.validate_entry(var, default, desired_type))
+        # Truncate the message after x characters for GUI-friendly formatting.
+        truncated_message = f"{message[:115]}..." if len(message) > 115 else message
 
-        # Minute entry
-        self.minute_entry = ctk.CTkEntry(self.trim_frame, textvariable=self.minute_var, width=50)
-        self.minute_entry.grid(row=0, column=3, padx=10, pady=10)
+        for label in labels:
+            if error:
+                label.configure(text=truncated_message, text_color="#FF0000")  # Red text for errors
+            else:
+                label.configure(text=truncated_message)
 
-        # Trim label1
-        self.colon_label1 = ctk.CTkLabel(self.trim_frame, text=":")
-        self.colon_label1.grid(row=0, column=4)
+    def validate_entry(self, var, default_value, desired_type):
+        """
+        Validates and updates the value of a Tkinter variable based on the desired type.
 
-        # Initialize second variable
-        self.second_var = ctk.StringVar()
-        self.second_var.set(self.default_second)
+        Args:
+        var (tkinter.Variable): The Tkinter variable to be validated and updated.
+        default_value: The default value to set if validation fails.
+        desired_type (type): The desired type for the variable (int or float).
 
-        # Trace the changes in the StringVar
-        self.second_var.trace_add("write",
-                                  lambda name, index, mode, var=self.second_var, default=self.default_second,
-                                         desired_type=int: self.validate_entry(var, default, desired_type))
+        Note: Ensure this method is used to validate and update Tkinter variable values.
+        """
+        if not self.validate_entries.get():
+            # Return if validate entries is disabled
+            return
 
-        # Second entry
-        self.second_entry = ctk.CTkEntry(self.trim_frame, textvariable=self.second_var, width=50)
-        self.second_entry.grid(row=0, column=5, padx=10, pady=10)
+        # Ensure the value is of the desired type
+        current_value = var.get()
 
-        # Trim label
-        self.trim_label1 = ctk.CTkLabel(self.trim_frame, text="-")
-        self.trim_label1.grid(row=0, column=6, padx=10, pady=5)
+        if desired_type == int:
+            # Check if the value is an integer
+            if not current_value.isdigit():
+                try:
+                    # Try to convert the value to an integer
+                    int_value = int(current_value)
+                    var.set(int_value)
+                except ValueError:
+                    # If conversion to integer fails, set it to the default value
+                    var.set(default_value)
+        elif desired_type == float:
+            # Check if the value is a float
+            try:
+                float_value = float(current_value)
+                var.set(float_value)
+            except ValueError:
+                # If conversion to float fails, set it to the default value
+                var.set(default_value)
+        else:
+            # If the desired type is neither int nor float, set it to the default value
+            var.set(default_value)
 
-        # Initialize hour variable1
-        self.hour_var1 = ctk.StringVar()
-        self.hour_var1.set(self.default_hour)
+    @staticmethod
+    def get_basenames(file_paths: list) -> list:
+        """
+        Get the basenames of a list of file paths.
 
-        # Trace the changes in the StringVar
-        self.hour_var1.trace_add("write",
-                                 lambda name, index, mode, var=self.hour_var1, default=self.default_hour,
-                                        desired_type=int: self.validate_entry(var, default, desired_type))
+        Parameters:
+        - file_paths (list): A list of file paths.
 
-        # Hour entry1
-        self.hour_entry1 = ctk.CTkEntry(self.trim_frame, textvariable=self.hour_var1, width=50)
-        self.hour_entry1.grid(row=0, column=7, padx=10, pady=10)
+        Returns:
+        - list: A list containing the basenames of the input file paths.
+        """
+        basenames = [os.path.basename(path) for path in file_paths]
+        return basenames
 
-        # Trim label2
-        self.colon_label2 = ctk.CTkLabel(self.trim_frame, text=":")
-        self.colon_label2.grid(row=0, column=8)
+    @staticmethod
+    def get_lengths(input_list: list) -> list:
+        """
+        Get the lengths of each item in the input list, add one to account for the whitespace, and append it to the
+        item.
 
-        # Initialize minute variable1
-        self.minute_var1 = ctk.StringVar()
-        self.minute_var1.set(self.default_minute)
+        Parameters:
+        - input_list (list): A list of items.
 
-        # Trace the changes in the StringVar
-        self.minute_var1.trace_add("write",
-                                   lambda name, index, mode, var=self.minute_var1, default=self.default_minute,
-                                          desired_type=int: self.validate_entry(var, default, desired_type))
+        Returns:
+        - list: A new list with each item appended by its length.
+        """
+        processed_list = [f"{item} (frees {(len(str(item)) + 1)} characters)" for item in
+                          input_list]
+        return processed_list
 
-        # Minute entry1
-        self.minute_entry1 = ctk.CTkEntry(self.trim_frame, textvariable=self.minute_var1, width=50)
-        self.minute_entry1.grid(row=0, column=9, padx=10, pady=10)
+    def start_progress(self, progress_bar_name: str, frame: str, determinate: bool = False):
+        """
+        Start a progress bar.
 
-        # Trim label3
-        self.colon_label3 = ctk.CTkLabel(self.trim_frame, text=":")
-        self.colon_label3.grid(row=0, column=10)
+        Args:
+        - progress_bar_name (str): The name of the progress bar attribute.
+        - frame (str): The name of the frame to which the progress bar will be added.
+        - determinate (bool): If True, create a determinate progress bar with a status label updated by
+          update_progress. Default is False.
 
-        # Initialize second variable
-        self.second_var1 = ctk.StringVar()
-        self.second_var1.set(self.default_second)
+        """
+        # Create a progress bar
+        mode = "determinate" if determinate else "indeterminate"
+        setattr(self, progress_bar_name, ctk.CTkProgressBar(frame, orientation="horizontal", mode=mode))
+        getattr(self, progress_bar_name).grid(row=0, column=0, padx=10, pady=10)
 
-        # Trace the changes in the StringVar
-        self.second_var1.trace_add("write",
-                                   lambda name, index, mode, var=self.second_var1, default=self.default_second,
-                                          desired_type=int: self.validate_entry(var, default, desired_type))
+        if determinate:
+            # Start at zero and show the throughput/ETA status below the bar
+            getattr(self, progress_bar_name).set(0)
+            setattr(self, f"{progress_bar_name}_label", ctk.CTkLabel(frame, text=""))
+            getattr(self, f"{progress_bar_name}_label").grid(row=1, column=0, padx=10)
+        else:
+            # Start the progress bar
+            getattr(self, progress_bar_name).start()
 
-        # Second entry1
-        self.second_entry1 = ctk.CTkEntry(self.trim_frame, textvariable=self.second_var1, width=50)
-        self.second_entry1.grid(row=0, column=11, padx=10, pady=10)
+    def update_progress(self, progress_bar_name: str, fraction: float, status: str):
+        """
+        Update a determinate progress bar and its status label.
 
-        # Video Editor Output directory frame
-        self.video_editor_output_directory_frame = ctk.CTkFrame(self.video_editor_frame, corner_radius=0,
-                                                                fg_color="transparent")
-        self.video_editor_output_directory_frame.grid(row=8, column=0, padx=10, pady=5)
+        Args:
+        - progress_bar_name (str): The name of the progress bar attribute.
+        - fraction (float): The completed fraction (0-1).
+        - status (str): The status text (counts, throughput and ETA).
 
-        # Browse video editor output directory folder button
-        self.browse_video_editor_output_directory_button = ctk.CTkButton(self.video_editor_output_directory_frame,
-                                                                         text="Output Directory",
-                                                                         command=self.browse_output_directory)
-        self.browse_video_editor_output_directory_button.grid(row=0, column=0, padx=5, pady=5)
+        """
+        progress_bar = getattr(self, progress_bar_name, None)
+        status_label = getattr(self, f"{progress_bar_name}_label", None)
 
-        # Video editor output directory entry
-        self.video_editor_output_directory_entry = ctk.CTkEntry(self.video_editor_output_directory_frame, width=890)
-        self.video_editor_output_directory_entry.grid(row=0, column=1, padx=10, pady=10)
+        # Ignore updates that arrive after the progress bar was destroyed
+        if progress_bar is None or not progress_bar.winfo_exists():
+            return
 
-        # Process video editor frame
-        self.process_video_editor_frame = ctk.CTkFrame(self.video_editor_frame, corner_radius=0,
-                                                       fg_color="transparent")
-        self.process_video_editor_frame.grid(row=9, column=0, padx=10, pady=5)
+        progress_bar.set(fraction)
+        if status_label is not None and status_label.winfo_exists():
+            status_label.configure(text=status)
 
-        # Clear video editor values Button
-        self.clear_video_editor_values_button = ctk.CTkButton(self.process_video_editor_frame,
-                                                              text="Clear Values",
-                                                                 command=lambda: self.clear_selection(
-                                                                     frame_name="video_editor_window",
-                                                                     reset_all=False))
-        self.clear_video_editor_values_button.grid(row=0, column=0, padx=10, pady=10)
+    def report_progress(self, progress_bar_name: str, tracker: ProgressTracker, force: bool = False):
+        """
+        Post a progress update for a tracker to the UI event bus, at most once per report interval.
 
-        # Clear video editor entries Button
-        self.clear_video_editor_entries_button = ctk.CTkButton(self.process_video_editor_frame,
-                                                               text="Clear Everything",
-                                                               command=lambda: self.clear_selection(
-                                                                   frame_name="video_editor_window"))
-        self.clear_video_editor_entries_button.grid(row=0, column=1, padx=10, pady=10)
+        Args:
+        - progress_bar_name (str): The name of the progress bar attribute.
+        - tracker (ProgressTracker): The tracker to report.
+        - force (bool): If True, report regardless of the interval. Default is False.
 
-        # Select Video Editor Last Used File Button
-        self.video_editor_last_used_file_button = ctk.CTkButton(self.process_video_editor_frame,
-                                                                text="Reload Last File",
-                                                                command=self.load_last_used_file)
-        self.video_editor_last_used_file_button.grid(row=0, column=2, padx=10, pady=10)
+        """
+        if tracker.due() or force:
+            self.ui_event_bus.post("progress", progress_bar_name=progress_bar_name, **tracker.snapshot())
 
-        # Interrupt button1
-        self.interrupt_button1 = ctk.CTkButton(self.process_video_editor_frame, text="Interrupt",
-                                               command=lambda: self.interrupt_processing("video_processing_thread"))
-        self.interrupt_button1.grid(row=0, column=3, padx=5, pady=5)
+    def stop_progress(self, progress_bar_name: str):
+        """
+        Stop and destroy a progress bar.
 
-        # Process video button
-        self.process_video_edits_button = ctk.CTkButton(self.process_video_editor_frame, text="Process Video(s)",
-                                                        command=self.gather_and_validate_entries)
-        self.process_video_edits_button.grid(row=0, column=4, padx=5, pady=5)
+        Args:
+        - progress_bar_name (str): The name of the progress bar attribute to stop and destroy.
 
-        # Frame to display messages on the video editor frame
-        self.send_to_module_frame2 = ctk.CTkFrame(self.video_editor_frame, corner_radius=0,
-                                                  fg_color="transparent")
-        self.send_to_module_frame2.grid(row=10, column=0, padx=10)
+        """
+        try:
+            # Stop the progress bar
+            getattr(self, progress_bar_name).stop()
 
-        # Send to File Renamer button
-        self.send_to_file_renamer_button = ctk.CTkButton(self.send_to_module_frame2, text="Send to File Renamer",
-                                                         command=lambda: self.send_to_module(
-                                                             destination="file_renamer_module"))
-        self.send_to_file_renamer_button.grid(row=0, column=0, padx=10, pady=10)
+            # Destroy the progress bar widget
+            getattr(self, progress_bar_name).destroy()
 
-        # Send to Name Normalizer button
-        self.send_to_name_normalizer_button1 = ctk.CTkButton(self.send_to_module_frame2,
-                                                             text="Send to Name Normalizer",
-                                                             command=lambda: self.send_to_module(
-                                                                 destination="name_normalizer_module"))
-        self.send_to_name_normalizer_button1.grid(row=0, column=1, padx=10, pady=10)
+            # Destroy the status label of a determinate progress bar
+            status_label = getattr(self, f"{progress_bar_name}_label", None)
+            if status_label is not None:
+                status_label.destroy()
+                setattr(self, f"{progress_bar_name}_label", None)
+        except AttributeError:
+            # Handle the case where the progress bar attribute does not exist
+            self.log_and_show(f"Progress bar '{progress_bar_name}' not found.", create_messagebox=True, error=True)
 
-        # Video editor checkbox frame
-        self.video_editor_checkbox_frame = ctk.CTkFrame(self.video_editor_frame, corner_radius=0,
-                                                        fg_color="transparent")
-        self.video_editor_checkbox_frame.grid(row=11, column=0, padx=10, pady=5)
+    def log_and_show(self, message, create_messagebox=False, error=False, not_logging=False):
+        """
+        Method to check logging state, log if applicable, and show a messagebox.
 
-        # Checkbox to enable/disable remove successful lines
-        self.remove_successful_lines_switch = ctk.CTkSwitch(self.video_editor_checkbox_frame,
-                                                                text="Remove successful lines from input file",
-                                                                variable=self.remove_successful_lines_var)
-        self.remove_successful_lines_switch.grid(row=0, column=0, padx=10, pady=10)
+        Parameters:
+        - message: The message to be logged and displayed.
+        - create_messagebox: Boolean indicating whether to create and display a messagebox.
+        - error: Boolean indicating whether the message is an error message.
+        - not_logging: Boolean indicating whether to skip logging.
+        """
+        # Check logging state and log message if applicable
+        if not not_logging and self.activate_logging_var.get():
+            logging_function = logging.error if error else logging.info
+            logging_function(message)
 
-        # Checkbox to enable/disable reset video editor entries
-        self.reset_video_switch = ctk.CTkSwitch(self.video_editor_checkbox_frame,
-                                                    text="Reset entries",
-                                                    variable=self.reset_video_entries_var)
-        self.reset_video_switch.grid(row=0, column=1, padx=10, pady=10)
+        # Worker threads must not touch widgets, so post the message to the UI event bus instead
+        if threading.current_thread() is not threading.main_thread():
+            # Attribute the message to the worker's module (threads are named after their frame)
+            thread_name = threading.current_thread().name
+            frame_name = thread_name if thread_name in self.log_views() else self.frame_name
+            self.ui_event_bus.post("message", message=message, error=error, frame_name=frame_name)
+            return
 
-        # Frame to display messages on the video editor frame
-        self.video_editor_message_label_frame = ctk.CTkFrame(self.video_editor_frame, corner_radius=0,
-                                                             fg_color="transparent")
-        self.video_editor_message_label_frame.grid(row=12, column=0, padx=10)
+        # Add the message to the frame's log view (if it has one)
+        self.append_to_log_view(self.frame_name, [message])
 
-        # Video editor message Label
-        self.video_editor_message_label = ctk.CTkLabel(self.video_editor_message_label_frame, text="")
-        self.video_editor_message_label.grid(row=0, column=0, padx=10, pady=10)
+        # Check messagebox state and display messageboxes if applicable
+        if self.show_messageboxes_var.get():
+            messagebox_function = messagebox.showerror if error else messagebox.showinfo
+            if create_messagebox:
+                messagebox_function("Error" if error else "Info", message)
+            else:
+                # Display the message on the applicable frame if messageboxes are enabled but none were created
+                self.show_message(message, error=error, frame_name=self.frame_name)
+        else:
+            # Display the message on the applicable frame if messageboxes are disabled
+            self.show_message(message, error=error, frame_name=self.frame_name)
 
-        # Progressbar frame1
-        self.slider_progressbar_frame1 = ctk.CTkFrame(self.video_editor_message_label_frame,
-                                                      corner_radius=0,
-                                                      fg_color="transparent")
-        self.slider_progressbar_frame1.grid(row=1, column=0, padx=10)
-        self.slider_progressbar_frame1.grid_columnconfigure(0, weight=1)
-        self.slider_progressbar_frame1.grid_rowconfigure(4, weight=1)
+    def log_views(self) -> dict:
+        """
+        Get the log view textbox of each frame that has one.
 
+        Returns:
+        - dict: The log view textboxes keyed by frame name.
         """
-        add_remove_window
+        return {"name_normalizer_window": self.name_normalizer_log_textbox,
+                "video_editor_window": self.video_editor_log_textbox}
+
+    def append_to_log_view(self, frame_name, lines):
         """
-        # Create Add/Remove frame
-        self.add_remove_frame = ctk.CTkFrame(self, corner_radius=0, fg_color="transparent")
-        self.add_remove_frame.grid_columnconfigure(0, weight=1)
+        Append lines to a frame's log view, keeping at most log_view_max_lines lines.
 
-        # Add/Remove Label
-        self.add_remove_label = ctk.CTkLabel(self.add_remove_frame, text="Add/Remove",
-                                             font=ctk.CTkFont(size=15, weight="bold"))
-        self.add_remove_label.grid(row=0, column=0, padx=10, pady=10)
+        Parameters:
+        - frame_name: The name of the frame whose log view to append to.
+        - lines: The lines to append.
+        """
+        textbox = self.log_views().get(frame_name)
+        if not textbox or not lines:
+            return
 
-        # Create an add_remove_tabview on add_remove_frame row 1
-        self.add_remove_tabview, self.add_remove_tabs = self.create_tabview(self.add_remove_frame,
-                                                                            self.add_remove_tab_names,
-                                                                            self.default_add_remove_tab)
+        # The textbox is read-only, so enable it only while writing
+        textbox.configure(state="normal")
+        textbox.insert(ctk.END, "\n".join(lines) + "\n")
 
-        """Artist Tab"""
-        # Add and remove artist top frame
-        self.add_remove_artist_top_frame = ctk.CTkFrame(self.add_remove_tabs.get("Artist"), corner_radius=0,
-                                                        fg_color="transparent")
-        self.add_remove_artist_top_frame.grid(row=0, column=0, padx=10, pady=10)
+        # Drop the oldest lines beyond the limit
+        line_count = int(textbox.index("end-1c").split(".")[0]) - 1
+        if line_count > self.log_view_max_lines:
+            textbox.delete("1.0", f"{line_count - self.log_view_max_lines + 1}.0")
 
-        # Add and remove artist label frame
-        self.add_remove_artist_label_frame = ctk.CTkFrame(self.add_remove_artist_top_frame, corner_radius=0,
-                                                          fg_color="transparent")
-        self.add_remove_artist_label_frame.grid(row=0, column=0, padx=10, pady=10)
+        # Scroll to the newest message
+        textbox.see(ctk.END)
+        textbox.configure(state="disabled")
 
-        # Add/Remove Artist Label
-        self.add_remove_artist_label = ctk.CTkLabel(self.add_remove_artist_label_frame, text="Add/Remove Artist",
-                                                    font=ctk.CTkFont(size=15, weight="bold"))
-        self.add_remove_artist_label.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
+    def run_on_main(self, callback, *args, **kwargs):
+        """
+        Run a callback on the Tk main thread, directly if already on it, otherwise through the UI event bus.
 
-        # Add and remove artist entry frame
-        self.add_remove_artist_entry_frame = ctk.CTkFrame(self.add_remove_artist_top_frame, corner_radius=0,
-                                                          fg_color="transparent")
-        self.add_remove_artist_entry_frame.grid(row=1, column=0, padx=10, pady=10)
+        Parameters:
+        - callback: The function to run.
+        - *args, **kwargs: The arguments to pass to the callback.
+        """
+        if threading.current_thread() is threading.main_thread():
+            callback(*args, **kwargs)
+        else:
+            self.ui_event_bus.post("call", callback=callback, args=args, kwargs=kwargs)
 
-        # Add artist button
-        self.add_artist_button = ctk.CTkButton(self.add_remove_artist_entry_frame, text="Add Artist",
-                                               command=self.add_artist_to_file)
-        self.add_artist_button.grid(row=0, column=0, padx=5)
+    def process_ui_events(self):
+        """
+        Drain the UI event bus on the main thread and apply the events in batches.
 
-        # Add artist entry
-        self.add_artist_entry = ctk.CTkEntry(self.add_remove_artist_entry_frame, width=370)
-        self.add_artist_entry.grid(row=0, column=1, padx=5)
+        Messages are appended to the log views in one insert per frame and the message label of each frame is
+        updated at most once per drain (with the latest message), as is each progress bar. Callbacks run in the
+        order they were posted; a callback that raises is logged and the drain continues.
+        """
+        try:
+            log_lines = {}
+            latest_messages = {}
+            latest_progress = {}
+
+            for kind, payload in self.ui_event_bus.drain(limit=5000):
+                if kind == "message":
+                    frame_name = payload["frame_name"]
+                    log_lines.setdefault(frame_name, []).append(payload["message"])
+                    latest_messages[frame_name] = (payload["message"], payload["error"])
+                elif kind == "progress":
+                    # Only the latest progress of each bar matters
+                    latest_progress[payload["progress_bar_name"]] = (payload["fraction"], payload["status"])
+                elif kind == "call":
+                    # Apply pending progress before callbacks (which may destroy the progress bar)
+                    for progress_bar_name, (fraction, status) in latest_progress.items():
+                        self.update_progress(progress_bar_name, fraction, status)
+                    latest_progress = {}
+
+                    # Flush the queued messages first so callbacks see them in order
+                    self.flush_ui_messages(log_lines, latest_messages)
+                    log_lines, latest_messages = {}, {}
+
+                    # A failing callback must not drop the events queued after it
+                    try:
+                        payload["callback"](*payload["args"], **payload["kwargs"])
+                    except Exception as e:
+                        callback_name = getattr(payload["callback"], "__name__", repr(payload["callback"]))
+                        logging.error(f"UI callback {callback_name} failed: {str(e)}")
+
+            self.flush_ui_messages(log_lines, latest_messages)
+            for progress_bar_name, (fraction, status) in latest_progress.items():
+                self.update_progress(progress_bar_name, fraction, status)
+        except Exception as e:
+            logging.error(f"Processing UI events failed: {str(e)}")
 
-        # Remove artist button
-        self.remove_artist_button = ctk.CTkButton(self.add_remove_artist_entry_frame, text="Remove Artist",
-                                                  command=self.remove_artist_from_file)
-        self.remove_artist_button.grid(row=0, column=2, padx=5, pady=5)
+        # Schedule the next drain
+        self.after(self.ui_event_interval_ms, self.process_ui_events)
 
-        # Remove artist entry
-        self.remove_artist_entry = ctk.CTkEntry(self.add_remove_artist_entry_frame, width=370)
-        self.remove_artist_entry.grid(row=0, column=3, padx=5)
+    def flush_ui_messages(self, log_lines, latest_messages):
+        """
+        Apply coalesced worker messages to the log views and message labels.
 
-        # Add and remove artist checkbox frame
-        self.auto_add_acc_record_frame = ctk.CTkFrame(self.add_remove_artist_top_frame, corner_radius=0,
-                                                      fg_color="transparent")
-        self.auto_add_acc_record_frame.grid(row=2, column=0, padx=10, pady=10)
+        Parameters:
+        - log_lines: The messages to append, keyed by frame name.
+        - latest_messages: The latest (message, error) tuple, keyed by frame name.
+        """
+        for frame_name, lines in log_lines.items():
+            self.append_to_log_view(frame_name, lines)
 
-        # Checkbox to enable/disable automatically add artist record for common categories
-        self.auto_add_acc_record_checkbox = ctk.CTkCheckBox(self.auto_add_acc_record_frame,
-                                                            text="Automatically add record for Common Categories",
-                                                            variable=self.auto_add_acc_record_var)
-        self.auto_add_acc_record_checkbox.grid(row=0, column=0, padx=10, pady=10)
+        for frame_name, (message, error) in latest_messages.items():
+            self.show_message(message, error=error, frame_name=frame_name)
 
-        # Add and remove artist label frame
-        self.add_remove_acc_record_label_frame = ctk.CTkFrame(self.add_remove_artist_top_frame, corner_radius=0,
-                                                              fg_color="transparent")
-        self.add_remove_acc_record_label_frame.grid(row=3, column=0, padx=10, pady=10)
+    def ask_confirmation(self, title, message):
+        """
+        Display a yes/no messagebox for confirmation.
 
-        # Add/Remove Artist Label
-        self.add_remove_acc_record_label = ctk.CTkLabel(self.add_remove_acc_record_label_frame,
-                                                        text="Add/Remove Artist "
-                                                             "Common Categories "
-                                                             "Record",
-                                                        font=ctk.CTkFont(size=15, weight="bold"))
-        self.add_remove_acc_record_label.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
+        Parameters:
+        - title (str): The title of the messagebox.
+        - message (str): The message to be displayed in the messagebox.
 
-        # Add and remove artist entry frame
-        self.add_remove_acc_record_entry_frame = ctk.CTkFrame(self.add_remove_artist_top_frame, corner_radius=0,
-                                                              fg_color="transparent")
-        self.add_remove_acc_record_entry_frame.grid(row=4, column=0, padx=10, pady=10)
+        Returns:
+        - bool: True if 'Yes' is selected, False otherwise.
+        """
+        # Check confirmation messagebox state and display messageboxes if applicable
+        if self.show_confirmation_messageboxes_var.get():
+            confirmation = messagebox.askyesno(title, message)
+            return confirmation
+        else:
+            if self.fallback_confirmation_var.get():
+                # Automatically choose Yes if fallback state is True.
+                return True
+            else:
+                # Automatically choose No if fallback state is False.
+                return False
 
-        # Add artist button
-        self.add_acc_record_button = ctk.CTkButton(self.add_remove_acc_record_entry_frame, text="Add Artist C.C.",
-                                                   command=self.add_artist_to_common_categories_dictionary)
-        self.add_acc_record_button.grid(row=0, column=0, padx=5)
+    def selection_window(self, title: str, prompt: str, label_text: str, item_list: list, item_text=None) -> str:
+        """
+        Display a selection window prompting the user to choose from a list of options.
 
-        # Add artist entry
-        self.add_acc_record_entry = ctk.CTkEntry(self.add_remove_acc_record_entry_frame, width=370)
-        self.add_acc_record_entry.grid(row=0, column=1, padx=5)
+        Args:
+        - title (str): Title of the selection window.
+        - prompt (str): Prompt message displayed in the window.
+        - label_text (str): Label text for the selection.
+        - item_list (list): List of items to choose from.
+        - item_text (list, optional): GUI-friendly list of items to choose from.
 
-        # Remove artist button
-        self.remove_acc_record_button = ctk.CTkButton(self.add_remove_acc_record_entry_frame, text="Remove Artist C.C.",
-                                                      command=self.remove_artist_from_common_categories_dictionary)
-        self.remove_acc_record_button.grid(row=0, column=2, padx=5, pady=5)
+        Returns:
+        - str: The selected option from the user.
 
-        # Remove artist entry
-        self.remove_acc_record_entry = ctk.CTkEntry(self.add_remove_acc_record_entry_frame, width=370)
-        self.remove_acc_record_entry.grid(row=0, column=3, padx=5)
+        """
+        # If the gui-friendly text is provided, then use it, else use the item_list
+        item_text = item_text if item_text else item_list
 
-        # Add/Remove artist common categories label frame
-        self.add_remove_acc_label_frame = ctk.CTkFrame(self.add_remove_artist_top_frame, corner_radius=0,
-                                                       fg_color="transparent")
-        self.add_remove_acc_label_frame.grid(row=5, column=0, padx=10, pady=10)
+        # Prompt the user to choose from the list using SelectOptionWindow
+        selection_window = SelectOptionWindow(title=title,
+                                              prompt=prompt,
+                                              label_text=label_text,
+                                              item_list=item_list,
+                                              item_text=item_text)
 
-        # Add/Remove artist common categories Label
-        self.add_remove_acc_label = ctk.CTkLabel(self.add_remove_acc_label_frame, text="Add/Remove Artist "
-                                                                                       "Common Categories",
-                                                 font=ctk.CTkFont(size=15, weight="bold"))
-        self.add_remove_acc_label.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
+        # Keep track of the open window
+        self.open_windows.append(selection_window)
 
-        # Browse frame for artist common categories
-        self.acc_browse_frame = ctk.CTkFrame(self.add_remove_artist_top_frame, corner_radius=0,
-                                             fg_color="transparent")
-        self.acc_browse_frame.grid(row=6, column=0, padx=10, pady=10)
+        # Wait for the user to respond before proceeding
+        selection_window.wait_window()
 
-        # Browse artist common categories button
-        self.browse_artist_button = ctk.CTkButton(self.acc_browse_frame, text="Browse Artist",
-                                                  command=lambda: self.browse_artist(mode="Browse"))
-        self.browse_artist_button.grid(row=0, column=0, padx=5)
+        # Retrieve the selected directory
+        selected_option = selection_window.get_selected_option()
 
-        # Artist Common Categories Display
-        self.acc_display_text = ctk.StringVar()
-        self.acc_display_text.set("Select an Artist using the 'Browse Artist' button...")
-        self.acc_display_entry = ctk.CTkEntry(self.acc_browse_frame, width=900,
-                                              textvariable=self.acc_display_text)
-        self.acc_display_entry.grid(row=0, column=1, padx=5)
+        # Remove the window from the list when it is closed
+        self.open_windows.remove(selection_window)
 
-        # Detect artist button
-        self.detect_artist_button = ctk.CTkButton(self.acc_browse_frame, text="Detect Artist",
-                                                  command=lambda: self.browse_artist(mode="Detect"))
-        self.detect_artist_button.grid(row=1, column=0, padx=5, pady=10)
+        return selected_option
 
-        # Add and remove artist common categories entry frame
-        self.add_remove_acc_entry_frame = ctk.CTkFrame(self.add_remove_artist_top_frame, corner_radius=0,
-                                                       fg_color="transparent")
-        self.add_remove_acc_entry_frame.grid(row=7, column=0, padx=10, pady=10)
+    """
+    Json Handling
+    """
 
-        # Add artist common categories button
-        self.add_acc_button = ctk.CTkButton(self.add_remove_acc_entry_frame, text="Add A.C.C.",
-                                            command=self.add_artist_common_category)
-        self.add_acc_button.grid(row=0, column=0, padx=5)
+    def initialize_json(self):
+        """
+        Initializes class attributes by loading data from the specified JSON file.
 
-        # Add artist common categories entry
-        self.add_acc_entry = ctk.CTkEntry(self.add_remove_acc_entry_frame, width=370)
-        self.add_acc_entry.grid(row=0, column=1, padx=5)
+        Note: Ensure this method is called appropriately during the initialization of your class.
+        """
+        # Load data from the dictionary_file
+        try:
+            if not os.path.isfile(self.dictionary_file):
+                # Return early if the file doesn't exist
+                return
 
-        # Remove artist common categories button
-        self.remove_acc_button = ctk.CTkButton(self.add_remove_acc_entry_frame, text="Remove A.C.C.",
-                                               command=self.remove_artist_common_category)
-        self.remove_acc_button.grid(row=0, column=2, padx=5, pady=5)
+            with open(self.dictionary_file, "r") as json_file:
+                data = json.load(json_file)
 
-        # Remove artist common categories entry
-        self.remove_acc_entry = ctk.CTkEntry(self.add_remove_acc_entry_frame, width=370)
-        self.remove_acc_entry.grid(row=0, column=3, padx=5)
+                # Get artist_common_categories dictionary
+                self.artist_common_categories = data.get("artist_common_categories", {})
 
-        """Category Tab"""
-        self.category_frame = ctk.CTkFrame(self.add_remove_tabs.get("Category"), corner_radius=0,
-                                           fg_color="transparent")
-        self.category_frame.grid(row=0, column=0, padx=10, pady=10)
+                # Get categories dictionary
+                self.categories = data.get("categories", {})
 
-        # Add Category Button
-        self.add_category_button = ctk.CTkButton(self.category_frame, text="Add Category", command=self.add_category)
-        self.add_category_button.grid(row=0, column=0, padx=5)
+                # Get custom_text_to_replace list
+                self.custom_text_to_replace = data.get("custom_text_to_replace", {})
 
-        # Add Category Entry
-        self.category_entry = ctk.CTkEntry(self.category_frame, width=310)
-        self.category_entry.grid(row=0, column=1, padx=5)
+                # Get excluded_folders list
+                self.excluded_folders = data.get("excluded_folders", [])
 
-        # Weight Label
-        self.weight_label = ctk.CTkLabel(self.category_frame, text="Weight:")
-        self.weight_label.grid(row=0, column=2, padx=5)
+                # Get title_exceptions list (small words kept lowercase by the title case)
+                self.title_exceptions = data.get("title_exceptions", [])
+                self.title_caser = TitleCaser(self.title_exceptions)
 
-        # Initialize weight variable
-        self.weight_var = ctk.StringVar()
-        self.weight_var.set(self.default_weight)
+                # Get file_extensions list
+                self.file_extensions = data.get("file_extensions", [])
 
-        # Trace the changes in the StringVar
-        self.weight_var.trace_add("write",
-                                  lambda name, index, mode, var=self.weight_var, default=self.default_weight,
-                                         desired_type=int: self.validate_entry(var, default, desired_type))
+                # Get valid_extensions list
+                self.valid_extensions = data.get("valid_extensions", [])
+
+                # Get weight_to_tab_name dictionary
+                weight_to_tab_name = data.get("weight_to_tab_name", {})
+                # Make sure the keys are integers
+                self.weight_to_tab_name = {int(key): value for key, value in weight_to_tab_name.items()}
+
+                # Bump the dictionary version to invalidate cached previews
+                self.dictionary_version += 1
+
+        except FileNotFoundError:
+            # Log that the file is not found
+            self.log_and_show(f"Dictionary JSON file not found: {self.dictionary_file}")
 
-        # Weight Entry
-        self.weight_entry = ctk.CTkEntry(self.category_frame, textvariable=self.weight_var, width=50)
-        self.weight_entry.grid(row=0, column=3, padx=5)
+        except json.JSONDecodeError as e:
+            # Handle JSON decoding error
+            self.log_and_show(f"Error decoding JSON in dictionary file: {self.dictionary_file}, {str(e)}", error=True)
 
-        # Remove Category Button
-        self.remove_category_button = ctk.CTkButton(self.category_frame, text="Remove Category",
-                                                    command=self.remove_category)
-        self.remove_category_button.grid(row=0, column=4, padx=5)
+        except Exception as e:
+            self.log_and_show(f"Initialize JSON failed: {self.dictionary_file}, {str(e)}", error=True)
 
-        # Remove Category Entry
-        self.remove_category_entry = ctk.CTkEntry(self.category_frame, width=310)
-        self.remove_category_entry.grid(row=0, column=5, padx=5)
+    def initialize_history(self):
+        """
+        Opens the persistent rename history, falling back to an in-memory history if the file cannot be opened.
+        """
+        try:
+            self.history_store = RenameHistoryStore(self.history_file,
+                                                    retention_limit=self.history_retention_limit,
+                                                    cache_kib=self.history_cache_kib)
+        except sqlite3.Error as e:
+            # Keep undo working for this session even if the history file is unavailable
+            self.log_and_show(f"Opening the rename history failed: {self.history_file}, {str(e)}. "
+                              f"Undo history will not be saved.", error=True)
+            self.history_store = RenameHistoryStore(":memory:", retention_limit=self.history_retention_limit,
+                                                    cache_kib=self.history_cache_kib)
 
-        """Custom Tab Name Tab"""
-        self.ctn_frame = ctk.CTkFrame(self.add_remove_tabs.get("Custom Tab Name"), corner_radius=0,
-                                      fg_color="transparent")
-        self.ctn_frame.grid(row=0, column=0, padx=10, pady=10)
+    def update_json(self, file_to_update, dictionary_name, updated_data):
+        """
+        Updates a specific dictionary in a JSON file with new data.
 
-        # Add Custom Tab Name Button
-        self.add_ctn_button = ctk.CTkButton(self.ctn_frame, text="Add Custom Tab", command=self.add_custom_tab_name)
-        self.add_ctn_button.grid(row=0, column=0, padx=5)
+        Args:
+        file_to_update (str): The path to the JSON file to be updated.
+        dictionary_name (str): The name of the dictionary key to be updated.
+        updated_data: The new data to be assigned to the specified dictionary key.
 
-        # Add Custom Tab Name Entry
-        self.custom_tab_name_entry = ctk.CTkEntry(self.ctn_frame, width=310)
-        self.custom_tab_name_entry.grid(row=0, column=1, padx=5)
+        Note: Ensure this method is called appropriately to update JSON files in your application.
+        """
+        try:
+            if not os.path.isfile(file_to_update):
+                # Return early if the file doesn't exist
+                raise FileNotFoundError
 
-        # Weight1 Label
-        self.weight_label1 = ctk.CTkLabel(self.ctn_frame, text="Weight:")
-        self.weight_label1.grid(row=0, column=2, padx=5)
+            # Read existing JSON data
+            with open(file_to_update, 'r') as json_file:
+                data = json.load(json_file)
 
-        # Initialize weight variable
-        self.weight_var1 = ctk.StringVar()
-        self.weight_var1.set(self.default_ctn_weight)
+            # Update the dictionary key
+            data[dictionary_name] = updated_data
 
-        # Trace the changes in the StringVar
-        self.weight_var1.trace_add("write",
-                                   lambda name, index, mode, var=self.weight_var1, default=self.default_ctn_weight,
-                                          desired_type=int: self.validate_entry(var, default, desired_type))
+            # Sort the dictionary alphabetically
+            sorted_data = {key: value for key, value in sorted(data.items())}
 
-        # Weight Entry1
-        self.weight_entry1 = ctk.CTkEntry(self.ctn_frame, textvariable=self.weight_var1, width=50)
-        self.weight_entry1.grid(row=0, column=3, padx=5)
+            # Write the sorted data back to the JSON file
+            with open(file_to_update, 'w') as json_file:
+                json.dump(sorted_data, json_file, indent=2)
 
-        # Remove Custom Tab Name Button
-        self.remove_ctn_button = ctk.CTkButton(self.ctn_frame, text="Remove Custom Tab",
-                                               command=self.remove_custom_tab_name)
-        self.remove_ctn_button.grid(row=0, column=4, padx=5)
+            # Bump the dictionary version to invalidate cached previews
+            self.dictionary_version += 1
 
-        # Remove Custom Tab Name Entry
-        self.remove_custom_tab_name_entry = ctk.CTkEntry(self.ctn_frame, width=310)
-        self.remove_custom_tab_name_entry.grid(row=0, column=5, padx=5)
+        except FileNotFoundError:
+            # Log that the file is not found
+            self.log_and_show(f"JSON file not found: {file_to_update}", create_messagebox=True, error=True)
 
-        """Custom Text to Replace Tab"""
-        # Custom Text to Replace frame
-        self.ctr_entry_frame = ctk.CTkFrame(self.add_remove_tabs.get("Custom Text to Replace"), corner_radius=0,
-                                            fg_color="transparent")
-        self.ctr_entry_frame.grid(row=0, column=0, padx=10, pady=10)
+        except json.JSONDecodeError as e:
+            # Handle JSON decoding error
+            self.log_and_show(f"Decoding JSON in JSON file failed: {file_to_update}, {str(e)}", error=True)
 
-        # Add ctr button
-        self.add_ctr_button = ctk.CTkButton(self.ctr_entry_frame, text="Add CTR",
-                                            command=self.add_custom_text_to_replace)
-        self.add_ctr_button.grid(row=0, column=0, padx=5)
+        except Exception as e:
+            self.log_and_show(f"Updating JSON failed: {file_to_update}, {str(e)}", error=True)
 
-        # Add ctr entry
-        self.add_ctr_name_entry = ctk.CTkEntry(self.ctr_entry_frame, width=370)
-        self.add_ctr_name_entry.grid(row=0, column=1, padx=5, pady=10)
+    """
+    Logging
+    """
 
-        # Replacement Label
-        self.replacement_label = ctk.CTkLabel(self.ctr_entry_frame, text="Replace with:")
-        self.replacement_label.grid(row=0, column=2, padx=5, pady=10)
+    def logging_setup(self):
+        """
+        Set up logging for the File Renamer application.
 
-        # Replacement text entry
-        self.replacement_text_entry = ctk.CTkEntry(self.ctr_entry_frame, width=100)
-        self.replacement_text_entry.grid(row=0, column=3, padx=5, pady=10)
+        Note: Ensure this method is called appropriately during the initialization of your application.
+        """
+        # Plain text or JSON lines format
+        if self.json_logging_var.get():
+            formatter = JsonLinesFormatter()
+        else:
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s: %(message)s')
 
-        # Remove ctr button
-        self.remove_ctr_button = ctk.CTkButton(self.ctr_entry_frame, text="Remove CTR",
-                                               command=self.remove_custom_text_to_replace)
-        self.remove_ctr_button.grid(row=1, column=0, padx=5)
+        # Setup is idempotent: if the pipeline is already running, only the format is updated
+        if self.log_listener is not None:
+            self.log_file_handler.setFormatter(formatter)
+            return
 
-        # Remove ctr entry
-        self.remove_ctr_name_entry = ctk.CTkEntry(self.ctr_entry_frame, width=370)
-        self.remove_ctr_name_entry.grid(row=1, column=1, padx=5)
+        # Single rotating sink, written only by the listener thread
+        self.log_file_handler = RotatingFileHandler(self.file_renamer_log, maxBytes=self.log_max_bytes,
+                                                    backupCount=self.log_backup_count, encoding="utf-8")
+        self.log_file_handler.setFormatter(formatter)
 
-        """Exclude Tab"""
-        # Exclude frame
-        self.exclude_entry_frame = ctk.CTkFrame(self.add_remove_tabs.get("Exclude"), corner_radius=0,
-                                                fg_color="transparent")
-        self.exclude_entry_frame.grid(row=0, column=0, padx=10, pady=10)
+        # Start the listener thread that drains the log queue into the sink
+        self.log_listener = QueueListener(self.log_queue, self.log_file_handler, respect_handler_level=True)
+        self.log_listener.start()
 
-        # Add Exclude button
-        self.add_exclude_button = ctk.CTkButton(self.exclude_entry_frame, text="Add Exclude",
-                                                command=self.add_folder_to_excluded_folders)
-        self.add_exclude_button.grid(row=0, column=0, padx=5)
+        # Callers only enqueue records, so log_and_show never waits on file I/O
+        self.log_queue_handler = QueueHandler(self.log_queue)
+        logger = logging.getLogger()
+        logger.setLevel(logging.INFO)
+        logger.addHandler(self.log_queue_handler)
 
-        # Add Exclude entry
-        self.add_exclude_name_entry = ctk.CTkEntry(self.exclude_entry_frame, width=370)
-        self.add_exclude_name_entry.grid(row=0, column=1, padx=5)
+        logging.info("Logging started.")
 
-        # Remove Exclude button
-        self.remove_exclude_button = ctk.CTkButton(self.exclude_entry_frame, text="Remove Exclude",
-                                                   command=self.remove_folder_from_excluded_folders)
-        self.remove_exclude_button.grid(row=0, column=3, padx=5)
+    def stop_logging(self):
+        """
+        Stop logging for the File Renamer application.
 
-        # Remove Exclude entry
-        self.remove_exclude_name_entry = ctk.CTkEntry(self.exclude_entry_frame, width=370)
-        self.remove_exclude_name_entry.grid(row=0, column=4, padx=5)
+        Note: Ensure this method is called appropriately during the cleanup or termination of your application.
+        """
+        # Nothing to stop if the pipeline is not running
+        if self.log_listener is None:
+            return
 
-        """File Extensions Tab"""
-        # File Extension frame
-        self.file_extension_entry_frame = ctk.CTkFrame(self.add_remove_tabs.get("File Extensions"), corner_radius=0,
-                                                       fg_color="transparent")
-        self.file_extension_entry_frame.grid(row=0, column=0, padx=10, pady=10)
+        # Notate that logging stopped
+        logging.info("Logging stopped.")
 
-        # Add File Extension button
-        self.add_file_extension_button = ctk.CTkButton(self.file_extension_entry_frame, text="Add File Ext.",
-                                                       command=self.add_file_extension)
-        self.add_file_extension_button.grid(row=0, column=0, padx=5)
+        # Detach the queue handler, then let the listener flush the queue before closing the sink
+        logging.getLogger().removeHandler(self.log_queue_handler)
+        self.log_listener.stop()
+        self.log_file_handler.close()
 
-        # Add File Extension entry
-        self.add_file_extension_entry = ctk.CTkEntry(self.file_extension_entry_frame, width=370)
-        self.add_file_extension_entry.grid(row=0, column=1, padx=5)
+        self.log_queue_handler = None
+        self.log_file_handler = None
+        self.log_listener = None
 
-        # Remove File Extension button
-        self.remove_file_extension_button = ctk.CTkButton(self.file_extension_entry_frame, text="Remove File Ext.",
-                                                          command=self.remove_file_extension)
-        self.remove_file_extension_button.grid(row=0, column=3, padx=5)
+    """
+    File Operations
+    """
 
-        # Remove File Extension entry
-        self.remove_file_extension_entry = ctk.CTkEntry(self.file_extension_entry_frame, width=370)
-        self.remove_file_extension_entry.grid(row=0, column=4, padx=5)
+    def remove_successful_line_from_file(self, file_path: str, line_to_remove: str):
+        """
+        Removes a specified line from a text file.
 
-        """NO-GO Tab"""
-        # NO-GO frame
-        self.no_go_entry_frame = ctk.CTkFrame(self.add_remove_tabs.get("NO GO"), corner_radius=0,
-                                              fg_color="transparent")
-        self.no_go_entry_frame.grid(row=0, column=0, padx=10, pady=10)
+        Args:
+        file_path (str): The path to the text file.
+        line_to_remove (str): The line to be removed from the file.
 
-        # Add NO-GO button
-        self.add_no_go_button = ctk.CTkButton(self.no_go_entry_frame, text="Add NO GO",
-                                              command=self.no_go_creation)
-        self.add_no_go_button.grid(row=0, column=0, padx=5)
+        Note: Ensure this method is called appropriately to remove a line from the specified text file.
+        """
+        try:
+            if not file_path.lower().endswith('.txt'):
+                # If the file does not have a .txt extension, return without performing any operation.
+                self.log_and_show("The provided file is not a txt file. Skipping removal of successful line.",
+                                  error=True)
+                return
 
-        # Add NO-GO entry
-        self.add_no_go_name_entry = ctk.CTkEntry(self.no_go_entry_frame, width=370)
-        self.add_no_go_name_entry.grid(row=0, column=1, padx=5)
+            # Read all lines from the file.
+            with open(file_path, 'r') as file:
+                lines = file.readlines()
 
-        # Remove NO-GO button
-        self.remove_no_go_button = ctk.CTkButton(self.no_go_entry_frame, text="Remove NO GO",
-                                                 command=self.no_go_removal)
-        self.remove_no_go_button.grid(row=0, column=3, padx=5)
+            # Open the file in write mode to remove the specified line.
+            with open(file_path, 'w') as file:
+                # Write lines back to the file, excluding the successful line to remove.
+                for line in lines:
+                    if line.strip() != line_to_remove:
+                        file.write(line)
 
-        # Remove NO-GO entry
-        self.remove_no_go_name_entry = ctk.CTkEntry(self.no_go_entry_frame, width=370)
-        self.remove_no_go_name_entry.grid(row=0, column=4, padx=5)
+            self.log_and_show(f"Successful line removed from {file_path}")
 
-        """Valid Extensions Tab"""
-        # Valid Extension frame
-        self.valid_extension_entry_frame = ctk.CTkFrame(self.add_remove_tabs.get("Valid Extensions"), corner_radius=0,
-                                                        fg_color="transparent")
-        self.valid_extension_entry_frame.grid(row=0, column=0, padx=10, pady=10)
+        except Exception as e:
+            # Log the exception using the logging module.
+            self.log_and_show(f"An error occurred while removing line from file: {e}", create_messagebox=True,
+                              error=True)
 
-        # Add Valid Extension button
-        self.add_valid_extension_button = ctk.CTkButton(self.valid_extension_entry_frame, text="Add Valid Ext.",
-                                                        command=self.add_valid_extension)
-        self.add_valid_extension_button.grid(row=0, column=0, padx=5)
+    def move_file_to_trash(self):
+        """
+        Move the selected file (or every file of the selected batch) to the system's trash in the background.
 
-        # Add Valid Extension entry
-        self.add_valid_extension_entry = ctk.CTkEntry(self.valid_extension_entry_frame, width=370)
-        self.add_valid_extension_entry.grid(row=0, column=1, padx=5)
+        The trash operation is recorded in the history, so "Undo File Rename" restores the files.
+        """
+        if self.file_renamer_selected_file:
+            # Trash the whole batch if one is selected
+            file_paths = list(self.file_renamer_batch_files) if self.file_renamer_batch_active() else [
+                self.file_renamer_selected_file]
 
-        # Remove Valid Extension button
-        self.remove_valid_extension_button = ctk.CTkButton(self.valid_extension_entry_frame, text="Remove Valid Ext.",
-                                                           command=self.remove_valid_extension)
-        self.remove_valid_extension_button.grid(row=0, column=3, padx=5)
+            # Ask for confirmation before moving to trash
+            confirmation = self.ask_confirmation("Confirm Action",
+                                                 "Are you sure you want to move this file to the trash?"
+                                                 if len(file_paths) == 1 else
+                                                 f"Are you sure you want to move these {len(file_paths)} files to "
+                                                 f"the trash?")
+            # Log the action if logging is enabled
+            self.log_and_show(f"'{self.file_renamer_selected_file}' selected for deletion."
+                              if len(file_paths) == 1 else f"{len(file_paths)} files selected for deletion.")
 
-        # Remove Valid Extension entry
-        self.remove_valid_extension_entry = ctk.CTkEntry(self.valid_extension_entry_frame, width=370)
-        self.remove_valid_extension_entry.grid(row=0, column=4, padx=5)
+            if confirmation:
+                def on_trashed(_trashed, selected_file=self.file_renamer_selected_file):
+                    # Reset selected file, queue, and clear display elements (unless another file was selected)
+                    if self.file_renamer_selected_file == selected_file:
+                        self.file_renamer_selected_file = ""
+                        self.file_renamer_batch_files = []
+                        self.file_renamer_queue = []
+                        self.file_display_text.set("")
+                        self.name_length_text.set("")
+                        self.prefix_text_entry.delete(0, ctk.END)
+                        self.custom_text_entry.delete(0, ctk.END)
+                        self.output_directory = ""
+                        self.output_directory_entry.delete(0, ctk.END)
+
+                # Move the input to trash in the background
+                self.start_bulk_trash(file_paths, "file_renamer_window", on_done=on_trashed)
+        else:
+            # Log the action if logging is enabled
+            self.log_and_show("No input selected. Cannot move to trash.", create_messagebox=True, error=True)
 
-        # Frame for clear add/remove button
-        self.clear_add_remove_frame = ctk.CTkFrame(self.add_remove_frame, corner_radius=0,
-                                                   fg_color="transparent")
-        self.clear_add_remove_frame.grid(row=2, column=0, padx=10)
+    def start_bulk_trash(self, file_paths: list, frame_name: str, on_done=None):
+        """
+        Move files to the system's trash on a background thread (see bulk_trash) and record the operation in the
+        frame's module history as one undoable operation.
 
-        # Clear add/remove Button
-        self.clear_add_remove_button = ctk.CTkButton(self.clear_add_remove_frame,
-                                                     text="Clear",
-                                                     command=lambda: self.clear_selection(
-                                                         frame_name="add_remove_window"))
-        self.clear_add_remove_button.grid(row=0, column=0, padx=10, pady=10)
+        Parameters:
+            file_paths (list): The paths of the files to move to the trash.
+            frame_name (str): The frame that started the operation ('file_renamer_window' or
+                'name_normalizer_window').
+            on_done (callable, optional): Called on the main thread with the list of trashed files.
+        """
+        # One trash operation at a time per frame
+        trash_thread = self.trash_threads.get(frame_name)
+        if trash_thread and trash_thread.is_alive():
+            self.log_and_show("Files are still being moved to the trash. Please wait for it to finish.",
+                              create_messagebox=True, error=True)
+            return
+
+        # Wait for the frame's other workers, which use the same progress bar
+        if frame_name == "file_renamer_window" and self.file_rename_active():
+            return
+        if self.frame_worker_active(frame_name):
+            self.log_and_show("Files are still being processed. Please wait for it to finish or interrupt it.",
+                              create_messagebox=True, error=True)
+            return
 
-        # Frame for reset add/remove checkbox
-        self.reset_add_remove_frame = ctk.CTkFrame(self.add_remove_frame, corner_radius=0,
-                                                   fg_color="transparent")
-        self.reset_add_remove_frame.grid(row=3, column=0, padx=10, pady=10)
+        progress_bar_name, progress_bar_frame = self.get_frame_progress_bar(frame_name)
+        module = "file_renamer" if frame_name == "file_renamer_window" else "name_normalizer"
 
-        # Checkbox to enable/disable reset add/remove entries
-        self.reset_add_remove_switch = ctk.CTkSwitch(self.reset_add_remove_frame,
-                                                         text="Reset entries",
-                                                         variable=self.reset_add_remove_var)
-        self.reset_add_remove_switch.grid(row=0, column=1, padx=10, pady=10)
+        def finish(results):
+            # Record the files whose place in the trash is known as one operation (undo restores them)
+            pairs = [(original_path, trashed_path) for original_path, trashed_path in results if trashed_path]
+            if pairs:
+                self.history_store.push(module, pairs)
 
-        # Frame to display messages on the add/remove frame
-        self.add_remove_message_label_frame = ctk.CTkFrame(self.add_remove_frame, corner_radius=0,
-                                                           fg_color="transparent")
-        self.add_remove_message_label_frame.grid(row=13, column=0, padx=10)
+            trashed = [original_path for original_path, _ in results]
+            self.log_and_show(f"{len(trashed)} of {len(file_paths)} file(s) moved to trash"
+                              f"{' (undo restores them)' if pairs else ''}")
+            if on_done:
+                on_done(trashed)
 
-        # Add/Remove Message Label
-        self.add_remove_message_label = ctk.CTkLabel(self.add_remove_message_label_frame, text="")
-        self.add_remove_message_label.grid(row=0, column=0, padx=10, pady=10)
+        cancel_event = self.trash_cancel_events[frame_name]
 
+        def run_trash():
+            try:
+                results = self.bulk_trash(file_paths, progress_bar_name, cancel_event)
+            finally:
+                self.run_on_main(self.stop_progress, progress_bar_name)
+            self.run_on_main(finish, results)
+
+        # Threads are named after their frame so their messages reach the right module
+        cancel_event.clear()
+        self.start_progress(progress_bar_name, progress_bar_frame, determinate=True)
+        self.trash_threads[frame_name] = threading.Thread(target=run_trash, name=frame_name, daemon=True)
+        self.trash_threads[frame_name].start()
+
+    @staticmethod
+    def frame_worker_active(frame_name: str) -> bool:
         """
-        settings_window
+        Check whether a worker thread of a frame is running. Workers that use the frame's progress bar (processing,
+        background moves and trash operations) are named after the frame.
+
+        Parameters:
+            frame_name (str): The frame ('file_renamer_window' or 'name_normalizer_window').
+
+        Returns:
+            bool: True if a thread named after the frame is running (other than the calling thread).
         """
-        # Create settings frame
-        self.settings_frame = ctk.CTkFrame(self, corner_radius=0, fg_color="transparent")
-        self.settings_frame.grid_columnconfigure(0, weight=1)
+        return any(thread.name == frame_name and thread.is_alive() and thread is not threading.current_thread()
+                   for thread in threading.enumerate())
 
-        # Settings label
-        self.settings_label = ctk.CTkLabel(self.settings_frame, text="Settings",
-                                           font=ctk.CTkFont(size=15, weight="bold"))
-        self.settings_label.grid(row=0, column=0, padx=5, pady=5, columnspan=5)
+    def bulk_trash(self, file_paths: list, progress_bar_name: str, cancel_event: threading.Event) -> list:
+        """
+        Move files to the system's trash in batches of trash_batch_size, grouped by filesystem.
 
-        # Create a settings_tabview on settings_frame row 1
-        self.settings_tabview, self.settings_tabs = self.create_tabview(self.settings_frame,
-                                                                        self.settings_tab_names)
+        Every file of a group goes to the same trash directory, which is listed before and after the group to find
+        where each file went (freedesktop.org trash, Linux), so the operation can be undone. Interrupt stops before
+        the next batch.
 
-        """Appearance Tab"""
-        # GUI settings frame
-        self.gui_settings_frame = ctk.CTkFrame(self.settings_tabs.get("Appearance"), corner_radius=0,
-                                               fg_color="transparent")
-        self.gui_settings_frame.grid(row=0, column=0, padx=10, pady=10)
+        Parameters:
+            file_paths (list): The paths of the files to move to the trash.
+            progress_bar_name (str): The progress bar to report to.
+            cancel_event (threading.Event): Set by the frame's Interrupt button.
 
-        # Select light or dark label
-        self.appearance_mode_label = ctk.CTkLabel(self.gui_settings_frame, text="Appearance:")
-        self.appearance_mode_label.grid(row=0, column=0, padx=10, pady=10)
+        Returns:
+            list: An (original_path, trashed_path) pair per trashed file. trashed_path is None if it is not known.
+        """
+        # Group the files by filesystem
+        groups = {}
+        for file_path in file_paths:
+            try:
+                groups.setdefault(os.lstat(file_path).st_dev, []).append(file_path)
+            except OSError as e:
+                self.log_and_show(f"Moving {os.path.basename(file_path)} to the trash failed: {e}", error=True)
 
-        # Select light or dark mode
-        self.appearance_mode_menu = ctk.CTkOptionMenu(self.gui_settings_frame,
-                                                      values=["Light", "Dark"],
-                                                      command=self.change_appearance_mode_event)
-        self.appearance_mode_menu.grid(row=0, column=1, padx=10, pady=10)
+        tracker = ProgressTracker(len(file_paths))
+        batch_size = max(1, self.trash_batch_size)
+        results = []
 
-        # Set default value for appearance
-        self.appearance_mode_menu.set("Dark")
+        for group in groups.values():
+            # List the trash directories this group may go to
+            trash_directories = self.get_trash_directories(group[0])
+            known_entries = {trash_directory: self.list_trash_info(trash_directory)
+                             for trash_directory, _ in trash_directories}
 
-        # Select scaling label
-        self.scaling_label = ctk.CTkLabel(self.gui_settings_frame, text="UI Scaling:")
-        self.scaling_label.grid(row=1, column=0, padx=10, pady=10)
+            trashed = []
+            for start in range(0, len(group), batch_size):
+                # Stop before the next batch if the user interrupts
+                if cancel_event.is_set():
+                    break
 
-        # Select scaling level
-        self.scaling_optionemenu = ctk.CTkOptionMenu(self.gui_settings_frame,
-                                                     values=["70%", "80%", "90%", "100%", "110%", "120%"],
-                                                     command=self.change_scaling_event)
-        self.scaling_optionemenu.grid(row=1, column=1, padx=10, pady=10)
+                batch = group[start:start + batch_size]
+                try:
+                    # Move the batch to trash using send2trash library
+                    send2trash.send2trash(batch)
+                    trashed.extend(batch)
+                except OSError:
+                    # send2trash stops at the first failure: keep the files it trashed and retry the rest one by one
+                    for file_path in batch:
+                        if not os.path.lexists(file_path):
+                            trashed.append(file_path)
+                            continue
+                        try:
+                            send2trash.send2trash(file_path)
+                            trashed.append(file_path)
+                        except OSError as e:
+                            self.log_and_show(f"Moving {os.path.basename(file_path)} to the trash failed: {e}",
+                                              error=True)
+
+                tracker.advance(items=len(batch))
+                self.report_progress(progress_bar_name, tracker)
+
+            # Find where each file of the group went
+            locations = {}
+            for trash_directory, top_directory in trash_directories:
+                locations.update(self.find_trashed_files(trash_directory, top_directory,
+                                                         known_entries[trash_directory]))
+            results.extend((file_path, locations.get(os.path.abspath(file_path))) for file_path in trashed)
+
+        if cancel_event.is_set():
+            self.log_and_show("User interrupted moving files to the trash.", error=True)
+        self.report_progress(progress_bar_name, tracker, force=True)
+        return results
 
-        # Set default value for scaling
-        self.scaling_optionemenu.set(f"{self.scaling}%")
+    @staticmethod
+    def get_trash_directories(file_path: str) -> list:
+        """
+        Get the freedesktop.org trash directories send2trash may move a file to: the home trash and the trash
+        directories of the file's mount point.
 
-        """Artist Tab"""
-        # Artist frame
-        self.artist_frame = ctk.CTkFrame(self.settings_tabs.get("Artist"), corner_radius=0,
-                                         fg_color="transparent")
-        self.artist_frame.grid(row=0, column=0, padx=10, pady=10)
+        Parameters:
+            file_path (str): The path of the file.
 
-        # Artist switch frame
-        self.artist_switch_frame = ctk.CTkFrame(self.artist_frame, corner_radius=0,
-                                                fg_color="transparent")
-        self.artist_switch_frame.grid(row=0, column=0, padx=10, pady=10)
+        Returns:
+            list: (trash_directory, top_directory) pairs, where trashed paths are recorded relative to the top
+            directory. Empty on Windows and macOS, whose trash is not searched.
+        """
+        if os.name != "posix" or os.uname().sysname == "Darwin":
+            return []
 
-        # Artist Search label
-        self.artist_search_label = ctk.CTkLabel(self.artist_switch_frame, text="Artist Search")
-        self.artist_search_label.grid(row=0, column=0, padx=10, pady=5)
+        # The home trash
+        data_home = os.path.expanduser(os.environ.get("XDG_DATA_HOME", "~/.local/share"))
+        directories = [(os.path.join(data_home, "Trash"), data_home)]
 
-        # Switch to enable/disable artist search
-        self.artist_search_switch = ctk.CTkSwitch(self.artist_switch_frame, text="Artist Search",
-                                                  variable=self.artist_search_var)
-        self.artist_search_switch.grid(row=1, column=0, padx=10, pady=10)
+        # The trash directories at the top of the file's mount point
+        mount_point = os.path.realpath(os.path.dirname(os.path.abspath(file_path)))
+        while not os.path.ismount(mount_point):
+            mount_point = os.path.dirname(mount_point)
+        directories.append((os.path.join(mount_point, ".Trash", str(os.getuid())), mount_point))
+        directories.append((os.path.join(mount_point, f".Trash-{os.getuid()}"), mount_point))
 
-        # Switch to enable/disable ignore known artists for artist search
-        self.ignore_known_artists_switch = ctk.CTkSwitch(self.artist_switch_frame, text="Ignore Known Artists",
-                                                         variable=self.ignore_known_artists_var)
-        self.ignore_known_artists_switch.grid(row=1, column=1, padx=10, pady=10)
+        return directories
 
-        # Artist Identifier label
-        self.artist_identifier_label = ctk.CTkLabel(self.artist_switch_frame, text="Artist Identifier")
-        self.artist_identifier_label.grid(row=2, column=0, padx=10, pady=5)
+    @staticmethod
+    def list_trash_info(trash_directory: str) -> set:
+        """
+        List the entries of a trash directory.
 
-        # Switch to enable/disable remove duplicates
-        self.remove_duplicates_switch = ctk.CTkSwitch(self.artist_switch_frame,
-                                                      text="Remove Artist Duplicates From Filename",
-                                                      variable=self.remove_artist_duplicates_var)
-        self.remove_duplicates_switch.grid(row=3, column=0, padx=10, pady=10)
+        Parameters:
+            trash_directory (str): The trash directory.
 
-        # Duplicate removal label
-        self.duplicate_removal_label = ctk.CTkLabel(self.artist_switch_frame, text="Duplicate Removal")
-        self.duplicate_removal_label.grid(row=4, column=0, padx=10, pady=5)
+        Returns:
+            set: The names of its .trashinfo files.
+        """
+        try:
+            return set(os.listdir(os.path.join(trash_directory, "info")))
+        except OSError:
+            return set()
 
-        # Switch to enable/disable remove word duplicates
-        self.remove_word_duplicates_switch = ctk.CTkSwitch(self.artist_switch_frame,
-                                                           text="Remove Word Duplicates From Filename",
-                                                           variable=self.remove_word_duplicates_var)
-        self.remove_word_duplicates_switch.grid(row=5, column=0, padx=10, pady=10)
+    def find_trashed_files(self, trash_directory: str, top_directory: str, known_entries: set) -> dict:
+        """
+        Find where files went in a trash directory from the entries added since it was listed.
 
-        # Artist browse frame
-        self.artist_browse_frame = ctk.CTkFrame(self.artist_frame, corner_radius=0,
-                                                fg_color="transparent")
-        self.artist_browse_frame.grid(row=1, column=0, padx=10, pady=10)
+        Parameters:
+            trash_directory (str): The trash directory.
+            top_directory (str): The directory trashed paths are recorded relative to.
+            known_entries (set): The entries listed before the files were trashed.
 
-        # Browse Artist Directory button
-        self.browse_artist_directory_button = ctk.CTkButton(self.artist_browse_frame, text="Artist Directory",
-                                                            command=lambda: self.browse_directory(
-                                                                self.artist_directory_entry, 'artist_directory'))
-        self.browse_artist_directory_button.grid(row=0, column=0, padx=10, pady=5)
+        Returns:
+            dict: The path of each trashed file in the trash, keyed by its original absolute path.
+        """
+        locations = {}
+        for entry in self.list_trash_info(trash_directory) - known_entries:
+            if not entry.endswith(".trashinfo"):
+                continue
+            try:
+                with open(os.path.join(trash_directory, "info", entry), "r") as info_file:
+                    for line in info_file:
+                        if line.startswith("Path="):
+                            # Paths are URL encoded and relative to the top directory when below it
+                            original_path = os.path.join(top_directory, urllib.parse.unquote(line[5:].strip()))
+                            locations[os.path.abspath(original_path)] = os.path.join(
+                                trash_directory, "files", entry[:-len(".trashinfo")])
+                            break
+            except OSError:
+                continue
+        return locations
 
-        # Artist Directory entry
-        self.artist_directory_entry = ctk.CTkEntry(self.artist_browse_frame, width=890)
-        self.artist_directory_entry.insert(0, self.artist_directory)
-        self.artist_directory_entry.grid(row=0, column=1, padx=10, pady=10)
+    @staticmethod
+    def forget_trash_info(trashed_path: str) -> None:
+        """
+        Remove the .trashinfo entry of a file restored from a freedesktop.org trash directory.
 
-        # Browse Artist File button
-        self.browse_artist_file_button = ctk.CTkButton(self.artist_browse_frame, text="Artist File",
-                                                       command=self.browse_artist_file)
-        self.browse_artist_file_button.grid(row=1, column=0, padx=5, pady=5)
+        Parameters:
+            trashed_path (str): The path the file had in the trash. Paths outside a trash directory are ignored.
+        """
+        files_directory, name = os.path.split(trashed_path)
+        if os.path.basename(files_directory) != "files":
+            return
+        with contextlib.suppress(OSError):
+            os.remove(os.path.join(os.path.dirname(files_directory), "info", f"{name}.trashinfo"))
 
-        # Artist File entry
-        self.artist_file_entry = ctk.CTkEntry(self.artist_browse_frame, width=890)
-        self.artist_file_entry.insert(0, self.artist_file)
-        self.artist_file_entry.grid(row=1, column=1, padx=10, pady=10)
+    def double_check_reminder(self, new_path: str):
+        """
+        Create a double-check reminder for the folder immediately above the specified location.
 
-        # Open Artist File button
-        self.open_artist_file_button = ctk.CTkButton(self.artist_browse_frame, text="Open Artist File",
-                                                     command=lambda: self.open_file(
-                                                         self.artist_file))
-        self.open_artist_file_button.grid(row=2, column=0, padx=5)
+        Args:
+        new_path (str): The path for which the double-check reminder is to be created.
 
-        """Logging Tab"""
-        # Logging frame
-        self.logging_frame = ctk.CTkFrame(self.settings_tabs.get("Logging"), corner_radius=0,
-                                          fg_color="transparent")
-        self.logging_frame.grid(row=0, column=0, padx=10, pady=10)
+        Note: Ensure this method is called appropriately to create double-check reminders.
+        """
+        try:
+            # Get the name of the folder immediately above the current location
+            folder_name = os.path.basename(os.path.dirname(new_path))
 
-        # Logging switch frame
-        self.logging_switch_frame = ctk.CTkFrame(self.logging_frame, corner_radius=0,
-                                                 fg_color="transparent")
-        self.logging_switch_frame.grid(row=0, column=0, padx=10, pady=10)
+            # Ask for confirmation of the double check reminder
+            confirmation = self.ask_confirmation("Double Check Reminder",
+                                                 f"Do you want to create a double check reminder for: "
+                                                 f"{folder_name}?")
+            if confirmation:
+                # Expand the user's home directory in the output directory path
+                double_check_directory = os.path.expanduser(self.double_check_directory)
 
-        # Switch to enable/disable activate logging
-        self.activate_logging_switch = ctk.CTkSwitch(self.logging_switch_frame, text="Activate Logging",
-                                                     variable=self.activate_logging_var)
-        self.activate_logging_switch.grid(row=0, column=0, padx=10, pady=10)
+                # Ensure the output directory exists, create it if not
+                if not os.path.exists(double_check_directory):
+                    os.makedirs(double_check_directory)
 
-        # Bind the callback function to the activate logging variable
-        self.activate_logging_var.trace_add("write", self.handle_logging_activation)
+                # Create an empty file with the specified naming scheme
+                file_name = f"Double check {folder_name}"
+                file_path = os.path.join(double_check_directory, file_name)
 
-        # Switch to enable/disable suppress standard outputs/errors
-        self.suppress_switch = ctk.CTkSwitch(self.logging_switch_frame, text="Suppress Standard Output/Error",
-                                             variable=self.suppress_var)
-        self.suppress_switch.grid(row=0, column=1, padx=10, pady=10)
+                # Empty file
+                with open(file_path, 'w'):
+                    pass
 
-        # Logging browse frame
-        self.logging_browse_frame = ctk.CTkFrame(self.logging_frame, corner_radius=0,
-                                                 fg_color="transparent")
-        self.logging_browse_frame.grid(row=1, column=0, padx=10, pady=10)
+                # Log the action if logging is enabled
+                self.log_and_show(f"Double check reminder created successfully for {folder_name} in \n"
+                                  f"{self.double_check_directory}")
+            else:
+                # If the user declines, then do not create the double check reminder
+                self.log_and_show(f"User declined double check reminder for: {folder_name}")
 
-        # Browse Log button
-        self.open_log_file_button = ctk.CTkButton(self.logging_browse_frame, text="Open Log File",
-                                                  command=lambda: self.open_file(
-                                                      self.file_renamer_log))
-        self.open_log_file_button.grid(row=0, column=0, padx=5)
+        except Exception as e:
+            # Handle any errors that may occur
+            self.log_and_show(f"Double check reminder was not created successfully: {str(e)}",
+                              create_messagebox=True, error=True)
 
-        # log File entry
-        self.log_file_entry = ctk.CTkEntry(self.logging_browse_frame, width=890)
-        self.log_file_entry.insert(0, self.file_renamer_log)
-        self.log_file_entry.grid(row=0, column=1, padx=10, pady=10)
+    def load_last_used_file(self):
+        """
+        Load the last used file based on the current frame and update the display accordingly.
+
+        Notes:
+        - Handles last used file loading for different frames (file_renamer, name_normalizer, video_editor).
+        - Logs the action if logging is enabled.
+        """
+        if self.frame_name == "file_renamer_window":
+            # Check if the file_renamer_last_used_file variable is provided and the input exists
+            if self.file_renamer_last_used_file and os.path.exists(self.file_renamer_last_used_file):
+                # Set the selected file to the file renamer last used file and update display
+                self.file_renamer_selected_file = self.file_renamer_last_used_file
+
+                self.file_renamer_queue = []
+                self.update_file_display()
+
+                # Log the action if logging is enabled
+                self.log_and_show(f"Input selected via Reload Last File: "
+                                  f"{os.path.basename(self.file_renamer_selected_file)}")
+            else:
+                self.log_and_show("No last used File Renamer input found.",
+                                  create_messagebox=True, error=True)
+        elif self.frame_name == "name_normalizer_window":
+            # Check if the name_normalizer_last_used_file variable is provided and the input exists
+            if self.name_normalizer_last_used_file and os.path.exists(self.name_normalizer_last_used_file):
+                # Set the name normalizer selected input to the name normalizer last used input and update display
+                self.name_normalizer_selected_file = self.name_normalizer_last_used_file
+
+                # Update the Name Normalizer display
+                self.update_nn_display()
+
+                # Log the action if logging is enabled
+                self.log_and_show(
+                    f"Last used Name Normalizer input selected: "
+                    f"{os.path.basename(self.name_normalizer_selected_file)}")
+            else:
+                self.log_and_show("No last used Name Normalizer input found.",
+                                  create_messagebox=True, error=True)
+        elif self.frame_name == "video_editor_window":
+            # Check if the video_editor_last_used_file variable is provided and the input exists
+            if self.video_editor_last_used_file and os.path.exists(self.video_editor_last_used_file):
+                # Set the video editor selected file to the video editor last used file and update display
+                self.video_editor_selected_file = self.video_editor_last_used_file
+                filename = os.path.basename(self.video_editor_selected_file)
 
-        """Messaging Tab"""
-        # Confirmation frame
-        self.confirmation_frame = ctk.CTkFrame(self.settings_tabs.get("Messaging"), corner_radius=0,
-                                               fg_color="transparent")
-        self.confirmation_frame.grid(row=0, column=0, padx=10)
+                # Set the selected input to the input entry widget
+                self.input_method_entry.delete(0, ctk.END)
+                self.input_method_entry.insert(0, filename)
 
-        # Switch to enable/disable show messageboxes
-        self.show_messageboxes_switch = ctk.CTkSwitch(self.confirmation_frame, text="Show Messageboxes",
-                                                      variable=self.show_messageboxes_var)
-        self.show_messageboxes_switch.grid(row=0, column=0, padx=10, pady=10)
+                # Log the action if logging is enabled
+                self.log_and_show(f"Last used Video Editor input selected: {filename}")
+            else:
+                self.log_and_show("No last used Video Editor input found.",
+                                  create_messagebox=True, error=True)
 
-        # Switch to enable/disable show confirmation messageboxes
-        self.show_confirmation_messageboxes_switch = ctk.CTkSwitch(self.confirmation_frame,
-                                                                   text="Show Confirmation Messageboxes",
-                                                                   variable=self.show_confirmation_messageboxes_var)
-        self.show_confirmation_messageboxes_switch.grid(row=0, column=1, padx=10, pady=10)
+    def send_to_module(self, destination: str):
+        """
+        Send the selected file to the specified module and perform necessary updates.
 
-        # Fallback confirmation state when confirmation messageboxes are suppressed
-        self.fallback_confirmation_label = ctk.CTkLabel(self.confirmation_frame, text="Fallback confirmation state:")
-        self.fallback_confirmation_label.grid(row=1, column=0, padx=10, pady=5)
+        Args:
+        - destination (str): The name of the destination module ("file_renamer_module", "name_normalizer_module",
+        "video_editor_module").
 
-        # Fallback true radio button
-        self.true_radio = ctk.CTkRadioButton(self.confirmation_frame, text="True",
-                                             variable=self.fallback_confirmation_var, value=True)
-        self.true_radio.grid(row=1, column=1, padx=10, pady=5)
+        Notes:
+        - Clears the selection for the source module.
+        - Updates the display based on the selected file and the destination module.
+        - Logs the action if logging is enabled.
+        - Switches frames to the specified destination module.
 
-        # Fallback false radio button
-        self.false_radio = ctk.CTkRadioButton(self.confirmation_frame, text="False",
-                                              variable=self.fallback_confirmation_var,
-                                              value=False)
-        self.false_radio.grid(row=1, column=2, padx=10, pady=5)
+        """
+        if self.frame_name == "file_renamer_window":
+            selected_file = self.file_renamer_selected_file
+        elif self.frame_name == "name_normalizer_window":
+            selected_file = self.name_normalizer_selected_file
+        elif self.frame_name == "video_editor_window":
+            selected_file = self.video_editor_selected_file
+        else:
+            # Invalid frame name
+            return
 
-        # Switch to enable/disable truncate text
-        self.truncate_text_switch = ctk.CTkSwitch(self.confirmation_frame, text="Truncate Text",
-                                                  variable=self.truncate_var)
-        self.truncate_text_switch.grid(row=2, column=0, padx=10, pady=5)
+        if not selected_file:
+            # Input not selected
+            self.log_and_show("No input selected. Cannot send to module",
+                              create_messagebox=True, error=True)
+            return
 
-        """Misc Tab"""
-        # Misc frame
-        self.misc_frame = ctk.CTkFrame(self.settings_tabs.get("Misc"), corner_radius=0,
-                                       fg_color="transparent")
-        self.misc_frame.grid(row=0, column=0, padx=10, pady=10)
+        # Send to File Renamer
+        if destination == "file_renamer_module":
+            # Clear selection for the file_renamer_window
+            self.clear_selection(frame_name="file_renamer_window")
 
-        # File Operations switch frame
-        self.file_ops_switch_frame = ctk.CTkFrame(self.misc_frame, corner_radius=0,
-                                                  fg_color="transparent")
-        self.file_ops_switch_frame.grid(row=0, column=0, padx=10)
+            # Set the name normalizer selected file to the file renamer selected file and update display
+            self.file_renamer_selected_file = selected_file
 
-        # Switch to enable/disable open on drop behavior
-        self.open_on_file_drop_switch = ctk.CTkSwitch(self.file_ops_switch_frame, text="Open File on Drag and Drop",
-                                                      variable=self.open_on_file_drop_var)
-        self.open_on_file_drop_switch.grid(row=0, column=0, padx=10, pady=10)
+            # Update the File Renamer display
+            self.update_file_display()
 
-        # Checkbox to enable/disable validate entries
-        self.validate_entries_switch = ctk.CTkSwitch(self.file_ops_switch_frame,
-                                                       text="Validate Entries",
-                                                       variable=self.validate_entries)
-        self.validate_entries_switch.grid(row=0, column=1, padx=10, pady=10)
+            # Add artist common categories to the queue
+            if self.artist_common_categories_var.get():
+                self.add_remove_common_categories_to_queue()
 
-        # Checkbox to enable/disable preview mode switch
-        self.preview_mode_switch = ctk.CTkSwitch(self.file_ops_switch_frame,
-                                                 text="Preview Mode",
-                                                 variable=self.preview_mode_var)
-        self.preview_mode_switch.grid(row=0, column=2, padx=10, pady=10)
+            # Log the action if logging is enabled
+            self.log_and_show(f"Input selected via send to module: "
+                              f"{os.path.basename(self.file_renamer_selected_file)}")
 
-        # Trace the changes in the variable
-        self.preview_mode_var.trace_add("write", self.update_nn_display)
+            # Clear selection for the source module
+            self.clear_selection(frame_name=self.frame_name)
 
-        # Master Entry frame
-        self.master_entry_frame = ctk.CTkFrame(self.misc_frame, corner_radius=0, fg_color="transparent")
-        self.master_entry_frame.grid(row=1, column=0, padx=10, pady=10)
+            # Switch frames to the File Renamer
+            self.file_renamer_button_event()
 
-        # Initial Directory frame
-        self.initial_directory_frame = ctk.CTkFrame(self.master_entry_frame, corner_radius=0, fg_color="transparent")
-        self.initial_directory_frame.grid(row=0, column=0, padx=10, pady=10)
+        # Send to Name Normalizer
+        elif destination == "name_normalizer_module":
+            # Clear selection for the name_normalizer_window
+            self.clear_selection(frame_name="name_normalizer_window")
 
-        # Browse Initial Directory button
-        self.browse_initial_directory_button = ctk.CTkButton(self.initial_directory_frame, text="Initial Directory",
-                                                             command=lambda: self.browse_directory(
-                                                                 self.initial_directory_entry, 'initial_directory'))
-        self.browse_initial_directory_button.grid(row=0, column=0, padx=5, pady=5)
+            # Set the source selected file to the Name Normalizer selected file
+            self.name_normalizer_selected_file = selected_file
 
-        # Initial Directory entry
-        self.initial_directory_entry = ctk.CTkEntry(self.initial_directory_frame, width=855)
-        self.initial_directory_entry.insert(0, self.initial_directory)
-        self.initial_directory_entry.grid(row=0, column=1, padx=10, pady=10)
+            # Log the action if logging is enabled
+            self.log_and_show(f"Input selected via send to module: "
+                              f"{os.path.basename(self.name_normalizer_selected_file)}")
 
-        # Browse Initial Output Directory button
-        self.browse_initial_output_directory_button = ctk.CTkButton(self.initial_directory_frame,
-                                                                    text="Initial Output Directory",
-                                                                    command=lambda:
-                                                                    self.browse_directory(
-                                                                        self.initial_output_directory_entry,
-                                                                        'initial_output_directory')
-                                                                    )
-        self.browse_initial_output_directory_button.grid(row=1, column=0, padx=5, pady=5)
+            # Clear selection for the source module
+            self.clear_selection(frame_name=self.frame_name)
 
-        # Initial Directory entry
-        self.initial_output_directory_entry = ctk.CTkEntry(self.initial_directory_frame, width=855)
-        self.initial_output_directory_entry.insert(0, self.initial_output_directory)
-        self.initial_output_directory_entry.grid(row=1, column=1, padx=10, pady=10)
+            # Update the Name Normalizer display
+            self.update_nn_display()
 
-        # Configuration File Frame
-        self.configuration_file_frame = ctk.CTkFrame(self.master_entry_frame, corner_radius=0,
-                                                     fg_color="transparent")
-        self.configuration_file_frame.grid(row=1, column=0, padx=10, pady=10)
+            # Switch frames to the Name Normalizer
+            self.name_normalizer_button_event()
 
-        # Browse Configuration File button
-        self.open_configuration_file_button = ctk.CTkButton(self.configuration_file_frame, text="Open Config File",
-                                                            command=lambda: self.open_file(
-                                                                self.config_file_path))
-        self.open_configuration_file_button.grid(row=0, column=0, padx=5)
+        # Send to Video Editor
+        elif destination == "video_editor_module":
+            # Confirm if the input is a valid file for the video editor window
+            if any(selected_file.lower().endswith(ext) for ext in self.valid_extensions):
+                # Clear selection for the video_editor_window
+                self.clear_selection(frame_name="video_editor_window")
 
-        # Configuration File entry
-        self.configuration_file_entry = ctk.CTkEntry(self.configuration_file_frame, width=890)
-        self.configuration_file_entry.insert(0, self.config_file_path)
-        self.configuration_file_entry.grid(row=0, column=1, padx=10, pady=10)
+                # Initialize video editor selected file to selected file from source module
+                self.video_editor_selected_file = selected_file
+                filename = os.path.basename(self.video_editor_selected_file)
 
-        # Dictionary File Frame
-        self.dictionary_file_frame = ctk.CTkFrame(self.master_entry_frame, corner_radius=0,
-                                                  fg_color="transparent")
-        self.dictionary_file_frame.grid(row=2, column=0, padx=10, pady=10)
+                # Clear selection for the source module
+                self.clear_selection(frame_name=self.frame_name)
 
-        # Browse Dictionary File button
-        self.open_dictionary_file_button = ctk.CTkButton(self.dictionary_file_frame, text="Open Dictionary File",
-                                                         command=lambda: self.open_file(
-                                                             self.dictionary_file))
-        self.open_dictionary_file_button.grid(row=0, column=0, padx=5)
+                # Set the video editor selected file to the input_method_entry
+                self.input_method_entry.insert(0, filename)
 
-        # Dictionary File entry
-        self.dictionary_file_entry = ctk.CTkEntry(self.dictionary_file_frame, width=890)
-        self.dictionary_file_entry.insert(0, self.dictionary_file)
-        self.dictionary_file_entry.grid(row=0, column=1, padx=10, pady=10)
+                # Log the action and display the message in the GUI
+                self.log_and_show(f"Input selected via send to module: {filename}")
 
-        """Reminders Tab"""
-        # Reminders frame
-        self.reminders_frame = ctk.CTkFrame(self.settings_tabs.get("Reminders"), corner_radius=0,
-                                            fg_color="transparent")
-        self.reminders_frame.grid(row=0, column=0, padx=10, pady=10)
+                # Switch frames to the video editor
+                self.video_editor_button_event()
+            else:
+                # Input not selected
+                self.log_and_show("Non-video input detected. Cannot send to Video Editor",
+                                  create_messagebox=True, error=True)
+        else:
+            # Invalid frame name
+            self.log_and_show("Invalid frame name for send to module",
+                              create_messagebox=True, error=True)
+            return
 
-        # Switch to enable/disable create double check reminder
-        self.double_check_switch = ctk.CTkSwitch(self.reminders_frame, text="Create Double Check Reminder",
-                                                 variable=self.double_check_var)
-        self.double_check_switch.grid(row=0, column=0, padx=10, pady=10)
+    def on_file_drop(self, event):
+        """
+        Handle the event when files are dropped onto the application window.
 
-        # Double Check Directory frame
-        self.double_check_reminder_directory_frame = ctk.CTkFrame(self.reminders_frame, corner_radius=0,
-                                                                  fg_color="transparent")
-        self.double_check_reminder_directory_frame.grid(row=1, column=0, padx=10, pady=10)
+        Args:
+        - event (Event): The event object representing the file drop.
 
-        # Browse Double Check Directory button
-        self.browse_reminder_directory_button = ctk.CTkButton(self.double_check_reminder_directory_frame,
-                                                              text="Double Check Reminder Directory",
-                                                              command=lambda: self.browse_directory(
-                                                                  self.double_check_reminder_directory_entry,
-                                                                  'double_check_directory'))
-        self.browse_reminder_directory_button.grid(row=0, column=0, padx=5, pady=5)
+        Notes:
+        - Splits the drop payload into paths with Tk's list splitting (paths with spaces arrive in braces).
+        - A single path is selected in the active module as before; several paths become a batch of the active
+          module (see on_multiple_file_drop).
+        - Extracts the file name from the path for GUI-friendly presentation.
+        - Assigns the selected file variable to the correct file depending on the active frame.
+        - Clears and updates the corresponding entry widgets and variables.
+        - Opens the input file if the corresponding option is set.
+        - Adds artist common categories to the queue if the option is set.
+        - Logs the action and displays the message in the GUI.
 
-        # Double Check Reminder entry
-        self.double_check_reminder_directory_entry = ctk.CTkEntry(self.double_check_reminder_directory_frame, width=775)
-        self.double_check_reminder_directory_entry.insert(0, self.double_check_directory)
-        self.double_check_reminder_directory_entry.grid(row=0, column=1, padx=10, pady=10)
+        """
+        # Split the payload into the dropped paths
+        dropped_paths = list(self.tk.splitlist(event.data))
+        if not dropped_paths:
+            return
 
-        # Browse NO GO Directory button
-        self.browse_no_go_directory_button = ctk.CTkButton(self.double_check_reminder_directory_frame,
-                                                           text="NO GO Directory",
-                                                           command=lambda: self.browse_directory(
-                                                               self.no_go_reminder_directory_entry, 'no_go_directory'))
-        self.browse_no_go_directory_button.grid(row=1, column=0, padx=5, pady=5)
+        # Queue several paths as a batch of the active module
+        if len(dropped_paths) > 1:
+            self.on_multiple_file_drop(dropped_paths)
+            return
 
-        # NO GO Reminder entry
-        self.no_go_reminder_directory_entry = ctk.CTkEntry(self.double_check_reminder_directory_frame, width=775)
-        self.no_go_reminder_directory_entry.insert(0, self.no_go_directory)
-        self.no_go_reminder_directory_entry.grid(row=1, column=1, padx=10, pady=10)
+        # Initialize the selected file variable to the dropped file
+        selected_file = dropped_paths[0]
 
-        # Open NO GO Artist File button
-        self.open_artist_file_button = ctk.CTkButton(self.double_check_reminder_directory_frame,
-                                                     text="Open NO GO Artist File",
-                                                     command=lambda: self.open_file(
-                                                         self.no_go_artist_file))
-        self.open_artist_file_button.grid(row=2, column=0, padx=10)
+        # Extract the file name from the path for GUI-friendly presentation
+        filename = os.path.basename(selected_file)
 
-        """Tabs"""
-        # Tab name frame
-        self.tab_name_frame = ctk.CTkFrame(self.settings_tabs.get("Tabs"), corner_radius=0, fg_color="transparent")
-        self.tab_name_frame.grid(row=0, column=0, padx=10, pady=10)
+        # Assign the selected file variable to the correct file depending on the active frame
+        if self.frame_name == "name_normalizer_window":
+            self.name_normalizer_selected_file = selected_file
 
-        # Switch to enable/disable use_custom_tab_names_var
-        self.use_custom_tab_names_switch = ctk.CTkSwitch(self.tab_name_frame, text="Use Custom Tab Names",
-                                                         variable=self.use_custom_tab_names_var)
-        self.use_custom_tab_names_switch.grid(row=0, column=0, padx=10)
+            # Update the Name Normalizer display
+            self.update_nn_display()
+        elif self.frame_name == "video_editor_window":
+            self.video_editor_selected_file = selected_file
 
-        # Bind the callback function to use_custom_tab_names_var
-        self.use_custom_tab_names_var.trace_add("write", self.refresh_category_buttons)
+            # Set the selected file to the input entry widget
+            self.input_method_entry.delete(0, ctk.END)
+            self.input_method_entry.insert(0, filename)
+        # Default to File Renamer module (file_renamer_window)
+        else:
+            self.file_renamer_selected_file = selected_file
 
-        # Switch to enable/disable sort tab names
-        self.sort_tab_names_switch = ctk.CTkSwitch(self.tab_name_frame, text="Sort Tab Names",
-                                                   variable=self.sort_tab_names_var)
-        self.sort_tab_names_switch.grid(row=0, column=1, padx=10)
+            # Remove the default entries text
+            self.prefix_text_entry.delete(0, ctk.END)
+            self.custom_text_entry.delete(0, ctk.END)
 
-        # Bind the callback function to sort_tab_names_var
-        self.sort_tab_names_var.trace_add("write", self.refresh_buttons_and_tabs)
+            self.file_renamer_queue = []
+            self.update_file_display()
 
-        # Switch to enable/disable sort_reverse_order_var
-        self.sort_tab_names_reverse_switch = ctk.CTkSwitch(self.tab_name_frame, text="Sort Tab Names (A-Z / Z-A)",
-                                                           variable=self.sort_reverse_order_var)
-        self.sort_tab_names_reverse_switch.grid(row=0, column=2, padx=10)
+            # Open the input if the corresponding option is set
+            if self.open_on_file_drop_var.get():
+                self.open_file(selected_file)
 
-        # Bind the callback function to sort_reverse_order_var
-        self.sort_reverse_order_var.trace_add("write", self.refresh_buttons_and_tabs)
+            # Add artist common categories to the queue
+            if self.artist_common_categories_var.get():
+                self.add_remove_common_categories_to_queue()
 
-    def on_frame_configure(self, *_):
+        # Log the action and display the message in the GUI
+        self.log_and_show(f"Input selected via drop: {filename}")
+
+    def on_multiple_file_drop(self, dropped_paths: list):
         """
-        Callback function to handle the frame configuration for scrolling.
+        Queue several dropped paths for the active module.
 
         Args:
-        *_: Variable number of arguments. Ignored in the implementation.
-        """
-        # Reset the scroll region to encompass the inner frame
-        self.file_renamer_canvas.configure(scrollregion=self.file_renamer_canvas.bbox("all"))
+        - dropped_paths (list): The dropped file and folder paths.
 
-    def on_canvas_configure(self, event):
+        Notes:
+        - Name Normalizer: the files (and the files of the folders) are normalized in one run, like a folder.
+        - Video Editor: every video (and the videos of the folders and line separated txt files) is edited in one run.
+        - File Renamer: the files (and the files of the folders) become a batch (see select_file_renamer_batch).
+        - The first path is the selected file, so a later single selection ends the batch.
         """
-        Callback function to handle the canvas configuration.
+        if self.frame_name == "name_normalizer_window":
+            self.name_normalizer_batch_paths = dropped_paths
+            self.name_normalizer_selected_file = dropped_paths[0]
 
-        Adjusts the width of the scrollable frame to match the canvas width.
+            # Update the Name Normalizer display
+            self.update_nn_display()
+        elif self.frame_name == "video_editor_window":
+            self.video_editor_batch_paths = dropped_paths
+            self.video_editor_selected_file = dropped_paths[0]
 
-        Args:
-        event (tk.Event): The event object containing information about the canvas configuration change.
-        """
-        # Set the scrollable frame's width to match the canvas
-        canvas_width = event.width - self.file_renamer_scrollbar.winfo_width()
-        self.file_renamer_canvas.itemconfig(self.file_renamer_scrollable_frame_window, width=canvas_width)
+            # Set the batch to the input entry widget
+            self.input_method_entry.delete(0, ctk.END)
+            self.input_method_entry.insert(0, f"{os.path.basename(dropped_paths[0])} (+{len(dropped_paths) - 1} more)")
+        # Default to File Renamer module (file_renamer_window)
+        else:
+            self.select_file_renamer_batch(dropped_paths, "drop")
+            return
 
-    def handle_logging_activation(self, *_):
-        """
-        Callback function to handle logging activation.
+        # Log the action and display the message in the GUI
+        self.log_and_show(f"Input selected via drop: {len(dropped_paths)} items")
 
-        Activates or deactivates logging based on the value of the activate_logging_var variable.
+    def name_normalizer_batch_active(self) -> bool:
+        """
+        Check whether the Name Normalizer holds several dropped paths (a batch ends once another input is selected).
 
-        Args:
-        *_: Variable number of arguments. Ignored in the implementation.
+        Returns:
+            bool: True if a batch is selected.
         """
-        # If logging is true, call the logging_setup function
-        if self.activate_logging_var.get():
-            try:
-                self.logging_setup()
-            except OSError as e:
-                print(f"Logging failed. Error: {e}")
-        else:
-            # If logging is false, call the stop_logging function
-            self.stop_logging()
+        return (len(self.name_normalizer_batch_paths) > 1 and
+                self.name_normalizer_batch_paths[0] == self.name_normalizer_selected_file)
 
-    def cleanup_on_exit(self):
+    def video_editor_batch_active(self) -> bool:
         """
-        Cleanup method to be called on program exit.
+        Check whether the Video Editor holds several dropped paths (a batch ends once another input is selected).
 
-        Note: Ensure this method is appropriately connected to an exit event or cleanup routine.
+        Returns:
+            bool: True if a batch is selected.
         """
-        # Interrupt threads that are processing
-        self.interrupt_processing("all")
+        return (len(self.video_editor_batch_paths) > 1 and
+                self.video_editor_batch_paths[0] == self.video_editor_selected_file)
 
-        # Destroy any open selection windows
-        for window in self.open_windows:
-            window.destroy()
+    def open_file(self, file_to_open: str):
+        """
+        Opens the specified file using the default system program.
 
-        # Stop logging if currently running
-        if self.activate_logging_var.get():
-            self.stop_logging()
+        Parameters:
+        - file_to_open (str): The path of the file to be opened.
 
-    def select_frame_by_name(self, frame_name: str):
+        Returns:
+        - None
         """
-        Switches between frames based on the provided frame_name and sets button colors accordingly.
+        # Check if the input exists
+        if not os.path.exists(file_to_open):
+            # If the provided input does not exist, log an error and return
+            self.log_and_show(f"Cannot open input as it does not exist: {file_to_open}",
+                              create_messagebox=True, error=True)
+            return
 
-        Args:
-        frame_name (str): The name of the frame to be selected.
+        # Get the filename from the file path
+        filename = os.path.basename(file_to_open)
 
-        Note: Ensure this method is connected to a button press or navigation event.
+        # If the input path is not empty, try to open the input using the default system program
+        if file_to_open:
+            try:
+                subprocess.Popen(['xdg-open', file_to_open])
+
+                # Log a success message if the input is opened successfully
+                self.log_and_show(f"Input opened: {filename}")
+            except OSError as e:
+                # If an error occurs while opening the file, log the error
+                self.log_and_show(f"{str(e)}", create_messagebox=True, error=True)
+
+    def schedule_file_display_update(self, *_) -> None:
         """
-        # Set button color for the selected button
-        self.file_renamer_button.configure(
-            fg_color=("gray75", "gray25") if frame_name == "file_renamer_window" else "transparent")
-        self.name_normalizer_button.configure(
-            fg_color=("gray75", "gray25") if frame_name == "name_normalizer_window" else "transparent")
-        self.video_editor_button.configure(
-            fg_color=("gray75", "gray25") if frame_name == "video_editor_window" else "transparent")
-        self.add_remove_button.configure(
-            fg_color=("gray75", "gray25") if frame_name == "add_remove_window" else "transparent")
-        self.settings_button.configure(
-            fg_color=("gray75", "gray25") if frame_name == "settings_window" else "transparent")
+        Schedule a debounced update of the file display.
 
-        # Show the selected frame and hide others, set the active frame_name
-        if frame_name == "file_renamer_window":
-            self.file_renamer_frame.grid(row=0, column=1, sticky="nsew")
-            self.frame_name = frame_name
-        else:
-            self.file_renamer_frame.grid_forget()
-        if frame_name == "name_normalizer_window":
-            self.name_normalizer_frame.grid(row=0, column=1, sticky="nsew")
-            self.frame_name = frame_name
-        else:
-            self.name_normalizer_frame.grid_forget()
-        if frame_name == "video_editor_window":
-            self.video_editor_frame.grid(row=0, column=1, sticky="nsew")
-            self.frame_name = frame_name
-        else:
-            self.video_editor_frame.grid_forget()
-        if frame_name == "add_remove_window":
-            self.add_remove_frame.grid(row=0, column=1, sticky="nsew")
-            self.frame_name = frame_name
-        else:
-            self.add_remove_frame.grid_forget()
-        if frame_name == "settings_window":
-            self.settings_frame.grid(row=0, column=1, sticky="nsew")
-            self.frame_name = frame_name
-        else:
-            self.settings_frame.grid_forget()
+        Each call cancels the pending update, so a burst of keystrokes or queue changes only recomputes the
+        preview once the input has been idle for preview_debounce_ms.
 
-    """
-    Event handlers for button clicks to switch frames
-    """
+        Args:
+        - *_: Variable number of arguments (unused in this method).
 
-    def file_renamer_button_event(self):
+        Returns:
+            None
         """
-        Event handler for the file renamer button.
+        # Cancel the pending update, if any
+        if self.file_display_update_id is not None:
+            self.after_cancel(self.file_display_update_id)
 
-        Calls the select_frame_by_name method to switch to the 'file_renamer_window' frame.
-        """
-        self.select_frame_by_name("file_renamer_window")
+        # Schedule the update after the debounce delay
+        self.file_display_update_id = self.after(self.preview_debounce_ms, self.update_file_display)
 
-    def name_normalizer_button_event(self):
+    def update_file_display(self, *_) -> None:
         """
-        Event handler for the name normalizer button.
+        Update the file display based on the selected file and user input.
 
-        Calls the select_frame_by_name method to switch to the 'name_normalizer_window' frame.
-        """
-        self.select_frame_by_name("name_normalizer_window")
+        Args:
+        - *_: Variable number of arguments (unused in this method).
 
-    def video_editor_button_event(self):
-        """
-        Event handler for the video editor button.
+        Returns:
+            None
 
-        Calls the select_frame_by_name method to switch to the 'video_editor_window' frame.
-        """
-        self.select_frame_by_name("video_editor_window")
+        Notes:
+        - Gathers data from the GUI including base name, weighted categories, prefix text, custom text, and extension.
+        - Constructs the proposed name using gathered information.
+        - Sets the proposed name to the char_length variable.
+        - Sets the proposed name to the display text.
+        - Checks the proposed name against the target filesystem (length in bytes, reserved characters and names).
+        - Updates the file display and name length variables.
 
-    def add_remove_button_event(self):
         """
-        Event handler for the add/remove button.
+        # Cancel any pending debounced update since the display is being refreshed now
+        if self.file_display_update_id is not None:
+            self.after_cancel(self.file_display_update_id)
+            self.file_display_update_id = None
 
-        Calls the select_frame_by_name method to switch to the 'add_remove_window' frame.
-        """
-        self.select_frame_by_name("add_remove_window")
+        if not self.file_renamer_selected_file:
+            # Set the file display to an empty string and return
+            self.file_display_text.set("")
+            return
 
-    def settings_button_event(self):
-        """
-        Event handler for the settings button.
+        # Gather the data from the GUI
+        (base_name, weighted_categories, prefix_text, custom_text, extension) = self.gather_and_sort()
 
-        Calls the select_frame_by_name method to switch to the 'settings_window' frame.
-        """
-        self.select_frame_by_name("settings_window")
+        # Construct the name
+        (proposed_name, char_length) = self.construct_new_name(base_name, weighted_categories, prefix_text,
+                                                               custom_text, extension)
 
-    def update_background_color(self):
-        """
-        Updates the canvas background color based on the current appearance mode.
+        # Set the proposed name to the file display (with the size of the batch, if any)
+        if self.file_renamer_batch_active():
+            self.file_display_text.set(f"{proposed_name} (+{len(self.file_renamer_batch_files) - 1} more files)")
+        else:
+            self.file_display_text.set(proposed_name)
 
-        Note: Ensure this method is called appropriately, such as in response to a mode change event.
-        """
-        # Update canvas background color based on the current appearance mode
-        current_mode = ctk.get_appearance_mode()
-        if current_mode == "Light":
-            self.file_renamer_canvas.configure(bg='#dbdbdb')
-        elif current_mode == "Dark":
-            self.file_renamer_canvas.configure(bg='#2B2B2B')
+        # Set the length of the name to the name_length_text
+        self.name_length_text.set(char_length)
 
-    def change_appearance_mode_event(self, new_appearance_mode: str):
-        """
-        Event handler for changing the appearance mode.
+        # Handle the constraints of the target filesystem
+        problem = self.check_file_renamer_name(proposed_name)
+        if problem:
+            self.name_length_handler(problem)
 
-        Updates the appearance mode using ctk.set_appearance_mode() and calls update_background_color()
-        to adjust the background color based on the new appearance mode.
+    def check_file_renamer_name(self, name: str) -> Union[str, None]:
+        """
+        Check a proposed File Renamer name against the filesystem of the output directory (or the file's directory).
 
         Args:
-        new_appearance_mode (str): The new appearance mode ('Light' or 'Dark').
-        """
-        # Update background color when appearance mode changes
-        ctk.set_appearance_mode(new_appearance_mode)
-        self.update_background_color()
+        - name (str): The proposed file name.
 
-    @staticmethod
-    def change_scaling_event(new_scaling: str):
+        Returns:
+        - Union[str, None]: Why the name cannot be used, or None if it can.
         """
-        Event handler for changing widget scaling.
+        directory = self.output_directory or os.path.dirname(self.file_renamer_selected_file)
+        return self.path_validator.check(os.path.join(directory, os.path.basename(name)))
 
-        Converts the new_scaling percentage to a float, sets the widget scaling using ctk.set_widget_scaling().
+    def name_length_handler(self, problem: str):
+        """
+        Handle a proposed file name the target filesystem would reject.
 
         Args:
-        new_scaling (str): The new widget scaling percentage.
+        - problem (str): Why the name cannot be used (e.g. its length in bytes is over the limit).
+
         """
-        new_scaling_float = int(new_scaling.replace("%", "")) / 100
-        ctk.set_widget_scaling(new_scaling_float)
+        if problem:
+            # Check if there is an entry in the queue list
+            if len(self.file_renamer_queue) == 0:
+                self.log_and_show(f"The proposed file name cannot be used: {problem}. "
+                                  "Operating system limitations prohibit this. Please remove some of your custom text"
+                                  " and try again.",
+                                  create_messagebox=True, error=True)
+            elif len(self.file_renamer_queue) > 0:
+                # Display the length of the category word + 1
+                categories_with_lengths = self.get_lengths(self.file_renamer_queue)
 
-    """
-    Messaging
-    """
+                # Prompt the user to choose from the list using SelectOptionWindow
+                chosen_category = self.selection_window(title="Name Length Error",
+                                                        prompt=f"The proposed file name cannot be used: {problem}. "
+                                                               "\nOperating system limitations prohibit this. "
+                                                               "\nPlease choose a category to remove:",
+                                                        label_text="Choose Category",
+                                                        item_list=self.file_renamer_queue,
+                                                        item_text=categories_with_lengths)
 
-    def update_text_color(self):
+                if chosen_category:
+                    # Remove the category from the queue
+                    self.remove_from_queue(chosen_category)
+
+    def undo_last(self):
         """
-        Updates text color based on the current appearance mode.
+        Undo the last category added to the file renamer queue.
+
+        Notes:
+        - Removes the last category from the queue and updates the file display.
+        - Logs the action if logging is enabled.
 
-        Note: Ensure this method is called appropriately, such as in response to a mode change event.
         """
-        # Update text color based on the current appearance mode
-        current_mode = ctk.get_appearance_mode()
-        if current_mode == "Light":
-            self.file_renamer_message_label.configure(text_color="#000000")
-            self.name_normalizer_message_label.configure(text_color="#000000")
-            self.video_editor_message_label.configure(text_color="#000000")
-            self.add_remove_message_label.configure(text_color="#000000")
-        elif current_mode == "Dark":
-            self.file_renamer_message_label.configure(text_color="#FFFFFF")
-            self.name_normalizer_message_label.configure(text_color="#FFFFFF")
-            self.video_editor_message_label.configure(text_color="#FFFFFF")
-            self.add_remove_message_label.configure(text_color="#FFFFFF")
+        if self.file_renamer_queue:
+            # Remove the last category from the queue and update display
+            self.file_renamer_queue.pop()
+            self.update_file_display()
+            self.log_and_show("Last category removed", not_logging=True)
+        else:
+            # Log the action if logging is enabled
+            self.log_and_show("Nothing in the queue. Nothing to undo.",
+                              create_messagebox=True, error=True)
 
-    def show_message(self, message, error=False, frame_name=None):
+    def undo_file_rename(self):
         """
-        Displays a message on the actively selected frame or all frames.
+        Undo the last file renaming or name normalization operation.
 
-        Args:
-        message (str): The message to be displayed.
-        error (bool): If True, formats the message with red text for error indication. Default is False.
-        frame_name (str or None): The name of the frame to display the message on. If None, displays on all frames.
+        This method checks the current frame and attempts to revert the changes made
+        in the last file renaming or name normalization operation. It provides a confirmation
+        prompt before performing the undo operation.
 
-        Note: Ensure this method is called appropriately to show messages in your GUI.
+        Returns:
+            None
         """
-        # Update text color when displaying a message
-        self.update_text_color()
+        if self.frame_name == "file_renamer_window":
+            # Get the last operation from the history
+            last_operation = self.history_store.peek("file_renamer")
 
-        # Display the message with optional error formatting on the actively selected frame
-        if frame_name == "file_renamer_window":
-            labels = [self.file_renamer_message_label]
-        elif frame_name == "name_normalizer_window":
-            labels = [self.name_normalizer_message_label]
-        elif frame_name == "video_editor_window":
-            labels = [self.video_editor_message_label]
-        elif frame_name == "add_remove_window":
-            labels = [self.add_remove_message_label]
-        else:
-            # Default to all frame labels if no frame name is passed
-            labels = [self.file_renamer_message_label, self.name_normalizer_message_label,
-                      self.video_editor_message_label, self.add_remove_message_label]
+            if last_operation:
+                # Extract the information needed to revert the changes
+                operation_id, pairs = last_operation
+                original_path, new_path = pairs[0]
+                batch_text = f"\n(and {len(pairs) - 1} more files of the batch)" if len(pairs) > 1 else ""
 
-        # Truncate the message after x characters for GUI-friendly formatting.
-        truncated_message = f"{message[:115]}..." if len(message) > 115 else message
+                # Ask for confirmation of the undo file rename operation
+                confirmation = self.ask_confirmation("Undo File Rename",
+                                                     f"Do you want to undo the file rename operation?: "
+                                                     f"\n{os.path.basename(new_path)}"
+                                                     f"\nOriginal name: "
+                                                     f"\n{os.path.basename(original_path)}{batch_text}")
 
-        for label in labels:
-            if error:
-                label.configure(text=truncated_message, text_color="#FF0000")  # Red text for errors
+                if confirmation:
+                    # Wait for a running rename or move to another drive to finish
+                    if self.file_rename_active() or self.background_move_active():
+                        return
+
+                    # Remove the operation from the history
+                    self.history_store.remove(operation_id)
+
+                    # Revert every file of a batch
+                    if len(pairs) > 1:
+                        self.undo_file_renamer_batch(pairs)
+                        return
+
+                    try:
+                        # Attempt to revert the changes by renaming the file back to the original path
+                        os.rename(new_path, original_path)
+                        self.forget_trash_info(new_path)
+
+                        # Log and display a message
+                        self.log_and_show(f"Undo successful. File reverted to: \n{original_path}")
+
+                        # Set the last used file
+                        self.file_renamer_last_used_file = original_path
+                    except OSError as e:
+                        if e.errno == errno.EXDEV:
+                            # Copy the file back to the other drive in the background
+                            def on_moved(_moved, original_path=original_path, new_path=new_path):
+                                self.log_and_show(
+                                    f"File: '{os.path.basename(new_path)}' renamed and moved successfully. "
+                                    f"\nSaved to: \n{original_path}")
+                                # Set the last used file
+                                self.file_renamer_last_used_file = original_path
+
+                            self.start_background_moves(
+                                [(new_path, original_path)], "file_renamer_window", on_success=on_moved,
+                                on_failure=lambda failed: self.restore_undo_history("file_renamer", failed))
+                        else:
+                            # Log the action for other OSError
+                            self.log_and_show(f"{str(e)}", create_messagebox=True, error=True)
+
+                else:
+                    # If the user declines, keep the operation in the history
+                    return
             else:
-                label.configure(text=truncated_message)
+                # Log the action if logging is enabled
+                self.log_and_show("No previous file rename operation. Nothing to undo.", create_messagebox=True,
+                                  error=True)
 
-    def validate_entry(self, var, default_value, desired_type):
-        """
-        Validates and updates the value of a Tkinter variable based on the desired type.
+        elif self.frame_name == "name_normalizer_window":
+            # Get the last operation from the history
+            last_operation = self.history_store.peek("name_normalizer")
 
-        Args:
-        var (tkinter.Variable): The Tkinter variable to be validated and updated.
-        default_value: The default value to set if validation fails.
-        desired_type (type): The desired type for the variable (int or float).
+            if last_operation:
+                # Extract the information needed to revert the changes
+                operation_id, pairs = last_operation
+                original_paths = [original_path for original_path, _ in pairs]
+                new_paths = [new_path for _, new_path in pairs]
 
-        Note: Ensure this method is used to validate and update Tkinter variable values.
-        """
-        if not self.validate_entries.get():
-            # Return if validate entries is disabled
-            return
+                # Filter out None values from new_paths
+                new_paths = [path for path in new_paths if path is not None]
 
-        # Ensure the value is of the desired type
-        current_value = var.get()
+                # Truncate paths if they exceed a certain limit (Beautify the data for the gui)
+                max_display_paths = 3
+                truncated_original_paths = original_paths[:max_display_paths]
+                truncated_new_paths = new_paths[:max_display_paths]
+                truncated_original_paths_str = ', '.join(os.path.basename(path) for path in truncated_original_paths)
+                truncated_new_paths_str = ', '.join(os.path.basename(path) for path in truncated_new_paths)
+                if len(original_paths) > max_display_paths:
+                    truncated_original_paths_str += f", and {len(original_paths) - max_display_paths} more..."
+                if len(new_paths) > max_display_paths:
+                    truncated_new_paths_str += f", and {len(new_paths) - max_display_paths} more..."
 
-        if desired_type == int:
-            # Check if the value is an integer
-            if not current_value.isdigit():
-                try:
-                    # Try to convert the value to an integer
-                    int_value = int(current_value)
-                    var.set(int_value)
-                except ValueError:
-                    # If conversion to integer fails, set it to the default value
-                    var.set(default_value)
-        elif desired_type == float:
-            # Check if the value is a float
-            try:
-                float_value = float(current_value)
-                var.set(float_value)
-            except ValueError:
-                # If conversion to float fails, set it to the default value
-                var.set(default_value)
-        else:
-            # If the desired type is neither int nor float, set it to the default value
-            var.set(default_value)
+                # Ask for confirmation of the undo name normalizer operation
+                confirmation = self.ask_confirmation("Undo Name Normalizer",
+                                                     f"Do you want to undo the name normalizer operation?: "
+                                                     f"\n{truncated_new_paths_str}"
+                                                     f"\n\nOriginal names: "
+                                                     f"\n{truncated_original_paths_str}")
 
-    @staticmethod
-    def get_basenames(file_paths: list) -> list:
-        """
-        Get the basenames of a list of file paths.
+                if confirmation:
+                    # Wait for a running move to another drive to finish
+                    if self.background_move_active():
+                        return
 
-        Parameters:
-        - file_paths (list): A list of file paths.
+                    # Remove the operation from the history
+                    self.history_store.remove(operation_id)
 
-        Returns:
-        - list: A list containing the basenames of the input file paths.
-        """
-        basenames = [os.path.basename(path) for path in file_paths]
-        return basenames
+                    # Files on another drive are copied back in the background after the renames
+                    cross_device_pairs = []
 
-    @staticmethod
-    def get_lengths(input_list: list) -> list:
-        """
-        Get the lengths of each item in the input list, add one to account for the whitespace, and append it to the
-        item.
+                    try:
+                        # Attempt to revert the changes by renaming/moving the files back to their original paths
+                        for original_path, new_path in zip(original_paths, new_paths):
+                            # Check if new path is provided and skip if the there is no change
+                            if new_path is not None and (original_path != new_path):
+                                try:
+                                    # Check if the file exists
+                                    if not os.path.isfile(new_path):
+                                        # Raise error if not found
+                                        raise FileNotFoundError
 
-        Parameters:
-        - input_list (list): A list of items.
+                                    # Rename the file
+                                    os.rename(new_path, original_path)
+                                    self.forget_trash_info(new_path)
+                                except FileNotFoundError:
+                                    # Handle the file not found error and log an error message
+                                    self.log_and_show(f"File not found: "
+                                                      f"\n{new_path}",
+                                                      create_messagebox=True, error=True)
+                                    continue
+                                except OSError as e:
+                                    # Move files on another drive in the background
+                                    if e.errno == errno.EXDEV:
+                                        cross_device_pairs.append((new_path, original_path))
+                                    else:
+                                        # Handle any other error and log an error message
+                                        self.log_and_show(f"Unexpected error renaming: "
+                                                          f"\n{new_path}"
+                                                          f"\n{original_path} "
+                                                          f"\n{e}",
+                                                          create_messagebox=True, error=True)
+                                    continue
 
-        Returns:
-        - list: A new list with each item appended by its length.
-        """
-        processed_list = [f"{item} (frees {(len(str(item)) + 1)} characters)" for item in
-                          input_list]
-        return processed_list
+                        if cross_device_pairs:
+                            def on_moved(moved):
+                                self.log_and_show(f"Undo successful. {len(moved)} file(s) moved back from another "
+                                                  f"drive.")
+
+                            # Log and move the remaining files back
+                            self.log_and_show(f"Moving {len(cross_device_pairs)} file(s) back from another drive...")
+                            self.start_background_moves(
+                                cross_device_pairs, "name_normalizer_window", on_success=on_moved,
+                                on_failure=lambda failed: self.restore_undo_history("name_normalizer", failed))
+                        else:
+                            # Log and display a message
+                            self.log_and_show(f"Undo successful. Files reverted to: \n{', '.join(original_paths)}")
+
+                        # Set the last used file
+                        self.name_normalizer_last_used_file = original_paths[-1]
+                    except OSError as e:
+                        # Log the action for other OSError
+                        self.log_and_show(f"{str(e)}", create_messagebox=True, error=True)
+
+                else:
+                    # If the user declines, keep the operation in the history
+                    return
+            else:
+                # Log the action if logging is enabled
+                self.log_and_show("No previous name normalizer operation. Nothing to undo.", create_messagebox=True,
+                                  error=True)
 
-    def start_progress(self, progress_bar_name: str, frame: str):
+    def undo_file_renamer_batch(self, pairs: list):
         """
-        Start a progress bar.
+        Revert a File Renamer batch, renaming each file back to its original path.
 
-        Args:
-        - progress_bar_name (str): The name of the progress bar attribute.
-        - frame (str): The name of the frame to which the progress bar will be added.
+        Files on another drive are moved back in the background after the renames.
 
+        Parameters:
+            pairs (list): The (original_path, new_path) pairs of the batch.
         """
-        # Create a progress bar
-        setattr(self, progress_bar_name, ctk.CTkProgressBar(frame, orientation="horizontal", mode="indeterminate"))
-        getattr(self, progress_bar_name).grid(row=0, column=0, padx=10, pady=10)
+        reverted = 0
+        cross_device_pairs = []
 
-        # Start the progress bar
-        getattr(self, progress_bar_name).start()
+        for original_path, new_path in pairs:
+            try:
+                # Rename the file back
+                os.rename(new_path, original_path)
+                self.forget_trash_info(new_path)
+                reverted += 1
+            except FileNotFoundError:
+                # Handle the file not found error and log an error message
+                self.log_and_show(f"File not found: \n{new_path}", error=True)
+            except OSError as e:
+                if e.errno == errno.EXDEV:
+                    # Move files on another drive in the background
+                    cross_device_pairs.append((new_path, original_path))
+                else:
+                    # Log the action for other OSError
+                    self.log_and_show(f"{str(e)}", error=True)
 
-    def stop_progress(self, progress_bar_name: str):
-        """
-        Stop and destroy a progress bar.
+        # Set the last used file
+        self.file_renamer_last_used_file = pairs[0][0]
 
-        Args:
-        - progress_bar_name (str): The name of the progress bar attribute to stop and destroy.
+        if cross_device_pairs:
+            def on_moved(moved):
+                self.log_and_show(f"Undo successful. {len(moved)} file(s) moved back from another drive.")
 
-        """
-        try:
-            # Stop the progress bar
-            getattr(self, progress_bar_name).stop()
+            self.start_background_moves(
+                cross_device_pairs, "file_renamer_window", on_success=on_moved,
+                on_failure=lambda failed: self.restore_undo_history("file_renamer", failed))
 
-            # Destroy the progress bar widget
-            getattr(self, progress_bar_name).destroy()
-        except AttributeError:
-            # Handle the case where the progress bar attribute does not exist
-            self.log_and_show(f"Progress bar '{progress_bar_name}' not found.", create_messagebox=True, error=True)
+        # Log and display a message
+        message = f"Undo of the batch: {reverted} of {len(pairs)} files reverted."
+        if cross_device_pairs:
+            message += f" Moving {len(cross_device_pairs)} file(s) back from another drive..."
+        self.log_and_show(message)
 
-    def log_and_show(self, message, create_messagebox=False, error=False, not_logging=False):
+    def restore_undo_history(self, module: str, failed_moves: list):
         """
-        Method to check logging state, log if applicable, and show a messagebox.
+        Record the files an undo could not move back from another drive as a new history operation.
+
+        The operation is removed from the history before its files are moved back, so the files that failed are added
+        again for the undo to be retried.
 
         Parameters:
-        - message: The message to be logged and displayed.
-        - create_messagebox: Boolean indicating whether to create and display a messagebox.
-        - error: Boolean indicating whether the message is an error message.
-        - not_logging: Boolean indicating whether to skip logging.
+            module (str): The module of the undone operation ('file_renamer' or 'name_normalizer').
+            failed_moves (list): The (new_path, original_path) pairs of the moves that failed.
         """
-        # Check logging state and log message if applicable
-        if not not_logging and self.activate_logging_var.get():
-            logging_function = logging.error if error else logging.info
-            logging_function(message)
-
-        # Check messagebox state and display messageboxes if applicable
-        if self.show_messageboxes_var.get():
-            messagebox_function = messagebox.showerror if error else messagebox.showinfo
-            if create_messagebox:
-                messagebox_function("Error" if error else "Info", message)
-            else:
-                # Display the message on the applicable frame if messageboxes are enabled but none were created
-                self.show_message(message, error=error, frame_name=self.frame_name)
-        else:
-            # Display the message on the applicable frame if messageboxes are disabled
-            self.show_message(message, error=error, frame_name=self.frame_name)
+        self.history_store.push(module, [(original_path, new_path) for new_path, original_path in failed_moves])
+        self.log_and_show(f"{len(failed_moves)} file(s) kept in the history. Undo again to retry.", error=True)
 
-    def ask_confirmation(self, title, message):
+    def clear_selection(self, frame_name: str, reset_all=True) -> None:
         """
-        Display a yes/no messagebox for confirmation.
+        Clear the selected options and input fields based on the provided frame name.
 
         Parameters:
-        - title (str): The title of the messagebox.
-        - message (str): The message to be displayed in the messagebox.
+            frame_name (str): The name of the frame for which to clear the selection.
+            reset_all (bool, optional): Boolean to track whether to reset everything or just the values.
 
         Returns:
-        - bool: True if 'Yes' is selected, False otherwise.
+            None
         """
-        # Check confirmation messagebox state and display messageboxes if applicable
-        if self.show_confirmation_messageboxes_var.get():
-            confirmation = messagebox.askyesno(title, message)
-            return confirmation
-        else:
-            if self.fallback_confirmation_var.get():
-                # Automatically choose Yes if fallback state is True.
-                return True
-            else:
-                # Automatically choose No if fallback state is False.
-                return False
+        if frame_name == "file_renamer_window":
+            self.file_renamer_selected_file = ""
+            self.file_renamer_batch_files = []
+            self.file_renamer_queue = []
+            self.name_length_text.set("")
 
-    def selection_window(self, title: str, prompt: str, label_text: str, item_list: list, item_text=None) -> str:
-        """
-        Display a selection window prompting the user to choose from a list of options.
+            # Clear text entries and reset output directory
+            self.prefix_text_entry.delete(0, ctk.END)
+            self.custom_text_entry.delete(0, ctk.END)
+            self.output_directory = ""
+            self.output_directory_entry.delete(0, ctk.END)
 
-        Args:
-        - title (str): Title of the selection window.
-        - prompt (str): Prompt message displayed in the window.
-        - label_text (str): Label text for the selection.
-        - item_list (list): List of items to choose from.
-        - item_text (list, optional): GUI-friendly list of items to choose from.
+            # Update file display
+            self.update_file_display()
 
-        Returns:
-        - str: The selected option from the user.
+        elif frame_name == "name_normalizer_window":
+            self.name_normalizer_selected_file = ""
+            self.name_normalizer_batch_paths = []
+            self.name_normalizer_output_directory = ""
 
-        """
-        # If the gui-friendly text is provided, then use it, else use the item_list
-        item_text = item_text if item_text else item_list
+            self.prefix_entry.delete(0, ctk.END)
+            self.suffix_entry.delete(0, ctk.END)
+            self.original_entry.delete(0, ctk.END)
+            self.replace_entry.delete(0, ctk.END)
 
-        # Prompt the user to choose from the list using SelectOptionWindow
-        selection_window = SelectOptionWindow(title=title,
-                                              prompt=prompt,
-                                              label_text=label_text,
-                                              item_list=item_list,
-                                              item_text=item_text)
+            self.move_directory_entry.delete(0, ctk.END)
+            self.custom_text_removal_entry.delete(0, ctk.END)
 
-        # Keep track of the open window
-        self.open_windows.append(selection_window)
+            # Update the Name Normalizer display
+            self.update_nn_display()
 
-        # Wait for the user to respond before proceeding
-        selection_window.wait_window()
+        elif frame_name == "video_editor_window":
+            if reset_all:
+                self.video_editor_selected_file = ""
+                self.video_editor_batch_paths = []
 
-        # Retrieve the selected directory
-        selected_option = selection_window.get_selected_option()
+                self.input_method_entry.delete(0, ctk.END)
+                self.video_editor_output_directory_entry.delete(0, ctk.END)
 
-        # Remove the window from the list when it is closed
-        self.open_windows.remove(selection_window)
+            # Clear decibel entry
+            self.decibel_entry.delete(0, ctk.END)
 
-        return selected_option
+            # Clear audio normalization entry
+            self.audio_normalization_entry.delete(0, ctk.END)
 
-    """
-    Json Handling
-    """
+            # Clear hour entries
+            self.hour_entry.delete(0, ctk.END)
+            self.hour_entry1.delete(0, ctk.END)
 
-    def initialize_json(self):
-        """
-        Initializes class attributes by loading data from the specified JSON file.
+            # Clear minute entries
+            self.minute_entry.delete(0, ctk.END)
+            self.minute_entry1.delete(0, ctk.END)
 
-        Note: Ensure this method is called appropriately during the initialization of your class.
-        """
-        # Load data from the dictionary_file
-        try:
-            if not os.path.isfile(self.dictionary_file):
-                # Return early if the file doesn't exist
-                return
+            # Clear second entries
+            self.second_entry.delete(0, ctk.END)
+            self.second_entry1.delete(0, ctk.END)
 
-            with open(self.dictionary_file, "r") as json_file:
-                data = json.load(json_file)
+            """Set the default variables"""
+            # Set the decibel entry
+            self.decibel_var.set(self.default_decibel)
 
-                # Get artist_common_categories dictionary
-                self.artist_common_categories = data.get("artist_common_categories", {})
+            # Set the audio normalization entry
+            self.audio_normalization_var.set(self.default_audio_normalization)
 
-                # Get categories dictionary
-                self.categories = data.get("categories", {})
+            # Set the hour entries
+            self.hour_var.set(self.default_hour)
+            self.hour_var1.set(self.default_hour)
 
-                # Get custom_text_to_replace list
-                self.custom_text_to_replace = data.get("custom_text_to_replace", {})
+            # Set the minute entries
+            self.minute_var.set(self.default_minute)
+            self.minute_var1.set(self.default_minute)
 
-                # Get excluded_folders list
-                self.excluded_folders = data.get("excluded_folders", [])
+            # Set the second entries
+            self.second_var.set(self.default_second)
+            self.second_var1.set(self.default_second)
 
-                # Get file_extensions list
-                self.file_extensions = data.get("file_extensions", [])
+        elif frame_name == "add_remove_window":
+            # Get the active tab from the add_remove_tabview
+            active_tab = self.add_remove_tabview.get()
 
-                # Get valid_extensions list
-                self.valid_extensions = data.get("valid_extensions", [])
+            if active_tab == "Artist":
+                # Clear add artist entry
+                self.add_artist_entry.delete(0, ctk.END)
 
-                # Get weight_to_tab_name dictionary
-                weight_to_tab_name = data.get("weight_to_tab_name", {})
-                # Make sure the keys are integers
-                self.weight_to_tab_name = {int(key): value for key, value in weight_to_tab_name.items()}
+                # Clear remove artist entry
+                self.remove_artist_entry.delete(0, ctk.END)
 
-        except FileNotFoundError:
-            # Log that the file is not found
-            self.log_and_show(f"Dictionary JSON file not found: {self.dictionary_file}")
+                # Clear add acc artist record entry
+                self.add_acc_record_entry.delete(0, ctk.END)
 
-        except json.JSONDecodeError as e:
-            # Handle JSON decoding error
-            self.log_and_show(f"Error decoding JSON in dictionary file: {self.dictionary_file}, {str(e)}", error=True)
+                # Clear remove acc artist record entry
+                self.remove_acc_record_entry.delete(0, ctk.END)
 
-        except Exception as e:
-            self.log_and_show(f"Initialize JSON failed: {self.dictionary_file}, {str(e)}", error=True)
+                # Clear acc artist
+                self.acc_selected_artist = ""
+                self.acc_display_text.set("")
 
-    def update_json(self, file_to_update, dictionary_name, updated_data):
-        """
-        Updates a specific dictionary in a JSON file with new data.
+                # Clear add acc entry
+                self.add_acc_entry.delete(0, ctk.END)
 
-        Args:
-        file_to_update (str): The path to the JSON file to be updated.
-        dictionary_name (str): The name of the dictionary key to be updated.
-        updated_data: The new data to be assigned to the specified dictionary key.
+                # Clear remove acc entry
+                self.remove_acc_entry.delete(0, ctk.END)
 
-        Note: Ensure this method is called appropriately to update JSON files in your application.
-        """
-        try:
-            if not os.path.isfile(file_to_update):
-                # Return early if the file doesn't exist
-                raise FileNotFoundError
+            elif active_tab == "Category":
+                # Clear add category entry
+                self.category_entry.delete(0, ctk.END)
+
+                self.weight_entry.delete(0, ctk.END)
+
+                # Clear remove category entry
+                self.remove_category_entry.delete(0, ctk.END)
+
+                # Set the default variable
+                self.weight_var.set(self.default_weight)
+
+            elif active_tab == "Custom Tab Name":
+                # Clear add custom tab name entry
+                self.custom_tab_name_entry.delete(0, ctk.END)
+
+                self.weight_entry1.delete(0, ctk.END)
+
+                # Clear remove custom tab name entry
+                self.remove_custom_tab_name_entry.delete(0, ctk.END)
+
+                # Set the default variable
+                self.weight_var1.set(self.default_ctn_weight)
+
+            elif active_tab == "Custom Text to Replace":
+                # Clear add custom text to replace entry
+                self.add_ctr_name_entry.delete(0, ctk.END)
+
+                # Clear replacement text to replace entry
+                self.replacement_text_entry.delete(0, ctk.END)
+
+                # Clear remove custom text to replace entry
+                self.remove_ctr_name_entry.delete(0, ctk.END)
 
-            # Read existing JSON data
-            with open(file_to_update, 'r') as json_file:
-                data = json.load(json_file)
+            elif active_tab == "Exclude":
+                # Clear add exclude entry
+                self.add_exclude_name_entry.delete(0, ctk.END)
 
-            # Update the dictionary key
-            data[dictionary_name] = updated_data
+                # Clear remove exclude entry
+                self.remove_exclude_name_entry.delete(0, ctk.END)
 
-            # Sort the dictionary alphabetically
-            sorted_data = {key: value for key, value in sorted(data.items())}
+            elif active_tab == "File Extensions":
+                # Clear add extension entry
+                self.add_file_extension_entry.delete(0, ctk.END)
 
-            # Write the sorted data back to the JSON file
-            with open(file_to_update, 'w') as json_file:
-                json.dump(sorted_data, json_file, indent=2)
+                # Clear remove extension entry
+                self.remove_file_extension_entry.delete(0, ctk.END)
 
-        except FileNotFoundError:
-            # Log that the file is not found
-            self.log_and_show(f"JSON file not found: {file_to_update}", create_messagebox=True, error=True)
+            elif active_tab == "NO GO":
+                # Clear add NO-GO entry
+                self.add_no_go_name_entry.delete(0, ctk.END)
 
-        except json.JSONDecodeError as e:
-            # Handle JSON decoding error
-            self.log_and_show(f"Decoding JSON in JSON file failed: {file_to_update}, {str(e)}", error=True)
+                # Clear remove NO-GO entry
+                self.remove_no_go_name_entry.delete(0, ctk.END)
 
-        except Exception as e:
-            self.log_and_show(f"Updating JSON failed: {file_to_update}, {str(e)}", error=True)
+            elif active_tab == "Valid Extensions":
+                # Clear add extension entry
+                self.add_valid_extension_entry.delete(0, ctk.END)
 
-    """
-    Logging
-    """
+                # Clear remove extension entry
+                self.remove_valid_extension_entry.delete(0, ctk.END)
+            else:
+                # Invalid tab name
+                return
+        else:
+            # Invalid frame name
+            return
 
-    def logging_setup(self):
-        """
-        Set up logging for the File Renamer application.
+        # Log action and display message on the applicable frame
+        self.log_and_show("Selection cleared", not_logging=True)
 
-        Note: Ensure this method is called appropriately during the initialization of your application.
+    def browse_artist_file(self):
         """
-        # Create the log file if it doesn't exist
-        if not os.path.exists(self.file_renamer_log):
-            with open(self.file_renamer_log, 'w'):
-                pass
+        Open a file dialog to browse and select an artist-related file.
 
-        # Initialize logging with both TimedRotatingFileHandler and RotatingFileHandler
-        timed_handler = TimedRotatingFileHandler(self.file_renamer_log, when="D", interval=1, backupCount=3)
-        size_handler = RotatingFileHandler(self.file_renamer_log, maxBytes=10 * 1024 * 1024, backupCount=5)
+        Updates:
+        - Sets the selected file path to the artist_file variable.
+        - Clears the entry and sets it to the artist file path in the GUI.
+        """
+        artist_file = filedialog.askopenfilename(
+            initialdir=self.initial_directory,
+            filetypes=[("Text Files", "*.txt")])
 
-        formatter = logging.Formatter('%(asctime)s - %(levelname)s: %(message)s')
+        if artist_file:
+            # Set the file to the artist file variable
+            self.artist_file = artist_file
 
-        timed_handler.setFormatter(formatter)
-        size_handler.setFormatter(formatter)
+            # Clear the entry and set it to the artist file
+            self.artist_file_entry.delete(0, ctk.END)
+            self.artist_file_entry.insert(0, self.artist_file)
 
-        # Set up the logger with both handlers
-        logger = logging.getLogger()
-        logger.setLevel(logging.INFO)
-        logger.addHandler(timed_handler)
-        logger.addHandler(size_handler)
+    def browse_directory(self, entry_widget, target_attribute):
+        """
+        Open a directory dialog to browse and select a directory.
 
-        logging.info("Logging started.")
+        Updates:
+        - Clears the entry in the GUI and sets it to the selected directory.
+        - Updates the corresponding attribute in the class with the selected directory path.
 
-    def stop_logging(self):
+        Parameters:
+        - entry_widget: The entry widget in the GUI where the selected directory path will be displayed.
+        - target_attribute: The attribute in the class to be updated with the selected directory path.
         """
-        Stop logging for the File Renamer application.
+        selected_directory = filedialog.askdirectory(initialdir=getattr(self, target_attribute))
 
-        Note: Ensure this method is called appropriately during the cleanup or termination of your application.
-        """
-        # Notate that logging stopped if the log file exists
-        if os.path.exists(self.file_renamer_log):
-            logging.info("Logging stopped.")
+        if selected_directory:
+            # Clear the entry and set it to the selected directory
+            entry_widget.delete(0, 'end')
+            entry_widget.insert(0, selected_directory)
+            # Update the corresponding attribute in your class
+            setattr(self, target_attribute, selected_directory)
 
-    def redirect_output(self):
+    def browse_input(self) -> None:
         """
-        Redirects standard output and error based on logging and suppression settings.
+        Browse and select input files or directories based on the frame context.
 
-        Note: Ensure this method is called appropriately to manage the redirection of output.
+        Returns:
+            None
         """
-        # If logging state is active, redirect the outputs to the log file instead of the console
-        if self.activate_logging_var.get():
-            # Redirect standard output and error to the log file
-            sys.stdout = open(self.file_renamer_log, 'a')
-            sys.stderr = open(self.file_renamer_log, 'a')
-        # If inactive, either suppress the output completely or revert behavior
-        else:
-            if self.suppress_var.get():
-                # Redirect standard output and error to /dev/null (discard)
-                sys.stdout = open(os.devnull, 'w')
-                sys.stderr = open(os.devnull, 'w')
-            else:
-                # Restore the original standard output and error
-                sys.stdout = self.original_stdout
-                sys.stderr = self.original_stderr
-
-    """
-    File Operations
-    """
+        if self.frame_name == "file_renamer_window":
+            # Remove the default prefix text entry text
+            self.prefix_text_entry.delete(0, ctk.END)
+            # Remove the default custom text entry text
+            self.custom_text_entry.delete(0, ctk.END)
 
-    def remove_successful_line_from_file(self, file_path: str, line_to_remove: str):
-        """
-        Removes a specified line from a text file.
+            file_path = filedialog.askopenfilename(initialdir=self.initial_directory)
+            if file_path:
+                # Set the selected file
+                self.file_renamer_selected_file = file_path
 
-        Args:
-        file_path (str): The path to the text file.
-        line_to_remove (str): The line to be removed from the file.
+                # Clear the queue
+                self.file_renamer_queue = []
+                # Update display
+                self.update_file_display()
 
-        Note: Ensure this method is called appropriately to remove a line from the specified text file.
-        """
-        try:
-            if not file_path.lower().endswith('.txt'):
-                # If the file does not have a .txt extension, return without performing any operation.
-                self.log_and_show("The provided file is not a txt file. Skipping removal of successful line.",
-                                  error=True)
-                return
+                # Add artist common categories to the queue
+                if self.artist_common_categories_var.get():
+                    self.add_remove_common_categories_to_queue()
 
-            # Read all lines from the file.
-            with open(file_path, 'r') as file:
-                lines = file.readlines()
+                # Log the action if logging is enabled
+                self.log_and_show(f"Input selected via Browse: "
+                                  f"{os.path.basename(self.file_renamer_selected_file)}")
 
-            # Open the file in write mode to remove the specified line.
-            with open(file_path, 'w') as file:
-                # Write lines back to the file, excluding the successful line to remove.
-                for line in lines:
-                    if line.strip() != line_to_remove:
-                        file.write(line)
+        elif self.frame_name == "name_normalizer_window":
+            # Method to browse and select a folder to normalize files
+            nn_input_method = filedialog.askdirectory(initialdir=self.initial_directory,
+                                                      title="Browse a directory. Close to select a file instead")
 
-            self.log_and_show(f"Successful line removed from {file_path}")
+            if not nn_input_method:
+                nn_input_method = filedialog.askopenfilename(
+                    initialdir=self.initial_directory,
+                    title="Browse a file.",
+                    filetypes=[("All Files", "*.*")]
+                )
 
-        except Exception as e:
-            # Log the exception using the logging module.
-            self.log_and_show(f"An error occurred while removing line from file: {e}", create_messagebox=True,
-                              error=True)
+            if nn_input_method:
+                # Set the name normalizer selected file
+                self.name_normalizer_selected_file = nn_input_method
 
-    def move_file_to_trash(self):
-        """
-        Move the selected file to the system's trash.
+                # Update the Name Normalizer display
+                self.update_nn_display()
 
-        Note: Ensure this method is called appropriately to move the selected file to the trash.
-        """
-        try:
-            if self.file_renamer_selected_file:
-                # Ask for confirmation before moving to trash
-                confirmation = self.ask_confirmation("Confirm Action",
-                                                     "Are you sure you want to move this file to the trash?")
                 # Log the action if logging is enabled
-                self.log_and_show(f"'{self.file_renamer_selected_file}' selected for deletion.")
+                self.log_and_show(f"Input selected via Browse: {os.path.basename(nn_input_method)}")
 
-                if confirmation:
-                    # Move the input to trash using send2trash library
-                    send2trash.send2trash(self.file_renamer_selected_file)
-                    # Reset selected file, queue, and clear display elements
-                    self.file_renamer_selected_file = ""
-                    self.file_renamer_queue = []
-                    self.file_display_text.set("")
-                    self.name_length_text.set("")
-                    self.prefix_text_entry.delete(0, ctk.END)
-                    self.custom_text_entry.delete(0, ctk.END)
-                    self.output_directory = ""
-                    self.output_directory_entry.delete(0, ctk.END)
-                    # Log the action if logging is enabled
-                    self.log_and_show("File moved to trash successfully")
-            else:
-                # Log the action if logging is enabled
-                self.log_and_show("No input selected. Cannot move to trash.", create_messagebox=True, error=True)
-        except OSError as e:
-            self.log_and_show(f"{str(e)}", create_messagebox=True, error=True)
+        elif self.frame_name == "video_editor_window":
+            # Initially ask for a file
+            input_method = filedialog.askopenfilename(
+                initialdir=self.initial_directory,
+                title="Browse a file. Close to select a directory instead",
+                filetypes=[("All Files", "*.*")]
+            )
+            if not input_method:
+                # If no file is selected, try to get a directory
+                input_method = filedialog.askdirectory(initialdir=self.initial_directory, title="Browse a directory")
 
-    def double_check_reminder(self, new_path: str):
-        """
-        Create a double-check reminder for the folder immediately above the specified location.
+            if input_method:
+                # Set the video editor selected file
+                self.video_editor_selected_file = input_method
 
-        Args:
-        new_path (str): The path for which the double-check reminder is to be created.
+                # Extract just the file name, not the absolute file path
+                filename = os.path.basename(input_method)
 
-        Note: Ensure this method is called appropriately to create double-check reminders.
+                # Set the selected file to the input entry widget
+                self.input_method_entry.delete(0, ctk.END)
+                self.input_method_entry.insert(0, filename)
+
+                # Log the action and display the message in the gui
+                self.log_and_show(f"Input selected via Browse: {filename}")
+
+    def browse_output_directory(self) -> None:
         """
-        try:
-            # Get the name of the folder immediately above the current location
-            folder_name = os.path.basename(os.path.dirname(new_path))
+        Browse and select an output directory based on the frame context.
 
-            # Ask for confirmation of the double check reminder
-            confirmation = self.ask_confirmation("Double Check Reminder",
-                                                 f"Do you want to create a double check reminder for: "
-                                                 f"{folder_name}?")
-            if confirmation:
-                # Expand the user's home directory in the output directory path
-                double_check_directory = os.path.expanduser(self.double_check_directory)
+        Returns:
+            None
+        """
+        if self.frame_name == "file_renamer_window":
+            # Check if an input is selected
+            if self.file_renamer_selected_file:
+                # Check if suggest output directory is true
+                if self.suggest_output_directory_var.get():
+                    # Call the suggest output directory function to determine initial directory
+                    initial_directory_check = self.suggest_output_directory()
 
-                # Ensure the output directory exists, create it if not
-                if not os.path.exists(double_check_directory):
-                    os.makedirs(double_check_directory)
+                    # If suggest output directory returns a single result, set it to initial_directory
+                    if initial_directory_check and not isinstance(initial_directory_check, list):
+                        initial_directory = initial_directory_check
 
-                # Create an empty file with the specified naming scheme
-                file_name = f"Double check {folder_name}"
-                file_path = os.path.join(double_check_directory, file_name)
+                    # If suggest output directory returns a list, then use SelectOptionWindow
+                    elif isinstance(initial_directory_check, list):
+                        # Sanitize the list for display in the GUI
+                        basename_list = self.get_basenames(initial_directory_check)
+
+                        # Prompt the user to choose from the list using SelectOptionWindow
+                        chosen_artist = self.selection_window(title="Suggest Output Directory",
+                                                              prompt="Multiple matching artists found. Choose "
+                                                                     "an artist:",
+                                                              label_text="Choose Artist",
+                                                              item_list=initial_directory_check,
+                                                              item_text=basename_list)
+
+                        if chosen_artist in initial_directory_check:
+                            initial_directory = chosen_artist
+                            self.log_and_show(f"User chose the suggested output directory: {chosen_artist}")
+                        else:
+                            # If the choice is not in the matching_artists, use the default initial output directory
+                            initial_directory = self.initial_output_directory
 
-                # Empty file
-                with open(file_path, 'w'):
-                    pass
+                    # If suggest output directory returns None, set initial_directory to self.initial_output_directory
+                    elif initial_directory_check is None:
+                        initial_directory = self.initial_output_directory
 
-                # Log the action if logging is enabled
-                self.log_and_show(f"Double check reminder created successfully for {folder_name} in \n"
-                                  f"{self.double_check_directory}")
+                    # Catchall, use the default initial output directory
+                    else:
+                        initial_directory = self.initial_output_directory
+                else:
+                    # If suggest output directory is false, use the default initial directory
+                    initial_directory = self.initial_directory
             else:
-                # If the user declines, then do not create the double check reminder
-                self.log_and_show(f"User declined double check reminder for: {folder_name}")
-
-        except Exception as e:
-            # Handle any errors that may occur
-            self.log_and_show(f"Double check reminder was not created successfully: {str(e)}",
-                              create_messagebox=True, error=True)
-
-    def load_last_used_file(self):
-        """
-        Load the last used file based on the current frame and update the display accordingly.
+                # If no input is selected, use the default initial output directory
+                initial_directory = self.initial_output_directory
 
-        Notes:
-        - Handles last used file loading for different frames (file_renamer, name_normalizer, video_editor).
-        - Logs the action if logging is enabled.
-        """
-        if self.frame_name == "file_renamer_window":
-            # Check if the file_renamer_last_used_file variable is provided and the input exists
-            if self.file_renamer_last_used_file and os.path.exists(self.file_renamer_last_used_file):
-                # Set the selected file to the file renamer last used file and update display
-                self.file_renamer_selected_file = self.file_renamer_last_used_file
+            # Ask for the output directory
+            self.output_directory = filedialog.askdirectory(initialdir=initial_directory)
 
-                self.file_renamer_queue = []
-                self.update_file_display()
+            # If output directory, update the entry field in the gui
+            if self.output_directory:
+                self.output_directory_entry.delete(0, ctk.END)
+                self.output_directory_entry.insert(0, self.output_directory)
 
-                # Log the action if logging is enabled
-                self.log_and_show(f"Input selected via Reload Last File: "
-                                  f"{os.path.basename(self.file_renamer_selected_file)}")
-            else:
-                self.log_and_show("No last used File Renamer input found.",
-                                  create_messagebox=True, error=True)
         elif self.frame_name == "name_normalizer_window":
-            # Check if the name_normalizer_last_used_file variable is provided and the input exists
-            if self.name_normalizer_last_used_file and os.path.exists(self.name_normalizer_last_used_file):
-                # Set the name normalizer selected input to the name normalizer last used input and update display
-                self.name_normalizer_selected_file = self.name_normalizer_last_used_file
+            # Ask for the output directory
+            self.name_normalizer_output_directory = filedialog.askdirectory(initialdir=self.initial_output_directory)
 
-                # Update the Name Normalizer display
-                self.update_nn_display()
+            # If name normalizer output directory, update the entry field in the GUI
+            if self.name_normalizer_output_directory:
+                self.move_directory_entry.delete(0, ctk.END)
+                self.move_directory_entry.insert(0, self.name_normalizer_output_directory)
 
-                # Log the action if logging is enabled
-                self.log_and_show(
-                    f"Last used Name Normalizer input selected: "
-                    f"{os.path.basename(self.name_normalizer_selected_file)}")
-            else:
-                self.log_and_show("No last used Name Normalizer input found.",
-                                  create_messagebox=True, error=True)
         elif self.frame_name == "video_editor_window":
-            # Check if the video_editor_last_used_file variable is provided and the input exists
-            if self.video_editor_last_used_file and os.path.exists(self.video_editor_last_used_file):
-                # Set the video editor selected file to the video editor last used file and update display
-                self.video_editor_selected_file = self.video_editor_last_used_file
-                filename = os.path.basename(self.video_editor_selected_file)
-
-                # Set the selected input to the input entry widget
-                self.input_method_entry.delete(0, ctk.END)
-                self.input_method_entry.insert(0, filename)
+            # Ask for the output directory
+            self.video_editor_output_directory = filedialog.askdirectory(initialdir=self.initial_output_directory)
 
-                # Log the action if logging is enabled
-                self.log_and_show(f"Last used Video Editor input selected: {filename}")
-            else:
-                self.log_and_show("No last used Video Editor input found.",
-                                  create_messagebox=True, error=True)
+            # If video editor output directory, update the entry field in the GUI
+            if self.video_editor_output_directory:
+                self.video_editor_output_directory_entry.delete(0, ctk.END)
+                self.video_editor_output_directory_entry.insert(0, self.video_editor_output_directory)
 
-    def send_to_module(self, destination: str):
+    def suggest_output_directory(self, file_path: str = None):
         """
-        Send the selected file to the specified module and perform necessary updates.
-
-        Args:
-        - destination (str): The name of the destination module ("file_renamer_module", "name_normalizer_module",
-        "video_editor_module").
+        Suggests an output directory based on the selected file's artist.
 
-        Notes:
-        - Clears the selection for the source module.
-        - Updates the display based on the selected file and the destination module.
-        - Logs the action if logging is enabled.
-        - Switches frames to the specified destination module.
+        Parameters:
+        - file_path (str, optional): The file to suggest a directory for. Defaults to the selected file.
 
+        Returns:
+        - If there is a single match, return the matching artist folder.
+        - If matches, returns the list of matching artist folder(s).
+        - If no matching artist folder is found or encountered an error, returns None.
         """
-        if self.frame_name == "file_renamer_window":
-            selected_file = self.file_renamer_selected_file
-        elif self.frame_name == "name_normalizer_window":
-            selected_file = self.name_normalizer_selected_file
-        elif self.frame_name == "video_editor_window":
-            selected_file = self.video_editor_selected_file
-        else:
-            # Invalid frame name
-            return
+        # Default to the selected file
+        file_path = file_path or self.file_renamer_selected_file
 
-        if not selected_file:
-            # Input not selected
-            self.log_and_show("No input selected. Cannot send to module",
+        # Check if an input is selected
+        if not file_path:
+            # If no input is selected, return None
+            self.log_and_show("No input selected. Using default initial directory.")
+            return None
+
+        # Check if self.artist_directory exists
+        if not os.path.exists(self.artist_directory):
+            # If artist directory does not exist, display an error message and return none
+            self.log_and_show(f"Suggest Output Directory cannot function as intended since the Artist Directory"
+                              f" does not exist."
+                              f"\nUsing default output directory as the fallback."
+                              f"\nPlease ensure Artist Directory: '{self.artist_directory}' exists.",
                               create_messagebox=True, error=True)
-            return
+            return None
 
-        # Send to File Renamer
-        if destination == "file_renamer_module":
-            # Clear selection for the file_renamer_window
-            self.clear_selection(frame_name="file_renamer_window")
+        try:
+            # Create a list from self.artist_directory
+            artist_folders = os.listdir(self.artist_directory)
 
-            # Set the name normalizer selected file to the file renamer selected file and update display
-            self.file_renamer_selected_file = selected_file
+            # Use self.excluded_folders to remove any matches (case-insensitive) from the list
+            excluded_folders_lower = [folder.lower() for folder in self.excluded_folders]
+            artist_folders = [folder for folder in artist_folders if folder.lower() not in excluded_folders_lower]
 
-            # Update the File Renamer display
-            self.update_file_display()
+            # Extract the base name from the selected file
+            base_name = os.path.basename(file_path)
+            base_name_lower = base_name.lower()  # Case insensitive comparison
 
-            # Add artist common categories to the queue
-            if self.artist_common_categories_var.get():
-                self.add_remove_common_categories_to_queue()
+            # Extract the artist from the filename
+            matching_artists = []
 
-            # Log the action if logging is enabled
-            self.log_and_show(f"Input selected via send to module: "
-                              f"{os.path.basename(self.file_renamer_selected_file)}")
+            # Use the filtered list to match the artist_folder
+            for artist_folder in artist_folders:
+                if artist_folder.lower() in base_name_lower:
+                    # Construct the artist folder path
+                    artist_folder_path = os.path.join(self.artist_directory, artist_folder)
 
-            # Clear selection for the source module
-            self.clear_selection(frame_name=self.frame_name)
+                    # Verify the folder exists
+                    if os.path.exists(artist_folder_path) and os.path.isdir(artist_folder_path):
+                        matching_artists.append(artist_folder_path)
 
-            # Switch frames to the File Renamer
-            self.file_renamer_button_event()
+            # Check if there are multiple matches
+            if len(matching_artists) > 1:
+                # If multiple matches, return the list
+                return matching_artists
 
-        # Send to Name Normalizer
-        elif destination == "name_normalizer_module":
-            # Clear selection for the name_normalizer_window
-            self.clear_selection(frame_name="name_normalizer_window")
+            elif len(matching_artists) == 1:
+                # If only one match found, return that
+                return matching_artists[0]
 
-            # Set the source selected file to the Name Normalizer selected file
-            self.name_normalizer_selected_file = selected_file
+            else:
+                # If no matching artist folder is found, return none
+                self.log_and_show("Cannot suggest output directory. Falling back to default output directory.")
+                return None
 
-            # Log the action if logging is enabled
-            self.log_and_show(f"Input selected via send to module: "
-                              f"{os.path.basename(self.name_normalizer_selected_file)}")
+        except Exception as e:
+            # Handle any unexpected exceptions and log an error message
+            self.log_and_show(f"Unexpected error suggesting an output directory: {e}",
+                              create_messagebox=True, error=True)
+            return None
 
-            # Clear selection for the source module
-            self.clear_selection(frame_name=self.frame_name)
+    def handle_rename_success(self, new_path: str, original_path: str = None):
+        """
+        Handles the success of a file renaming operation.
 
-            # Update the Name Normalizer display
-            self.update_nn_display()
+        Parameters:
+        - new_path (str): The new path after the file renaming operation.
+        - original_path (str, optional): The path before the operation. Defaults to the selected file.
+        """
+        # Store information about the rename operation in the history
+        original_path = original_path or self.file_renamer_selected_file
+        self.history_store.push("file_renamer", [(original_path, new_path)])
 
-            # Switch frames to the Name Normalizer
-            self.name_normalizer_button_event()
+        # Reset selected file and queue, unless another file was selected while the rename ran in the background
+        if self.file_renamer_selected_file == original_path:
+            self.file_renamer_selected_file = ""
+            self.file_renamer_queue = []
+            self.file_display_text.set("")
+            self.name_length_text.set("")
+            self.prefix_text_entry.delete(0, ctk.END)
+            self.custom_text_entry.delete(0, ctk.END)
 
-        # Send to Video Editor
-        elif destination == "video_editor_module":
-            # Confirm if the input is a valid file for the video editor window
-            if any(selected_file.lower().endswith(ext) for ext in self.valid_extensions):
-                # Clear selection for the video_editor_window
-                self.clear_selection(frame_name="video_editor_window")
+        # Update file renamer last used file
+        self.file_renamer_last_used_file = new_path
 
-                # Initialize video editor selected file to selected file from source module
-                self.video_editor_selected_file = selected_file
-                filename = os.path.basename(self.video_editor_selected_file)
+        # Get the base name and truncate after x characters
+        last_used_name = os.path.basename(new_path)
+        if len(last_used_name) > 115:
+            last_used_name = last_used_name[:115]
+        self.last_used_display.configure(text=last_used_name)
 
-                # Clear selection for the source module
-                self.clear_selection(frame_name=self.frame_name)
+        if self.reset_output_directory_var.get():
+            # Clear and reset the Output Directory
+            self.output_directory = ""
+            self.output_directory_entry.delete(0, ctk.END)
+
+        # Check if the double check reminder variable is true
+        if self.double_check_var.get():
+            # Call the double check reminder function
+            self.double_check_reminder(new_path)
+
+        # Log the action if logging is enabled
+        self.log_and_show("File renamed and saved successfully")
+
+    """
+    Category Management
+    """
+
+    def add_category(self) -> None:
+        """
+        Add a new category to the dictionary with the specified weight,
+        save the updated categories to the file, and refresh the category buttons in the GUI.
+
+        Returns:
+            None
+        """
+        # Get the new category from the add category entry widget
+        new_category = self.category_entry.get().strip()
 
-                # Set the video editor selected file to the input_method_entry
-                self.input_method_entry.insert(0, filename)
+        # Get the weight from the GUI entry field
+        weight_entry_value = self.weight_entry.get().strip()
 
-                # Log the action and display the message in the GUI
-                self.log_and_show(f"Input selected via send to module: {filename}")
+        if not new_category:
+            # If the new category is an empty string, log an error message and return
+            self.log_and_show("Add Category cannot be empty.",
+                              create_messagebox=True, error=True)
+            return
 
-                # Switch frames to the video editor
-                self.video_editor_button_event()
-            else:
-                # Input not selected
-                self.log_and_show("Non-video input detected. Cannot send to Video Editor",
-                                  create_messagebox=True, error=True)
-        else:
-            # Invalid frame name
-            self.log_and_show("Invalid frame name for send to module",
+        try:
+            # Use the provided weight if it's an integer, otherwise use the default weight
+            weight = int(weight_entry_value) if weight_entry_value else int(self.default_weight)
+        except ValueError:
+            self.log_and_show("Weight must be an integer. Please try again with a number",
                               create_messagebox=True, error=True)
             return
 
-    def on_file_drop(self, event):
-        """
-        Handle the event when a file is dropped onto the application window.
+        if new_category:
+            # Convert to lowercase for case-insensitive check
+            new_category_lower = new_category.lower()
+            # Prevent duplicate entries in the json file
+            if new_category_lower not in map(lambda x: x.lower(), self.categories.keys()):
+                # Add the new category to the dictionary with the specified weight
+                self.categories[new_category] = weight
+                # Save the updated categories to the file
+                self.update_json(self.dictionary_file, "categories", self.categories)
+                # Refresh the category buttons in the GUI
+                self.refresh_category_buttons()
 
-        Args:
-        - event (Event): The event object representing the file drop.
+                # Log the action if logging is enabled
+                self.log_and_show(f"Category added: '{new_category}' with weight({weight})")
+            else:
+                # Log the action if logging is enabled
+                self.log_and_show(f"'{new_category}' already exists. Skipping.",
+                                  create_messagebox=True, error=True)
 
-        Notes:
-        - Initializes the selected file variable to the dropped file.
-        - Extracts the file name from the path for GUI-friendly presentation.
-        - Assigns the selected file variable to the correct file depending on the active frame.
-        - Clears and updates the corresponding entry widgets and variables.
-        - Opens the input file if the corresponding option is set.
-        - Adds artist common categories to the queue if the option is set.
-        - Logs the action and displays the message in the GUI.
+        # Reset the category entries
+        if self.reset_add_remove_var.get():
+            # Clear the category entry and weight entry fields
+            self.category_entry.delete(0, ctk.END)
+            self.weight_entry.delete(0, ctk.END)
+
+            # Set the default variable
+            self.weight_var.set(self.default_weight)
 
+    def remove_category(self):
         """
-        # Initialize the selected file variable to the dropped file
-        selected_file = event.data.strip('{}')
+        Remove a category from the dictionary, save the updated categories to the file,
+        and refresh the category buttons in the GUI.
 
-        # Extract the file name from the path for GUI-friendly presentation
-        filename = os.path.basename(selected_file)
+        Returns:
+            None
+        """
+        # Get the category to be removed from the remove category entry widget
+        category_to_remove = self.remove_category_entry.get().strip()
 
-        # Assign the selected file variable to the correct file depending on the active frame
-        if self.frame_name == "name_normalizer_window":
-            self.name_normalizer_selected_file = selected_file
+        if not category_to_remove:
+            # If the category to be removed is an empty string, log an error message and return
+            self.log_and_show("Remove Category cannot be empty.", create_messagebox=True, error=True)
+            return
 
-            # Update the Name Normalizer display
-            self.update_nn_display()
-        elif self.frame_name == "video_editor_window":
-            self.video_editor_selected_file = selected_file
+        # Check for a case-sensitive match
+        if category_to_remove in self.categories:
+            # Remove the category from the dictionary
+            del self.categories[category_to_remove]
+            # Save the updated categories to the file
+            self.update_json(self.dictionary_file, "categories", self.categories)
+            # Refresh the category buttons in the GUI
+            self.refresh_category_buttons()
 
-            # Set the selected file to the input entry widget
-            self.input_method_entry.delete(0, ctk.END)
-            self.input_method_entry.insert(0, filename)
-        # Default to File Renamer module (file_renamer_window)
+            # Log the action if logging is enabled
+            self.log_and_show(f"Category removed: {category_to_remove}")
         else:
-            self.file_renamer_selected_file = selected_file
-
-            # Remove the default entries text
-            self.prefix_text_entry.delete(0, ctk.END)
-            self.custom_text_entry.delete(0, ctk.END)
-
-            self.file_renamer_queue = []
-            self.update_file_display()
-
-            # Open the input if the corresponding option is set
-            if self.open_on_file_drop_var.get():
-                self.open_file(selected_file)
+            # Check for a case-insensitive match
+            matching_category = next((key for key in self.categories if key.lower() == category_to_remove.lower()),
+                                     None)
+            if matching_category:
+                # Remove the case-insensitive matched category from the dictionary
+                del self.categories[matching_category]
+                # Save the updated categories to the file
+                self.update_json(self.dictionary_file, "categories", self.categories)
+                # Refresh the category buttons in the GUI
+                self.refresh_category_buttons()
 
-            # Add artist common categories to the queue
-            if self.artist_common_categories_var.get():
-                self.add_remove_common_categories_to_queue()
+                # Log the action if logging is enabled
+                self.log_and_show(f"Category removed: {matching_category}")
+            else:
+                # Log the action if logging is enabled
+                self.log_and_show(f"'{category_to_remove}' not found in dictionary. Skipping.",
+                                  create_messagebox=True, error=True)
 
-        # Log the action and display the message in the GUI
-        self.log_and_show(f"Input selected via drop: {filename}")
+        # Reset the category entries
+        if self.reset_add_remove_var.get():
+            # Clear the remove category entry field
+            self.remove_category_entry.delete(0, ctk.END)
 
-    def open_file(self, file_to_open: str):
+    def create_category_button(self, tab, category):
         """
-        Opens the specified file using the default system program.
+        Create a category button within a specified tab.
 
         Parameters:
-        - file_to_open (str): The path of the file to be opened.
+            tab: The tab in which the button will be created.
+            category (str): The category for which the button is created.
 
         Returns:
-        - None
+            ctk.CTkButton: The created category button.
         """
-        # Check if the input exists
-        if not os.path.exists(file_to_open):
-            # If the provided input does not exist, log an error and return
-            self.log_and_show(f"Cannot open input as it does not exist: {file_to_open}",
-                              create_messagebox=True, error=True)
-            return
-
-        # Get the filename from the file path
-        filename = os.path.basename(file_to_open)
+        # Set the category to the button text variable for potential formatting
+        button_text = category
 
-        # If the input path is not empty, try to open the input using the default system program
-        if file_to_open:
-            try:
-                subprocess.Popen(['xdg-open', file_to_open])
+        if self.truncate_var.get():
+            # Truncate the text after x characters for GUI friendly formatting.
+            button_text = f"{category[:13]}..." if len(button_text) > 16 else category
 
-                # Log a success message if the input is opened successfully
-                self.log_and_show(f"Input opened: {filename}")
-            except OSError as e:
-                # If an error occurs while opening the file, log the error
-                self.log_and_show(f"{str(e)}", create_messagebox=True, error=True)
+        return ctk.CTkButton(tab, text=button_text, command=lambda c=category: self.add_to_queue(c))
 
-    def update_file_display(self, *_) -> None:
+    def refresh_category_buttons(self, *_):
         """
-        Update the file display based on the selected file and user input.
+        Refresh the category buttons by destroying existing tabs and buttons,
+        loading categories, and creating new tabs and buttons.
 
-        Args:
-        - *_: Variable number of arguments (unused in this method).
+        Parameters:
+            *_: Variable number of positional arguments (ignored in the function)
 
         Returns:
             None
-
-        Notes:
-        - Gathers data from the GUI including base name, weighted categories, prefix text, custom text, and extension.
-        - Constructs the proposed name using gathered information.
-        - Sets the proposed name to the char_length variable.
-        - Sets the proposed name to the display text.
-        - Handles name length constraints, truncating if necessary.
-        - Updates the file display and name length variables.
-
         """
-        if not self.file_renamer_selected_file:
-            # Set the file display to an empty string and return
-            self.file_display_text.set("")
-            return
-
-        # Gather the data from the GUI
-        (base_name, weighted_categories, prefix_text, custom_text, extension) = self.gather_and_sort()
-
-        # Construct the name
-        (proposed_name, char_length) = self.construct_new_name(base_name, weighted_categories, prefix_text,
-                                                               custom_text, extension)
+        # Destroy existing tabs and buttons
+        if hasattr(self, 'cat_tabview') and self.cat_tabview:
+            self.cat_tabview.destroy()
+        for button in getattr(self, 'buttons', []):
+            button.destroy()
 
-        # Set the proposed name to the file display
-        self.file_display_text.set(proposed_name)
+        # Load categories from the file or create an empty dictionary
+        self.initialize_json()
 
-        # Set the length of the name to the name_length_text
-        self.name_length_text.set(char_length)
+        # Create the cat_tabview and buttons
+        self.create_cat_tabview()
 
-        # Handle name length constraints
-        if char_length > 255:
-            self.name_length_handler(char_length)
+    def create_cat_tabview(self):
+        """
+        Create the category tabview and populate it with buttons based on category weights.
 
-    def name_length_handler(self, char_length: int):
+        Returns:
+            None
         """
-        Handle name length constraints for the proposed file name.
+        # Rebuild the category search index so searches reflect the loaded dictionary
+        self.category_search_index = CategorySearchIndex(self.categories.keys(),
+                                                         fuzzy=self.fuzzy_category_search_var.get())
+        self.update_category_search()
 
-        Args:
-        - char_length (int): Length of the proposed file name.
+        # Create cat_tabview (row 0 of cat_button_frame is the category search)
+        self.cat_tabview = ctk.CTkTabview(self.cat_button_frame)
+        self.cat_tabview.grid(row=1, column=0)
 
-        """
-        if char_length > 255:
-            # Check if there is an entry in the queue list
-            if len(self.file_renamer_queue) == 0:
-                self.log_and_show("The proposed file name exceeds 255 characters. "
-                                  "Operating system limitations prohibit this. Please remove some of your custom text"
-                                  " and try again.",
-                                  create_messagebox=True, error=True)
-            elif len(self.file_renamer_queue) > 0:
-                # Display the length of the category word + 1
-                categories_with_lengths = self.get_lengths(self.file_renamer_queue)
+        # Create a tab for all categories
+        all_cat_tab = self.cat_tabview.add("All")
+        self.cat_tabs["All"] = all_cat_tab  # Store the reference to the tab
 
-                # Prompt the user to choose from the list using SelectOptionWindow
-                chosen_category = self.selection_window(title="Name Length Error",
-                                                        prompt="The proposed file name exceeds 255 characters. "
-                                                               "\nOperating system limitations prohibit this. "
-                                                               "\nPlease choose a category to remove:",
-                                                        label_text="Choose Category",
-                                                        item_list=self.file_renamer_queue,
-                                                        item_text=categories_with_lengths)
+        # Create a tab for "Most Categories" with weights 1-9
+        most_cat_tab = self.cat_tabview.add("Most")
+        self.cat_tabs["Most"] = most_cat_tab  # Store the reference to the tab
 
-                if chosen_category:
-                    # Remove the category from the queue
-                    self.remove_from_queue(chosen_category)
+        # Skip rendering every button for large dictionaries and rely on the category search instead
+        if not self.render_category_buttons_var.get():
+            for tab in (all_cat_tab, most_cat_tab):
+                ctk.CTkLabel(tab, text="Category buttons are disabled. Use the search above to find a "
+                                       "category.").grid(row=0, column=0, padx=5, pady=5)
+            weights = []
+        # Sort the weight tab_names
+        elif self.sort_tab_names_var.get():
+            # Determine the order to sort (forward or backward)
+            sort_reverse_order_var = True if self.sort_reverse_order_var.get() else False
 
-    def undo_last(self):
-        """
-        Undo the last category added to the file renamer queue.
+            # Create a tab for each sorted weight
+            weights = sorted(list(set(self.categories.values())), reverse=sort_reverse_order_var)
+        else:
+            # Create a tab for each weight
+            weights = set(self.categories.values())
 
-        Notes:
-        - Removes the last category from the queue and updates the file display.
-        - Logs the action if logging is enabled.
+        # Reset the weight tab buttons so a refresh never destroys stale buttons twice
+        self.buttons = []
+
+        for weight in weights:
+            # Set either custom names or use the default weight naming scheme
+            if self.use_custom_tab_names_var.get() and weight in self.weight_to_tab_name:
+                tab_name = self.weight_to_tab_name[weight]
+            else:
+                tab_name = f"Weight {weight}"
 
-        """
-        if self.file_renamer_queue:
-            # Remove the last category from the queue and update display
-            self.file_renamer_queue.pop()
-            self.update_file_display()
-            self.log_and_show("Last category removed", not_logging=True)
-        else:
-            # Log the action if logging is enabled
-            self.log_and_show("Nothing in the queue. Nothing to undo.",
-                              create_messagebox=True, error=True)
+            tab = self.cat_tabview.add(tab_name)
 
-    def undo_file_rename(self):
-        """
-        Undo the last file renaming or name normalization operation.
+            self.cat_tabs[weight] = tab  # Store the reference to the tab
 
-        This method checks the current frame and attempts to revert the changes made
-        in the last file renaming or name normalization operation. It provides a confirmation
-        prompt before performing the undo operation.
+            # Filter categories based on weight and sort case-insensitively
+            weight_categories = sorted([category for category, w in self.categories.items() if w == weight],
+                                       key=lambda x: x.lower())
 
-        Returns:
-            None
-        """
-        if self.frame_name == "file_renamer_window":
-            if self.history:
-                # Get the last operation from the history
-                last_operation = self.history.pop()
+            # Batch processing for button creation
+            buttons = [self.create_category_button(tab, category) for category in weight_categories]
 
-                # Extract the information needed to revert the changes
-                original_path, new_path = last_operation['original_path'], last_operation['new_path']
+            for i, button in enumerate(buttons):
+                button.grid(row=i // self.column_numbers, column=i % self.column_numbers, padx=5, pady=5)
 
-                # Ask for confirmation of the undo file rename operation
-                confirmation = self.ask_confirmation("Undo File Rename",
-                                                     f"Do you want to undo the file rename operation?: "
-                                                     f"\n{os.path.basename(new_path)}"
-                                                     f"\nOriginal name: "
-                                                     f"\n{os.path.basename(original_path)}")
+            self.buttons = buttons
 
-                if confirmation:
-                    try:
-                        # Attempt to revert the changes by renaming the file back to the original path
-                        os.rename(new_path, original_path)
+        # Create buttons for all categories in the "All Categories" tab
+        all_categories = sorted(self.categories.keys(), key=lambda x: x.lower()) \
+            if self.render_category_buttons_var.get() else []
+        all_buttons = [self.create_category_button(all_cat_tab, category) for category in all_categories]
 
-                        # Log and display a message
-                        self.log_and_show(f"Undo successful. File reverted to: \n{original_path}")
+        for i, button in enumerate(all_buttons):
+            button.grid(row=i // self.column_numbers, column=i % self.column_numbers, padx=5, pady=5)
 
-                        # Set the last used file
-                        self.file_renamer_last_used_file = original_path
-                    except OSError as e:
-                        if "Invalid cross-device link" in str(e):
-                            # Attempt to use shutil.move if "Invalid cross-device link" error
-                            try:
-                                shutil.move(new_path, original_path)
-                                self.log_and_show(
-                                    f"File: '{os.path.basename(new_path)}' renamed and moved successfully. "
-                                    f"\nSaved to: \n{original_path}")
-                                # Set the last used file
-                                self.file_renamer_last_used_file = original_path
-                            except Exception as move_error:
-                                # Log the action if shutil.move also fails
-                                self.log_and_show(f"Renaming and moving file failed: {str(move_error)}",
-                                                  create_messagebox=True, error=True)
-                        else:
-                            # Log the action for other OSError
-                            self.log_and_show(f"{str(e)}", create_messagebox=True, error=True)
+        self.all_buttons = all_buttons
 
-                else:
-                    # If the user declines, re-add the operation to the history
-                    self.history.append(last_operation)
-                    return
-            else:
-                # Log the action if logging is enabled
-                self.log_and_show("No previous file rename operation. Nothing to undo.", create_messagebox=True,
-                                  error=True)
+        # Create buttons for categories with weights 1-default_most_number in the "Most Categories" tab
+        most_categories = [category for category, w in self.categories.items() if 1 <= w <= self.default_most_number] \
+            if self.render_category_buttons_var.get() else []
+        # Sort the categories alphabetically and ignore case
+        most_categories_sorted = sorted(most_categories, key=lambda x: x.lower())
+        # Create buttons for the sorted categories
+        most_buttons = [self.create_category_button(most_cat_tab, category) for category in most_categories_sorted]
 
-        elif self.frame_name == "name_normalizer_window":
-            if self.nn_history:
-                # Get the last operation from the nn_history
-                last_operation = self.nn_history.pop()
+        for i, button in enumerate(most_buttons):
+            button.grid(row=i // self.column_numbers, column=i % self.column_numbers, padx=5, pady=5)
 
-                # Extract the information needed to revert the changes
-                original_paths, new_paths = last_operation['original_paths'], last_operation['new_paths']
+        self.most_buttons = most_buttons
 
-                # Filter out None values from new_paths
-                new_paths = [path for path in new_paths if path is not None]
+        # Attempt to set the default tab
+        try:
+            # Check if self.default_cat_tab is in the tab names
+            if self.default_cat_tab and self.cat_tabview.index(self.default_cat_tab) is not None:
+                self.cat_tabview.set(self.default_cat_tab)
+        except ValueError:
+            return
 
-                # Truncate paths if they exceed a certain limit (Beautify the data for the gui)
-                max_display_paths = 3
-                truncated_original_paths = original_paths[:max_display_paths]
-                truncated_new_paths = new_paths[:max_display_paths]
-                truncated_original_paths_str = ', '.join(os.path.basename(path) for path in truncated_original_paths)
-                truncated_new_paths_str = ', '.join(os.path.basename(path) for path in truncated_new_paths)
-                if len(original_paths) > max_display_paths:
-                    truncated_original_paths_str += f", and {len(original_paths) - max_display_paths} more..."
-                if len(new_paths) > max_display_paths:
-                    truncated_new_paths_str += f", and {len(new_paths) - max_display_paths} more..."
+    def update_category_search(self, *_):
+        """
+        Update the category search results for the text in the category search entry.
 
-                # Ask for confirmation of the undo name normalizer operation
-                confirmation = self.ask_confirmation("Undo Name Normalizer",
-                                                     f"Do you want to undo the name normalizer operation?: "
-                                                     f"\n{truncated_new_paths_str}"
-                                                     f"\n\nOriginal names: "
-                                                     f"\n{truncated_original_paths_str}")
+        Parameters:
+            *_: Variable number of positional arguments (ignored in the function)
 
-                if confirmation:
-                    try:
-                        # Attempt to revert the changes by renaming/moving the files back to their original paths
-                        for original_path, new_path in zip(original_paths, new_paths):
-                            # Check if new path is provided and skip if the there is no change
-                            if new_path is not None and (original_path != new_path):
-                                try:
-                                    # Check if the file exists
-                                    if not os.path.isfile(new_path):
-                                        # Raise error if not found
-                                        raise FileNotFoundError
+        Returns:
+            None
+        """
+        # Do nothing until the search entry and index exist
+        if not self.category_search_entry or self.category_search_index is None:
+            return
 
-                                    # Rename the file
-                                    os.rename(new_path, original_path)
-                                except FileNotFoundError:
-                                    # Handle the file not found error and log an error message
-                                    self.log_and_show(f"File not found: "
-                                                      f"\n{new_path}",
-                                                      create_messagebox=True, error=True)
-                                    continue
-                                except OSError as e:
-                                    # Use shutil as a fallback
-                                    if "Invalid cross-device link" in str(e):
-                                        try:
-                                            # Rename the file and move it across devices
-                                            shutil.move(new_path, original_path)
-                                        except Exception as e:
-                                            # Handle any exceptions and log an error message
-                                            self.log_and_show(f"Unexpected error renaming: "
-                                                              f"\n{new_path}"
-                                                              f"\n{original_path} "
-                                                              f"\n{e}",
-                                                              create_messagebox=True, error=True)
-                                            continue
+        # Search the index, limited to a single row of buttons
+        self.category_search_results = self.category_search_index.search(self.category_search_entry.get(),
+                                                                          limit=len(self.category_search_buttons))
 
-                        # Log and display a message
-                        self.log_and_show(f"Undo successful. Files reverted to: \n{', '.join(original_paths)}")
+        # Reuse the result buttons instead of creating new widgets on every keystroke
+        for i, button in enumerate(self.category_search_buttons):
+            if i < len(self.category_search_results):
+                category = self.category_search_results[i]
+                button_text = category
 
-                        # Set the last used file
-                        self.name_normalizer_last_used_file = original_paths[-1]
-                    except OSError as e:
-                        # Log the action for other OSError
-                        self.log_and_show(f"{str(e)}", create_messagebox=True, error=True)
+                if self.truncate_var.get():
+                    # Truncate the text after x characters for GUI friendly formatting.
+                    button_text = f"{category[:13]}..." if len(button_text) > 16 else category
 
-                else:
-                    # If the user declines, re-add the operation to the nn_history
-                    self.nn_history.append(last_operation)
-                    return
+                button.configure(text=button_text, command=lambda c=category: self.add_to_queue(c))
+                button.grid(row=0, column=i, padx=5, pady=5)
             else:
-                # Log the action if logging is enabled
-                self.log_and_show("No previous name normalizer operation. Nothing to undo.", create_messagebox=True,
-                                  error=True)
+                button.grid_remove()
 
-    def clear_selection(self, frame_name: str, reset_all=True) -> None:
+    def queue_top_category_search_result(self, *_):
         """
-        Clear the selected options and input fields based on the provided frame name.
+        Add the top category search result to the queue and clear the search.
 
         Parameters:
-            frame_name (str): The name of the frame for which to clear the selection.
-            reset_all (bool, optional): Boolean to track whether to reset everything or just the values.
+            *_: Variable number of positional arguments (ignored in the function)
 
         Returns:
             None
         """
-        if frame_name == "file_renamer_window":
-            self.file_renamer_selected_file = ""
-            self.file_renamer_queue = []
-            self.name_length_text.set("")
-
-            # Clear text entries and reset output directory
-            self.prefix_text_entry.delete(0, ctk.END)
-            self.custom_text_entry.delete(0, ctk.END)
-            self.output_directory = ""
-            self.output_directory_entry.delete(0, ctk.END)
-
-            # Update file display
-            self.update_file_display()
-
-        elif frame_name == "name_normalizer_window":
-            self.name_normalizer_selected_file = ""
-            self.name_normalizer_output_directory = ""
+        # Refresh the results in case the entry changed without a key release (e.g. pasted text)
+        self.update_category_search()
 
-            self.prefix_entry.delete(0, ctk.END)
-            self.suffix_entry.delete(0, ctk.END)
-            self.original_entry.delete(0, ctk.END)
-            self.replace_entry.delete(0, ctk.END)
+        if not self.category_search_results:
+            self.log_and_show("No category matches the search.", not_logging=True)
+            return
 
-            self.move_directory_entry.delete(0, ctk.END)
-            self.custom_text_removal_entry.delete(0, ctk.END)
+        # Clear the search before queueing so the results do not linger
+        category = self.category_search_results[0]
+        self.clear_category_search()
+        self.add_to_queue(category)
 
-            # Update the Name Normalizer display
-            self.update_nn_display()
+    def clear_category_search(self, *_):
+        """
+        Clear the category search entry and hide the results.
 
-        elif frame_name == "video_editor_window":
-            if reset_all:
-                self.video_editor_selected_file = ""
+        Parameters:
+            *_: Variable number of positional arguments (ignored in the function)
 
-                self.input_method_entry.delete(0, ctk.END)
-                self.video_editor_output_directory_entry.delete(0, ctk.END)
+        Returns:
+            None
+        """
+        if self.category_search_entry:
+            self.category_search_entry.delete(0, ctk.END)
+        self.update_category_search()
 
-            # Clear decibel entry
-            self.decibel_entry.delete(0, ctk.END)
+    def add_to_queue(self, category):
+        """
+        Add a category to the processing queue.
 
-            # Clear audio normalization entry
-            self.audio_normalization_entry.delete(0, ctk.END)
+        Parameters:
+            category (str): The category to be added to the queue.
 
-            # Clear hour entries
-            self.hour_entry.delete(0, ctk.END)
-            self.hour_entry1.delete(0, ctk.END)
+        Returns:
+            None
+        """
+        if not self.file_renamer_selected_file:
+            # If no input selected, log the action and display a message in the GUI
+            self.log_and_show("Please select an input first and then add a word to the queue.",
+                              create_messagebox=True, error=True)
+            return
 
-            # Clear minute entries
-            self.minute_entry.delete(0, ctk.END)
-            self.minute_entry1.delete(0, ctk.END)
+        # Check if the category is not already in the queue
+        if category not in self.file_renamer_queue:
+            # Add the category to the queue
+            self.file_renamer_queue.append(category)
+            self.log_and_show(f"Word added to queue: {category}", not_logging=True)
 
-            # Clear second entries
-            self.second_entry.delete(0, ctk.END)
-            self.second_entry1.delete(0, ctk.END)
+        # Check if the category is already in the queue
+        elif category in self.file_renamer_queue:
+            # Ask for confirmation of removing the category from the queue
+            confirmation = self.ask_confirmation("Queue Conflict",
+                                                 f"{category} is already in the queue. Do you want to remove it?")
 
-            """Set the default variables"""
-            # Set the decibel entry
-            self.decibel_var.set(self.default_decibel)
+            if confirmation:
+                # Remove the category from the queue
+                self.remove_from_queue(category)
 
-            # Set the audio normalization entry
-            self.audio_normalization_var.set(self.default_audio_normalization)
+        # Update file display (debounced so bursts of queue changes only rebuild the preview once)
+        self.schedule_file_display_update()
 
-            # Set the hour entries
-            self.hour_var.set(self.default_hour)
-            self.hour_var1.set(self.default_hour)
+    def remove_from_queue(self, category, suppress=False):
+        """
+        remove_from_queue(category, suppress=False)
 
-            # Set the minute entries
-            self.minute_var.set(self.default_minute)
-            self.minute_var1.set(self.default_minute)
+        Removes a word from the queue based on the specified category.
 
-            # Set the second entries
-            self.second_var.set(self.default_second)
-            self.second_var1.set(self.default_second)
+        Parameters:
+        - category (str): The category of the word to be removed from the queue.
+        - suppress (bool): If True, suppresses log and show messages when the word is not in the queue.
 
-        elif frame_name == "add_remove_window":
-            # Get the active tab from the add_remove_tabview
-            active_tab = self.add_remove_tabview.get()
+        Returns:
+        None
 
-            if active_tab == "Artist":
-                # Clear add artist entry
-                self.add_artist_entry.delete(0, ctk.END)
+        If no input file is selected, logs an error and shows a message in the GUI.
 
-                # Clear remove artist entry
-                self.remove_artist_entry.delete(0, ctk.END)
+        If the specified category is not in the queue, logs an error and shows a message unless suppress is True.
 
-                # Clear add acc artist record entry
-                self.add_acc_record_entry.delete(0, ctk.END)
+        Updates the file display after removing the word from the queue.
+        """
+        if not self.file_renamer_selected_file:
+            # If no input selected, log the action and display a message in the GUI
+            self.log_and_show("Please select an input first and then remove a word from the queue.",
+                              create_messagebox=True, error=True)
+            return
 
-                # Clear remove acc artist record entry
-                self.remove_acc_record_entry.delete(0, ctk.END)
+        # Check if the category is not already in the queue
+        if category not in self.file_renamer_queue:
+            # Check if the message is suppressed
+            if not suppress:
+                # If not suppressed, log and show the message
+                self.log_and_show(f"Word not in queue: {category}",
+                                  create_messagebox=True, error=True, not_logging=True)
+            return
 
-                # Clear acc artist
-                self.acc_selected_artist = ""
-                self.acc_display_text.set("")
+        # Remove the category from the queue
+        self.file_renamer_queue.remove(category)
+        self.log_and_show(f"Word removed from queue: {category}", not_logging=True)
 
-                # Clear add acc entry
-                self.add_acc_entry.delete(0, ctk.END)
+        # Update file display (debounced so bursts of queue changes only rebuild the preview once)
+        self.schedule_file_display_update()
 
-                # Clear remove acc entry
-                self.remove_acc_entry.delete(0, ctk.END)
+    def handle_common_categories_state(self, *_):
+        """
+        Handle the state change of the artist common categories variable.
 
-            elif active_tab == "Category":
-                # Clear add category entry
-                self.category_entry.delete(0, ctk.END)
+        Parameters:
+            *_: Variable number of positional arguments (ignored in the function)
 
-                self.weight_entry.delete(0, ctk.END)
+        Returns:
+            None
+        """
+        # Check if the artist common categories variable is true
+        if self.artist_common_categories_var.get():
+            # Call the add_remove_common_categories_to_queue method
+            self.add_remove_common_categories_to_queue()
+        else:
+            # Call the add_remove_common_categories_to_queue method with the remove parameter
+            self.add_remove_common_categories_to_queue(remove=True)
 
-                # Clear remove category entry
-                self.remove_category_entry.delete(0, ctk.END)
+    def add_remove_common_categories_to_queue(self, remove=False):
+        """
+        Add or remove common categories to/from the processing queue based on the selected file.
 
-                # Set the default variable
-                self.weight_var.set(self.default_weight)
+        Parameters:
+            remove (bool): Flag indicating whether to remove common categories from the queue. Default is False.
 
-            elif active_tab == "Custom Tab Name":
-                # Clear add custom tab name entry
-                self.custom_tab_name_entry.delete(0, ctk.END)
+        Returns:
+            None
+        """
+        # Check if the selected file is set
+        if not self.file_renamer_selected_file:
+            return  # Do nothing if the selected file is not set
 
-                self.weight_entry1.delete(0, ctk.END)
+        # Extract the base name from the selected file
+        base_name = os.path.basename(self.file_renamer_selected_file)
+        base_name_lower = base_name.lower()  # Convert to lowercase for case-insensitive comparison
 
-                # Clear remove custom tab name entry
-                self.remove_custom_tab_name_entry.delete(0, ctk.END)
+        # Check if there is a '-' in the name
+        if '-' not in base_name_lower:
+            # If no '-', return
+            self.log_and_show("No '-' found in the file name. Cannot identify artist for Artist Common Categories "
+                              "functionality.")
+            return
 
-                # Set the default variable
-                self.weight_var1.set(self.default_ctn_weight)
+        # Extract the artist from the text before '-'
+        artist = base_name_lower.split('-')[0].strip()
 
-            elif active_tab == "Custom Text to Replace":
-                # Clear add custom text to replace entry
-                self.add_ctr_name_entry.delete(0, ctk.END)
+        # Iterate through common categories and associated values
+        for key, values in self.artist_common_categories.items():
+            # Check if the lowercase key is present in the lowercase base name
+            if artist.find(key.lower()) != -1:
+                # Iterate through the values associated with the matching key
+                for value in values:
+                    if remove:
+                        self.remove_from_queue(value, suppress=True)  # Remove each value from the processing queue
+                    else:
+                        self.add_to_queue(value)  # Add each value to the processing queue
+                return  # Stop processing after the first match
 
-                # Clear replacement text to replace entry
-                self.replacement_text_entry.delete(0, ctk.END)
+    """
+    File Renaming
+    """
 
-                # Clear remove custom text to replace entry
-                self.remove_ctr_name_entry.delete(0, ctk.END)
+    def rename_files(self):
+        """
+        Rename selected files based on user preferences.
 
-            elif active_tab == "Exclude":
-                # Clear add exclude entry
-                self.add_exclude_name_entry.delete(0, ctk.END)
+        - Gathers data from the GUI, constructs a new name, and handles name length constraints.
+        - Moves text between '-' and '__-__' if the move_text_var is set.
+        - Looks up suggested output directories, probes for conflicts, runs the Artist Search and renames/moves the
+          file in a background task (see plan_file_rename and execute_file_rename), keeping the GUI responsive.
+        - Applies the result with handle_rename_success on the main thread.
 
-                # Clear remove exclude entry
-                self.remove_exclude_name_entry.delete(0, ctk.END)
+        """
+        # Wait for a running rename or move to another drive to finish
+        if self.file_rename_active() or self.background_move_active():
+            return
 
-            elif active_tab == "File Extensions":
-                # Clear add extension entry
-                self.add_file_extension_entry.delete(0, ctk.END)
+        # Check if an input is selected and either the queue is not empty or custom text is provided
+        if self.file_renamer_selected_file and (
+                self.file_renamer_queue or self.prefix_text_entry.get().strip() or
+                self.custom_text_entry.get().strip()):
+            # Start the rename with fresh stage timings (discarding the previews' timings)
+            self.stage_profiler.reset()
 
-                # Clear remove extension entry
-                self.remove_file_extension_entry.delete(0, ctk.END)
+            # Rename every file of a batch in one background run
+            if self.file_renamer_batch_active():
+                self.rename_batch()
+                return
 
-            elif active_tab == "NO GO":
-                # Clear add NO-GO entry
-                self.add_no_go_name_entry.delete(0, ctk.END)
+            # Gather the data from the gui
+            (base_name, weighted_categories, prefix_text, custom_text, extension) = self.gather_and_sort()
 
-                # Clear remove NO-GO entry
-                self.remove_no_go_name_entry.delete(0, ctk.END)
+            # Construct the name
+            (name, _) = self.construct_new_name(base_name, weighted_categories, prefix_text, custom_text, extension)
 
-            elif active_tab == "Valid Extensions":
-                # Clear add extension entry
-                self.add_valid_extension_entry.delete(0, ctk.END)
+            # If move_text_var is set, move the text between - and __-__
+            if self.move_text_var.get():
+                name = self.move_text(name)
 
-                # Clear remove extension entry
-                self.remove_valid_extension_entry.delete(0, ctk.END)
-            else:
-                # Invalid tab name
+            # Handle the constraints of the target filesystem before anything is touched
+            problem = self.check_file_renamer_name(name)
+            if problem:
+                self.name_length_handler(problem)
                 return
-        else:
-            # Invalid frame name
-            return
 
-        # Log action and display message on the applicable frame
-        self.log_and_show("Selection cleared", not_logging=True)
-
-    def browse_artist_file(self):
-        """
-        Open a file dialog to browse and select an artist-related file.
+            # If output directory is not explicitly set, default to the same directory as the file
+            if not self.output_directory:
+                self.output_directory = os.path.dirname(self.file_renamer_selected_file)
 
-        Updates:
-        - Sets the selected file path to the artist_file variable.
-        - Clears the entry and sets it to the artist file path in the GUI.
-        """
-        artist_file = filedialog.askopenfilename(
-            initialdir=self.initial_directory,
-            filetypes=[("Text Files", "*.txt")])
+            # Snapshot the rename so the background task never reads the GUI or the current selection
+            self.file_renamer_job = {
+                "source": self.file_renamer_selected_file,
+                "name": name,
+                "move_up_directory": self.move_up_directory_var.get(),
+                "suggest_output_directory": self.suggest_output_directory_var.get(),
+                "artist_search": self.artist_search_var.get(),
+                "ignore_known_artists": self.ignore_known_artists_var.get(),
+                "cancel_event": threading.Event()
+            }
 
-        if artist_file:
-            # Set the file to the artist file variable
-            self.artist_file = artist_file
+            # Look up the suggested output directories in the background, then choose the destination
+            self.submit_file_rename_step(self.plan_file_rename, self.choose_file_rename_destination)
 
-            # Clear the entry and set it to the artist file
-            self.artist_file_entry.delete(0, ctk.END)
-            self.artist_file_entry.insert(0, self.artist_file)
+        # If an input is selected and either the queue is empty or no custom text is provided show error
+        elif self.file_renamer_selected_file and not (
+                self.file_renamer_queue or self.prefix_text_entry.get().strip() or
+                self.custom_text_entry.get().strip()):
+            # Log the action if logging is enabled
+            self.log_and_show("Input selected but nothing added to the queue. Nothing to rename.",
+                              create_messagebox=True, error=True)
+        # If no input is selected, show error
+        elif not self.file_renamer_selected_file:
+            # Log the action if logging is enabled
+            self.log_and_show("No input selected. Nothing to rename.", create_messagebox=True, error=True)
 
-    def browse_directory(self, entry_widget, target_attribute):
+    def submit_file_rename_step(self, step, on_done):
         """
-        Open a directory dialog to browse and select a directory.
-
-        Updates:
-        - Clears the entry in the GUI and sets it to the selected directory.
-        - Updates the corresponding attribute in the class with the selected directory path.
+        Run a step of the current File Renamer job in the background and hand its future to a main thread callback.
 
         Parameters:
-        - entry_widget: The entry widget in the GUI where the selected directory path will be displayed.
-        - target_attribute: The attribute in the class to be updated with the selected directory path.
+        - step (callable): The background step, called with the job.
+        - on_done (callable): Called on the main thread with the job and the step's future.
         """
-        selected_directory = filedialog.askdirectory(initialdir=getattr(self, target_attribute))
-
-        if selected_directory:
-            # Clear the entry and set it to the selected directory
-            entry_widget.delete(0, 'end')
-            entry_widget.insert(0, selected_directory)
-            # Update the corresponding attribute in your class
-            setattr(self, target_attribute, selected_directory)
+        job = self.file_renamer_job
+        self.file_renamer_future = self.file_renamer_executor.submit(step, job)
+        self.file_renamer_future.add_done_callback(lambda future: self.run_on_main(on_done, job, future))
 
-    def browse_input(self) -> None:
+    def file_rename_step_succeeded(self, job: dict, future: concurrent.futures.Future) -> bool:
         """
-        Browse and select input files or directories based on the frame context.
+        Check the result of a File Renamer step on the main thread, ending the job if it failed or was interrupted.
+
+        Parameters:
+        - job (dict): The File Renamer job.
+        - future (concurrent.futures.Future): The step's future.
 
         Returns:
-            None
+        - bool: True if the job should continue.
         """
-        if self.frame_name == "file_renamer_window":
-            # Remove the default prefix text entry text
-            self.prefix_text_entry.delete(0, ctk.END)
-            # Remove the default custom text entry text
-            self.custom_text_entry.delete(0, ctk.END)
-
-            file_path = filedialog.askopenfilename(initialdir=self.initial_directory)
-            if file_path:
-                # Set the selected file
-                self.file_renamer_selected_file = file_path
-
-                # Clear the queue
-                self.file_renamer_queue = []
-                # Update display
-                self.update_file_display()
-
-                # Add artist common categories to the queue
-                if self.artist_common_categories_var.get():
-                    self.add_remove_common_categories_to_queue()
+        try:
+            # Stop if the job was interrupted (including while the user was choosing a directory)
+            if job["cancel_event"].is_set():
+                raise concurrent.futures.CancelledError
+            future.result()
+            return True
+        except concurrent.futures.CancelledError:
+            self.log_and_show("Rename interrupted. The file was not renamed.")
+        except Exception as e:
+            # Log the action for OSError and unexpected errors
+            self.log_and_show(f"{str(e)}", create_messagebox=True, error=True)
 
-                # Log the action if logging is enabled
-                self.log_and_show(f"Input selected via Browse: "
-                                  f"{os.path.basename(self.file_renamer_selected_file)}")
+        # End the job and save its stage timings
+        self.file_renamer_job = None
+        self.dump_profile_report("file_renamer")
+        return False
 
-        elif self.frame_name == "name_normalizer_window":
-            # Method to browse and select a folder to normalize files
-            nn_input_method = filedialog.askdirectory(initialdir=self.initial_directory,
-                                                      title="Browse a directory. Close to select a file instead")
+    def plan_file_rename(self, job: dict) -> Union[str, list, None]:
+        """
+        Background step: look up the suggested output directories of a File Renamer job.
 
-            if not nn_input_method:
-                nn_input_method = filedialog.askopenfilename(
-                    initialdir=self.initial_directory,
-                    title="Browse a file.",
-                    filetypes=[("All Files", "*.*")]
-                )
+        Parameters:
+        - job (dict): The File Renamer job.
 
-            if nn_input_method:
-                # Set the name normalizer selected file
-                self.name_normalizer_selected_file = nn_input_method
+        Returns:
+        - Union[str, list, None]: The result of suggest_output_directory, or None if it is not used.
+        """
+        if job["move_up_directory"] or not job["suggest_output_directory"]:
+            return None
 
-                # Update the Name Normalizer display
-                self.update_nn_display()
+        # Call the suggest output directory to get a suggested output directory
+        return self.suggest_output_directory(job["source"])
 
-                # Log the action if logging is enabled
-                self.log_and_show(f"Input selected via Browse: {os.path.basename(nn_input_method)}")
+    def choose_file_rename_destination(self, job: dict, future: concurrent.futures.Future):
+        """
+        Main thread step: let the user choose a suggested output directory and start the rename.
 
-        elif self.frame_name == "video_editor_window":
-            # Initially ask for a file
-            input_method = filedialog.askopenfilename(
-                initialdir=self.initial_directory,
-                title="Browse a file. Close to select a directory instead",
-                filetypes=[("All Files", "*.*")]
-            )
-            if not input_method:
-                # If no file is selected, try to get a directory
-                input_method = filedialog.askdirectory(initialdir=self.initial_directory, title="Browse a directory")
+        Parameters:
+        - job (dict): The File Renamer job.
+        - future (concurrent.futures.Future): The future of plan_file_rename.
+        """
+        if not self.file_rename_step_succeeded(job, future):
+            return
 
-            if input_method:
-                # Set the video editor selected file
-                self.video_editor_selected_file = input_method
+        name = job["name"]
 
-                # Extract just the file name, not the absolute file path
-                filename = os.path.basename(input_method)
+        # Determine the new path based on user preferences
+        if job["move_up_directory"]:
+            # Ignore the provided output directory and move the input up one folder
+            parent_directory = os.path.dirname(os.path.dirname(job["source"]))
+            new_path = os.path.join(parent_directory, os.path.basename(name))
+        else:
+            # Use the suggest output directory
+            if job["suggest_output_directory"]:
+                suggested_output_directory = future.result()
+
+                # If suggest output directory returns a result, use SelectOptionWindow to determine output directory
+                if suggested_output_directory:
+                    # If suggest output directory is a single result, convert it to a list (sanitize)
+                    if suggested_output_directory and not isinstance(suggested_output_directory, list):
+                        suggested_output_directory = [suggested_output_directory]
+                    # Sanitize the list for display in the GUI
+                    basename_list = self.get_basenames(suggested_output_directory)
+
+                    # Prompt the user to choose from the list using SelectOptionWindow
+                    chosen_directory = self.selection_window(title="Suggest Output Directory",
+                                                             prompt="Suggested output directory found."
+                                                                    "\nDo you want use the suggested output "
+                                                                    "directory?"
+                                                                    "\nCancel to use default output "
+                                                                    "directory.",
+                                                             label_text="Choose Directory",
+                                                             item_list=suggested_output_directory,
+                                                             item_text=basename_list)
+
+                    if chosen_directory in suggested_output_directory:
+                        self.output_directory = chosen_directory
+                        self.log_and_show(f"User chose the suggested output directory: {chosen_directory}")
+                    else:
+                        # If the user did not select the suggested directory, use the previously set output
+                        # directory
+                        self.log_and_show(
+                            "User did not choose the suggested output directory. Falling back to default "
+                            "directory.")
 
-                # Set the selected file to the input entry widget
-                self.input_method_entry.delete(0, ctk.END)
-                self.input_method_entry.insert(0, filename)
+                elif suggested_output_directory is None:
+                    # If suggest output directory returns none, use the previously set output directory
+                    # Log the result and update the GUI
+                    self.log_and_show(f"Suggest output directory returned no result. Using {self.output_directory}")
 
-                # Log the action and display the message in the gui
-                self.log_and_show(f"Input selected via Browse: {filename}")
+                # Catchall, use the previously set output directory
+                else:
+                    # Log the result and update the GUI
+                    self.log_and_show(f"Suggest output directory could not function due to invalid return"
+                                      f" '{suggested_output_directory}'."
+                                      f"\nUsing {self.output_directory}")
 
-    def browse_output_directory(self) -> None:
+            # Use the chosen or specified output directory
+            new_path = os.path.join(self.output_directory, os.path.basename(name))
+
+        # Probe for conflicts, search for the artist and rename the file in the background
+        job["new_path"] = new_path
+        self.submit_file_rename_step(self.execute_file_rename, self.finish_file_rename)
+
+    def execute_file_rename(self, job: dict) -> tuple:
         """
-        Browse and select an output directory based on the frame context.
+        Background step: resolve conflicts, run the Artist Search and rename/move the file of a File Renamer job.
+
+        Parameters:
+        - job (dict): The File Renamer job.
 
         Returns:
-            None
-        """
-        if self.frame_name == "file_renamer_window":
-            # Check if an input is selected
-            if self.file_renamer_selected_file:
-                # Check if suggest output directory is true
-                if self.suggest_output_directory_var.get():
-                    # Call the suggest output directory function to determine initial directory
-                    initial_directory_check = self.suggest_output_directory()
+        - tuple: The final path of the file and the Artist Search result (an (artist, artist_file_path) tuple, or None),
+          which finish_file_rename shows on the main thread.
 
-                    # If suggest output directory returns a single result, set it to initial_directory
-                    if initial_directory_check and not isinstance(initial_directory_check, list):
-                        initial_directory = initial_directory_check
+        Raises:
+        - OSError: If the rename or move fails.
+        - concurrent.futures.CancelledError: If the job is interrupted before or during a move to another drive.
+        """
+        source = job["source"]
+        new_path = job["new_path"]
+
+        # Check if the new_path exists
+        if os.path.exists(new_path):
+            # Get a non-conflicting filename
+            new_path = self.get_non_conflicting_filename(new_path)
+            if not new_path:
+                raise OSError(errno.EEXIST, "No non-conflicting file name found", job["new_path"])
+
+        # Check the final path against the target filesystem (the chosen directory may have other limits)
+        problem = self.path_validator.check(new_path)
+        if problem:
+            raise OSError(errno.EINVAL, f"The new name cannot be used: {problem}", new_path)
+
+        # Check if Artist Search is true (messageboxes cannot be shown from this thread, see finish_file_rename)
+        identified = None
+        if job["artist_search"]:
+            # Use artist search to find other instances of artists in files outside the current folder
+            identified = self.artist_search(source, job["ignore_known_artists"])
+
+            if not identified:
+                # Log the action
+                self.log_and_show(f"No Artist Search result")
+
+        # Stop before touching the disk if the job was interrupted
+        if job["cancel_event"].is_set():
+            raise concurrent.futures.CancelledError
+
+        # Report the bytes copied by a move to another drive (and stop it if the job is interrupted)
+        size = os.path.getsize(source)
+        tracker = ProgressTracker(1, total_units=size or 1, total_bytes=size)
+
+        def on_progress(copied, _total):
+            if job["cancel_event"].is_set():
+                raise concurrent.futures.CancelledError
+            tracker.set_partial(copied)
+            self.report_progress(self.progressbar2, tracker)
+
+        # Rename the file (a move to another drive copies it in the background)
+        self.run_on_main(self.start_progress, self.progressbar2, self.file_renamer_progressbar_frame,
+                         determinate=True)
+        try:
+            with self.stage_profiler.stage("disk_rename"):
+                self.move_file(source, new_path, on_progress)
+            tracker.advance(units=size or 1, nbytes=size)
+            self.report_progress(self.progressbar2, tracker, force=True)
+        finally:
+            self.run_on_main(self.stop_progress, self.progressbar2)
 
-                    # If suggest output directory returns a list, then use SelectOptionWindow
-                    elif isinstance(initial_directory_check, list):
-                        # Sanitize the list for display in the GUI
-                        basename_list = self.get_basenames(initial_directory_check)
+        return new_path, identified
 
-                        # Prompt the user to choose from the list using SelectOptionWindow
-                        chosen_artist = self.selection_window(title="Suggest Output Directory",
-                                                              prompt="Multiple matching artists found. Choose "
-                                                                     "an artist:",
-                                                              label_text="Choose Artist",
-                                                              item_list=initial_directory_check,
-                                                              item_text=basename_list)
+    def finish_file_rename(self, job: dict, future: concurrent.futures.Future):
+        """
+        Main thread step: apply the result of a File Renamer job.
 
-                        if chosen_artist in initial_directory_check:
-                            initial_directory = chosen_artist
-                            self.log_and_show(f"User chose the suggested output directory: {chosen_artist}")
-                        else:
-                            # If the choice is not in the matching_artists, use the default initial output directory
-                            initial_directory = self.initial_output_directory
+        Parameters:
+        - job (dict): The File Renamer job.
+        - future (concurrent.futures.Future): The future of execute_file_rename.
+        """
+        # A rename that completed is applied even if the job was interrupted after the file was moved
+        if not future.cancelled() and future.exception() is None:
+            job["cancel_event"].clear()
 
-                    # If suggest output directory returns None, set initial_directory to self.initial_output_directory
-                    elif initial_directory_check is None:
-                        initial_directory = self.initial_output_directory
+        if not self.file_rename_step_succeeded(job, future):
+            return
 
-                    # Catchall, use the default initial output directory
-                    else:
-                        initial_directory = self.initial_output_directory
-                else:
-                    # If suggest output directory is false, use the default initial directory
-                    initial_directory = self.initial_directory
-            else:
-                # If no input is selected, use the default initial output directory
-                initial_directory = self.initial_output_directory
+        # End the job
+        new_path, identified = future.result()
+        self.file_renamer_job = None
 
-            # Ask for the output directory
-            self.output_directory = filedialog.askdirectory(initialdir=initial_directory)
+        if identified:
+            # Unpack the tuple
+            (artist, artist_file_path) = identified
 
-            # If output directory, update the entry field in the gui
-            if self.output_directory:
-                self.output_directory_entry.delete(0, ctk.END)
-                self.output_directory_entry.insert(0, self.output_directory)
+            # Log the result and display a messagebox to the user
+            self.log_and_show(f"Artist Search identified {artist} outside the current folder: "
+                              f"\n\nFile name: {artist}"
+                              f"\n{os.path.basename(artist_file_path)} "
+                              f"\n\nFile path: "
+                              f"\n{artist_file_path}",
+                              create_messagebox=True)
 
-        elif self.frame_name == "name_normalizer_window":
-            # Ask for the output directory
-            self.name_normalizer_output_directory = filedialog.askdirectory(initialdir=self.initial_output_directory)
+        self.log_and_show(f"File: '{os.path.basename(job['source'])}' renamed successfully. "
+                          f"\nSaved to: \n{new_path}")
+        self.handle_rename_success(new_path, job["source"])
 
-            # If name normalizer output directory, update the entry field in the GUI
-            if self.name_normalizer_output_directory:
-                self.move_directory_entry.delete(0, ctk.END)
-                self.move_directory_entry.insert(0, self.name_normalizer_output_directory)
+        # Save the stage timings of the rename
+        self.dump_profile_report("file_renamer")
 
-        elif self.frame_name == "video_editor_window":
-            # Ask for the output directory
-            self.video_editor_output_directory = filedialog.askdirectory(initialdir=self.initial_output_directory)
+    def rename_batch(self):
+        """
+        Rename every file of the File Renamer batch with the same queue, prefix, custom text and placement in one
+        background run (see execute_batch_rename), recorded as one history entry.
+        """
+        # Gather the data from the gui (the base name of each file is cleaned in the background)
+        (_, categories_text, prefix_text, custom_text, _) = self.gather_and_sort()
 
-            # If video editor output directory, update the entry field in the GUI
-            if self.video_editor_output_directory:
-                self.video_editor_output_directory_entry.delete(0, ctk.END)
-                self.video_editor_output_directory_entry.insert(0, self.video_editor_output_directory)
+        # Snapshot the batch so the background task never reads the GUI
+        self.file_renamer_job = {
+            "sources": list(self.file_renamer_batch_files),
+            "categories_text": categories_text,
+            "prefix_text": prefix_text,
+            "custom_text": custom_text,
+            "placement": self.placement_choice.get(),
+            "move_text": self.move_text_var.get(),
+            "move_up_directory": self.move_up_directory_var.get(),
+            "output_directory": self.output_directory,
+            "remove_artist_duplicates": self.remove_artist_duplicates_var.get(),
+            "remove_word_duplicates": self.remove_word_duplicates_var.get(),
+            "cancel_event": threading.Event()
+        }
 
-    def suggest_output_directory(self):
+        self.log_and_show(f"Batch rename of {len(self.file_renamer_batch_files)} files started")
+        self.submit_file_rename_step(self.execute_batch_rename, self.finish_batch_rename)
+
+    def execute_batch_rename(self, job: dict) -> list:
         """
-        Suggests an output directory based on the selected file's artist.
+        Background step: rename/move every file of a File Renamer batch.
+
+        Files are renamed one at a time, so conflicting names are numbered in order. An interrupted batch stops
+        before the next file (or between the chunks of a move to another drive); the files renamed so far are kept.
+
+        Parameters:
+        - job (dict): The File Renamer batch job.
 
         Returns:
-        - If there is a single match, return the matching artist folder.
-        - If matches, returns the list of matching artist folder(s).
-        - If no matching artist folder is found or encountered an error, returns None.
+        - list: A (source, new_path, status) tuple per file. new_path is None if the file was not renamed.
         """
-        # Check if an input is selected
-        if not self.file_renamer_selected_file:
-            # If no input is selected, return None
-            self.log_and_show("No input selected. Using default initial directory.")
-            return None
+        sources = job["sources"]
+        results = []
 
-        # Check if self.artist_directory exists
-        if not os.path.exists(self.artist_directory):
-            # If artist directory does not exist, display an error message and return none
-            self.log_and_show(f"Suggest Output Directory cannot function as intended since the Artist Directory"
-                              f" does not exist."
-                              f"\nUsing default output directory as the fallback."
-                              f"\nPlease ensure Artist Directory: '{self.artist_directory}' exists.",
-                              create_messagebox=True, error=True)
-            return None
+        # Plan the new path of every file (None if it cannot be planned) and why it cannot be renamed, if so
+        planned_paths, problems = self.plan_batch_rename(job)
+
+        # Plan the work up front so progress is determinate
+        sizes = []
+        for source in sources:
+            try:
+                sizes.append(os.path.getsize(source))
+            except OSError:
+                sizes.append(0)
+        tracker = ProgressTracker(len(sources), total_bytes=sum(sizes))
 
+        self.run_on_main(self.start_progress, self.progressbar2, self.file_renamer_progressbar_frame,
+                         determinate=True)
         try:
-            # Create a list from self.artist_directory
-            artist_folders = os.listdir(self.artist_directory)
+            for source, size, new_path, problem in zip(sources, sizes, planned_paths, problems):
+                # Skip the remaining files once the batch is interrupted
+                if job["cancel_event"].is_set():
+                    results.append((source, None, "interrupted"))
+                    continue
+
+                # Skip the files whose names were rejected up front
+                if problem:
+                    results.append((source, None, f"skipped, {problem}"))
+                    tracker.advance(nbytes=size)
+                    continue
+
+                # Report the bytes copied by a move to another drive (and stop it if the batch is interrupted)
+                def on_progress(copied, total):
+                    if job["cancel_event"].is_set():
+                        raise concurrent.futures.CancelledError
+                    tracker.set_partial(copied / total if total else 0)
+                    self.report_progress(self.progressbar2, tracker)
 
-            # Use self.excluded_folders to remove any matches (case-insensitive) from the list
-            excluded_folders_lower = [folder.lower() for folder in self.excluded_folders]
-            artist_folders = [folder for folder in artist_folders if folder.lower() not in excluded_folders_lower]
+                try:
+                    if new_path == source:
+                        results.append((source, None, "unchanged"))
+                        continue
 
-            # Extract the base name from the selected file
-            base_name = os.path.basename(self.file_renamer_selected_file)
-            base_name_lower = base_name.lower()  # Case insensitive comparison
+                    # Check if the new_path exists and get a non-conflicting filename
+                    if os.path.exists(new_path):
+                        name = os.path.basename(new_path)
+                        new_path = self.get_non_conflicting_filename(new_path, quiet=True)
+                        if not new_path:
+                            raise OSError(errno.EEXIST, "No non-conflicting file name found", name)
+
+                        # The counter makes the name longer
+                        problem = self.path_validator.check(new_path)
+                        if problem:
+                            results.append((source, None, f"skipped, {problem}"))
+                            continue
+
+                    # Rename the file
+                    with self.stage_profiler.stage("disk_rename"):
+                        self.move_file(source, new_path, on_progress)
+                    results.append((source, new_path, "renamed"))
+                except concurrent.futures.CancelledError:
+                    results.append((source, None, "interrupted"))
+                except OSError as e:
+                    results.append((source, None, f"failed, {e}"))
+                finally:
+                    tracker.advance(nbytes=size)
+                    self.report_progress(self.progressbar2, tracker)
+        finally:
+            self.report_progress(self.progressbar2, tracker, force=True)
+            self.run_on_main(self.stop_progress, self.progressbar2)
 
-            # Extract the artist from the filename
-            matching_artists = []
+        return results
 
-            # Use the filtered list to match the artist_folder
-            for artist_folder in artist_folders:
-                if artist_folder.lower() in base_name_lower:
-                    # Construct the artist folder path
-                    artist_folder_path = os.path.join(self.artist_directory, artist_folder)
+    def plan_batch_rename(self, job: dict) -> tuple:
+        """
+        Background step: construct the new path of every file of a File Renamer batch and check the whole plan
+        against the target filesystems, reporting the names that cannot be used before anything is renamed.
 
-                    # Verify the folder exists
-                    if os.path.exists(artist_folder_path) and os.path.isdir(artist_folder_path):
-                        matching_artists.append(artist_folder_path)
+        Parameters:
+        - job (dict): The File Renamer batch job.
 
-            # Check if there are multiple matches
-            if len(matching_artists) > 1:
-                # If multiple matches, return the list
-                return matching_artists
+        Returns:
+        - tuple: The planned path of each file (None if it could not be planned) and why each file cannot be renamed
+          (None for the files that can).
+        """
+        planned_paths = []
+        problems = []
+        for source in job["sources"]:
+            try:
+                # Construct the name from the file's cleaned base name
+                base_name, extension = self.clean_base_name(source, job["remove_artist_duplicates"],
+                                                            job["remove_word_duplicates"])
+                (name, _) = self.construct_new_name(base_name, job["categories_text"], job["prefix_text"],
+                                                    job["custom_text"], extension, placement=job["placement"])
+
+                # If move_text is set, move the text between - and __-__
+                if job["move_text"]:
+                    name = self.move_text(name)
+
+                # Determine the new path based on user preferences
+                if job["move_up_directory"]:
+                    destination_directory = os.path.dirname(os.path.dirname(source))
+                else:
+                    destination_directory = job["output_directory"] or os.path.dirname(source)
+                planned_paths.append(os.path.join(destination_directory, os.path.basename(name)))
+                problems.append(None)
+            except OSError as e:
+                planned_paths.append(None)
+                problems.append(f"failed, {e}")
 
-            elif len(matching_artists) == 1:
-                # If only one match found, return that
-                return matching_artists[0]
+        # Check the whole plan at once
+        planned = [index for index, path in enumerate(planned_paths) if path]
+        for index, problem in zip(planned, self.path_validator.check_many([planned_paths[i] for i in planned])):
+            problems[index] = problem
 
-            else:
-                # If no matching artist folder is found, return none
-                self.log_and_show("Cannot suggest output directory. Falling back to default output directory.")
-                return None
+        # Report the rejected names up front
+        rejected = [(source, problem) for source, problem in zip(job["sources"], problems) if problem]
+        if rejected:
+            self.log_and_show(f"{len(rejected)} file(s) of the batch will be skipped:\n" + "\n".join(
+                f"{os.path.basename(source)}: {problem}" for source, problem in rejected), error=True)
+
+        return planned_paths, problems
+
+    def finish_batch_rename(self, job: dict, future: concurrent.futures.Future):
+        """
+        Main thread step: record a File Renamer batch as one history entry and report the result of each file.
+
+        Parameters:
+        - job (dict): The File Renamer batch job.
+        - future (concurrent.futures.Future): The future of execute_batch_rename.
+        """
+        # End the job
+        self.file_renamer_job = None
 
+        try:
+            results = future.result()
+        except concurrent.futures.CancelledError:
+            self.log_and_show("Batch rename interrupted. No files were renamed.")
+            self.dump_profile_report("file_renamer")
+            return
         except Exception as e:
-            # Handle any unexpected exceptions and log an error message
-            self.log_and_show(f"Unexpected error suggesting an output directory: {e}",
-                              create_messagebox=True, error=True)
-            return None
+            # Log the action for unexpected errors
+            self.log_and_show(f"Batch rename failed: {str(e)}", create_messagebox=True, error=True)
+            self.dump_profile_report("file_renamer")
+            return
+
+        # Record the renamed files as one operation
+        renamed = [(source, new_path) for source, new_path, _ in results if new_path]
+        if renamed:
+            self.handle_batch_rename_success(renamed, job["sources"][0])
 
-    def handle_rename_success(self, new_path: str):
+        # Report the result of each file
+        summary = f"Batch rename: {len(renamed)} of {len(results)} files renamed"
+        report_lines = [f"{os.path.basename(source)} -> {os.path.basename(new_path)}" if new_path
+                        else f"{os.path.basename(source)}: {status}" for source, new_path, status in results]
+        if self.activate_logging_var.get():
+            for line in report_lines:
+                logging.info(line)
+        self.log_and_show(summary)
+        if self.show_messageboxes_var.get():
+            self.show_report_window("Batch Rename Report", [summary, ""] + report_lines)
+
+        # Save the stage timings of the batch
+        self.dump_profile_report("file_renamer")
+
+    def handle_batch_rename_success(self, pairs: list, first_source: str):
         """
-        Handles the success of a file renaming operation.
+        Handles the success of a File Renamer batch.
 
         Parameters:
-        - new_path (str): The new path after the file renaming operation.
+        - pairs (list): The (original_path, new_path) pairs of the renamed files.
+        - first_source (str): The first file of the batch (the selected file when the batch started).
         """
-        # Store information about the rename operation in the history
-        self.history.append({
-            'original_path': self.file_renamer_selected_file,
-            'new_path': new_path
-        })
+        # Store the whole batch as one operation in the history
+        self.history_store.push("file_renamer", pairs)
 
-        # Reset selected file, queue and update file renamer last used file
-        self.file_renamer_selected_file = ""
-        self.file_renamer_queue = []
-        self.file_display_text.set("")
-        self.name_length_text.set("")
-        self.prefix_text_entry.delete(0, ctk.END)
-        self.custom_text_entry.delete(0, ctk.END)
-        self.file_renamer_last_used_file = new_path
+        # Reset the batch, selected file and queue, unless another file was selected while the batch ran
+        if self.file_renamer_selected_file == first_source:
+            self.file_renamer_selected_file = ""
+            self.file_renamer_batch_files = []
+            self.file_renamer_queue = []
+            self.file_display_text.set("")
+            self.name_length_text.set("")
+            self.prefix_text_entry.delete(0, ctk.END)
+            self.custom_text_entry.delete(0, ctk.END)
+
+        # Update file renamer last used file
+        self.file_renamer_last_used_file = pairs[-1][1]
 
         # Get the base name and truncate after x characters
-        last_used_name = os.path.basename(new_path)
+        last_used_name = os.path.basename(self.file_renamer_last_used_file)
         if len(last_used_name) > 115:
             last_used_name = last_used_name[:115]
         self.last_used_display.configure(text=last_used_name)
@@ -4446,1798 +7638,1975 @@ class OCDFileRenamer(ctk.CTk, TkinterDnD.DnDWrapper):
             self.output_directory = ""
             self.output_directory_entry.delete(0, ctk.END)
 
-        # Check if the double check reminder variable is true
-        if self.double_check_var.get():
-            # Call the double check reminder function
-            self.double_check_reminder(new_path)
+    def show_report_window(self, title: str, lines: list):
+        """
+        Show a read-only report in its own window.
 
-        # Log the action if logging is enabled
-        self.log_and_show("File renamed and saved successfully")
+        Args:
+        - title (str): The title of the window.
+        - lines (list): The lines of the report.
+        """
+        report_window = ctk.CTkToplevel(self)
+        report_window.geometry("800x450")
+        report_window.title(title)
 
-    """
-    Category Management
-    """
+        # Read-only textbox holding the report
+        report_textbox = ctk.CTkTextbox(report_window, width=780, height=430)
+        report_textbox.pack(padx=10, pady=10, fill="both", expand=True)
+        report_textbox.insert(ctk.END, "\n".join(lines))
+        report_textbox.configure(state="disabled")
 
-    def add_category(self) -> None:
+        # Keep track of the open window
+        self.open_windows.append(report_window)
+
+    def file_renamer_batch_active(self) -> bool:
         """
-        Add a new category to the dictionary with the specified weight,
-        save the updated categories to the file, and refresh the category buttons in the GUI.
+        Check whether the File Renamer holds a batch (a batch ends once another file is selected).
 
         Returns:
-            None
+            bool: True if a batch is selected.
         """
-        # Get the new category from the add category entry widget
-        new_category = self.category_entry.get().strip()
+        return (len(self.file_renamer_batch_files) > 1 and
+                self.file_renamer_batch_files[0] == self.file_renamer_selected_file)
 
-        # Get the weight from the GUI entry field
-        weight_entry_value = self.weight_entry.get().strip()
+    def select_file_renamer_batch(self, paths: list, selected_via: str):
+        """
+        Select several files (folders are expanded to the files they contain) as a File Renamer batch.
 
-        if not new_category:
-            # If the new category is an empty string, log an error message and return
-            self.log_and_show("Add Category cannot be empty.",
-                              create_messagebox=True, error=True)
+        Args:
+        - paths (list): The selected file and folder paths.
+        - selected_via (str): How the files were selected (e.g. 'Browse'), for the log.
+        """
+        # Expand folders to their files (not their subdirectories), in name order
+        batch_files = []
+        for path in paths:
+            if os.path.isdir(path):
+                batch_files.extend(sorted(entry.path for entry in os.scandir(path) if entry.is_file()))
+            elif os.path.isfile(path):
+                batch_files.append(path)
+
+        if not batch_files:
+            self.log_and_show("No files selected for the batch.", create_messagebox=True, error=True)
             return
 
-        try:
-            # Use the provided weight if it's an integer, otherwise use the default weight
-            weight = int(weight_entry_value) if weight_entry_value else int(self.default_weight)
-        except ValueError:
-            self.log_and_show("Weight must be an integer. Please try again with a number",
-                              create_messagebox=True, error=True)
-            return
+        # Select the first file for the preview
+        self.file_renamer_batch_files = batch_files
+        self.file_renamer_selected_file = batch_files[0]
 
-        if new_category:
-            # Convert to lowercase for case-insensitive check
-            new_category_lower = new_category.lower()
-            # Prevent duplicate entries in the json file
-            if new_category_lower not in map(lambda x: x.lower(), self.categories.keys()):
-                # Add the new category to the dictionary with the specified weight
-                self.categories[new_category] = weight
-                # Save the updated categories to the file
-                self.update_json(self.dictionary_file, "categories", self.categories)
-                # Refresh the category buttons in the GUI
-                self.refresh_category_buttons()
+        # Remove the default entries text and clear the queue
+        self.prefix_text_entry.delete(0, ctk.END)
+        self.custom_text_entry.delete(0, ctk.END)
+        self.file_renamer_queue = []
+        self.update_file_display()
 
-                # Log the action if logging is enabled
-                self.log_and_show(f"Category added: '{new_category}' with weight({weight})")
-            else:
-                # Log the action if logging is enabled
-                self.log_and_show(f"'{new_category}' already exists. Skipping.",
-                                  create_messagebox=True, error=True)
+        # Add artist common categories (of the first file) to the queue
+        if self.artist_common_categories_var.get():
+            self.add_remove_common_categories_to_queue()
 
-        # Reset the category entries
-        if self.reset_add_remove_var.get():
-            # Clear the category entry and weight entry fields
-            self.category_entry.delete(0, ctk.END)
-            self.weight_entry.delete(0, ctk.END)
+        # Log the action if logging is enabled
+        self.log_and_show(f"Batch selected via {selected_via}: {len(batch_files)} files")
+
+    def browse_batch(self):
+        """
+        Browse several files, or a folder whose files are renamed, as a File Renamer batch.
+        """
+        batch_paths = list(filedialog.askopenfilenames(initialdir=self.initial_directory,
+                                                       title="Browse files. Close to select a directory instead"))
+        if not batch_paths:
+            batch_directory = filedialog.askdirectory(initialdir=self.initial_directory, title="Browse a directory")
+            batch_paths = [batch_directory] if batch_directory else []
 
-            # Set the default variable
-            self.weight_var.set(self.default_weight)
+        if batch_paths:
+            self.select_file_renamer_batch(batch_paths, "Browse")
 
-    def remove_category(self):
+    def file_rename_active(self) -> bool:
         """
-        Remove a category from the dictionary, save the updated categories to the file,
-        and refresh the category buttons in the GUI.
+        Check whether a File Renamer job is still running, telling the user if so.
 
         Returns:
-            None
+            bool: True if a File Renamer job is running.
         """
-        # Get the category to be removed from the remove category entry widget
-        category_to_remove = self.remove_category_entry.get().strip()
-
-        if not category_to_remove:
-            # If the category to be removed is an empty string, log an error message and return
-            self.log_and_show("Remove Category cannot be empty.", create_messagebox=True, error=True)
-            return
+        if self.file_renamer_job is not None:
+            self.log_and_show("A rename is still in progress. Please wait for it to finish or interrupt it.",
+                              create_messagebox=True, error=True)
+            return True
+        return False
 
-        # Check for a case-sensitive match
-        if category_to_remove in self.categories:
-            # Remove the category from the dictionary
-            del self.categories[category_to_remove]
-            # Save the updated categories to the file
-            self.update_json(self.dictionary_file, "categories", self.categories)
-            # Refresh the category buttons in the GUI
-            self.refresh_category_buttons()
+    def cancel_file_rename(self):
+        """
+        Interrupt the running File Renamer job: a step that has not started is cancelled, a running step stops at
+        its next checkpoint (before the rename and between the chunks of a move to another drive).
+        """
+        if self.file_renamer_job is not None:
+            self.file_renamer_job["cancel_event"].set()
+            if self.file_renamer_future is not None:
+                self.file_renamer_future.cancel()
 
-            # Log the action if logging is enabled
-            self.log_and_show(f"Category removed: {category_to_remove}")
-        else:
-            # Check for a case-insensitive match
-            matching_category = next((key for key in self.categories if key.lower() == category_to_remove.lower()),
-                                     None)
-            if matching_category:
-                # Remove the case-insensitive matched category from the dictionary
-                del self.categories[matching_category]
-                # Save the updated categories to the file
-                self.update_json(self.dictionary_file, "categories", self.categories)
-                # Refresh the category buttons in the GUI
-                self.refresh_category_buttons()
+    def gather_and_sort(self) -> tuple:
+        """
+        Gather information from the gui and sort categories based on weights.
 
-                # Log the action if logging is enabled
-                self.log_and_show(f"Category removed: {matching_category}")
-            else:
-                # Log the action if logging is enabled
-                self.log_and_show(f"'{category_to_remove}' not found in dictionary. Skipping.",
-                                  create_messagebox=True, error=True)
+        Returns:
+        tuple: A tuple containing base_name, categories_text, prefix_text, custom_text, and extension.
+        """
 
-        # Reset the category entries
-        if self.reset_add_remove_var.get():
-            # Clear the remove category entry field
-            self.remove_category_entry.delete(0, ctk.END)
+        # Get custom text, prefix_text, basename, and file extension
+        prefix_text = self.prefix_text_entry.get().strip()
+        custom_text = self.custom_text_entry.get().strip()
+        base_name, extension = self.get_clean_base_name()
 
-    def create_category_button(self, tab, category):
-        """
-        Create a category button within a specified tab.
+        # Filter categories that are both in file_renamer_queue and categories
+        weighted_categories = [category for category in self.file_renamer_queue if category in self.categories]
 
-        Parameters:
-            tab: The tab in which the button will be created.
-            category (str): The category for which the button is created.
+        # Sort the weighted_categories based on their weights in the categories dictionary
+        # Use default weight if one isn't present
+        weighted_categories.sort(key=lambda category: self.categories.get(category, self.default_weight))
 
-        Returns:
-            ctk.CTkButton: The created category button.
-        """
-        # Set the category to the button text variable for potential formatting
-        button_text = category
+        # Create a new list containing non-weighted categories from file_renamer_queue
+        categories = weighted_categories + [category for category in self.file_renamer_queue if
+                                            category not in weighted_categories]
 
-        if self.truncate_var.get():
-            # Truncate the text after x characters for GUI friendly formatting.
-            button_text = f"{category[:13]}..." if len(button_text) > 16 else category
+        # Join the categories list into a space-separated string and strip any leading or trailing whitespaces
+        categories_text = ' '.join(categories).strip()
 
-        return ctk.CTkButton(tab, text=button_text, command=lambda c=category: self.add_to_queue(c))
+        # Return a tuple containing the data
+        return base_name, categories_text, prefix_text, custom_text, extension
 
-    def refresh_category_buttons(self, *_):
+    def get_clean_base_name(self) -> tuple:
         """
-        Refresh the category buttons by destroying existing tabs and buttons,
-        loading categories, and creating new tabs and buttons.
+        Get the selected file's base name with duplicate artists and words removed, memoized per selected file.
 
-        Parameters:
-            *_: Variable number of positional arguments (ignored in the function)
+        The cleanup only reruns when the selected file, the duplicate removal settings or the artist file change,
+        so per-keystroke previews only pay for the string assembly in construct_new_name.
 
         Returns:
-            None
+        tuple: A tuple containing the cleaned base_name and the extension.
         """
-        # Destroy existing tabs and buttons
-        if hasattr(self, 'cat_tabview') and self.cat_tabview:
-            self.cat_tabview.destroy()
-        for button in getattr(self, 'buttons', []):
-            button.destroy()
+        remove_artist_duplicates = self.remove_artist_duplicates_var.get()
+        remove_word_duplicates = self.remove_word_duplicates_var.get()
 
-        # Load categories from the file or create an empty dictionary
-        self.initialize_json()
+        # The artist file only affects the result when removing artist duplicates
+        artist_file_signature = self.get_artist_file_signature() if remove_artist_duplicates else None
 
-        # Create the cat_tabview and buttons
-        self.create_cat_tabview()
+        # Build the cache key from everything the cleanup depends on
+        key = (self.file_renamer_selected_file, remove_artist_duplicates, remove_word_duplicates,
+               artist_file_signature)
 
-    def create_cat_tabview(self):
+        # Return the memoized result if nothing changed
+        if key == self.file_renamer_base_name_key:
+            return self.file_renamer_base_name
+
+        # Store the result for the next call
+        self.file_renamer_base_name_key = key
+        self.file_renamer_base_name = self.clean_base_name(self.file_renamer_selected_file, remove_artist_duplicates,
+                                                           remove_word_duplicates)
+
+        return self.file_renamer_base_name
+
+    def clean_base_name(self, file_path: str, remove_artist_duplicates: bool, remove_word_duplicates: bool) -> tuple:
         """
-        Create the category tabview and populate it with buttons based on category weights.
+        Get a file's base name with duplicate artists and/or words removed.
+
+        Args:
+        file_path (str): The path of the file.
+        remove_artist_duplicates (bool): Remove duplicate artists from the base name.
+        remove_word_duplicates (bool): Remove duplicate words from the base name.
 
         Returns:
-            None
+        tuple: A tuple containing the cleaned base_name and the extension.
         """
-        # Create cat_tabview
-        self.cat_tabview = ctk.CTkTabview(self.cat_button_frame)
-        self.cat_tabview.grid(row=0, column=0)
+        base_name, extension = os.path.splitext(os.path.basename(file_path))
 
-        # Create a tab for all categories
-        all_cat_tab = self.cat_tabview.add("All")
-        self.cat_tabs["All"] = all_cat_tab  # Store the reference to the tab
+        if remove_artist_duplicates:
+            # Remove duplicate artists from filename
+            base_name = self.remove_artist_duplicates_from_filename(base_name)
 
-        # Create a tab for "Most Categories" with weights 1-9
-        most_cat_tab = self.cat_tabview.add("Most")
-        self.cat_tabs["Most"] = most_cat_tab  # Store the reference to the tab
+        if remove_word_duplicates:
+            # Remove duplicate words from filename
+            base_name = self.remove_word_duplicates_from_filename(base_name)
 
-        # Sort the weight tab_names
-        if self.sort_tab_names_var.get():
-            # Determine the order to sort (forward or backward)
-            sort_reverse_order_var = True if self.sort_reverse_order_var.get() else False
+        return base_name, extension
 
-            # Create a tab for each sorted weight
-            weights = sorted(list(set(self.categories.values())), reverse=sort_reverse_order_var)
-        else:
-            # Create a tab for each weight
-            weights = set(self.categories.values())
+    def construct_new_name(self, base_name: str, categories_text: str, prefix_text: str, custom_text: str,
+                           extension: str, placement: str = None) -> tuple:
+        """
+        Construct a new file name based on specified parameters.
 
-        for weight in weights:
-            # Set either custom names or use the default weight naming scheme
-            if self.use_custom_tab_names_var.get() and weight in self.weight_to_tab_name:
-                tab_name = self.weight_to_tab_name[weight]
-            else:
-                tab_name = f"Weight {weight}"
+        Args:
+        base_name (str): The original base name of the file.
+        categories_text (str): Space-separated string containing categories sorted based on weights.
+        prefix_text (str): Custom prefix text.
+        custom_text (str): Custom text.
+        extension (str): File extension.
+        placement (str, optional): The placement ('prefix', 'special_character' or 'suffix'). Defaults to the
+            placement chosen in the GUI.
 
-            tab = self.cat_tabview.add(tab_name)
+        Returns:
+        tuple: A tuple containing the constructed new file name and its length.
+        """
+        # Default to the placement chosen in the GUI
+        placement = placement or self.placement_choice.get()
 
-            self.cat_tabs[weight] = tab  # Store the reference to the tab
+        # Place the queue at the beginning of the name
+        if placement == "prefix":
+            name = f"{prefix_text} {custom_text} {categories_text} {base_name}".strip()
+        # Place the queue at the first instance of the special character
+        elif placement == "special_character":
+            parts = base_name.split(self.special_character_var, 1)
+            if len(parts) == 2:
+                name = f"{prefix_text} {parts[0].rstrip()} {categories_text} {custom_text} {parts[1].lstrip()}".strip()
+                try:
+                    # Remove the tail __-__ if found
+                    name = name.replace("__-__", "")
+                except OSError as e:
+                    # Log the action if logging is enabled
+                    self.log_and_show(f"{str(e)}", create_messagebox=True, error=True)
+            else:
+                # If there's no special character found, fallback to edge case custom formatting
+                name = f"{prefix_text} {categories_text} {custom_text} {base_name}".strip()
+        else:  # Default to suffix
+            name = f"{prefix_text} {base_name} {categories_text} {custom_text}".strip()
 
-            # Filter categories based on weight and sort case-insensitively
-            weight_categories = sorted([category for category, w in self.categories.items() if w == weight],
-                                       key=lambda x: x.lower())
+        # Remove extra whitespaces from the name
+        name = " ".join(name.split()).strip()
 
-            # Batch processing for button creation
-            buttons = [self.create_category_button(tab, category) for category in weight_categories]
+        # Construct the name by adding the base_name and extension
+        name = name + extension
 
-            for i, button in enumerate(buttons):
-                button.grid(row=i // self.column_numbers, column=i % self.column_numbers, padx=5, pady=5)
+        # Get the length of the name
+        name_length = len(name)
 
-            self.buttons = buttons
+        return name, name_length
 
-        # Create buttons for all categories in the "All Categories" tab
-        all_categories = sorted(self.categories.keys(), key=lambda x: x.lower())
-        all_buttons = [self.create_category_button(all_cat_tab, category) for category in all_categories]
+    def get_non_conflicting_filename(self, path: str, quiet: bool = False) -> Union[str, None]:
+        """
+        Get a non-conflicting filename by appending a counter to the base filename if conflicts are detected.
 
-        for i, button in enumerate(all_buttons):
-            button.grid(row=i // self.column_numbers, column=i % self.column_numbers, padx=5, pady=5)
+        Args:
+        - path (str): The original file path.
+        - quiet (bool): If True, skip logging and displaying messages (used for previews). Default is False.
 
-        self.all_buttons = all_buttons
+        Returns:
+        - Union[str, None]: The non-conflicting filename or None if an error occurs.
 
-        # Create buttons for categories with weights 1-default_most_number in the "Most Categories" tab
-        most_categories = [category for category, w in self.categories.items() if 1 <= w <= self.default_most_number]
-        # Sort the categories alphabetically and ignore case
-        most_categories_sorted = sorted(most_categories, key=lambda x: x.lower())
-        # Create buttons for the sorted categories
-        most_buttons = [self.create_category_button(most_cat_tab, category) for category in most_categories_sorted]
+        Raises:
+        - OSError: If an error occurs while checking for file existence or constructing the new filename.
 
-        for i, button in enumerate(most_buttons):
-            button.grid(row=i // self.column_numbers, column=i % self.column_numbers, padx=5, pady=5)
+        Examples:
+        self.get_non_conflicting_filename("/path/to/file.txt")
+        '/path/to/file (1).txt'
 
-        self.most_buttons = most_buttons
+        self.get_non_conflicting_filename("/path/to/file (1).txt")
+        '/path/to/file (2).txt'
+        """
+        if not quiet:
+            # Log the action and display a message
+            self.log_and_show(f"Conflict detected on: '{os.path.basename(path)}'")
 
-        # Attempt to set the default tab
         try:
-            # Check if self.default_cat_tab is in the tab names
-            if self.default_cat_tab and self.cat_tabview.index(self.default_cat_tab) is not None:
-                self.cat_tabview.set(self.default_cat_tab)
-        except ValueError:
-            return
+            # Split the given path into the base filename and its extension.
+            base, ext = os.path.splitext(os.path.basename(path))
 
-    def add_to_queue(self, category):
-        """
-        Add a category to the processing queue.
+            # Extract the counter from the original filename if it exists.
+            counter = 1
+            match = re.match(r'(.+) \((\d+)\)', base)
+            if match:
+                base, counter = match.groups()
+                counter = int(counter)
 
-        Parameters:
-            category (str): The category to be added to the queue.
+            # Check if the file already exists at the given path.
+            while os.path.exists(os.path.join(os.path.dirname(path), f"{base} ({counter}){ext}")):
+                # If the file exists, update the counter.
+                counter += 1
 
-        Returns:
-            None
-        """
-        if not self.file_renamer_selected_file:
-            # If no input selected, log the action and display a message in the GUI
-            self.log_and_show("Please select an input first and then add a word to the queue.",
-                              create_messagebox=True, error=True)
-            return
+            # Construct the new base filename with the updated counter.
+            new_base = f"{base} ({counter})"
 
-        # Check if the category is not already in the queue
-        if category not in self.file_renamer_queue:
-            # Add the category to the queue
-            self.file_renamer_queue.append(category)
-            self.log_and_show(f"Word added to queue: {category}", not_logging=True)
+            # Construct the new path by joining the directory and the new base filename.
+            new_path = os.path.join(os.path.dirname(path), f"{new_base}{ext}")
 
-        # Check if the category is already in the queue
-        elif category in self.file_renamer_queue:
-            # Ask for confirmation of removing the category from the queue
-            confirmation = self.ask_confirmation("Queue Conflict",
-                                                 f"{category} is already in the queue. Do you want to remove it?")
+            if not quiet:
+                # Log action and display a message
+                self.log_and_show(f"Using non-conflicting file name: {new_base}{ext}")
 
-            if confirmation:
-                # Remove the category from the queue
-                self.remove_from_queue(category)
+            # Return the generated non-conflicting filename.
+            return new_path
+        except Exception as e:
+            # Log error and display an error message when get non-conflicting file name fails.
+            self.log_and_show(f"Getting non-conflicting file name failed: {str(e)}", create_messagebox=True,
+                              error=True)
 
-        # Update file display
-        self.update_file_display()
+            # Return None in case of an error.
+            return None
 
-    def remove_from_queue(self, category, suppress=False):
+    @staticmethod
+    def move_text(name: str) -> str:
         """
-        remove_from_queue(category, suppress=False)
-
-        Removes a word from the queue based on the specified category.
+        Move the text between '-' and '__-__' in the given name.
 
-        Parameters:
-        - category (str): The category of the word to be removed from the queue.
-        - suppress (bool): If True, suppresses log and show messages when the word is not in the queue.
+        Args:
+        - name (str): The original name containing the text to be moved.
 
         Returns:
-        None
+        - str: The modified name with the text moved.
 
-        If no input file is selected, logs an error and shows a message in the GUI.
+        Example:
+        self.move_text("Artist - words to move__-__file.mp3")
+        'Artist file words to move.mp3'
+        """
+        # Move the text between - and __-__ in the name
+        match = re.match(r"^(.*) - (.*?)__-__ (.*)\.(\w+)$", name)
+        if match:
+            prefix, moved_text, suffix, extension = match.groups()
+            name = f"{prefix} {suffix} {moved_text}.{extension}"
+        return name
 
-        If the specified category is not in the queue, logs an error and shows a message unless suppress is True.
+    """
+    Name Normalizer
+    """
 
-        Updates the file display after removing the word from the queue.
+    def remove_custom_user_text(self, name: str) -> str:
         """
-        if not self.file_renamer_selected_file:
-            # If no input selected, log the action and display a message in the GUI
-            self.log_and_show("Please select an input first and then remove a word from the queue.",
-                              create_messagebox=True, error=True)
-            return
+        Remove custom user-specified text from the provided name.
 
-        # Check if the category is not already in the queue
-        if category not in self.file_renamer_queue:
-            # Check if the message is suppressed
-            if not suppress:
-                # If not suppressed, log and show the message
-                self.log_and_show(f"Word not in queue: {category}",
-                                  create_messagebox=True, error=True, not_logging=True)
-            return
+        Args:
+        name (str): The original name.
 
-        # Remove the category from the queue
-        self.file_renamer_queue.remove(category)
-        self.log_and_show(f"Word removed from queue: {category}", not_logging=True)
+        Returns:
+        str: The modified name with custom user text removed.
+        """
+        try:
+            # Get the text to remove from the entry
+            text_to_remove = self.custom_text_removal_entry.get().strip()
+        except Exception as e:
+            self.log_and_show(f"An error occurred getting the custom text to remove: {str(e)}",
+                              create_messagebox=True,
+                              error=True)
+            return name  # Return original name if there's an error retrieving custom text
 
-        # Update file display
-        self.update_file_display()
+        try:
+            # Check if text to remove is provided
+            if text_to_remove:
+                if self.replace_mode_var.get():
+                    # Check if the text to remove is present in name (case-insensitive)
+                    pattern = re.compile(re.escape(text_to_remove), re.IGNORECASE)
 
-    def handle_common_categories_state(self, *_):
-        """
-        Handle the state change of the artist common categories variable.
+                    # Remove all instances of the text to remove from name
+                    name = pattern.sub('', name)
 
-        Parameters:
-            *_: Variable number of positional arguments (ignored in the function)
+                    # Replace consecutive spaces with a single space when custom text is removed
+                    name = WHITESPACE_PATTERN.sub(' ', name)
+                else:
+                    # Check if the text to remove is present in name (case-sensitive)
+                    if text_to_remove in name:
+                        # Remove all instances of the text to remove from name
+                        name = name.replace(text_to_remove, '')
 
-        Returns:
-            None
-        """
-        # Check if the artist common categories variable is true
-        if self.artist_common_categories_var.get():
-            # Call the add_remove_common_categories_to_queue method
-            self.add_remove_common_categories_to_queue()
-        else:
-            # Call the add_remove_common_categories_to_queue method with the remove parameter
-            self.add_remove_common_categories_to_queue(remove=True)
+                        # Replace consecutive spaces with a single space when custom text is removed
+                        name = WHITESPACE_PATTERN.sub(' ', name)
+        except Exception as e:
+            self.log_and_show(f"An error occurred during text removal: {str(e)}",
+                              create_messagebox=True,
+                              error=True)
+            # Return original name if there's an error during text removal
+            return name
 
-    def add_remove_common_categories_to_queue(self, remove=False):
+        return name
+
+    def replace_user_text(self, name: str) -> str:
         """
-        Add or remove common categories to/from the processing queue based on the selected file.
+        Replace user-specified text from the provided name.
 
-        Parameters:
-            remove (bool): Flag indicating whether to remove common categories from the queue. Default is False.
+        Args:
+        name (str): The original name.
 
         Returns:
-            None
+        str: The modified name with user-specified text removed or replaced.
         """
-        # Check if the selected file is set
-        if not self.file_renamer_selected_file:
-            return  # Do nothing if the selected file is not set
+        try:
+            # Get the original text and replacement text from the entry
+            original_entry = self.original_entry.get().strip()
+            replace_entry = self.replace_entry.get().strip()
+        except Exception as e:
+            self.log_and_show(f"An error occurred getting the original text or text to replace: {str(e)}",
+                              create_messagebox=True,
+                              error=True)
+            return name  # Return original name if there's an error retrieving original or replacement text
 
-        # Extract the base name from the selected file
-        base_name = os.path.basename(self.file_renamer_selected_file)
-        base_name_lower = base_name.lower()  # Convert to lowercase for case-insensitive comparison
+        try:
+            # Check if the original_entry is provided
+            if original_entry:
+                # Replace user-specified text from the name
+                if self.replace_mode_var.get():
+                    # Check if the text to replace is present in name (case-insensitive)
+                    pattern = re.compile(re.escape(original_entry), re.IGNORECASE)
 
-        # Check if there is a '-' in the name
-        if '-' not in base_name_lower:
-            # If no '-', return
-            self.log_and_show("No '-' found in the file name. Cannot identify artist for Artist Common Categories "
-                              "functionality.")
-            return
+                    # Replace the text with the specified replacement or remove if replacement is an empty string
+                    name = pattern.sub(replace_entry, name)
 
-        # Extract the artist from the text before '-'
-        artist = base_name_lower.split('-')[0].strip()
+                else:
+                    # Check if the text to remove is present in name (case-sensitive)
+                    if original_entry in name:
+                        # Remove all instances of the text to remove from name
+                        name = name.replace(original_entry, replace_entry)
 
-        # Iterate through common categories and associated values
-        for key, values in self.artist_common_categories.items():
-            # Check if the lowercase key is present in the lowercase base name
-            if artist.find(key.lower()) != -1:
-                # Iterate through the values associated with the matching key
-                for value in values:
-                    if remove:
-                        self.remove_from_queue(value, suppress=True)  # Remove each value from the processing queue
-                    else:
-                        self.add_to_queue(value)  # Add each value to the processing queue
-                return  # Stop processing after the first match
+                # Replace consecutive spaces with a single space when custom text is removed
+                name = WHITESPACE_PATTERN.sub(' ', name)
+        except Exception as e:
+            self.log_and_show(f"An error occurred during text replacement: {str(e)}",
+                              create_messagebox=True,
+                              error=True)
+            return name  # Return original name if there's an error during text replacement
 
-    """
-    File Renaming
-    """
+        return name
 
-    def rename_files(self):
+    def get_custom_text_replacer(self) -> LiteralReplacer:
         """
-        Rename selected files based on user preferences.
-
-        - Gathers data from the GUI, constructs a new name, and handles name length constraints.
-        - Moves text between '-' and '__-__' if the move_text_var is set.
-        - Determines the new path based on user preferences for output directory.
-        - Attempts to rename the file and handles success or errors.
-
-        Raises:
-            OSError: If an error occurs during the file renaming process.
+        Get the replacer for the custom_text_to_replace dictionary, rebuilt only when the dictionary or the replace
+        mode changes.
 
+        Returns:
+            LiteralReplacer: The replacer matching the current dictionary and replace mode.
         """
-        # Check if an input is selected and either the queue is not empty or custom text is provided
-        if self.file_renamer_selected_file and (
-                self.file_renamer_queue or self.prefix_text_entry.get().strip() or
-                self.custom_text_entry.get().strip()):
-            # Gather the data from the gui
-            (base_name, weighted_categories, prefix_text, custom_text, extension) = self.gather_and_sort()
-
-            # Construct the name
-            (name, char_length) = self.construct_new_name(base_name, weighted_categories, prefix_text, custom_text,
-                                                          extension)
-
-            # Handle name length constraints
-            if char_length > 255:
-                self.name_length_handler(char_length)
-                return
+        key = (self.dictionary_version, self.replace_mode_var.get())
+        if self.custom_text_replacer is None or self.custom_text_replacer_key != key:
+            self.custom_text_replacer = LiteralReplacer(self.custom_text_to_replace, ignore_case=key[1])
+            self.custom_text_replacer_key = key
+        return self.custom_text_replacer
 
-            # If move_text_var is set, move the text between - and __-__
-            if self.move_text_var.get():
-                name = self.move_text(name)
+    def replace_custom_text(self, name: str) -> str:
+        """
+        Replace custom text from the custom_text_to_replace dictionary.
 
-            # If output directory is not explicitly set, default to the same directory as the file
-            if not self.output_directory:
-                self.output_directory = os.path.dirname(self.file_renamer_selected_file)
+        Args:
+        name (str): The original name.
 
-            # Determine the new path based on user preferences
-            if self.move_up_directory_var.get():
-                # Ignore the provided output directory and move the input up one folder
-                parent_directory = os.path.dirname(os.path.dirname(self.file_renamer_selected_file))
-                new_path = os.path.join(parent_directory, os.path.basename(name))
-            else:
-                # Use the suggest output directory
-                if self.suggest_output_directory_var.get():
-                    # Call the suggest output directory to get a suggested output directory
-                    suggested_output_directory = self.suggest_output_directory()
-
-                    # If suggest output directory returns a result, use SelectOptionWindow to determine output directory
-                    if suggested_output_directory:
-                        # If suggest output directory is a single result, convert it to a list (sanitize)
-                        if suggested_output_directory and not isinstance(suggested_output_directory, list):
-                            suggested_output_directory = [suggested_output_directory]
-                        # Sanitize the list for display in the GUI
-                        basename_list = self.get_basenames(suggested_output_directory)
+        Returns:
+        str: The modified name with custom text removed or replaced.
+        """
+        try:
+            # Replace every rule from the custom_text_to_replace dictionary in one scan (case-insensitive in
+            # replace mode)
+            name = self.get_custom_text_replacer().sub(name)
 
-                        # Prompt the user to choose from the list using SelectOptionWindow
-                        chosen_directory = self.selection_window(title="Suggest Output Directory",
-                                                                 prompt="Suggested output directory found."
-                                                                        "\nDo you want use the suggested output "
-                                                                        "directory?"
-                                                                        "\nCancel to use default output "
-                                                                        "directory.",
-                                                                 label_text="Choose Directory",
-                                                                 item_list=suggested_output_directory,
-                                                                 item_text=basename_list)
-
-                        if chosen_directory in suggested_output_directory:
-                            self.output_directory = chosen_directory
-                            self.log_and_show(f"User chose the suggested output directory: {chosen_directory}")
-                        else:
-                            # If the user did not select the suggested directory, use the previously set output
-                            # directory
-                            self.log_and_show(
-                                "User did not choose the suggested output directory. Falling back to default "
-                                "directory.")
-
-                    elif suggested_output_directory is None:
-                        # If suggest output directory returns none, use the previously set output directory
-                        # Log the result and update the GUI
-                        self.log_and_show(f"Suggest output directory returned no result. Using {self.output_directory}")
-
-                    # Catchall, use the previously set output directory
-                    else:
-                        # Log the result and update the GUI
-                        self.log_and_show(f"Suggest output directory could not function due to invalid return"
-                                          f" '{suggested_output_directory}'."
-                                          f"\nUsing {self.output_directory}")
+            # Replace consecutive spaces with a single space when custom text is removed
+            name = WHITESPACE_PATTERN.sub(' ', name)
 
-                    new_path = os.path.join(self.output_directory, os.path.basename(name))
+        except Exception as e:
+            self.log_and_show(f"An error occurred during custom text replacement: {str(e)}",
+                              create_messagebox=True,
+                              error=True)
+            return name  # Return original name if there's an error during text replacement
 
-                else:
-                    # Use the specified output directory
-                    new_path = os.path.join(self.output_directory, os.path.basename(name))
+        return name
 
-            # Attempt to rename the input and handle success or errors
-            try:
-                # Check if the new_path exists
-                if os.path.exists(new_path):
-                    # Get a non-conflicting filename
-                    new_path = self.get_non_conflicting_filename(new_path)
-
-                # Check if Artist Search is true
-                if self.artist_search_var.get():
-                    # Use artist search to find other instances of artists in files outside the current folder
-                    identified = self.artist_search()
-
-                    if identified:
-                        # Unpack the tuple
-                        (artist, artist_file_path) = identified
-
-                        # Log the result and display a messagebox to the user
-                        self.log_and_show(f"Artist Search identified {artist} outside the current folder: "
-                                          f"\n\nFile name: {artist}"
-                                          f"\n{os.path.basename(artist_file_path)} "
-                                          f"\n\nFile path: "
-                                          f"\n{artist_file_path}",
-                                          create_messagebox=True)
-                    else:
-                        # Log the action
-                        self.log_and_show(f"No Artist Search result")
+    def remove_non_ascii_symbols(self, name: str) -> str:
+        """
+        Remove non-ASCII symbols from the provided name.
 
-                # Rename the file
-                os.rename(self.file_renamer_selected_file, str(new_path))
-                self.log_and_show(f"File: '{os.path.basename(self.file_renamer_selected_file)}' renamed successfully. "
-                                  f"\nSaved to: \n{new_path}")
-                self.handle_rename_success(new_path)
+        Args:
+        name (str): The original name.
 
-            except OSError as e:
-                if "Invalid cross-device link" in str(e):
-                    # Attempt to use shutil.move if "Invalid cross-device link" error
-                    try:
-                        shutil.move(self.file_renamer_selected_file, str(new_path))
-                        self.log_and_show(
-                            f"File: '{os.path.basename(self.file_renamer_selected_file)}' renamed and moved "
-                            f"successfully."
-                            f"\nSaved to: \n{new_path}")
-                        self.handle_rename_success(new_path)
-                    except Exception as move_error:
-                        # Log the action if shutil.move also fails
-                        self.log_and_show(f"Renaming and moving file failed: {str(move_error)}",
-                                          create_messagebox=True, error=True)
-                else:
-                    # Log the action for other OSError
-                    self.log_and_show(f"{str(e)}", create_messagebox=True, error=True)
+        Returns:
+        str: The modified name with non-ASCII symbols removed.
+        """
+        # Pure ASCII names have nothing to transliterate
+        if name.isascii():
+            return name
 
-        # If an input is selected and either the queue is empty or no custom text is provided show error
-        elif self.file_renamer_selected_file and not (
-                self.file_renamer_queue or self.prefix_text_entry.get().strip() or
-                self.custom_text_entry.get().strip()):
-            # Log the action if logging is enabled
-            self.log_and_show("Input selected but nothing added to the queue. Nothing to rename.",
-                              create_messagebox=True, error=True)
-        # If no input is selected, show error
-        elif not self.file_renamer_selected_file:
-            # Log the action if logging is enabled
-            self.log_and_show("No input selected. Nothing to rename.", create_messagebox=True, error=True)
+        try:
+            # Replace non-ASCII characters with their ASCII equivalents (slashes become spaces) in one pass
+            name = name.translate(TRANSLITERATION_TABLE)
+        except Exception as e:
+            # Log and handle the error
+            self.log_and_show(f"An error occurred during non-ASCII symbol removal: {str(e)}",
+                              create_messagebox=True,
+                              error=True)
+            return name  # Return the original name if there's an error during symbol removal
 
-    def gather_and_sort(self) -> tuple:
-        """
-        Gather information from the gui and sort categories based on weights.
+        return name
 
-        Returns:
-        tuple: A tuple containing base_name, categories_text, prefix_text, custom_text, and extension.
+    def remove_symbols(self, name, remove_chars):
         """
+        Remove specified symbols from the provided name.
 
-        # Get custom text, prefix_text, basename, and file extension
-        prefix_text = self.prefix_text_entry.get().strip()
-        custom_text = self.custom_text_entry.get().strip()
-        base_name, extension = os.path.splitext(os.path.basename(self.file_renamer_selected_file))
-
-        if self.remove_artist_duplicates_var.get():
-            # Remove duplicate artists from filename
-            base_name = self.remove_artist_duplicates_from_filename(base_name)
+        Args:
+        name (str): The original name.
+        remove_chars (str): The characters to be removed from the name.
 
-        if self.remove_word_duplicates_var.get():
-            # Remove duplicate words from filename
-            base_name = self.remove_word_duplicates_from_filename(base_name)
+        Returns:
+        str: The modified name with specified symbols removed.
+        """
+        try:
+            for char in remove_chars:
+                name = name.replace(char, "")
+        except Exception as e:
+            self.log_and_show(f"An error occurred during symbol removal: {str(e)}",
+                              create_messagebox=True,
+                              error=True)
+            return name  # Return the original name if there's an error during symbol removal
 
-        # Filter categories that are both in file_renamer_queue and categories
-        weighted_categories = [category for category in self.file_renamer_queue if category in self.categories]
+        return name
 
-        # Sort the weighted_categories based on their weights in the categories dictionary
-        # Use default weight if one isn't present
-        weighted_categories.sort(key=lambda category: self.categories.get(category, self.default_weight))
+    def remove_numbers(self, name: str) -> str:
+        """
+        Remove all numbers from the provided name.
 
-        # Create a new list containing non-weighted categories from file_renamer_queue
-        categories = weighted_categories + [category for category in self.file_renamer_queue if
-                                            category not in weighted_categories]
+        Args:
+        name (str): The original name.
 
-        # Join the categories list into a space-separated string and strip any leading or trailing whitespaces
-        categories_text = ' '.join(categories).strip()
+        Returns:
+        str: The modified name with numbers removed.
+        """
+        try:
+            name = ''.join(char for char in name if not char.isdigit())
+        except Exception as e:
+            self.log_and_show(f"An error occurred during number removal: {str(e)}",
+                              create_messagebox=True,
+                              error=True)
+            return name  # Return the original name if there's an error during number removal
 
-        # Return a tuple containing the data
-        return base_name, categories_text, prefix_text, custom_text, extension
+        return name
 
-    def construct_new_name(self, base_name: str, categories_text: str, prefix_text: str, custom_text: str,
-                           extension: str) -> tuple:
+    def remove_text_trailing(self, name, symbol):
         """
-        Construct a new file name based on specified parameters.
+        Remove text in parentheses and trailing text.
 
         Args:
-        base_name (str): The original base name of the file.
-        categories_text (str): Space-separated string containing categories sorted based on weights.
-        prefix_text (str): Custom prefix text.
-        custom_text (str): Custom text.
-        extension (str): File extension.
+        name (str): The original name.
+        symbol (str): The symbol indicating the beginning of the trailing text.
 
         Returns:
-        tuple: A tuple containing the constructed new file name and its length.
+        str: The modified name with trailing text removed.
         """
-        # Place the queue at the beginning of the name
-        if self.placement_choice.get() == "prefix":
-            name = f"{prefix_text} {custom_text} {categories_text} {base_name}".strip()
-        # Place the queue at the first instance of the special character
-        elif self.placement_choice.get() == "special_character":
-            parts = base_name.split(self.special_character_var, 1)
-            if len(parts) == 2:
-                name = f"{prefix_text} {parts[0].rstrip()} {categories_text} {custom_text} {parts[1].lstrip()}".strip()
-                try:
-                    # Remove the tail __-__ if found
-                    name = name.replace("__-__", "")
-                except OSError as e:
-                    # Log the action if logging is enabled
-                    self.log_and_show(f"{str(e)}", create_messagebox=True, error=True)
-            else:
-                # If there's no special character found, fallback to edge case custom formatting
-                name = f"{prefix_text} {categories_text} {custom_text} {base_name}".strip()
-        else:  # Default to suffix
-            name = f"{prefix_text} {base_name} {categories_text} {custom_text}".strip()
-
-        # Remove extra whitespaces from the name
-        name = " ".join(name.split()).strip()
-
-        # Construct the name by adding the base_name and extension
-        name = name + extension
-
-        # Get the length of the name
-        name_length = len(name)
+        try:
+            index = name.find(symbol)
+            if index != -1:
+                name = name[:index].strip()
+        except Exception as e:
+            self.log_and_show(f"An error occurred during trailing text removal: {str(e)}",
+                              create_messagebox=True,
+                              error=True)
+            return name  # Return the original name if there's an error during trailing text removal
 
-        return name, name_length
+        return name
 
-    def get_non_conflicting_filename(self, path: str) -> Union[str, None]:
+    def remove_dashes(self, name: str) -> str:
         """
-        Get a non-conflicting filename by appending a counter to the base filename if conflicts are detected.
+        Remove dashes from the provided name.
 
         Args:
-        - path (str): The original file path.
+        name (str): The original name.
 
         Returns:
-        - Union[str, None]: The non-conflicting filename or None if an error occurs.
-
-        Raises:
-        - OSError: If an error occurs while checking for file existence or constructing the new filename.
+        str: The modified name with dashes removed.
+        """
+        try:
+            name = re.sub(r'-', '', name)
+        except Exception as e:
+            self.log_and_show(f"An error occurred during dash removal: {str(e)}",
+                              create_messagebox=True,
+                              error=True)
+            return name  # Return the original name if there's an error during dash removal
 
-        Examples:
-        self.get_non_conflicting_filename("/path/to/file.txt")
-        '/path/to/file (1).txt'
+        return name
 
-        self.get_non_conflicting_filename("/path/to/file (1).txt")
-        '/path/to/file (2).txt'
+    def remove_endashes(self, name: str) -> str:
         """
-        # Log the action and display a message
-        self.log_and_show(f"Conflict detected on: '{os.path.basename(path)}'")
-
-        try:
-            # Split the given path into the base filename and its extension.
-            base, ext = os.path.splitext(os.path.basename(path))
+        Remove endashes from the provided name.
 
-            # Extract the counter from the original filename if it exists.
-            counter = 1
-            match = re.match(r'(.+) \((\d+)\)', base)
-            if match:
-                base, counter = match.groups()
-                counter = int(counter)
+        Args:
+        name (str): The original name.
 
-            # Check if the file already exists at the given path.
-            while os.path.exists(os.path.join(os.path.dirname(path), f"{base} ({counter}){ext}")):
-                # If the file exists, update the counter.
-                counter += 1
+        Returns:
+        str: The modified name with endashes removed.
+        """
+        try:
+            name = re.sub(r'–', '', name)
+        except Exception as e:
+            self.log_and_show(f"An error occurred during endash removal: {str(e)}",
+                              create_messagebox=True,
+                              error=True)
+            return name  # Return the original name if there's an error during endash removal
 
-            # Construct the new base filename with the updated counter.
-            new_base = f"{base} ({counter})"
+        return name
 
-            # Construct the new path by joining the directory and the new base filename.
-            new_path = os.path.join(os.path.dirname(path), f"{new_base}{ext}")
+    def remove_emdashes(self, name: str) -> str:
+        """
+        Remove emdashes from the provided name.
 
-            # Log action and display a message
-            self.log_and_show(f"Using non-conflicting file name: {new_base}{ext}")
+        Args:
+        name (str): The original name.
 
-            # Return the generated non-conflicting filename.
-            return new_path
+        Returns:
+        str: The modified name with emdashes removed.
+        """
+        try:
+            name = re.sub(r'—', '', name)
         except Exception as e:
-            # Log error and display an error message when get non-conflicting file name fails.
-            self.log_and_show(f"Getting non-conflicting file name failed: {str(e)}", create_messagebox=True,
+            # Log and handle the error
+            self.log_and_show(f"An error occurred during emdash removal: {str(e)}",
+                              create_messagebox=True,
                               error=True)
+            return name  # Return the original name if there's an error during emdash removal
 
-            # Return None in case of an error.
-            return None
+        return name
 
-    @staticmethod
-    def move_text(name: str) -> str:
+    def remove_ampersands(self, name: str) -> str:
         """
-        Move the text between '-' and '__-__' in the given name.
+        Remove ampersands from the provided name.
 
         Args:
-        - name (str): The original name containing the text to be moved.
+        name (str): The original name.
 
         Returns:
-        - str: The modified name with the text moved.
-
-        Example:
-        self.move_text("Artist - words to move__-__file.mp3")
-        'Artist file words to move.mp3'
+        str: The modified name with ampersands removed.
         """
-        # Move the text between - and __-__ in the name
-        match = re.match(r"^(.*) - (.*?)__-__ (.*)\.(\w+)$", name)
-        if match:
-            prefix, moved_text, suffix, extension = match.groups()
-            name = f"{prefix} {suffix} {moved_text}.{extension}"
-        return name
+        try:
+            name = re.sub(r'&', '', name)
+        except Exception as e:
+            # Log and handle the error
+            self.log_and_show(f"An error occurred during ampersand removal: {str(e)}",
+                              create_messagebox=True,
+                              error=True)
+            return name  # Return the original name if there's an error during ampersand removal
 
-    """
-    Name Normalizer
-    """
+        return name
 
-    def remove_custom_user_text(self, name: str) -> str:
+    def remove_at_symbols(self, name: str) -> str:
         """
-        Remove custom user-specified text from the provided name.
+        Remove at symbols from the provided name.
 
         Args:
         name (str): The original name.
 
         Returns:
-        str: The modified name with custom user text removed.
+        str: The modified name with at symbols removed.
         """
         try:
-            # Get the text to remove from the entry
-            text_to_remove = self.custom_text_removal_entry.get().strip()
+            name = re.sub(r'@', '', name)
         except Exception as e:
-            self.log_and_show(f"An error occurred getting the custom text to remove: {str(e)}",
+            # Log and handle the error
+            self.log_and_show(f"An error occurred during at symbol removal: {str(e)}",
                               create_messagebox=True,
                               error=True)
-            return name  # Return original name if there's an error retrieving custom text
+            return name  # Return the original name if there's an error during at symbol removal
 
-        try:
-            # Check if text to remove is provided
-            if text_to_remove:
-                if self.replace_mode_var.get():
-                    # Check if the text to remove is present in name (case-insensitive)
-                    pattern = re.compile(re.escape(text_to_remove), re.IGNORECASE)
+        return name
 
-                    # Remove all instances of the text to remove from name
-                    name = pattern.sub('', name)
+    def remove_underscores(self, name: str) -> str:
+        """
+        Remove underscores from the provided name.
 
-                    # Replace consecutive spaces with a single space when custom text is removed
-                    name = re.sub(r'\s+', ' ', name)
-                else:
-                    # Check if the text to remove is present in name (case-sensitive)
-                    if text_to_remove in name:
-                        # Remove all instances of the text to remove from name
-                        name = name.replace(text_to_remove, '')
+        Args:
+        name (str): The original name.
 
-                        # Replace consecutive spaces with a single space when custom text is removed
-                        name = re.sub(r'\s+', ' ', name)
+        Returns:
+        str: The modified name with underscores replaced by spaces.
+        """
+        try:
+            name = name.replace('_', ' ')
         except Exception as e:
-            self.log_and_show(f"An error occurred during text removal: {str(e)}",
+            # Log and handle the error
+            self.log_and_show(f"An error occurred during underscore removal: {str(e)}",
                               create_messagebox=True,
                               error=True)
-            # Return original name if there's an error during text removal
-            return name
+            return name  # Return the original name if there's an error during underscore removal
 
         return name
 
-    def replace_user_text(self, name: str) -> str:
+    def remove_commas(self, name: str) -> str:
         """
-        Replace user-specified text from the provided name.
+        Remove commas from the provided name.
 
         Args:
         name (str): The original name.
 
         Returns:
-        str: The modified name with user-specified text removed or replaced.
+        str: The modified name with commas removed.
         """
         try:
-            # Get the original text and replacement text from the entry
-            original_entry = self.original_entry.get().strip()
-            replace_entry = self.replace_entry.get().strip()
+            name = name.replace(',', '')
         except Exception as e:
-            self.log_and_show(f"An error occurred getting the original text or text to replace: {str(e)}",
+            # Log and handle the error
+            self.log_and_show(f"An error occurred during comma removal: {str(e)}",
                               create_messagebox=True,
                               error=True)
-            return name  # Return original name if there's an error retrieving original or replacement text
+            return name  # Return the original name if there's an error during comma removal
 
-        try:
-            # Check if the original_entry is provided
-            if original_entry:
-                # Replace user-specified text from the name
-                if self.replace_mode_var.get():
-                    # Check if the text to replace is present in name (case-insensitive)
-                    pattern = re.compile(re.escape(original_entry), re.IGNORECASE)
+        return name
 
-                    # Replace the text with the specified replacement or remove if replacement is an empty string
-                    name = pattern.sub(replace_entry, name)
+    def remove_single_quotes(self, name: str) -> str:
+        """
+        Remove single quotes from the provided name.
 
-                else:
-                    # Check if the text to remove is present in name (case-sensitive)
-                    if original_entry in name:
-                        # Remove all instances of the text to remove from name
-                        name = name.replace(original_entry, replace_entry)
+        Args:
+        name (str): The original name.
 
-                # Replace consecutive spaces with a single space when custom text is removed
-                name = re.sub(r'\s+', ' ', name)
+        Returns:
+        str: The modified name with single quotes removed.
+        """
+        try:
+            name = name.replace('\'', '')
         except Exception as e:
-            self.log_and_show(f"An error occurred during text replacement: {str(e)}",
+            # Log and handle the error
+            self.log_and_show(f"An error occurred during single quote removal: {str(e)}",
                               create_messagebox=True,
                               error=True)
-            return name  # Return original name if there's an error during text replacement
+            return name  # Return the original name if there's an error during single quote removal
 
         return name
 
-    def replace_custom_text(self, name: str) -> str:
+    def remove_double_quotes(self, name: str) -> str:
         """
-        Replace custom text from the custom_text_to_replace dictionary.
+        Remove double quotes from the provided name.
 
         Args:
         name (str): The original name.
 
         Returns:
-        str: The modified name with custom text removed or replaced.
+        str: The modified name with double quotes removed.
         """
         try:
-            # Replace custom text from the custom_text_to_replace dictionary
-            if self.replace_mode_var.get():
-                for text_to_replace, replacement in self.custom_text_to_replace.items():
-                    # Check if the text to replace is present in name (case-insensitive)
-                    pattern = re.compile(re.escape(text_to_replace), re.IGNORECASE)
+            name = name.replace('\"', '')
+        except Exception as e:
+            # Log and handle the error
+            self.log_and_show(f"An error occurred during double quote removal: {str(e)}",
+                              create_messagebox=True,
+                              error=True)
+            return name  # Return the original name if there's an error during double quote removal
 
-                    # Replace the text with the specified replacement or remove if replacement is an empty string
-                    name = pattern.sub(replacement, name) if replacement != "" else pattern.sub('', name)
-            else:
-                # Check if the text to replace is present in name (case-sensitive)
-                for text_to_replace, replacement in self.custom_text_to_replace.items():
-                    # Replace the text with the specified replacement or remove if replacement is an empty string
-                    name = name.replace(text_to_replace, replacement) if replacement != "" else name.replace(
-                        text_to_replace, '')
+        return name
 
-            # Replace consecutive spaces with a single space when custom text is removed
-            name = re.sub(r'\s+', ' ', name)
+    def remove_colons(self, name: str) -> str:
+        """
+        Remove colons from the provided name.
 
+        Args:
+        name (str): The original name.
+
+        Returns:
+        str: The modified name with colons removed.
+        """
+        try:
+            name = name.replace(':', '')
         except Exception as e:
-            self.log_and_show(f"An error occurred during custom text replacement: {str(e)}",
+            # Log and handle the error
+            self.log_and_show(f"An error occurred during colon removal: {str(e)}",
                               create_messagebox=True,
                               error=True)
-            return name  # Return original name if there's an error during text replacement
+            return name  # Return the original name if there's an error during colon removal
 
         return name
 
-    def remove_non_ascii_symbols(self, name: str) -> str:
+    def remove_semicolons(self, name: str) -> str:
         """
-        Remove non-ASCII symbols from the provided name.
+        Remove semicolons from the provided name.
 
         Args:
         name (str): The original name.
 
         Returns:
-        str: The modified name with non-ASCII symbols removed.
+        str: The modified name with semicolons removed.
         """
         try:
-            # Get all printable ASCII characters
-            standard_chars = set(string.printable)
-
-            # Replace non-ASCII characters with their ASCII equivalents (ignore slashes)
-            name = ''.join(unidecode(char) if char not in standard_chars and char not in ['⁄', '／']
-                           else char if char not in ['⁄', '／'] else ' ' for char in name)
+            name = name.replace(';', '')
         except Exception as e:
             # Log and handle the error
-            self.log_and_show(f"An error occurred during non-ASCII symbol removal: {str(e)}",
+            self.log_and_show(f"An error occurred during semicolon removal: {str(e)}",
                               create_messagebox=True,
                               error=True)
-            return name  # Return the original name if there's an error during symbol removal
+            return name  # Return the original name if there's an error during semicolon removal
 
         return name
 
-    def remove_symbols(self, name, remove_chars):
+    def remove_percents(self, name: str) -> str:
         """
-        Remove specified symbols from the provided name.
+        Remove percents from the provided name.
 
         Args:
         name (str): The original name.
-        remove_chars (str): The characters to be removed from the name.
 
         Returns:
-        str: The modified name with specified symbols removed.
+        str: The modified name with percents removed.
         """
         try:
-            for char in remove_chars:
-                name = name.replace(char, "")
+            name = name.replace('%', '')
         except Exception as e:
-            self.log_and_show(f"An error occurred during symbol removal: {str(e)}",
+            # Log and handle the error
+            self.log_and_show(f"An error occurred during percent removal: {str(e)}",
                               create_messagebox=True,
                               error=True)
-            return name  # Return the original name if there's an error during symbol removal
+            return name  # Return the original name if there's an error during percent removal
 
         return name
 
-    def remove_numbers(self, name: str) -> str:
+    def remove_carets(self, name: str) -> str:
         """
-        Remove all numbers from the provided name.
+        Remove carets from the provided name.
 
         Args:
         name (str): The original name.
 
         Returns:
-        str: The modified name with numbers removed.
+        str: The modified name with carets removed.
         """
         try:
-            name = ''.join(char for char in name if not char.isdigit())
+            name = name.replace('^', '')
         except Exception as e:
-            self.log_and_show(f"An error occurred during number removal: {str(e)}",
+            # Log and handle the error
+            self.log_and_show(f"An error occurred during caret removal: {str(e)}",
                               create_messagebox=True,
                               error=True)
-            return name  # Return the original name if there's an error during number removal
+            return name  # Return the original name if there's an error during caret removal
 
         return name
 
-    def remove_text_trailing(self, name, symbol):
+    def remove_parenthesis(self, name: str) -> str:
         """
-        Remove text in parentheses and trailing text.
+        Remove parenthesis from the provided name.
 
         Args:
         name (str): The original name.
-        symbol (str): The symbol indicating the beginning of the trailing text.
 
         Returns:
-        str: The modified name with trailing text removed.
+        str: The modified name with parenthesis removed.
         """
         try:
-            index = name.find(symbol)
-            if index != -1:
-                name = name[:index].strip()
+            name = name.replace('(', '').replace(')', '')
         except Exception as e:
-            self.log_and_show(f"An error occurred during trailing text removal: {str(e)}",
+            # Log and handle the error
+            self.log_and_show(f"An error occurred during parenthesis removal: {str(e)}",
                               create_messagebox=True,
                               error=True)
-            return name  # Return the original name if there's an error during trailing text removal
+            return name  # Return the original name if there's an error during parenthesis removal
 
         return name
 
-    def remove_dashes(self, name: str) -> str:
+    def remove_hashtags(self, name: str) -> str:
         """
-        Remove dashes from the provided name.
+        Remove hashtags from the provided name.
 
         Args:
         name (str): The original name.
 
         Returns:
-        str: The modified name with dashes removed.
+        str: The modified name with hashtags removed.
         """
         try:
-            name = re.sub(r'-', '', name)
+            name = name.replace('#', '')
         except Exception as e:
-            self.log_and_show(f"An error occurred during dash removal: {str(e)}",
+            # Log and handle the error
+            self.log_and_show(f"An error occurred during hashtag removal: {str(e)}",
                               create_messagebox=True,
                               error=True)
-            return name  # Return the original name if there's an error during dash removal
+            return name  # Return the original name if there's an error during hashtag removal
 
         return name
 
-    def remove_endashes(self, name: str) -> str:
+    def remove_dollar_signs(self, name: str) -> str:
         """
-        Remove endashes from the provided name.
+        Remove dollar signs from the provided name.
 
         Args:
         name (str): The original name.
 
         Returns:
-        str: The modified name with endashes removed.
+        str: The modified name with dollar signs removed.
         """
         try:
-            name = re.sub(r'–', '', name)
+            name = name.replace('$', '')
         except Exception as e:
-            self.log_and_show(f"An error occurred during endash removal: {str(e)}",
+            # Log and handle the error
+            self.log_and_show(f"An error occurred during dollar sign removal: {str(e)}",
                               create_messagebox=True,
                               error=True)
-            return name  # Return the original name if there's an error during endash removal
+            return name  # Return the original name if there's an error during dollar sign removal
 
         return name
 
-    def remove_emdashes(self, name: str) -> str:
+    def remove_asterisks(self, name: str) -> str:
         """
-        Remove emdashes from the provided name.
+        Remove asterisks from the provided name.
 
         Args:
         name (str): The original name.
 
         Returns:
-        str: The modified name with emdashes removed.
+        str: The modified name with asterisks removed.
         """
         try:
-            name = re.sub(r'—', '', name)
+            name = name.replace('*', '')
         except Exception as e:
             # Log and handle the error
-            self.log_and_show(f"An error occurred during emdash removal: {str(e)}",
+            self.log_and_show(f"An error occurred during asterisk removal: {str(e)}",
                               create_messagebox=True,
                               error=True)
-            return name  # Return the original name if there's an error during emdash removal
+            return name  # Return the original name if there's an error during asterisk removal
 
         return name
 
-    def remove_ampersands(self, name: str) -> str:
+    def remove_plus_signs(self, name: str) -> str:
         """
-        Remove ampersands from the provided name.
+        Remove plus signs from the provided name.
 
         Args:
         name (str): The original name.
 
         Returns:
-        str: The modified name with ampersands removed.
+        str: The modified name with plus signs removed.
         """
         try:
-            name = re.sub(r'&', '', name)
+            name = name.replace('+', '')
         except Exception as e:
             # Log and handle the error
-            self.log_and_show(f"An error occurred during ampersand removal: {str(e)}",
+            self.log_and_show(f"An error occurred during plus sign removal: {str(e)}",
                               create_messagebox=True,
                               error=True)
-            return name  # Return the original name if there's an error during ampersand removal
+            return name  # Return the original name if there's an error during plus sign removal
 
         return name
 
-    def remove_at_symbols(self, name: str) -> str:
+    def remove_equal_signs(self, name: str) -> str:
         """
-        Remove at symbols from the provided name.
+        Remove equal signs from the provided name.
 
         Args:
         name (str): The original name.
 
         Returns:
-        str: The modified name with at symbols removed.
+        str: The modified name with equal signs removed.
         """
         try:
-            name = re.sub(r'@', '', name)
+            name = name.replace('=', '')
         except Exception as e:
             # Log and handle the error
-            self.log_and_show(f"An error occurred during at symbol removal: {str(e)}",
+            self.log_and_show(f"An error occurred during equal sign removal: {str(e)}",
                               create_messagebox=True,
                               error=True)
-            return name  # Return the original name if there's an error during at symbol removal
+            return name  # Return the original name if there's an error during equal sign removal
 
         return name
 
-    def remove_underscores(self, name: str) -> str:
+    def remove_curly_braces(self, name: str) -> str:
         """
-        Remove underscores from the provided name.
+        Remove curly braces from the provided name.
 
         Args:
         name (str): The original name.
 
         Returns:
-        str: The modified name with underscores replaced by spaces.
+        str: The modified name with curly braces removed.
         """
         try:
-            name = name.replace('_', ' ')
+            name = name.replace('{', '').replace('}', '')
         except Exception as e:
             # Log and handle the error
-            self.log_and_show(f"An error occurred during underscore removal: {str(e)}",
+            self.log_and_show(f"An error occurred during curly brace removal: {str(e)}",
                               create_messagebox=True,
                               error=True)
-            return name  # Return the original name if there's an error during underscore removal
+            return name  # Return the original name if there's an error during curly brace removal
 
         return name
 
-    def remove_commas(self, name: str) -> str:
+    def remove_square_brackets(self, name: str) -> str:
         """
-        Remove commas from the provided name.
+        Remove square brackets from the provided name.
 
         Args:
         name (str): The original name.
 
         Returns:
-        str: The modified name with commas removed.
+        str: The modified name with square brackets removed.
         """
         try:
-            name = name.replace(',', '')
+            name = name.replace('[', '').replace(']', '')
         except Exception as e:
             # Log and handle the error
-            self.log_and_show(f"An error occurred during comma removal: {str(e)}",
+            self.log_and_show(f"An error occurred during square bracket removal: {str(e)}",
                               create_messagebox=True,
                               error=True)
-            return name  # Return the original name if there's an error during comma removal
+            return name  # Return the original name if there's an error during square bracket removal
 
         return name
 
-    def remove_single_quotes(self, name: str) -> str:
+    def remove_pipes(self, name: str) -> str:
         """
-        Remove single quotes from the provided name.
+        Remove pipes from the provided name.
 
         Args:
         name (str): The original name.
 
         Returns:
-        str: The modified name with single quotes removed.
+        str: The modified name with pipes removed.
         """
         try:
-            name = name.replace('\'', '')
+            name = name.replace('|', '')
         except Exception as e:
             # Log and handle the error
-            self.log_and_show(f"An error occurred during single quote removal: {str(e)}",
+            self.log_and_show(f"An error occurred during pipe removal: {str(e)}",
                               create_messagebox=True,
                               error=True)
-            return name  # Return the original name if there's an error during single quote removal
+            return name  # Return the original name if there's an error during pipe removal
 
         return name
 
-    def remove_double_quotes(self, name: str) -> str:
+    def remove_backslashes(self, name: str) -> str:
         """
-        Remove double quotes from the provided name.
+        Remove backslashes from the provided name.
 
         Args:
         name (str): The original name.
 
         Returns:
-        str: The modified name with double quotes removed.
+        str: The modified name with backslashes removed.
         """
         try:
-            name = name.replace('\"', '')
+            name = name.replace('\\', '')
         except Exception as e:
             # Log and handle the error
-            self.log_and_show(f"An error occurred during double quote removal: {str(e)}",
+            self.log_and_show(f"An error occurred during backslash removal: {str(e)}",
                               create_messagebox=True,
                               error=True)
-            return name  # Return the original name if there's an error during double quote removal
+            return name  # Return the original name if there's an error during backslash removal
 
         return name
 
-    def remove_colons(self, name: str) -> str:
+    def remove_angle_brackets(self, name: str) -> str:
         """
-        Remove colons from the provided name.
+        Remove angle brackets from the provided name.
 
         Args:
         name (str): The original name.
 
         Returns:
-        str: The modified name with colons removed.
+        str: The modified name with angle brackets removed.
         """
         try:
-            name = name.replace(':', '')
+            name = name.replace('<', '').replace('>', '')
         except Exception as e:
             # Log and handle the error
-            self.log_and_show(f"An error occurred during colon removal: {str(e)}",
+            self.log_and_show(f"An error occurred during angle bracket removal: {str(e)}",
                               create_messagebox=True,
                               error=True)
-            return name  # Return the original name if there's an error during colon removal
+            return name  # Return the original name if there's an error during angle bracket removal
 
         return name
 
-    def remove_semicolons(self, name: str) -> str:
+    def remove_question_marks(self, name: str) -> str:
         """
-        Remove semicolons from the provided name.
+        Remove question marks from the provided name.
 
         Args:
         name (str): The original name.
 
         Returns:
-        str: The modified name with semicolons removed.
+        str: The modified name with question marks removed.
         """
         try:
-            name = name.replace(';', '')
+            name = name.replace('?', '')
         except Exception as e:
             # Log and handle the error
-            self.log_and_show(f"An error occurred during semicolon removal: {str(e)}",
+            self.log_and_show(f"An error occurred during question mark removal: {str(e)}",
                               create_messagebox=True,
                               error=True)
-            return name  # Return the original name if there's an error during semicolon removal
+            return name  # Return the original name if there's an error during question mark removal
 
         return name
 
-    def remove_percents(self, name: str) -> str:
+    def title_the_name(self, name: str) -> str:
         """
-        Remove percents from the provided name.
+        Make the file name a title while preserving lowercase letters after apostrophes in contractions.
+        If [, {, or ( are used, capitalize the very next letter unless it's whitespace.
+        Words from the title_exceptions list in the dictionary file stay lowercase inside the title.
 
         Args:
         name (str): The original name.
 
         Returns:
-        str: The modified name with percents removed.
+        str: The modified name with title case.
         """
         try:
-            name = name.replace('%', '')
+            # Title-case the name, keeping the small words from the dictionary file lowercase
+            return self.title_caser.title(name)
         except Exception as e:
             # Log and handle the error
-            self.log_and_show(f"An error occurred during percent removal: {str(e)}",
+            self.log_and_show(f"An error occurred during title formatting: {str(e)}",
                               create_messagebox=True,
                               error=True)
-            return name  # Return the original name if there's an error during percent removal
-
-        return name
+            return name  # Return the original name if there's an error during title formatting
 
-    def remove_carets(self, name: str) -> str:
+    def remove_extra_whitespace(self, name: str) -> str:
         """
-        Remove carets from the provided name.
+        Sanitize the filename by removing extra whitespaces.
 
         Args:
         name (str): The original name.
 
         Returns:
-        str: The modified name with carets removed.
+        str: The modified name with extra whitespaces removed.
         """
         try:
-            name = name.replace('^', '')
+            name = ' '.join(name.split())
         except Exception as e:
             # Log and handle the error
-            self.log_and_show(f"An error occurred during caret removal: {str(e)}",
+            self.log_and_show(f"An error occurred during whitespace removal: {str(e)}",
                               create_messagebox=True,
                               error=True)
-            return name  # Return the original name if there's an error during caret removal
+            return name  # Return the original name if there's an error during whitespace removal
 
         return name
 
-    def remove_parenthesis(self, name: str) -> str:
+    def get_artist_file_signature(self) -> Union[tuple, None]:
         """
-        Remove parenthesis from the provided name.
+        Get a signature of the artist file used to detect changes.
+
+        Returns:
+            tuple or None: The artist file's modification time and size, or None if it cannot be accessed.
+        """
+        try:
+            stat = os.stat(self.artist_file)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None
+
+    def load_artist_list(self) -> tuple:
+        """
+        Load the list of artists and their compiled case-insensitive patterns, reusing the cached copy until the
+        artist file changes on disk.
+
+        Returns:
+            tuple: A tuple containing the list of artists and the list of compiled patterns.
+
+        Raises:
+            FileNotFoundError: If the artist file specified is not found.
+        """
+        signature = self.get_artist_file_signature()
+
+        # Reload the artist file if it changed (or could not be accessed)
+        if signature is None or signature != self.artist_file_signature:
+            # Read the list of artists from the artist_file
+            with open(self.artist_file, 'r') as artist_list_file:
+                artists = [artist.strip() for artist in artist_list_file]
+
+            # Compile the whole-word, case-insensitive patterns once
+            self.cached_artist_patterns = [re.compile(rf'\b{re.escape(artist)}\b', re.IGNORECASE)
+                                           for artist in artists]
+            self.cached_artist_list = artists
+            self.artist_file_signature = signature
+
+        return self.cached_artist_list, self.cached_artist_patterns
+
+    def artist_identifier(self, name: str) -> str:
+        """
+        Identify artists in the given filename and modify the filename accordingly.
 
         Args:
-        name (str): The original name.
+            name (str): The original filename to be processed.
 
         Returns:
-        str: The modified name with parenthesis removed.
+            str: The modified filename with artist information.
+
+        Raises:
+            FileNotFoundError: If the artist file specified is not found.
+            Exception: For any other unexpected errors during the artist identification process.
+
         """
         try:
-            name = name.replace('(', '').replace(')', '')
+            # Get the cached list of artists and their compiled patterns from the artist_file
+            artists, patterns = self.load_artist_list()
+
+            # Search for artist names and add them as prefixes
+            artist_prefix = ''
+            for artist, regex in zip(artists, patterns):
+                # The patterns are case-insensitive
+                if regex.search(name):
+                    artist_prefix += f"{artist} "
+
+            # Remove extra spaces and dashes at the beginning and end
+            artist_prefix = artist_prefix.strip()
+            name = name.strip("-")
+
+            # Add artist prefix to the filename if artist_prefix is not empty
+            name = f"{artist_prefix} - {name}" if artist_prefix else name
+
+        except FileNotFoundError:
+            self.log_and_show(f"File not found: {self.artist_file}", create_messagebox=True, error=True)
         except Exception as e:
-            # Log and handle the error
-            self.log_and_show(f"An error occurred during parenthesis removal: {str(e)}",
-                              create_messagebox=True,
+            self.log_and_show(f"Artist Identifier failed {self.artist_file}: {e}", create_messagebox=True,
                               error=True)
-            return name  # Return the original name if there's an error during parenthesis removal
-
         return name
 
-    def remove_hashtags(self, name: str) -> str:
+    def add_prefix(self, name: str) -> str:
         """
-        Remove hashtags from the provided name.
+        Add a prefix to the beginning of the provided name.
 
         Args:
         name (str): The original name.
 
         Returns:
-        str: The modified name with hashtags removed.
+        str: The modified name with the added prefix.
         """
         try:
-            name = name.replace('#', '')
+            # Get the prefix_entry text from the entry
+            prefix_entry = self.prefix_entry.get().strip()
+
+            # Check if there is a prefix
+            if prefix_entry:
+                # Add prefix to the beginning of the name
+                name = f"{prefix_entry} {name}"
+
+            return name
         except Exception as e:
-            # Log and handle the error
-            self.log_and_show(f"An error occurred during hashtag removal: {str(e)}",
+            self.log_and_show(f"An error occurred adding the prefix: {str(e)}",
                               create_messagebox=True,
                               error=True)
-            return name  # Return the original name if there's an error during hashtag removal
-
-        return name
+            return name
 
-    def remove_dollar_signs(self, name: str) -> str:
+    def add_suffix(self, name: str) -> str:
         """
-        Remove dollar signs from the provided name.
+        Add a suffix to the end of the provided name.
 
         Args:
         name (str): The original name.
 
         Returns:
-        str: The modified name with dollar signs removed.
+        str: The modified name with the added suffix.
         """
         try:
-            name = name.replace('$', '')
+            # Get the suffix_entry text from the entry
+            suffix_entry = self.suffix_entry.get().strip()
+
+            # Check if there is a suffix
+            if suffix_entry:
+                # Add suffix to the end of the name
+                name += f" {suffix_entry}"
+
+            return name
         except Exception as e:
-            # Log and handle the error
-            self.log_and_show(f"An error occurred during dollar sign removal: {str(e)}",
+            self.log_and_show(f"An error occurred adding the suffix: {str(e)}",
                               create_messagebox=True,
                               error=True)
-            return name  # Return the original name if there's an error during dollar sign removal
-
-        return name
+            return name
 
-    def remove_asterisks(self, name: str) -> str:
+    def add_tail(self, name: str) -> str:
         """
-        Remove asterisks from the provided name.
+        Add a tail to the end of the provided name.
 
         Args:
         name (str): The original name.
 
         Returns:
-        str: The modified name with asterisks removed.
+        str: The modified name with the added tail.
         """
         try:
-            name = name.replace('*', '')
+            # Add tail to the end of the name
+            name += "__-__ "
+
+            # Catchall for situations where only "artist -__-__" is present after operation
+            name = re.sub(r' -__-__', '', name).strip()
+
+            # Catchall for situations where the tail is already present "__-____-__"
+            name = re.sub(r'__-____-__', '__-__', name).strip()
         except Exception as e:
             # Log and handle the error
-            self.log_and_show(f"An error occurred during asterisk removal: {str(e)}",
+            self.log_and_show(f"An error occurred during tail addition: {str(e)}",
                               create_messagebox=True,
                               error=True)
-            return name  # Return the original name if there's an error during asterisk removal
+            return name  # Return the original name if there's an error during tail addition
 
         return name
 
-    def remove_plus_signs(self, name: str) -> str:
+    def remove_word_duplicates_from_filename(self, name: str) -> str:
         """
-        Remove plus signs from the provided name.
+        Remove duplicate words from the filename while preserving the original order of words.
 
-        Args:
-        name (str): The original name.
+        Parameters:
+        - name (str): The filename with or without a path.
 
         Returns:
-        str: The modified name with plus signs removed.
+        - str: The modified filename with duplicate words removed and original word order preserved.
         """
         try:
-            name = name.replace('+', '')
+            # Extract the file name without the path
+            basename = os.path.basename(name)
+
+            # Find the first occurrence of '-'
+            index = basename.find('-')
+
+            if index != -1:
+                # Temporary removal of everything before the dash
+                temp_name = basename[index + 1:]
+                temp_name = temp_name.strip()
+
+                # Split the temp_name into words while preserving the order
+                words = temp_name.split()
+            else:
+                # Split the basename into words while preserving the order
+                words = basename.split()
+
+            # Use OrderedDict to keep track of unique words in order
+            unique_words_dict = OrderedDict.fromkeys(words)
+
+            # Join the unique words back into the basename while preserving order
+            new_basename = ' '.join(unique_words_dict)
+
+            if index != -1:
+                # Add the prefix back to the new_basename
+                new_basename = f"{basename[:index + 1]} {new_basename.strip()}"
+
+            return new_basename
+
         except Exception as e:
-            # Log and handle the error
-            self.log_and_show(f"An error occurred during plus sign removal: {str(e)}",
-                              create_messagebox=True,
-                              error=True)
-            return name  # Return the original name if there's an error during plus sign removal
+            self.log_and_show(f"Removing duplicate words failed: {e}", create_messagebox=True, error=True)
+            return name  # Return the original filename in case of an error
 
-        return name
+    def remove_artist_duplicates_from_filename(self, file_name: str) -> str:
+        """
+        Remove artist names from the given file name by processing the list of artists
+        read from the artist_file and modifying the file name accordingly.
 
-    def remove_equal_signs(self, name: str) -> str:
+        Parameters:
+            file_name (str): The original file name.
+
+        Returns:
+            str: The modified file name with artist names removed.
+
+        Example:
+            self.remove_artist_duplicates_from_filename('Artist - A Title Artist - Album Version Artist')
+            'Artist - A Title - Album Version'
         """
-        Remove equal signs from the provided name.
+        try:
+            # Get the cached compiled artist patterns from the artist_file
+            _, artist_patterns = self.load_artist_list()
+
+            # Extract the file name without the path
+            basename = os.path.basename(file_name)
+
+            # Find the first occurrence of '-'
+            index = basename.find('-')
+
+            if index != -1:
+                # Temporary removal of everything before the dash
+                temp_name = basename[index + 1:]
+                temp_name = temp_name.strip()
+
+                # Search for artist names and remove them (the patterns are case-insensitive)
+                for regex in artist_patterns:
+                    temp_name = regex.sub('', temp_name)
+
+                # Reattach the dash and any remaining text
+                new_file_name = f"{basename[:index + 1]} {temp_name.strip()}"
+            else:
+                # No dash found, return the original filename
+                return file_name
+
+            # Sanitize file name. Remove extra whitespace.
+            new_file_name = ' '.join(new_file_name.split()).strip()
 
-        Args:
-        name (str): The original name.
+            # Check for double dashes and remove the second dash
+            if ' - - ' in new_file_name:
+                new_file_name = new_file_name.replace(' - - ', ' - ', 1)
 
-        Returns:
-        str: The modified name with equal signs removed.
-        """
-        try:
-            name = name.replace('=', '')
+            return new_file_name
         except Exception as e:
             # Log and handle the error
-            self.log_and_show(f"An error occurred during equal sign removal: {str(e)}",
+            self.log_and_show(f"An error occurred during artist name removal: {str(e)}",
                               create_messagebox=True,
                               error=True)
-            return name  # Return the original name if there's an error during equal sign removal
-
-        return name
+            return file_name  # Return the original filename if there's an error
 
-    def remove_curly_braces(self, name: str) -> str:
+    def update_nn_display(self, *_) -> None:
         """
-        Remove curly braces from the provided name.
-
-        Args:
-        name (str): The original name.
+        Update the display in the Name Normalizer window.
 
         Returns:
-        str: The modified name with curly braces removed.
+            None
         """
         try:
-            name = name.replace('{', '').replace('}', '')
-        except Exception as e:
-            # Log and handle the error
-            self.log_and_show(f"An error occurred during curly brace removal: {str(e)}",
-                              create_messagebox=True,
-                              error=True)
-            return name  # Return the original name if there's an error during curly brace removal
+            if not self.name_normalizer_selected_file:
+                # Set the name normalizer display to an empty string, cancel the folder preview and return
+                self.nn_display_text.set("")
+                self.update_nn_folder_preview()
+                return
 
-        return name
+            # Start (or keep) the folder preview for a selected folder, or cancel it for a file
+            self.update_nn_folder_preview()
 
-    def remove_square_brackets(self, name: str) -> str:
-        """
-        Remove square brackets from the provided name.
+            if self.name_normalizer_batch_active():
+                # Display the first path and the size of the batch
+                display_text = (f"BATCH: {os.path.basename(self.name_normalizer_selected_file)} "
+                                f"(+{len(self.name_normalizer_batch_paths) - 1} more)")
+            elif self.preview_mode_var.get() and os.path.isfile(self.name_normalizer_selected_file):
+                # Get the proposed name from the preview cache (computed by construct_nn_name on a miss)
+                proposed_name = self.get_nn_preview(self.name_normalizer_selected_file)
 
-        Args:
-        name (str): The original name.
+                # Sanitize for the GUI
+                if proposed_name:
+                    # Display the basename of the proposed name
+                    display_text = f"FILE: {os.path.basename(proposed_name)}"
+                else:
+                    # Display the basename of the selected file
+                    display_text = f"FILE: {os.path.basename(self.name_normalizer_selected_file)}"
+            else:
+                # Set the type of the file to be displayed in the GUI
+                type_var = "DIR" if os.path.isdir(self.name_normalizer_selected_file) else "FILE"
 
-        Returns:
-        str: The modified name with square brackets removed.
-        """
-        try:
-            name = name.replace('[', '').replace(']', '')
+                # Display the basename of the selection
+                display_text = f"{type_var}: {os.path.basename(self.name_normalizer_selected_file)}"
+
+            # Set the proposed name to the nn display
+            self.nn_display_text.set(display_text)
         except Exception as e:
             # Log and handle the error
-            self.log_and_show(f"An error occurred during square bracket removal: {str(e)}",
+            self.log_and_show(f"An error occurred during NN display update: {str(e)}",
                               create_messagebox=True,
                               error=True)
-            return name  # Return the original name if there's an error during square bracket removal
-
-        return name
 
-    def remove_pipes(self, name: str) -> str:
+    def get_nn_settings_fingerprint(self) -> tuple:
         """
-        Remove pipes from the provided name.
-
-        Args:
-        name (str): The original name.
+        Get a fingerprint of every setting that affects the Name Normalizer output.
 
         Returns:
-        str: The modified name with pipes removed.
+            tuple: A hashable tuple of the checkbox states, entry texts, dictionary version and artist file signature.
         """
-        try:
-            name = name.replace('|', '')
-        except Exception as e:
-            # Log and handle the error
-            self.log_and_show(f"An error occurred during pipe removal: {str(e)}",
-                              create_messagebox=True,
-                              error=True)
-            return name  # Return the original name if there's an error during pipe removal
+        # Checkbox/switch states used by construct_nn_name
+        flags = tuple(getattr(self, flag_name).get() for flag_name in NameNormalizerSnapshot.FLAG_NAMES)
 
-        return name
+        # Entry texts used by construct_nn_name
+        entries = tuple(getattr(self, entry_name).get().strip() for entry_name in NameNormalizerSnapshot.ENTRY_NAMES)
 
-    def remove_backslashes(self, name: str) -> str:
+        # The artist file only affects the result when artists are identified or removed
+        uses_artist_file = self.artist_identifier_var.get() or self.remove_artist_duplicates_var.get()
+        artist_file_signature = self.get_artist_file_signature() if uses_artist_file else None
+
+        return flags, entries, self.dictionary_version, artist_file_signature
+
+    def get_nn_preview(self, file_path: str, fingerprint: tuple = None) -> Union[str, None]:
         """
-        Remove backslashes from the provided name.
+        Get the proposed Name Normalizer path for a file, memoized in an LRU cache.
 
-        Args:
-        name (str): The original name.
+        The cache key includes the parent directory's modification time so conflict resolution is recomputed when
+        files are added, removed or renamed in the directory.
+
+        Parameters:
+            file_path (str): The path of the file.
+            fingerprint (tuple, optional): The settings fingerprint, computed if not provided.
 
         Returns:
-        str: The modified name with backslashes removed.
+            Union[str, None]: The proposed file path or None if ignored or unchanged.
         """
+        if fingerprint is None:
+            fingerprint = self.get_nn_settings_fingerprint()
+
         try:
-            name = name.replace('\\', '')
-        except Exception as e:
-            # Log and handle the error
-            self.log_and_show(f"An error occurred during backslash removal: {str(e)}",
-                              create_messagebox=True,
-                              error=True)
-            return name  # Return the original name if there's an error during backslash removal
+            directory_mtime = os.stat(os.path.dirname(file_path) or ".").st_mtime_ns
+        except OSError:
+            directory_mtime = None
 
-        return name
+        key = (file_path, fingerprint, directory_mtime)
 
-    def remove_angle_brackets(self, name: str) -> str:
-        """
-        Remove angle brackets from the provided name.
+        # Return the cached result and mark it as most recently used
+        if key in self.nn_preview_cache:
+            self.nn_preview_cache.move_to_end(key)
+            return self.nn_preview_cache[key]
 
-        Args:
-        name (str): The original name.
+        # Compute the proposed name without logging
+        proposed_name = self.construct_nn_name(file_path, quiet=True)
 
-        Returns:
-        str: The modified name with angle brackets removed.
-        """
-        try:
-            name = name.replace('<', '').replace('>', '')
-        except Exception as e:
-            # Log and handle the error
-            self.log_and_show(f"An error occurred during angle bracket removal: {str(e)}",
-                              create_messagebox=True,
-                              error=True)
-            return name  # Return the original name if there's an error during angle bracket removal
+        # Store the result and evict the least recently used entries
+        self.nn_preview_cache[key] = proposed_name
+        while len(self.nn_preview_cache) > self.nn_preview_cache_size:
+            self.nn_preview_cache.popitem(last=False)
 
-        return name
+        return proposed_name
 
-    def remove_question_marks(self, name: str) -> str:
+    def find_duplicates_in_folder(self):
         """
-        Remove question marks from the provided name.
-
-        Args:
-        name (str): The original name.
+        Find duplicate files (same content, any name) in the selected Name Normalizer folder in the background and
+        offer to move the duplicates to the trash.
 
         Returns:
-        str: The modified name with question marks removed.
+            None
         """
-        try:
-            name = name.replace('?', '')
-        except Exception as e:
-            # Log and handle the error
-            self.log_and_show(f"An error occurred during question mark removal: {str(e)}",
-                              create_messagebox=True,
-                              error=True)
-            return name  # Return the original name if there's an error during question mark removal
+        folder_path = self.name_normalizer_selected_file
 
-        return name
+        # Check if a folder is selected
+        if not folder_path or not os.path.isdir(folder_path):
+            self.log_and_show("Select a folder to search for duplicates.", create_messagebox=True, error=True)
+            return
 
-    def title_the_name(self, name: str) -> str:
-        """
-        Make the file name a title while preserving lowercase letters after apostrophes in contractions.
-        If [, {, or ( are used, capitalize the very next letter unless it's whitespace.
+        # Show the log while the worker runs
+        self.nn_output_tabview.set("Log")
 
-        Args:
-        name (str): The original name.
+        # Snapshot the walk setting on the main thread and start the search
+        self.interrupt_name_processing_thread_var = False
+        threading.Thread(target=self.run_duplicate_finder, args=(folder_path, self.deep_walk_var.get()),
+                         name="name_normalizer_window", daemon=True).start()
 
-        Returns:
-        str: The modified name with title case.
+    def run_duplicate_finder(self, folder_path: str, deep_walk: bool):
         """
+        Worker thread: find the duplicates in a folder, report them and offer them for the trash on the main thread.
+
+        Parameters:
+            folder_path (str): The path of the folder.
+            deep_walk (bool): Include subdirectories.
+        """
+        self.log_and_show(f"Searching for duplicates in '{folder_path}'")
+        self.run_on_main(self.start_progress, self.progressbar, self.slider_progressbar_frame, determinate=True)
         try:
-            words = name.split()
-            formatted_words = []
-            for word in words:
-                # Check for edge cases with [,{, or (
-                if any(char in word for char in ['[', '{', '(']):
-                    new_word = ''
-                    capitalize_next = False
-                    for char in word:
-                        if char in ['[', '{', '(']:
-                            capitalize_next = True
-                            new_word += char
-                        elif char.isalpha() and capitalize_next:
-                            new_word += char.upper()
-                            capitalize_next = False
-                        else:
-                            new_word += char
-                    formatted_word = new_word
-                elif "'" in word:
-                    # If the word is a contraction with ', capitalize the first part and keep the rest in lowercase
-                    parts = word.split("'")
-                    formatted_word = "'".join([parts[0].capitalize()] + [part.lower() for part in parts[1:]])
-                else:
-                    # Capitalize the word as usual
-                    formatted_word = word.capitalize()
+            groups = self.find_duplicates(folder_path, deep_walk)
+        except (OSError, sqlite3.Error) as e:
+            self.log_and_show(f"Searching for duplicates failed: {e}", create_messagebox=True, error=True)
+            return
+        finally:
+            self.run_on_main(self.stop_progress, self.progressbar)
 
-                formatted_words.append(formatted_word)
-            # Join the words back into a formatted name
-            name = ' '.join(formatted_words)
-            return name
-        except Exception as e:
-            # Log and handle the error
-            self.log_and_show(f"An error occurred during title formatting: {str(e)}",
-                              create_messagebox=True,
-                              error=True)
-            return name  # Return the original name if there's an error during title formatting
+        if self.interrupt_name_processing_thread_var:
+            self.interrupt_name_processing_thread_var = False
+            self.log_and_show("User interrupted the duplicate search.", error=True)
+            return
 
-    def remove_extra_whitespace(self, name: str) -> str:
+        # Report each group with the file that is kept first
+        for group in groups:
+            self.log_and_show(f"Keeping {os.path.basename(group[0])}, duplicates: "
+                              f"{', '.join(os.path.basename(path) for path in group[1:])}")
+
+        if not groups:
+            self.log_and_show("No duplicates found.")
+            return
+
+        self.run_on_main(self.offer_duplicates_for_trash, groups)
+
+    def find_duplicates(self, folder_path: str, deep_walk: bool) -> list:
         """
-        Sanitize the filename by removing extra whitespaces.
+        Find files with identical content in a folder.
 
-        Args:
-        name (str): The original name.
+        Files are grouped by size first, then by a hash of their first and last duplicate_partial_hash_kib, and only
+        the files still matching are hashed in full. Hashing runs on duplicate_hash_workers threads and the hashes
+        are cached in hash_cache_file, keyed by inode and modification time. Empty files, symbolic links and extra
+        hard links of the same file are skipped.
+
+        Parameters:
+            folder_path (str): The path of the folder.
+            deep_walk (bool): Include subdirectories.
 
         Returns:
-        str: The modified name with extra whitespaces removed.
-        """
-        try:
-            name = ' '.join(name.split())
-        except Exception as e:
-            # Log and handle the error
-            self.log_and_show(f"An error occurred during whitespace removal: {str(e)}",
-                              create_messagebox=True,
-                              error=True)
-            return name  # Return the original name if there's an error during whitespace removal
+            list: The groups of identical files. Each group lists the file to keep (the oldest) first.
+        """
+        # Index the files by size
+        stat_results = {}
+        paths_by_size = {}
+        seen_files = set()
+        directories = [folder_path]
+        while directories:
+            with os.scandir(directories.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if deep_walk:
+                                directories.append(entry.path)
+                            continue
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                        stat_result = os.stat(entry.path, follow_symlinks=False)
+                    except OSError:
+                        continue
 
-        return name
+                    # Skip empty files and hard links to a file already indexed
+                    file_id = (stat_result.st_dev, stat_result.st_ino)
+                    if not stat_result.st_size or file_id in seen_files:
+                        continue
+                    seen_files.add(file_id)
 
-    def artist_identifier(self, name: str) -> str:
+                    stat_results[entry.path] = stat_result
+                    paths_by_size.setdefault(stat_result.st_size, []).append(entry.path)
+
+        # Only files sharing a size can be duplicates
+        groups = [paths for paths in paths_by_size.values() if len(paths) > 1]
+
+        # Compare the ends of the files, then the full content of those that still match
+        groups = self.group_files_by_hash(
+            groups, stat_results, "partial_hash",
+            lambda path: self.hash_file_ends(path, stat_results[path].st_size))
+
+        # The ends of small files cover the whole file, so their groups are already confirmed
+        partial_limit = 2 * max(1, self.duplicate_partial_hash_kib) * 1024
+        confirmed = [group for group in groups if stat_results[group[0]].st_size <= partial_limit]
+        confirmed += self.group_files_by_hash(
+            [group for group in groups if stat_results[group[0]].st_size > partial_limit], stat_results,
+            "full_hash", self.hash_file)
+
+        # Keep the oldest file of each group
+        return sorted((sorted(group, key=lambda path: (stat_results[path].st_mtime_ns, len(path), path))
+                       for group in confirmed), key=lambda group: group[0])
+
+    def group_files_by_hash(self, groups: list, stat_results: dict, column: str, hash_function) -> list:
         """
-        Identify artists in the given filename and modify the filename accordingly.
+        Split groups of candidate duplicates by a hash of their content.
 
-        Args:
-            name (str): The original filename to be processed.
+        Parameters:
+            groups (list): The groups of paths to split.
+            stat_results (dict): The os.stat_result of each file, keyed by path.
+            column (str): The hash cache column ('partial_hash' or 'full_hash').
+            hash_function (callable): Computes the hash of a path.
 
         Returns:
-            str: The modified filename with artist information.
+            list: The groups of paths with the same hash (groups of one file are dropped).
+        """
+        paths = [path for group in groups for path in group]
+        if not paths:
+            return []
+
+        # Use the cached hashes of unchanged files
+        hash_cache = self.get_hash_cache()
+        partial_kib = max(1, self.duplicate_partial_hash_kib)
+        hashes = hash_cache.get_many(column, {path: stat_results[path] for path in paths}, partial_kib)
+        pending = [path for path in paths if path not in hashes]
+
+        # Hash the other files in parallel
+        tracker = ProgressTracker(len(pending), total_bytes=sum(stat_results[path].st_size for path in pending))
+        self.log_and_show(f"Hashing {len(pending)} file(s) ({column.replace('_', ' ')}), "
+                          f"{len(paths) - len(pending)} cached")
+        computed = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, self.duplicate_hash_workers),
+                                                   thread_name_prefix="name_normalizer_window") as executor:
+            futures = {executor.submit(hash_function, path): path for path in pending}
+            for future in concurrent.futures.as_completed(futures):
+                path = futures[future]
+
+                # Stop hashing if the user interrupts
+                if self.interrupt_name_processing_thread_var:
+                    for remaining in futures:
+                        remaining.cancel()
+                    return []
 
-        Raises:
-            FileNotFoundError: If the artist file specified is not found.
-            Exception: For any other unexpected errors during the artist identification process.
+                try:
+                    hashes[path] = future.result()
+                    computed.append((stat_results[path], hashes[path]))
+                except OSError as e:
+                    self.log_and_show(f"Hashing failed for {os.path.basename(path)}: {e}", error=True)
 
-        """
-        try:
-            # Read the list of artists from the artist_file
-            with open(self.artist_file, 'r') as artist_list_file:
-                artists = [artist.strip() for artist in artist_list_file]
+                tracker.advance(nbytes=stat_results[path].st_size)
+                self.report_progress(self.progressbar, tracker)
 
-            # Search for artist names and add them as prefixes
-            artist_prefix = ''
-            for artist in artists:
-                # Make the search case-insensitive
-                regex = re.compile(rf'\b{re.escape(artist)}\b', re.IGNORECASE)
-                if regex.search(name):
-                    artist_prefix += f"{artist} "
+        # Save the new hashes
+        hash_cache.put_many(column, computed, partial_kib)
 
-            # Remove extra spaces and dashes at the beginning and end
-            artist_prefix = artist_prefix.strip()
-            name = name.strip("-")
+        # Split each group by hash
+        split_groups = []
+        for group in groups:
+            paths_by_hash = {}
+            for path in group:
+                if path in hashes:
+                    paths_by_hash.setdefault(hashes[path], []).append(path)
+            split_groups.extend(paths for paths in paths_by_hash.values() if len(paths) > 1)
+        return split_groups
 
-            # Add artist prefix to the filename if artist_prefix is not empty
-            name = f"{artist_prefix} - {name}" if artist_prefix else name
+    def get_hash_cache(self) -> FileHashCache:
+        """
+        Get the hash cache, opening it on first use and falling back to an in-memory cache if the file cannot be
+        opened.
 
-        except FileNotFoundError:
-            self.log_and_show(f"File not found: {self.artist_file}", create_messagebox=True, error=True)
-        except Exception as e:
-            self.log_and_show(f"Artist Identifier failed {self.artist_file}: {e}", create_messagebox=True,
-                              error=True)
-        return name
+        Returns:
+            FileHashCache: The hash cache.
+        """
+        if self.hash_cache is None:
+            try:
+                self.hash_cache = FileHashCache(self.hash_cache_file)
+            except sqlite3.Error as e:
+                # Keep the duplicate finder working for this session even if the cache file is unavailable
+                self.log_and_show(f"Opening the hash cache failed: {self.hash_cache_file}, {str(e)}. "
+                                  f"Hashes will not be saved.", error=True)
+                self.hash_cache = FileHashCache(":memory:")
+        return self.hash_cache
 
-    def add_prefix(self, name: str) -> str:
+    def offer_duplicates_for_trash(self, groups: list):
         """
-        Add a prefix to the beginning of the provided name.
+        Ask whether to move the duplicates found by find_duplicates to the trash (keeping the first file of each
+        group) and trash them in the background.
 
-        Args:
-        name (str): The original name.
+        Parameters:
+            groups (list): The groups of identical files, the file to keep first.
+        """
+        duplicates = [path for group in groups for path in group[1:]]
+        wasted_bytes = 0
+        for path in duplicates:
+            with contextlib.suppress(OSError):
+                wasted_bytes += os.path.getsize(path)
 
-        Returns:
-        str: The modified name with the added prefix.
+        # Ask for confirmation before moving to trash
+        confirmation = self.ask_confirmation("Confirm Action",
+                                             f"Found {len(duplicates)} duplicate(s) in {len(groups)} group(s) "
+                                             f"({wasted_bytes / 1048576:.1f} MB)."
+                                             f"\nDo you want to move the duplicates to the trash?"
+                                             f"\nThe oldest file of each group is kept.")
+        if not confirmation:
+            self.log_and_show("User kept the duplicates.")
+            return
+
+        # Move the duplicates to trash in the background ("Undo Name Normalizer" restores them)
+        self.start_bulk_trash(duplicates, "name_normalizer_window")
+
+    def iter_nn_input_files(self, input_paths: list):
         """
-        try:
-            # Get the prefix_entry text from the entry
-            prefix_entry = self.prefix_entry.get().strip()
+        Yield the files of a batch the Name Normalizer would process: files as given, folders as in
+        iter_nn_folder_files.
 
-            # Check if there is a prefix
-            if prefix_entry:
-                # Add prefix to the beginning of the name
-                name = f"{prefix_entry} {name}"
+        Parameters:
+            input_paths (list): The paths of the files and folders.
 
-            return name
-        except Exception as e:
-            self.log_and_show(f"An error occurred adding the prefix: {str(e)}",
-                              create_messagebox=True,
-                              error=True)
-            return name
+        Yields:
+            str: The path of each file.
+        """
+        for input_path in input_paths:
+            if os.path.isdir(input_path):
+                yield from self.iter_nn_folder_files(input_path)
+            elif os.path.isfile(input_path):
+                yield input_path
 
-    def add_suffix(self, name: str) -> str:
+    def iter_nn_folder_files(self, folder_path: str, deep_walk: bool = None):
         """
-        Add a suffix to the end of the provided name.
+        Yield the files of a folder the Name Normalizer would process, walking subdirectories if deep_walk_var is set.
 
-        Args:
-        name (str): The original name.
+        Parameters:
+            folder_path (str): The path of the folder.
+            deep_walk (bool, optional): Whether to walk subdirectories. Read from deep_walk_var if not provided
+                (pass it from background threads, which must not read Tk variables).
 
-        Returns:
-        str: The modified name with the added suffix.
+        Yields:
+            str: The path of each file.
         """
-        try:
-            # Get the suffix_entry text from the entry
-            suffix_entry = self.suffix_entry.get().strip()
+        if deep_walk is None:
+            deep_walk = self.deep_walk_var.get()
 
-            # Check if there is a suffix
-            if suffix_entry:
-                # Add suffix to the end of the name
-                name += f" {suffix_entry}"
+        # Traverse through the folder using os.walk
+        for root, dirs, files in os.walk(folder_path):
+            # Include subdirectories if deep_walk is True or the root folder is selected
+            if deep_walk or root == folder_path:
+                for file in sorted(files):
+                    yield str(os.path.join(root, file))
 
-            return name
-        except Exception as e:
-            self.log_and_show(f"An error occurred adding the suffix: {str(e)}",
-                              create_messagebox=True,
-                              error=True)
-            return name
+            # Stop descending if subdirectories are excluded
+            if not deep_walk:
+                break
 
-    def add_tail(self, name: str) -> str:
+    def update_nn_folder_preview(self) -> None:
         """
-        Add a tail to the end of the provided name.
+        Start the background folder preview for the selected folder, or cancel it if the selection is not a folder.
 
-        Args:
-        name (str): The original name.
+        The preview is only restarted when the folder, its modification time or the Name Normalizer settings change.
 
         Returns:
-        str: The modified name with the added tail.
+            None
         """
-        try:
-            # Add tail to the end of the name
-            name += "__-__ "
+        folder_path = self.name_normalizer_selected_file
+
+        # Only folders in preview mode get a folder preview
+        if not folder_path or not self.preview_mode_var.get() or not os.path.isdir(folder_path):
+            # Bump the generation so a running worker stops, then clear the pane
+            self.nn_plan_generation += 1
+            self.nn_plan_key = None
+            self.nn_plan_pages = []
+            self.nn_plan_done = True
+            self.set_nn_preview_text("")
+            self.nn_preview_page_label.configure(text="")
+            self.nn_preview_counts_label.configure(text="")
+            return
 
-            # Catchall for situations where only "artist -__-__" is present after operation
-            name = re.sub(r' -__-__', '', name).strip()
+        # Keep the current preview if nothing it depends on changed
+        deep_walk = self.deep_walk_var.get()
+        plan_key = (folder_path, os.stat(folder_path).st_mtime_ns, deep_walk, self.get_nn_settings_fingerprint())
+        if plan_key == self.nn_plan_key:
+            return
 
-            # Catchall for situations where the tail is already present "__-____-__"
-            name = re.sub(r'__-____-__', '__-__', name).strip()
-        except Exception as e:
-            # Log and handle the error
-            self.log_and_show(f"An error occurred during tail addition: {str(e)}",
-                              create_messagebox=True,
-                              error=True)
-            return name  # Return the original name if there's an error during tail addition
+        # Reset the preview state and start a new worker generation
+        self.nn_plan_generation += 1
+        self.nn_plan_key = plan_key
+        self.nn_plan_pages = []
+        self.nn_plan_page_index = 0
+        self.nn_plan_counts = {"changed": 0, "unchanged": 0, "colliding": 0}
+        self.nn_plan_done = False
+        self.set_nn_preview_text("Computing preview...")
+        self.render_nn_preview_page()
 
-        return name
+        # The worker computes the names from a snapshot of the settings (Tk variables are main thread only)
+        threading.Thread(target=self.nn_folder_preview_worker,
+                         args=(self.nn_plan_generation, folder_path, NameNormalizerSnapshot.from_app(self), deep_walk),
+                         daemon=True).start()
 
-    def remove_word_duplicates_from_filename(self, name: str) -> str:
+        # Start polling for pages (unless a poll loop is already running)
+        if not self.nn_plan_polling:
+            self.nn_plan_polling = True
+            self.after(100, self.check_nn_plan_queue)
+
+    def nn_folder_preview_worker(self, generation: int, folder_path: str, snapshot: "NameNormalizerSnapshot",
+                                 deep_walk: bool) -> None:
         """
-        Remove duplicate words from the filename while preserving the original order of words.
+        Compute the proposed names for a folder page by page and post each page to the preview queue.
+
+        A name is colliding if its target already exists on disk (and is not the file itself) or if an earlier file
+        in the folder maps to the same target.
 
         Parameters:
-        - name (str): The filename with or without a path.
+            generation (int): The preview generation; the worker stops as soon as it is superseded.
+            folder_path (str): The path of the folder.
+            snapshot (NameNormalizerSnapshot): The settings to compute the names with, taken on the main thread.
+            deep_walk (bool): Whether to include the files of subdirectories.
 
         Returns:
-        - str: The modified filename with duplicate words removed and original word order preserved.
+            None
         """
         try:
-            # Extract the file name without the path
-            basename = os.path.basename(name)
+            lines = []
+            counts = {"changed": 0, "unchanged": 0, "colliding": 0}
+            planned_targets = set()
 
-            # Find the first occurrence of '-'
-            index = basename.find('-')
+            for file_path in self.iter_nn_folder_files(folder_path, deep_walk):
+                # Stop if the selection or settings changed
+                if generation != self.nn_plan_generation:
+                    return
 
-            if index != -1:
-                # Temporary removal of everything before the dash
-                temp_name = basename[index + 1:]
-                temp_name = temp_name.strip()
+                # Get the raw target without conflict resolution
+                new_path = snapshot.construct_nn_name(file_path, quiet=True, resolve_conflicts=False)
+                relative_path = os.path.relpath(file_path, folder_path)
 
-                # Split the temp_name into words while preserving the order
-                words = temp_name.split()
-            else:
-                # Split the basename into words while preserving the order
-                words = basename.split()
+                if not new_path:
+                    counts["unchanged"] += 1
+                    lines.append(f"{relative_path} (unchanged)")
+                else:
+                    target_key = os.path.normcase(new_path)
 
-            # Use OrderedDict to keep track of unique words in order
-            unique_words_dict = OrderedDict.fromkeys(words)
+                    # Check for an existing file (other than this one) or a duplicate target in the plan
+                    colliding = target_key in planned_targets or (
+                            os.path.exists(new_path) and not os.path.samefile(file_path, new_path))
+                    planned_targets.add(target_key)
 
-            # Join the unique words back into the basename while preserving order
-            new_basename = ' '.join(unique_words_dict)
+                    if colliding:
+                        counts["colliding"] += 1
+                        lines.append(f"{relative_path} -> {os.path.basename(new_path)} [COLLISION]")
+                    else:
+                        counts["changed"] += 1
+                        lines.append(f"{relative_path} -> {os.path.basename(new_path)}")
 
-            if index != -1:
-                # Add the prefix back to the new_basename
-                new_basename = f"{basename[:index + 1]} {new_basename.strip()}"
+                # Post a full page
+                if len(lines) >= self.nn_preview_page_size:
+                    self.nn_plan_queue.put(("page", generation, lines, dict(counts)))
+                    lines = []
 
-            return new_basename
+            # Post the last partial page and signal completion
+            if lines:
+                self.nn_plan_queue.put(("page", generation, lines, dict(counts)))
+            self.nn_plan_queue.put(("done", generation, None, dict(counts)))
 
         except Exception as e:
-            self.log_and_show(f"Removing duplicate words failed: {e}", create_messagebox=True, error=True)
-            return name  # Return the original filename in case of an error
+            self.nn_plan_queue.put(("error", generation, str(e), None))
 
-    def remove_artist_duplicates_from_filename(self, file_name: str) -> str:
+    def check_nn_plan_queue(self) -> None:
         """
-        Remove artist names from the given file name by processing the list of artists
-        read from the artist_file and modifying the file name accordingly.
-
-        Parameters:
-            file_name (str): The original file name.
+        Drain the folder preview queue on the main thread and refresh the preview pane.
 
         Returns:
-            str: The modified file name with artist names removed.
-
-        Example:
-            self.remove_artist_duplicates_from_filename('Artist - A Title Artist - Album Version Artist')
-            'Artist - A Title - Album Version'
+            None
         """
+        updated = False
         try:
-            # Read the list of artists from the artist_file
-            with open(self.artist_file, 'r') as artist_list_file:
-                artist_list = [artist.strip() for artist in artist_list_file]
-
-            # Extract the file name without the path
-            basename = os.path.basename(file_name)
-
-            # Find the first occurrence of '-'
-            index = basename.find('-')
+            while True:
+                kind, generation, payload, counts = self.nn_plan_queue.get_nowait()
+
+                # Ignore pages from superseded workers
+                if generation != self.nn_plan_generation:
+                    continue
+
+                updated = True
+                if kind == "page":
+                    self.nn_plan_pages.append(payload)
+                    self.nn_plan_counts = counts
+                elif kind == "done":
+                    self.nn_plan_counts = counts
+                    self.nn_plan_done = True
+                else:
+                    self.nn_plan_done = True
+                    self.log_and_show(f"Folder preview failed: {payload}", error=True)
+        except queue.Empty:
+            pass
 
-            if index != -1:
-                # Temporary removal of everything before the dash
-                temp_name = basename[index + 1:]
-                temp_name = temp_name.strip()
+        if updated:
+            self.render_nn_preview_page()
 
-                # Search for artist names and remove them
-                for artist in artist_list:
-                    # Make the search case-insensitive
-                    regex = re.compile(rf'\b{re.escape(artist)}\b', re.IGNORECASE)
-                    temp_name = regex.sub('', temp_name)
+        # Keep polling until the current worker is done
+        if self.nn_plan_done:
+            self.nn_plan_polling = False
+        else:
+            self.after(100, self.check_nn_plan_queue)
 
-                # Reattach the dash and any remaining text
-                new_file_name = f"{basename[:index + 1]} {temp_name.strip()}"
-            else:
-                # No dash found, return the original filename
-                return file_name
+    def render_nn_preview_page(self) -> None:
+        """
+        Show the current folder preview page, the page position and the changed/unchanged/colliding counts.
 
-            # Sanitize file name. Remove extra whitespace.
-            new_file_name = ' '.join(new_file_name.split()).strip()
+        Returns:
+            None
+        """
+        if self.nn_plan_pages:
+            self.set_nn_preview_text("\n".join(self.nn_plan_pages[self.nn_plan_page_index]))
+        elif self.nn_plan_done:
+            self.set_nn_preview_text("No files to preview.")
 
-            # Check for double dashes and remove the second dash
-            if ' - - ' in new_file_name:
-                new_file_name = new_file_name.replace(' - - ', ' - ', 1)
+        # A trailing '+' means more pages are still being computed
+        more = "" if self.nn_plan_done else "+"
+        self.nn_preview_page_label.configure(
+            text=f"Page {self.nn_plan_page_index + 1 if self.nn_plan_pages else 0}/{len(self.nn_plan_pages)}{more}")
 
-            return new_file_name
-        except Exception as e:
-            # Log and handle the error
-            self.log_and_show(f"An error occurred during artist name removal: {str(e)}",
-                              create_messagebox=True,
-                              error=True)
-            return file_name  # Return the original filename if there's an error
+        status = "" if self.nn_plan_done else " (scanning...)"
+        self.nn_preview_counts_label.configure(
+            text=f"Changed: {self.nn_plan_counts['changed']} | Unchanged: {self.nn_plan_counts['unchanged']} | "
+                 f"Colliding: {self.nn_plan_counts['colliding']}{status}")
 
-    def update_nn_display(self, *_) -> None:
+    def change_nn_preview_page(self, step: int) -> None:
         """
-        Update the display in the Name Normalizer window.
+        Move the folder preview forward or backward by a page.
+
+        Parameters:
+            step (int): The number of pages to move (negative to go back).
 
         Returns:
             None
         """
-        try:
-            if not self.name_normalizer_selected_file:
-                # Set the name normalizer display to an empty string and return
-                self.nn_display_text.set("")
-                return
+        if not self.nn_plan_pages:
+            return
 
-            if self.preview_mode_var.get() and os.path.isfile(self.name_normalizer_selected_file):
-                # Call the construct name function to get the proposed name
-                proposed_name = self.construct_nn_name(self.name_normalizer_selected_file)
+        # Clamp to the computed pages
+        self.nn_plan_page_index = max(0, min(self.nn_plan_page_index + step, len(self.nn_plan_pages) - 1))
+        self.render_nn_preview_page()
 
-                # Sanitize for the GUI
-                if proposed_name:
-                    # Display the basename of the proposed name
-                    display_text = f"FILE: {os.path.basename(proposed_name)}"
-                else:
-                    # Display the basename of the selected file
-                    display_text = f"FILE: {os.path.basename(self.name_normalizer_selected_file)}"
-            else:
-                # Set the type of the file to be displayed in the GUI
-                type_var = "DIR" if os.path.isdir(self.name_normalizer_selected_file) else "FILE"
+    def set_nn_preview_text(self, text: str) -> None:
+        """
+        Replace the contents of the Name Normalizer preview textbox.
 
-                # Display the basename of the selection
-                display_text = f"{type_var}: {os.path.basename(self.name_normalizer_selected_file)}"
+        Parameters:
+            text (str): The text to display.
 
-            # Set the proposed name to the nn display
-            self.nn_display_text.set(display_text)
-        except Exception as e:
-            # Log and handle the error
-            self.log_and_show(f"An error occurred during NN display update: {str(e)}",
-                              create_messagebox=True,
-                              error=True)
+        Returns:
+            None
+        """
+        if not self.nn_preview_textbox:
+            return
 
-    def construct_nn_name(self, file_path: str) -> Union[str, None]:
+        # The textbox is read-only, so enable it only while writing
+        self.nn_preview_textbox.configure(state="normal")
+        self.nn_preview_textbox.delete("1.0", ctk.END)
+        self.nn_preview_textbox.insert("1.0", text)
+        self.nn_preview_textbox.configure(state="disabled")
+
+    def construct_nn_name(self, file_path: str, quiet: bool = False,
+                          resolve_conflicts: bool = True) -> Union[str, None]:
         """
         Construct the modified file name based on various user settings.
 
         Parameters:
             file_path (str): The path of the file.
+            quiet (bool): If True, skip logging and displaying messages (used for previews). Default is False.
+            resolve_conflicts (bool): If False, return the raw target even if it already exists. Default is True.
 
         Returns:
             Union[str, None]: The modified file name or None if ignored.
@@ -6247,8 +9616,9 @@ class OCDFileRenamer(ctk.CTk, TkinterDnD.DnDWrapper):
         name, ext = os.path.splitext(filename)
 
         if ext.lower() not in self.file_extensions:
-            # Log that the input is ignored if not on the file extensions list
-            self.log_and_show(f"Ignored file not on file extensions list: {filename}")
+            if not quiet:
+                # Log that the input is ignored if not on the file extensions list
+                self.log_and_show(f"Ignored file not on file extensions list: {filename}")
             return None
 
         # Check if the input has one of the video file extensions
@@ -6385,119 +9755,417 @@ class OCDFileRenamer(ctk.CTk, TkinterDnD.DnDWrapper):
                 # Remove angle brackets
                 name = self.remove_angle_brackets(name)
 
-            if self.remove_question_mark_var.get():
-                # Remove question marks
-                name = self.remove_question_marks(name)
+            if self.remove_question_mark_var.get():
+                # Remove question marks
+                name = self.remove_question_marks(name)
+
+            if self.title_var.get():
+                # Make file name a title while preserving lowercase letters after apostrophes in contractions
+                name = self.title_the_name(name)
+
+            if self.replace_custom_text_var.get():
+                # Replace custom text from the custom_text_to_replace dictionary
+                name = self.replace_custom_text(name)
+
+            if self.artist_identifier_var.get():
+                # Process artist names to place identified artist(s) at the beginning
+                name = self.artist_identifier(name)
+
+            if self.remove_artist_duplicates_var.get():
+                # Remove duplicate artists from filename
+                name = self.remove_artist_duplicates_from_filename(name)
+
+            if self.remove_word_duplicates_var.get():
+                # Remove duplicate words from filename
+                name = self.remove_word_duplicates_from_filename(name)
+
+            if self.remove_extra_whitespace_var.get():
+                # Remove extra white space
+                name = self.remove_extra_whitespace(name)
+
+            # Add prefix
+            name = self.add_prefix(name)
+
+            # Add suffix
+            name = self.add_suffix(name)
+
+            # Add the file extension back to the name
+            name += ext
+
+            # Skip renaming if the name is the same as the original
+            if name == filename:
+                if not quiet:
+                    logging.info(f"Skipped renaming: {filename} (no changes needed)")
+                return None
+
+            # Construct the new file path
+            new_path = os.path.join(dir_path, name)
+
+            # Check if the new filename already exists
+            if resolve_conflicts and os.path.exists(new_path):
+                # Get a non-conflicting name
+                new_path = self.get_non_conflicting_filename(new_path, quiet=quiet)
+
+            return new_path
+
+    def rename_and_move_file(self, file_path, new_path: str = None):
+        """
+        Rename the given file based on the user-defined settings and move it to a specified directory if provided.
+
+        The final destination (the output directory when set, otherwise the source directory) is computed first and
+        conflicts are resolved there only, so the file is renamed and moved with a single move_file call.
+
+        Parameters:
+            file_path (str): The path of the file to be renamed.
+            new_path (str, optional): The precomputed target from construct_nn_name(resolve_conflicts=False). If not
+                provided, the target is computed.
+
+        Returns:
+            tuple: A tuple containing the original file path and the final file path after renaming and, if applicable,
+            moving.
+        """
+        if new_path is None:
+            # Call the construct name function to get the raw target (conflicts are resolved at the destination)
+            new_path = self.construct_nn_name(file_path, resolve_conflicts=False)
+
+        if not new_path:
+            # Return a tuple with file path and file path if no result
+            return file_path, file_path
+
+        # Check if the output directory is provided and is different from the original directory
+        moving = bool(self.name_normalizer_output_directory) and os.path.abspath(
+            self.name_normalizer_output_directory) != os.path.abspath(os.path.dirname(file_path))
+
+        # Create the destination file path by joining the destination directory and the new file name
+        destination_file = os.path.join(self.name_normalizer_output_directory,
+                                        os.path.basename(new_path)) if moving else new_path
+
+        # Check if the destination file already exists
+        if os.path.exists(destination_file):
+            # Get a non-conflicting name
+            destination_file = self.get_non_conflicting_filename(destination_file)
+
+            # The counter makes the name longer, so check it against the target filesystem again
+            problem = self.path_validator.check(destination_file) if destination_file else None
+            if problem:
+                self.log_and_show(f"Skipped {os.path.basename(file_path)}: the new name cannot be used: {problem}",
+                                  error=True)
+                return file_path, file_path
+
+        try:
+            # Rename and, if applicable, move the file in one step
+            with self.stage_profiler.stage("disk_move" if moving else "disk_rename"):
+                self.move_file(file_path, destination_file)
+        except OSError as e:
+            # Log an error if renaming/moving fails
+            self.log_and_show(f"{'Moving' if moving else 'Renaming'} failed for {os.path.basename(file_path)}: {e}",
+                              error=True)
+            # Return a tuple with file path and file path if error
+            return file_path, file_path
+
+        # Set self.name_normalizer_last_used_file to the new path
+        self.name_normalizer_last_used_file = destination_file
+
+        # Log the renaming/moving operation if logging is activated
+        self.log_and_show(f"{'Moved' if moving else 'Renamed'}: {os.path.basename(file_path)} -> "
+                          f"{os.path.basename(destination_file)}")
+
+        # Return a tuple with file path and name normalizer last used file
+        return file_path, destination_file
+
+    def move_file(self, source: str, destination: str, on_progress=None):
+        """
+        Move a file with a single rename, falling back to a verified copy when the destination is on another device.
+
+        Parameters:
+            source (str): The path of the file to be moved.
+            destination (str): The final path of the file.
+            on_progress (callable, optional): Called with (bytes_copied, total_bytes) after each chunk of a
+                cross-device copy.
+
+        Raises:
+            OSError: If the rename, copy or verification fails.
+        """
+        try:
+            # Rename in place when the source and destination share a device
+            os.rename(source, destination)
+            return
+        except OSError as e:
+            # Anything other than a cross-device link is a real failure
+            if e.errno != errno.EXDEV:
+                raise
+
+        # Copy the file to the other device, then remove the source only after the copy is safely in place
+        self.copy_file_across_devices(source, destination, on_progress)
+        os.unlink(source)
+
+    def copy_file_across_devices(self, source: str, destination: str, on_progress=None):
+        """
+        Copy a file to another device without leaving a partial file at the destination.
+
+        The data is transferred in move_chunk_kib chunks to a uniquely named temporary file next to the destination
+        (short, so it fits wherever the destination name fits), which is fsynced, given the source's metadata
+        (permissions, timestamps, extended attributes and, where permitted, ownership), verified (size, and a BLAKE2
+        digest of both files if verify_cross_device_moves is set) and then renamed into place.
+
+        Parameters:
+            source (str): The path of the file to be copied.
+            destination (str): The final path of the copy.
+            on_progress (callable, optional): Called with (bytes_copied, total_bytes) after each chunk.
+
+        Raises:
+            OSError: If the copy or verification fails.
+        """
+        with open(source, "rb") as source_file:
+            source_stat = os.fstat(source_file.fileno())
+
+            # Create the temporary file (only a file created here is ever removed on failure)
+            temp_fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(destination) or ".", prefix=".ocd-",
+                                                  suffix=".part")
+            try:
+                with open(temp_fd, "wb") as temp_file:
+                    # Transfer the data in the kernel where possible
+                    self.transfer_file_data(source_file.fileno(), temp_file.fileno(), source_stat.st_size,
+                                            on_progress)
+
+                    # Flush the copy to disk before it replaces anything
+                    os.fsync(temp_file.fileno())
+
+                # Preserve permissions, timestamps and extended attributes
+                shutil.copystat(source, temp_path)
+
+                # Preserve ownership where the user is allowed to
+                if hasattr(os, "chown"):
+                    with contextlib.suppress(OSError):
+                        os.chown(temp_path, source_stat.st_uid, source_stat.st_gid)
+
+                # Verify the copy before the source is removed
+                if os.path.getsize(temp_path) != source_stat.st_size:
+                    raise OSError(errno.EIO, "Copied file size does not match the source", destination)
+                if self.verify_cross_device_moves and self.hash_file(temp_path) != self.hash_file(source):
+                    raise OSError(errno.EIO, "Copied file hash does not match the source", destination)
+
+                # Move the verified copy into place
+                os.replace(temp_path, destination)
+            except BaseException:
+                # Remove the partial copy, leaving the source untouched
+                with contextlib.suppress(OSError):
+                    os.unlink(temp_path)
+                raise
+
+        # Persist the directory entry where the platform supports it
+        with contextlib.suppress(OSError, AttributeError):
+            directory_fd = os.open(os.path.dirname(destination) or ".", os.O_RDONLY)
+            try:
+                os.fsync(directory_fd)
+            finally:
+                os.close(directory_fd)
+
+    def transfer_file_data(self, source_fd: int, destination_fd: int, total_bytes: int, on_progress=None) -> int:
+        """
+        Copy the data of one open file to another in move_chunk_kib chunks.
 
-            if self.title_var.get():
-                # Make file name a title while preserving lowercase letters after apostrophes in contractions
-                name = self.title_the_name(name)
+        os.copy_file_range is tried first, then os.sendfile (Linux), then a plain read/write loop. A method that is
+        not supported for this pair of files is only skipped before any data has been transferred.
 
-            if self.replace_custom_text_var.get():
-                # Replace custom text from the custom_text_to_replace dictionary
-                name = self.replace_custom_text(name)
+        Parameters:
+            source_fd (int): The file descriptor to read from (at offset 0).
+            destination_fd (int): The file descriptor to write to (at offset 0).
+            total_bytes (int): The expected size, reported to on_progress.
+            on_progress (callable, optional): Called with (bytes_copied, total_bytes) after each chunk.
 
-            if self.artist_identifier_var.get():
-                # Process artist names to place identified artist(s) at the beginning
-                name = self.artist_identifier(name)
+        Returns:
+            int: The number of bytes copied.
+        """
+        chunk_size = max(1, self.move_chunk_kib) * 1024
 
-            if self.remove_artist_duplicates_var.get():
-                # Remove duplicate artists from filename
-                name = self.remove_artist_duplicates_from_filename(name)
+        # Zero-copy transfers, in order of preference
+        methods = []
+        if hasattr(os, "copy_file_range"):
+            methods.append(lambda count: os.copy_file_range(source_fd, destination_fd, count))
+        if hasattr(os, "sendfile") and hasattr(os, "uname") and os.uname().sysname == "Linux":
+            methods.append(lambda count: os.sendfile(destination_fd, source_fd, None, count))
 
-            if self.remove_word_duplicates_var.get():
-                # Remove duplicate words from filename
-                name = self.remove_word_duplicates_from_filename(name)
+        copied = 0
+        while True:
+            while methods:
+                try:
+                    transferred = methods[0](chunk_size)
+                    break
+                except OSError as e:
+                    # Fall back to the next method only if this one is unsupported and nothing was copied yet
+                    if copied or e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP,
+                                                 errno.ENOTSUP, errno.EBADF, errno.ENOTSOCK):
+                        raise
+                    methods.pop(0)
+            else:
+                # Userspace copy
+                chunk = os.read(source_fd, chunk_size)
+                view = memoryview(chunk)
+                while view:
+                    view = view[os.write(destination_fd, view):]
+                transferred = len(chunk)
 
-            if self.remove_extra_whitespace_var.get():
-                # Remove extra white space
-                name = self.remove_extra_whitespace(name)
+            # Stop at the end of the source
+            if not transferred:
+                return copied
 
-            # Add prefix
-            name = self.add_prefix(name)
+            copied += transferred
+            if on_progress:
+                on_progress(copied, total_bytes)
 
-            # Add suffix
-            name = self.add_suffix(name)
+    def hash_file(self, file_path: str) -> bytes:
+        """
+        Compute the BLAKE2 digest of a file, streaming it through a read-only memory map in move_chunk_kib chunks.
 
-            # Add the file extension back to the name
-            name += ext
+        Files that cannot be mapped (empty files, some network and virtual filesystems) are read instead.
 
-            # Skip renaming if the name is the same as the original
-            if name == filename:
-                logging.info(f"Skipped renaming: {filename} (no changes needed)")
-                return None
+        Parameters:
+            file_path (str): The path of the file to hash.
 
-            # Construct the new file path
-            new_path = os.path.join(dir_path, name)
+        Returns:
+            bytes: The digest.
+        """
+        chunk_size = max(1, self.move_chunk_kib) * 1024
+        digest = hashlib.blake2b()
+        with open(file_path, "rb") as file:
+            try:
+                mapped_file = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Read the file in chunks instead
+                for chunk in iter(lambda: file.read(chunk_size), b""):
+                    digest.update(chunk)
+                return digest.digest()
 
-            # Check if the new filename already exists
-            if os.path.exists(new_path):
-                # Get a non-conflicting name
-                new_path = self.get_non_conflicting_filename(new_path)
+            with mapped_file:
+                # Tell the kernel to read ahead
+                if hasattr(mapped_file, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                    mapped_file.madvise(mmap.MADV_SEQUENTIAL)
 
-            return new_path
+                # Hash slices of the map without copying them (hashlib releases the GIL for large updates)
+                with memoryview(mapped_file) as view:
+                    for offset in range(0, len(view), chunk_size):
+                        digest.update(view[offset:offset + chunk_size])
+        return digest.digest()
 
-    def rename_and_move_file(self, file_path):
+    def hash_file_ends(self, file_path: str, size: int) -> bytes:
         """
-        Rename the given file based on the user-defined settings and move it to a specified directory if provided.
+        Compute the BLAKE2 digest of the first and last duplicate_partial_hash_kib of a file.
+
+        For files up to twice that size the ends cover the whole file, so the digest equals hash_file's.
 
         Parameters:
-            file_path (str): The path of the file to be renamed.
+            file_path (str): The path of the file to hash.
+            size (int): The size of the file.
 
         Returns:
-            tuple: A tuple containing the original file path and the final file path after renaming and, if applicable,
-            moving.
+            bytes: The digest.
+        """
+        chunk_size = max(1, self.duplicate_partial_hash_kib) * 1024
+        digest = hashlib.blake2b()
+        with open(file_path, "rb") as file:
+            digest.update(file.read(chunk_size))
+            if size > chunk_size:
+                # Read the tail without overlapping the head
+                file.seek(max(chunk_size, size - chunk_size))
+                digest.update(file.read(chunk_size))
+        return digest.digest()
+
+    def start_background_moves(self, pairs: list, frame_name: str, on_success=None, on_failure=None,
+                               run_name: str = None):
         """
-        # Call the construct name function to get the name
-        new_path = self.construct_nn_name(file_path)
+        Move files with move_file on a background thread, showing byte progress on the frame's progress bar.
+
+        Failed moves are reported together on the main thread when the moves end, so the messagebox is shown.
 
-        if new_path:
+        Parameters:
+            pairs (list): The (source, destination) pairs to move.
+            frame_name (str): The frame that started the moves ('file_renamer_window' or 'name_normalizer_window').
+            on_success (callable, optional): Called on the main thread with the list of pairs that were moved.
+            on_failure (callable, optional): Called on the main thread with the list of pairs that were not moved.
+            run_name (str, optional): If provided, the stage timings are saved under this name when the moves end.
+        """
+        # Pick the frame's progress bar
+        progress_bar_name, progress_bar_frame = self.get_frame_progress_bar(frame_name)
+
+        # Plan the work up front so progress is determinate
+        sizes = []
+        for source, _ in pairs:
+            try:
+                sizes.append(os.path.getsize(source))
+            except OSError:
+                sizes.append(0)
+        tracker = ProgressTracker(len(pairs), total_units=sum(sizes) or len(pairs), total_bytes=sum(sizes))
+
+        def run_moves():
+            moved = []
+            failed = []
+            errors = []
             try:
-                # Rename the file
-                os.rename(file_path, new_path)
+                for (source, destination), size in zip(pairs, sizes):
+                    # Report the bytes copied so far on the current file
+                    def on_progress(copied, _total):
+                        tracker.set_partial(copied)
+                        self.report_progress(progress_bar_name, tracker)
 
-                # Set self.name_normalizer_last_used_file to the new path
-                self.name_normalizer_last_used_file = new_path
+                    try:
+                        with self.stage_profiler.stage("disk_move"):
+                            self.move_file(source, destination, on_progress)
+                        moved.append((source, destination))
 
-                # Log the renaming operation if logging is activated
-                self.log_and_show(f"Renamed: {os.path.basename(file_path)} -> {os.path.basename(new_path)}")
+                        # Drop the trash entry of a file restored from the trash
+                        self.forget_trash_info(source)
+                    except OSError as e:
+                        failed.append((source, destination))
+                        errors.append(f"{os.path.basename(source)}: {e}")
 
-                # Check if the output directory is provided and is different from the original directory
-                if self.name_normalizer_output_directory and os.path.abspath(
-                        self.name_normalizer_output_directory) != os.path.abspath(os.path.dirname(file_path)):
-                    # Create the destination file path by joining the destination directory and the source file name
-                    destination_file = os.path.join(self.name_normalizer_output_directory, os.path.basename(new_path))
+                    tracker.advance(units=size if sum(sizes) else 1, nbytes=size)
+                    self.report_progress(progress_bar_name, tracker, force=True)
 
-                    # Check if the destination file already exists
-                    if os.path.exists(destination_file):
-                        # Get a non-conflicting name
-                        destination_file = self.get_non_conflicting_filename(destination_file)
+                if moved and on_success:
+                    self.run_on_main(on_success, moved)
 
-                    try:
-                        # Perform the move to the provided directory
-                        shutil.move(str(new_path), str(destination_file))
+                if failed:
+                    # Messageboxes can only be shown from the main thread
+                    self.run_on_main(self.log_and_show, f"Moving failed for {len(failed)} file(s):\n" +
+                                     "\n".join(errors), create_messagebox=True, error=True)
+                    if on_failure:
+                        self.run_on_main(on_failure, failed)
+            finally:
+                self.run_on_main(self.stop_progress, progress_bar_name)
+                if run_name:
+                    self.dump_profile_report(run_name)
 
-                        # Update self.name_normalizer_last_used_file to the new path
-                        self.name_normalizer_last_used_file = destination_file
+        # Threads are named after their frame so their messages reach the right module
+        self.start_progress(progress_bar_name, progress_bar_frame, determinate=True)
+        self.background_move_thread = threading.Thread(target=run_moves, name=frame_name, daemon=True)
+        self.background_move_thread.start()
 
-                        # Log the move operation if logging is activated
-                        self.log_and_show(
-                            f"Moved: {os.path.basename(new_path)} -> {os.path.basename(destination_file)}")
-                    except OSError as e:
-                        # Log error if logging is activated
-                        self.log_and_show(f"Moving failed for {os.path.basename(new_path)}: {e}", error=True)
+    def get_frame_progress_bar(self, frame_name: str) -> tuple:
+        """
+        Get the progress bar of a frame.
 
-                # Return a tuple with file path and name normalizer last used file
-                return file_path, self.name_normalizer_last_used_file
+        Parameters:
+            frame_name (str): The frame ('file_renamer_window' or 'name_normalizer_window').
 
-            except OSError as e:
-                # Log an error if renaming fails
-                self.log_and_show(f"Renaming failed for {os.path.basename(file_path)}: {e}", error=True)
-                # Return a tuple with file path and file path if error
-                return file_path, file_path
-        else:
-            # Return a tuple with file path and file path if no result
-            return file_path, file_path
+        Returns:
+            tuple: The name of the progress bar attribute and the frame holding it.
+        """
+        return {"file_renamer_window": (self.progressbar2, self.file_renamer_progressbar_frame),
+                "name_normalizer_window": (self.progressbar, self.slider_progressbar_frame)}[frame_name]
+
+    def background_move_active(self) -> bool:
+        """
+        Check whether a background move is still running, telling the user if so.
+
+        Returns:
+            bool: True if a background move is running.
+        """
+        if self.background_move_thread and self.background_move_thread.is_alive():
+            self.log_and_show("A move to another drive is still in progress. Please wait for it to finish.",
+                              create_messagebox=True, error=True)
+            return True
+        return False
 
     def process_name_normalizer(self):
         """
@@ -6549,17 +10217,34 @@ class OCDFileRenamer(ctk.CTk, TkinterDnD.DnDWrapper):
                               f"{self.name_normalizer_selected_file}.")
             return
 
+        # Show the log while the worker runs
+        self.nn_output_tabview.set("Log")
+
+        # Start the run with fresh stage timings (discarding the previews' timings)
+        self.stage_profiler.reset()
+
         try:
-            if os.path.isfile(self.name_normalizer_selected_file):
+            if self.name_normalizer_batch_active():
+                # Process the dropped files and folders in one run, like a folder
+                snapshot = NameNormalizerSnapshot.from_app(self)
+                self.name_processing_thread_multiple = threading.Thread(
+                    target=self.process_folder,
+                    args=(os.path.dirname(self.name_normalizer_selected_file), snapshot,
+                          list(self.name_normalizer_batch_paths)),
+                    name="name_normalizer_window").start()
+            elif os.path.isfile(self.name_normalizer_selected_file):
                 # If a single file is provided, use threading to directly process it
                 self.name_processing_thread_single = threading.Thread(target=self.process_single_file,
-                                                                      args=(self.name_normalizer_selected_file,)
-                                                                      ).start()
+                                                                      args=(self.name_normalizer_selected_file,),
+                                                                      name="name_normalizer_window").start()
             else:
                 # Get folder contents and use threading to process the files
+                # Snapshot the settings on the main thread for the name computation
+                snapshot = NameNormalizerSnapshot.from_app(self)
                 self.name_processing_thread_multiple = threading.Thread(target=self.process_folder,
-                                                                        args=(self.name_normalizer_selected_file,)
-                                                                        ).start()
+                                                                        args=(self.name_normalizer_selected_file,
+                                                                              snapshot),
+                                                                        name="name_normalizer_window").start()
 
         except Exception as e:
             # Display error message if an exception occurs
@@ -6577,11 +10262,25 @@ class OCDFileRenamer(ctk.CTk, TkinterDnD.DnDWrapper):
 
         """
         try:
-            # Start the progress bar for the Name Normalizer function
-            self.start_progress(self.progressbar, self.slider_progressbar_frame)
+            # Start the determinate progress bar for the Name Normalizer function
+            self.run_on_main(self.start_progress, self.progressbar, self.slider_progressbar_frame, determinate=True)
+            tracker = ProgressTracker(1, total_bytes=os.path.getsize(file_path))
+
+            # Compute the new name and check it against the target filesystem before anything is moved
+            target = self.construct_nn_name(file_path, resolve_conflicts=False)
+            if target:
+                target = self.validate_nn_targets([file_path], [target])[0]
+
+            if target:
+                # Rename and move the file, obtaining original and new paths
+                original_path, new_path = self.rename_and_move_file(file_path, target)
+            else:
+                # Ignored, unchanged or rejected, nothing to rename
+                original_path, new_path = file_path, file_path
 
-            # Rename and move the file, obtaining original and new paths
-            original_path, new_path = self.rename_and_move_file(file_path)
+            # Report the completed file
+            tracker.advance(nbytes=tracker.total_bytes)
+            self.report_progress(self.progressbar, tracker, force=True)
 
             # Check if the tuple is the same to prevent no operations from being added to history
             if original_path != new_path:
@@ -6594,40 +10293,49 @@ class OCDFileRenamer(ctk.CTk, TkinterDnD.DnDWrapper):
             # Log the action if logging is enabled
             self.log_and_show("File has been processed successfully.")
 
+            # Save the stage timings of the run
+            self.dump_profile_report("name_normalizer")
+
             # Stop the progress bar for the Name Normalizer function
-            self.stop_progress(self.progressbar)
+            self.run_on_main(self.stop_progress, self.progressbar)
 
             # Reset GUI input fields if reset is True
             if self.reset_nn_var.get():
                 # Clear selection for the name_normalizer_window
-                self.clear_selection(frame_name="name_normalizer_window")
+                self.run_on_main(self.clear_selection, frame_name="name_normalizer_window")
 
             # Schedule the next check after 100 milliseconds
-            self.after(100, self.check_queue)
+            self.run_on_main(self.after, 100, self.check_queue)
 
         except Exception as e:
             # Handle unexpected exceptions and log an error message
             self.log_and_show(f"Error processing file {file_path}: {e}", create_messagebox=True, error=True)
             # Stop the progress bar in case of an error
-            self.stop_progress(self.progressbar)
+            self.run_on_main(self.stop_progress, self.progressbar)
 
-    def process_folder(self, folder_path: str) -> None:
+    def process_folder(self, folder_path: str, snapshot: "NameNormalizerSnapshot" = None,
+                       input_paths: list = None) -> None:
         """
         Process all files in a folder using the Name Normalizer function.
 
+        The names are computed first (in a process pool for large folders), then the renames are applied in walk order
+        on this thread so conflict resolution stays deterministic.
+
         Args:
-            folder_path (str): The path of the folder to be processed.
+            folder_path (str): The path of the folder to be processed (the folder of the first path of a batch).
+            snapshot (NameNormalizerSnapshot, optional): The settings to compute the names with. Taken from the
+                application if not provided.
+            input_paths (list, optional): The dropped files and folders of a batch, processed instead of folder_path.
 
         Returns:
             None
 
         """
         try:
-            # Start the progress bar for the Name Normalizer function
-            self.start_progress(self.progressbar, self.slider_progressbar_frame)
+            # Start the determinate progress bar for the Name Normalizer function
+            self.run_on_main(self.start_progress, self.progressbar, self.slider_progressbar_frame, determinate=True)
 
-            # Initialize an empty list to store file paths
-            file_paths = []
+            # Initialize the lists to store the original and new paths
             original_paths = []
             new_paths = []
 
@@ -6637,34 +10345,65 @@ class OCDFileRenamer(ctk.CTk, TkinterDnD.DnDWrapper):
             else:
                 deep_walk_status = "excluding subdirectories"
 
-            self.log_and_show(
-                f"Info: os.walk, {deep_walk_status}, started on '{folder_path}'")
-
-            # Traverse through the folder using os.walk
-            for root, dirs, files in os.walk(folder_path):
-                # Include subdirectories if the deep_walk_var is True or the root folder is selected
-                if self.deep_walk_var.get() or root == folder_path:
-                    for file in files:
-                        # Append the full file path to the list
-                        file_paths.append(str(os.path.join(root, file)))
-
-                    # Iterate through file paths and rename/move files
-                    for file_path in file_paths:
-                        original_path, new_path = self.rename_and_move_file(file_path)
-                        # Check if the tuple is the same to prevent no operations from being added to history
-                        if original_path != new_path:
-                            original_paths.append(original_path)
-                            new_paths.append(new_path)
-
-                        # Check if processing should be interrupted
-                        if self.interrupt_name_processing_thread_var:
-                            break  # Break out of the loop
-
-                    # Append the batch operation to the name normalizer history
-                    self.queue.put({
-                        'original_paths': original_paths,
-                        'new_paths': new_paths
-                    })
+            if input_paths:
+                self.log_and_show(f"Info: os.walk, {deep_walk_status}, started on {len(input_paths)} dropped items")
+            else:
+                self.log_and_show(
+                    f"Info: os.walk, {deep_walk_status}, started on '{folder_path}'")
+
+            # Plan the work up front so progress is determinate (file paths and sizes from the directory index)
+            file_paths = []
+            file_sizes = []
+            if input_paths:
+                input_files = self.iter_nn_input_files(input_paths)
+            else:
+                input_files = self.iter_nn_folder_files(folder_path)
+            for file_path in input_files:
+                file_paths.append(file_path)
+                try:
+                    file_sizes.append(os.path.getsize(file_path))
+                except OSError:
+                    file_sizes.append(0)
+
+            # Compute the new names (pure string work, no disk changes)
+            targets = self.compute_nn_names(file_paths, snapshot or NameNormalizerSnapshot.from_app(self))
+
+            # Summarize the files that need no rename
+            ignored_count = unchanged_count = 0
+            for file_path, target in zip(file_paths, targets):
+                if target is None:
+                    if os.path.splitext(file_path)[1].lower() not in self.file_extensions:
+                        ignored_count += 1
+                    else:
+                        unchanged_count += 1
+            if ignored_count or unchanged_count:
+                self.log_and_show(f"Ignored {ignored_count} file(s) not on the file extensions list. "
+                                  f"{unchanged_count} file(s) needed no changes.")
+
+            # Leave the files whose new names the target filesystem would reject (reported up front)
+            targets = self.validate_nn_targets(file_paths, targets)
+
+            tracker = ProgressTracker(len(file_paths), total_bytes=sum(file_sizes))
+            self.report_progress(self.progressbar, tracker, force=True)
+
+            # Apply the renames (in walk order, concurrently on slow filesystems)
+            io_limit = self.get_io_limit(self.name_normalizer_output_directory or folder_path)
+            if io_limit > 1:
+                results = self.apply_nn_renames_concurrently(file_paths, targets, file_sizes, tracker, io_limit)
+            else:
+                results = self.apply_nn_renames(file_paths, targets, file_sizes, tracker)
+
+            for original_path, new_path in results:
+                # Check if the tuple is the same to prevent no operations from being added to history
+                if original_path != new_path:
+                    original_paths.append(original_path)
+                    new_paths.append(new_path)
+
+            # Append the batch operation to the name normalizer history
+            self.queue.put({
+                'original_paths': original_paths,
+                'new_paths': new_paths
+            })
 
             if self.interrupt_name_processing_thread_var:
                 # Log the action if logging is enabled
@@ -6674,32 +10413,303 @@ class OCDFileRenamer(ctk.CTk, TkinterDnD.DnDWrapper):
                 # Log the action if logging is enabled
                 self.log_and_show("File(s) have been processed successfully.")
 
+            # Save the stage timings of the run
+            self.dump_profile_report("name_normalizer")
+
             # Stop the progress bar for the Name Normalizer function
-            self.stop_progress(self.progressbar)
+            self.run_on_main(self.stop_progress, self.progressbar)
 
             # Reset GUI input fields if reset is True
             if self.reset_nn_var.get():
                 # Clear selection for the name_normalizer_window
-                self.clear_selection(frame_name="name_normalizer_window")
+                self.run_on_main(self.clear_selection, frame_name="name_normalizer_window")
 
             # Reset the variable back to false
             self.interrupt_name_processing_thread_var = False
 
             # Schedule the next check after 100 milliseconds
-            self.after(100, self.check_queue)
+            self.run_on_main(self.after, 100, self.check_queue)
 
         except Exception as e:
             # Handle unexpected exceptions and log an error message
             self.log_and_show(f"Error processing folder {folder_path}: {e}", create_messagebox=True, error=True)
             # Stop the progress bar in case of an error
-            self.stop_progress(self.progressbar)
+            self.run_on_main(self.stop_progress, self.progressbar)
+
+    def validate_nn_targets(self, file_paths: list, targets: list) -> list:
+        """
+        Check the planned Name Normalizer destinations against their target filesystems and log the rejected ones.
+
+        Parameters:
+            file_paths (list): The paths of the files, in walk order.
+            targets (list): The computed target of each file, or None to leave it.
+
+        Returns:
+            list: The targets, with None for the files whose destination cannot be used.
+        """
+        # The destination is in the output directory when one is set
+        planned = [(index, os.path.join(self.name_normalizer_output_directory, os.path.basename(target))
+                    if self.name_normalizer_output_directory else target)
+                   for index, target in enumerate(targets) if target is not None]
+
+        targets = list(targets)
+        rejected = []
+        for (index, destination), problem in zip(planned, self.path_validator.check_many(
+                [destination for _, destination in planned])):
+            if problem:
+                targets[index] = None
+                rejected.append(f"{os.path.basename(file_paths[index])}: {problem}")
+
+        if rejected:
+            self.log_and_show(f"Skipped {len(rejected)} file(s) whose new name cannot be used:\n" +
+                              "\n".join(rejected), error=True)
+        return targets
+
+    def apply_nn_renames(self, file_paths: list, targets: list, file_sizes: list, tracker: ProgressTracker) -> list:
+        """
+        Apply the computed renames one at a time, in walk order.
+
+        Parameters:
+            file_paths (list): The paths of the files.
+            targets (list): The computed target of each file, or None to leave it.
+            file_sizes (list): The size of each file, for progress.
+            tracker (ProgressTracker): The tracker of the run.
+
+        Returns:
+            list: (original path, final path) tuples of the processed files, in walk order.
+        """
+        results = []
+        for file_path, target, file_size in zip(file_paths, targets, file_sizes):
+            # Check if processing should be interrupted
+            if self.interrupt_name_processing_thread_var:
+                break  # Break out of the loop
+
+            if target is None:
+                # Ignored or unchanged, nothing to rename
+                results.append((file_path, file_path))
+            else:
+                results.append(self.rename_and_move_file(file_path, target))
+
+            # Report the progress (batched by the tracker's report interval)
+            tracker.advance(nbytes=file_size)
+            self.report_progress(self.progressbar, tracker)
+
+        return results
+
+    def apply_nn_renames_concurrently(self, file_paths: list, targets: list, file_sizes: list,
+                                      tracker: ProgressTracker, io_limit: int) -> list:
+        """
+        Apply the computed renames with up to io_limit renames in flight.
+
+        The final name of every file is resolved on this thread first, in walk order (see plan_nn_destinations), so
+        conflicts are numbered as on the sequential path. Renames are then keyed by their final name, so renames into
+        the same directory (or output directory) overlap. A rename into a name freed by an earlier rename of the run
+        waits for that rename.
+
+        Parameters:
+            file_paths (list): The paths of the files.
+            targets (list): The computed target of each file, or None to leave it.
+            file_sizes (list): The size of each file, for progress.
+            tracker (ProgressTracker): The tracker of the run.
+            io_limit (int): The number of renames in flight.
+
+        Returns:
+            list: (original path, final path) tuples of the processed files, in walk order.
+        """
+        def report(future, nbytes):
+            # Renames cancelled by an interrupt are not progress
+            if future is not None and future.cancelled():
+                return
+            tracker.advance(nbytes=nbytes)
+            self.report_progress(self.progressbar, tracker)
+
+        # Resolve the final names before any rename is submitted
+        plans = self.plan_nn_destinations(file_paths, targets)
+
+        self.log_and_show(f"Applying renames with up to {io_limit} in flight")
+        submitted = []
+        with KeyedIOExecutor(io_limit, thread_name=threading.current_thread().name) as executor:
+            for file_path, plan, file_size in zip(file_paths, plans, file_sizes):
+                # Stop submitting and cancel the queued renames if processing is interrupted
+                if self.interrupt_name_processing_thread_var:
+                    executor.cancel_pending()
+                    break
+
+                if plan is None:
+                    # Ignored, unchanged or rejected, nothing to rename
+                    submitted.append((file_path, None))
+                    report(None, file_size)
+                    continue
+
+                destination, key = plan
+                future = executor.submit(key, self.rename_and_move_file, file_path, destination)
+                future.add_done_callback(functools.partial(report, nbytes=file_size))
+                submitted.append((file_path, future))
+
+        # Collect the results in walk order (cancelled renames left the file in place)
+        return [(file_path, file_path) if future is None or future.cancelled() else future.result()
+                for file_path, future in submitted]
+
+    def plan_nn_destinations(self, file_paths: list, targets: list) -> list:
+        """
+        Resolve the final destination of each Name Normalizer rename in walk order, numbering conflicts with the names
+        on disk and the names claimed by earlier files of the run, the way get_non_conflicting_filename numbers them
+        when the renames run one at a time.
+
+        Parameters:
+            file_paths (list): The paths of the files, in walk order.
+            targets (list): The computed target of each file, or None to leave it.
+
+        Returns:
+            list: A (destination, ordering key) tuple per file, or None for the files to leave. Renames sharing a key
+            must run in order: a rename into a name freed by an earlier rename shares that rename's key.
+        """
+        claimed = set()
+        # Source names freed by earlier renames of the run, mapped to the key of the rename freeing them
+        freed = {}
+
+        def is_free(path):
+            key = os.path.normcase(path)
+            return key not in claimed and (key in freed or not os.path.exists(path))
+
+        plans = []
+        for file_path, target in zip(file_paths, targets):
+            if target is None:
+                plans.append(None)
+                continue
+
+            # The destination is in the output directory when one is set
+            if self.name_normalizer_output_directory:
+                destination = os.path.join(self.name_normalizer_output_directory, os.path.basename(target))
+            else:
+                destination = target
+
+            if not is_free(destination):
+                self.log_and_show(f"Conflict detected on: '{os.path.basename(destination)}'")
+
+                # Number the name like get_non_conflicting_filename
+                base, ext = os.path.splitext(os.path.basename(destination))
+                counter = 1
+                match = re.match(r'(.+) \((\d+)\)', base)
+                if match:
+                    base, counter = match.group(1), int(match.group(2))
+                while not is_free(os.path.join(os.path.dirname(destination), f"{base} ({counter}){ext}")):
+                    counter += 1
+                destination = os.path.join(os.path.dirname(destination), f"{base} ({counter}){ext}")
+                self.log_and_show(f"Using non-conflicting file name: {base} ({counter}){ext}")
+
+                # The counter makes the name longer, so check it against the target filesystem again
+                problem = self.path_validator.check(destination)
+                if problem:
+                    self.log_and_show(f"Skipped {os.path.basename(file_path)}: the new name cannot be used: "
+                                      f"{problem}", error=True)
+                    plans.append(None)
+                    continue
+
+            # Wait for the rename freeing the name, if any, otherwise order by the name itself
+            destination_key = os.path.normcase(destination)
+            key = freed.pop(destination_key, destination_key)
+            claimed.add(destination_key)
+            freed[os.path.normcase(file_path)] = key
+            plans.append((destination, key))
+        return plans
+
+    def get_filesystem_type(self, path: str) -> Union[str, None]:
+        """
+        Get the type of the filesystem holding a path (e.g. 'ext4', 'nfs4', 'cifs') from the mount table.
+
+        Parameters:
+            path (str): The path.
+
+        Returns:
+            Union[str, None]: The filesystem type, or None if the mount table is not available (non-Linux systems).
+        """
+        try:
+            with open("/proc/self/mounts", "r") as mounts_file:
+                mounts = [line.split()[1:3] for line in mounts_file if len(line.split()) >= 3]
+        except OSError:
+            return None
+
+        # The mount point is the longest one containing the path (spaces are escaped as \040)
+        real_path = os.path.realpath(path)
+        best_match, filesystem_type = "", None
+        for mount_point, mount_type in mounts:
+            mount_point = mount_point.replace("\\040", " ")
+            if ((real_path == mount_point or real_path.startswith(mount_point.rstrip("/") + "/"))
+                    and len(mount_point) > len(best_match)):
+                best_match, filesystem_type = mount_point, mount_type
+        return filesystem_type
+
+    def get_io_limit(self, path: str) -> int:
+        """
+        Get the number of renames to keep in flight for a target, tuned per filesystem type.
+
+        Parameters:
+            path (str): The target directory.
+
+        Returns:
+            int: The io_filesystem_limits entry of the target's filesystem, or io_max_in_flight.
+        """
+        filesystem_type = self.get_filesystem_type(path)
+        return max(1, self.io_filesystem_limits.get(filesystem_type, self.io_max_in_flight))
+
+    def compute_nn_names(self, file_paths: list, snapshot: "NameNormalizerSnapshot") -> list:
+        """
+        Compute the Name Normalizer targets of the files, in a process pool across CPU cores for large batches.
+
+        Parameters:
+            file_paths (list): The paths of the files, in walk order.
+            snapshot (NameNormalizerSnapshot): The settings to compute the names with.
+
+        Returns:
+            list: The proposed path of each file (conflicts unresolved), or None if ignored or unchanged. Shorter than
+            file_paths if the user interrupted the computation.
+        """
+        workers = self.nn_worker_processes or os.cpu_count() or 1
+
+        if self.stage_profiler.enabled:
+            # Time the stages on this thread (timed wrappers cannot be sent to worker processes)
+            self.stage_profiler.instrument(snapshot, self.profiled_methods)
+            try:
+                return snapshot.normalize_paths(file_paths)
+            finally:
+                # Release the snapshot so runs do not accumulate in the profiler
+                self.stage_profiler.uninstrument(snapshot)
+
+        # Small batches are faster on this thread than with the process start-up cost
+        if workers < 2 or len(file_paths) < self.nn_parallel_threshold:
+            return snapshot.normalize_paths(file_paths)
+
+        # Split the files into a few chunks per worker
+        chunk_size = max(1, -(-len(file_paths) // (workers * 4)))
+        chunks = [file_paths[index:index + chunk_size] for index in range(0, len(file_paths), chunk_size)]
+        self.log_and_show(f"Computing {len(file_paths)} name(s) on {workers} processes in {len(chunks)} chunk(s)")
+
+        # Report the name computation on the progress bar
+        tracker = ProgressTracker(len(file_paths), item_name="names")
+        targets = []
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(snapshot.normalize_paths, chunk) for chunk in chunks]
+            for future, chunk in zip(futures, chunks):
+                # Stop waiting for the remaining chunks if processing is interrupted
+                if self.interrupt_name_processing_thread_var:
+                    for pending in futures:
+                        pending.cancel()
+                    break
+
+                # Collect the chunks in order
+                targets.extend(future.result())
+                tracker.advance(len(chunk))
+                self.report_progress(self.progressbar, tracker)
+
+        return targets
 
     def check_queue(self):
         """
         Check the queue for results from the Name Normalizer process.
 
         This method is responsible for continuously checking the queue for results from the Name Normalizer process.
-        It retrieves results from the queue and appends them to the `nn_history` list.
+        It retrieves results from the queue and records them in the rename history.
 
         Returns:
             None
@@ -6708,7 +10718,7 @@ class OCDFileRenamer(ctk.CTk, TkinterDnD.DnDWrapper):
         try:
             while True:
                 result = self.queue.get_nowait()
-                self.nn_history.append(result)
+                self.history_store.push("name_normalizer", list(zip(result['original_paths'], result['new_paths'])))
         except queue.Empty:
             pass
 
@@ -6725,11 +10735,18 @@ class OCDFileRenamer(ctk.CTk, TkinterDnD.DnDWrapper):
         """
         if thread_name == "name_processing_thread":
             self.interrupt_name_processing_thread_var = True
+            self.trash_cancel_events["name_normalizer_window"].set()
         elif thread_name == "video_processing_thread":
             self.interrupt_video_processing_thread_var = True
+        elif thread_name == "file_renamer_thread":
+            self.cancel_file_rename()
+            self.trash_cancel_events["file_renamer_window"].set()
         elif thread_name == "all":
             self.interrupt_name_processing_thread_var = True
             self.interrupt_video_processing_thread_var = True
+            self.cancel_file_rename()
+            for cancel_event in self.trash_cancel_events.values():
+                cancel_event.set()
         else:
             self.log_and_show(f"Thread {thread_name} is not running, cannot interrupt.",
                               create_messagebox=True, error=True)
@@ -6738,6 +10755,49 @@ class OCDFileRenamer(ctk.CTk, TkinterDnD.DnDWrapper):
     Video Editor
     """
 
+    def report_video_progress(self, tracker: ProgressTracker, units: float):
+        """
+        Record the progress of the video being written and report it to the progress bar.
+
+        Parameters:
+            tracker (ProgressTracker): The tracker of the current Video Editor run.
+            units (float): The seconds of the current video written so far.
+        """
+        tracker.set_partial(units)
+        self.report_progress(self.progressbar1, tracker)
+
+    def handle_encoder_message(self, message: str):
+        """
+        Handle a message logged by MoviePy while writing a video.
+
+        Messages go to the log file when logging is active, are discarded when standard output is suppressed and
+        are printed to the console otherwise.
+
+        Parameters:
+            message (str): The message logged by MoviePy.
+        """
+        if self.activate_logging_var.get():
+            logging.info(message)
+        elif not self.suppress_var.get():
+            print(message)
+
+    def get_video_duration(self, input_path: str) -> Union[float, None]:
+        """
+        Get the duration of a video from its header without decoding it.
+
+        Parameters:
+            input_path (str): The path of the video file.
+
+        Returns:
+            float or None: The duration in seconds, or None if it cannot be read.
+        """
+        try:
+            return float(ffmpeg_parse_infos(input_path).get("duration") or 0) or None
+        except Exception as e:
+            # Progress falls back to the average duration for this video
+            self.log_and_show(f"Reading the duration of {os.path.basename(input_path)} failed: {str(e)}")
+            return None
+
     def rotate_video(self, clip, rotation_angle):
         """
         Rotate or mirror a video clip.
@@ -6954,10 +11014,16 @@ class OCDFileRenamer(ctk.CTk, TkinterDnD.DnDWrapper):
                               create_messagebox=True, error=True)
             return
 
-        # Define which input paths based on user input (Video file, .txt file, or directory)
+        # Define which input paths based on user input (Video file, .txt file, directory or several dropped paths)
         try:
+            # Several dropped paths
+            if self.video_editor_batch_active():
+                input_paths = self.collect_video_batch_paths(self.video_editor_batch_paths)
+                if input_paths is None:
+                    # If the user does not confirm the directories, return
+                    return
             # Video file
-            if os.path.isfile(self.video_editor_selected_file) and self.video_editor_selected_file.lower().endswith(
+            elif os.path.isfile(self.video_editor_selected_file) and self.video_editor_selected_file.lower().endswith(
                     tuple(self.valid_extensions)):
                 input_paths = [self.video_editor_selected_file]
             # .txt file
@@ -6991,10 +11057,54 @@ class OCDFileRenamer(ctk.CTk, TkinterDnD.DnDWrapper):
             self.log_and_show(f"Processing input failed: {str(e)}", create_messagebox=True, error=True)
             return
 
+        # Start the run with fresh stage timings
+        self.stage_profiler.reset()
+
         # Process the input(s)
         self.video_processing_thread = threading.Thread(target=self.process_video_paths,
                                                         args=(audio_normalization, decibel, input_paths, rotation_angle,
-                                                              total_start_time, total_end_time, trim,)).start()
+                                                              total_start_time, total_end_time, trim,),
+                                                        name="video_editor_window").start()
+
+    def collect_video_batch_paths(self, batch_paths: list) -> Union[list, None]:
+        """
+        Collect the videos of several dropped paths: video files, the videos listed in line separated txt files and the
+        videos of directories.
+
+        Args:
+        - batch_paths (list): The dropped paths.
+
+        Returns:
+        - Union[list, None]: The video paths, or None if the user does not confirm editing the directories.
+        """
+        # Ask for confirmation once if any directory was dropped
+        directories = [path for path in batch_paths if os.path.isdir(path)]
+        if directories:
+            confirmation = self.ask_confirmation("Confirm Action",
+                                                 f"Are you sure you want edit ALL video files in the "
+                                                 f"{len(directories)} provided directories?"
+                                                 "\nThis option may be computer intensive.")
+            if not confirmation:
+                return None
+            self.log_and_show(f"User confirmed the directories for {len(directories)} dropped items.")
+
+        input_paths = []
+        for path in batch_paths:
+            if os.path.isdir(path):
+                # Get the absolute file paths of all files within the directory with valid extensions
+                input_paths.extend(os.path.join(root, file) for root, _, files in os.walk(path)
+                                   for file in files if os.path.splitext(file)[1].lower() in self.valid_extensions)
+            elif os.path.isfile(path) and path.lower().endswith('.txt'):
+                # Read the line separated video paths
+                with open(path, 'r') as file:
+                    input_paths.extend(line.strip() for line in file if
+                                       os.path.splitext(line.strip())[1].lower() in self.valid_extensions)
+            elif os.path.isfile(path) and path.lower().endswith(tuple(self.valid_extensions)):
+                input_paths.append(path)
+            else:
+                self.log_and_show(f"Skipping unsupported input: {os.path.basename(path)}")
+
+        return input_paths
 
     def process_video_paths(self, audio_normalization: float, decibel: float, input_paths: list,
                             rotation_angle, total_start_time: int, total_end_time: int, trim: bool):
@@ -7011,21 +11121,43 @@ class OCDFileRenamer(ctk.CTk, TkinterDnD.DnDWrapper):
         - trim (bool): Flag indicating whether to trim the video.
 
         Notes:
-        - Redirects MoviePy output for video edits.
+        - Captures MoviePy output per video with a VideoProgressLogger (global streams are left untouched).
         - Applies specified video editing operations to each input video.
         - Logs the outcome of each operation.
-        - Resets redirect MoviePy output for video edits after processing.
-        - If a temporary copy is created due to filename length constraints, it is deleted after 
-        processing.
-        """
-        # Redirect MoviePy output for video edits
-        self.redirect_output()
-
-        # Start the progress bar for the Name Normalizer function
-        self.start_progress(self.progressbar1, self.slider_progressbar_frame1)
+        - Output names too long for the target filesystem are shortened; outputs that still cannot be saved are
+        reported and skipped before any video is processed.
+        """
+        # Start the determinate progress bar for the Video Editor function
+        self.run_on_main(self.start_progress, self.progressbar1, self.slider_progressbar_frame1, determinate=True)
+
+        # Plan the work up front from the sum of the clip durations (unknown durations count as the average)
+        durations = [self.get_video_duration(input_path) for input_path in input_paths]
+        known_durations = [duration for duration in durations if duration]
+        average_duration = sum(known_durations) / len(known_durations) if known_durations else 1.0
+        durations = [duration or average_duration for duration in durations]
+        file_sizes = [os.path.getsize(input_path) if os.path.isfile(input_path) else 0 for input_path in input_paths]
+
+        tracker = ProgressTracker(len(input_paths), total_units=sum(durations), total_bytes=sum(file_sizes),
+                                  item_name="videos")
+        self.report_progress(self.progressbar1, tracker, force=True)
+
+        # Plan the output paths, shortened to fit the target filesystem, and report the unusable ones up front
+        output_paths = [self.plan_video_output_path(input_path) for input_path in input_paths]
+        problems = self.path_validator.check_many(output_paths)
+        rejected = [f"{os.path.basename(input_path)}: {problem}"
+                    for input_path, problem in zip(input_paths, problems) if problem]
+        if rejected:
+            self.log_and_show(f"{len(rejected)} video(s) will be skipped, their output cannot be saved:\n" +
+                              "\n".join(rejected), error=True)
 
         # Process each input path
-        for input_path in input_paths:
+        for input_path, duration, file_size, output_path, problem in zip(input_paths, durations, file_sizes,
+                                                                         output_paths, problems):
+            # Capture this video's encoder output and feed its frame progress to the progress model
+            encoder_logger = VideoProgressLogger(
+                on_progress=lambda fraction, d=duration: self.report_video_progress(tracker, fraction * d),
+                on_message=self.handle_encoder_message, max_lines=self.encoder_log_lines)
+
             # Check if processing should be interrupted
             if self.interrupt_video_processing_thread_var:
                 # Log the action if logging is enabled
@@ -7036,39 +11168,17 @@ class OCDFileRenamer(ctk.CTk, TkinterDnD.DnDWrapper):
                 break  # Break out of the loop
 
             try:
-                # Initialize the temp copy exists variable to False
-                temp_copy_exists = False
-
-                # Check if the file name length exceeds the upper limit of characters
-                if len(os.path.basename(input_path)) > 228:
-                    self.log_and_show(f"Long file name length detected. Video will be saved as 'temp_EDITED'."
-                                      f"\nOriginal File: {input_path}", error=True)
-
-                    # Create a temporary copy of the file
-                    temp_dir = os.path.dirname(input_path)
-                    temp_copy_path = os.path.join(temp_dir, 'temp.mp4')
-                    shutil.copyfile(input_path, temp_copy_path)
-                    temp_copy_exists = True
-                else:
-                    temp_copy_path = input_path
-
-                # Extract filename, extension, and output directory
-                filename, extension = os.path.splitext(os.path.basename(temp_copy_path))
-                output_dir = os.path.dirname(temp_copy_path)
-
-                # Create the output path with the operation suffix
-                output_path = os.path.join(output_dir, f"{filename}_EDITED{extension}")
-
-                # Adjust output path if a video output directory is specified
-                if self.video_editor_output_directory:
-                    output_path = os.path.join(self.video_editor_output_directory, os.path.basename(output_path))
+                # Skip the videos whose output was rejected up front
+                if problem:
+                    continue
 
                 # Get a non-conflicting name for the output path if it exists
                 if os.path.exists(output_path):
                     output_path = self.get_non_conflicting_filename(output_path)
 
                 # Load the original video clip
-                original_clip = VideoFileClip(temp_copy_path)
+                with self.stage_profiler.stage("video_load"):
+                    original_clip = VideoFileClip(input_path)
                 successful_operations = True
 
                 # Apply operations in sequence, checking for success
@@ -7103,14 +11213,16 @@ class OCDFileRenamer(ctk.CTk, TkinterDnD.DnDWrapper):
 
                 # Write the final modified clip to the output path if all operations were successful
                 if successful_operations:
-                    original_clip.write_videofile(output_path, codec="libx264", audio_codec="aac")
+                    with self.stage_profiler.stage("video_write"):
+                        original_clip.write_videofile(output_path, codec="libx264", audio_codec="aac",
+                                                      logger=encoder_logger)
 
                     # Set the video editor last used file upon success
                     self.video_editor_last_used_file = output_path
 
                     if self.reset_video_entries_var.get():
                         # Clear selection for the video_editor_window
-                        self.clear_selection(frame_name="video_editor_window")
+                        self.run_on_main(self.clear_selection, frame_name="video_editor_window")
 
                     # Check if remove successful lines is true and the input is a txt file
                     if (self.remove_successful_lines_var.get() and
@@ -7128,21 +11240,47 @@ class OCDFileRenamer(ctk.CTk, TkinterDnD.DnDWrapper):
                 # Close the original clip to free resources
                 original_clip.close()
 
-                # Delete the temporary copy if it was created
-                if temp_copy_exists:
-                    os.remove(temp_copy_path)
-
             except OSError as e:
                 # Log error and skip to the next file in case of OSError
                 self.log_and_show(f"OSError: {str(e)} Skipping this file and moving to the next one.",
                                   create_messagebox=True, error=True)
+
+                # Add the captured encoder output to the log for troubleshooting
+                if encoder_logger.lines:
+                    self.log_and_show("Encoder output:\n" + "\n".join(encoder_logger.lines), error=True)
                 continue
 
-        # Reset redirect MoviePy output for video edits
-        self.redirect_output()
+            finally:
+                # Report the finished (or skipped) video
+                tracker.advance(units=duration, nbytes=file_size)
+                self.report_progress(self.progressbar1, tracker)
+
+        # Save the stage timings of the run
+        self.dump_profile_report("video_editor")
 
         # Stop the progress bar for the Name Normalizer function
-        self.stop_progress(self.progressbar1)
+        self.run_on_main(self.stop_progress, self.progressbar1)
+
+    def plan_video_output_path(self, input_path: str) -> str:
+        """
+        Plan the output path of a video: the input name with the '_EDITED' suffix, in the video output directory if
+        one is set. The name is shortened to fit the target filesystem, leaving room for a conflict counter.
+
+        Args:
+        - input_path (str): The path of the input video.
+
+        Returns:
+        - str: The planned output path (conflicts unresolved).
+        """
+        # Extract filename, extension, and output directory
+        filename, extension = os.path.splitext(os.path.basename(input_path))
+        output_dir = self.video_editor_output_directory or os.path.dirname(input_path)
+
+        # Create the output name with the operation suffix (" (99)" is left free for get_non_conflicting_filename)
+        output_name = self.path_validator.fit_name(output_dir, filename, f"_EDITED{extension}", reserve=5)
+        if output_name != f"{filename}_EDITED{extension}":
+            self.log_and_show(f"Long file name shortened for the output: {output_name}")
+        return os.path.join(output_dir, output_name)
 
     """
     add_remove_window
@@ -8391,7 +12529,7 @@ class OCDFileRenamer(ctk.CTk, TkinterDnD.DnDWrapper):
             # Update the last_cache_update timestamp to the current time
             self.last_cache_update = current_time
 
-    def artist_search(self):
+    def artist_search(self, file_path: str = None, ignore_known_artists: bool = None):
         """
         Perform an artist search based on the selected input and artist directory.
 
@@ -8399,11 +12537,21 @@ class OCDFileRenamer(ctk.CTk, TkinterDnD.DnDWrapper):
         - Requires file name with a dash (-) in it to help reduce false positives with common words. Place the
         artist on the left hand side of the dash to be considered for use with this function.
 
+        Args:
+            file_path (str, optional): The file to search for. Defaults to the selected file.
+            ignore_known_artists (bool, optional): Overrides the "Ignore Known Artists" setting (used by background
+                tasks, which must not read the GUI variables).
+
         Returns:
             tuple or None: If a matching artist is found, returns a tuple (artist, artist_file_path), else returns None.
         """
+        # Default to the selected file and the GUI setting
+        file_path = file_path or self.file_renamer_selected_file
+        if ignore_known_artists is None:
+            ignore_known_artists = self.ignore_known_artists_var.get()
+
         # Check if an input is selected
-        if not self.file_renamer_selected_file:
+        if not file_path:
             # If no input is selected, return none
             self.log_and_show("No input selected.")
             return None
@@ -8419,7 +12567,7 @@ class OCDFileRenamer(ctk.CTk, TkinterDnD.DnDWrapper):
 
         try:
             # Extract the base name from the selected file
-            base_name = os.path.basename(self.file_renamer_selected_file)
+            base_name = os.path.basename(file_path)
 
             # Check if there is a '-' in the name
             if '-' not in base_name:
@@ -8431,7 +12579,7 @@ class OCDFileRenamer(ctk.CTk, TkinterDnD.DnDWrapper):
             # Extract the artist from the text before '-'
             artist = base_name.split('-')[0].strip()
 
-            if self.ignore_known_artists_var.get():
+            if ignore_known_artists:
                 # Perform case-insensitive matching for known artists in the artist_directory
                 matching_artists = [directory for directory in os.listdir(self.artist_directory) if
                                     re.match(artist, directory, re.IGNORECASE)]
@@ -8454,7 +12602,7 @@ class OCDFileRenamer(ctk.CTk, TkinterDnD.DnDWrapper):
                 # Check if the artist is present in the file name
                 if artist.lower() in os.path.basename(artist_file_path).lower():
                     # Skip the current file being compared
-                    if artist_file_path == self.file_renamer_selected_file:
+                    if artist_file_path == file_path:
                         continue
 
                     # Verify the file exists and artist's name is not part of the directory path
@@ -8474,6 +12622,175 @@ class OCDFileRenamer(ctk.CTk, TkinterDnD.DnDWrapper):
             return None
 
 
+# Create a read-only stand-in for a Tk variable or entry
+class SnapshotValue:
+    """A fixed value exposing get(), standing in for a Tk variable or entry in a NameNormalizerSnapshot.
+
+    Args:
+        value: The value returned by get().
+    """
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        """Return the stored value."""
+        return self.value
+
+
+# Create a Tk-free copy of the Name Normalizer settings that runs the same pipeline as the GUI
+class NameNormalizerSnapshot:
+    """A picklable snapshot of the Name Normalizer settings that runs the GUI's naming pipeline without a Tk root.
+
+    The pipeline methods are shared with OCDFileRenamer, so a snapshot produces exactly the names the GUI would. Used
+    by the Name Normalizer's worker processes and the benchmark suite (benchmark.py).
+
+    Args:
+        flags (dict, optional): The checkbox states by variable name (see FLAG_NAMES). Missing flags are False.
+        entries (dict, optional): The entry texts by entry name (see ENTRY_NAMES). Missing entries are empty.
+        file_extensions (list, optional): The file extensions the Name Normalizer processes.
+        custom_text_to_replace (dict, optional): The custom text replacements from the dictionary file.
+        artist_file (str, optional): The path of the list of artists.
+        title_exceptions (list, optional): The small words kept lowercase by the title case.
+    """
+
+    # Checkbox/switch variables read by construct_nn_name
+    FLAG_NAMES = (
+        "remove_non_ascii_symbols_var", "remove_all_symbols_var", "remove_most_symbols_var", "remove_number_var",
+        "remove_hashtag_trail_var", "remove_parenthesis_trail_var", "remove_dash_var", "remove_endash_var",
+        "remove_emdash_var", "remove_ampersand_var", "remove_at_var", "remove_underscore_var", "remove_comma_var",
+        "remove_single_quote_var", "remove_double_quote_var", "remove_colon_var", "remove_semicolon_var",
+        "remove_percent_var", "remove_caret_var", "remove_parenthesis_var", "remove_hashtag_var", "remove_dollar_var",
+        "remove_asterisk_var", "remove_plus_var", "remove_equal_var", "remove_curly_brace_var",
+        "remove_square_bracket_var", "remove_pipe_var", "remove_backslash_var", "remove_angle_bracket_var",
+        "remove_question_mark_var", "title_var", "replace_custom_text_var", "replace_mode_var",
+        "artist_identifier_var", "remove_artist_duplicates_var", "remove_word_duplicates_var",
+        "remove_extra_whitespace_var")
+
+    # Entries read by construct_nn_name
+    ENTRY_NAMES = ("custom_text_removal_entry", "original_entry", "replace_entry", "prefix_entry", "suffix_entry")
+
+    # Pipeline methods shared with the GUI
+    construct_nn_name = OCDFileRenamer.construct_nn_name
+    get_non_conflicting_filename = OCDFileRenamer.get_non_conflicting_filename
+    remove_custom_user_text = OCDFileRenamer.remove_custom_user_text
+    replace_user_text = OCDFileRenamer.replace_user_text
+    replace_custom_text = OCDFileRenamer.replace_custom_text
+    get_custom_text_replacer = OCDFileRenamer.get_custom_text_replacer
+    remove_non_ascii_symbols = OCDFileRenamer.remove_non_ascii_symbols
+    remove_symbols = OCDFileRenamer.remove_symbols
+    remove_numbers = OCDFileRenamer.remove_numbers
+    remove_text_trailing = OCDFileRenamer.remove_text_trailing
+    remove_dashes = OCDFileRenamer.remove_dashes
+    remove_endashes = OCDFileRenamer.remove_endashes
+    remove_emdashes = OCDFileRenamer.remove_emdashes
+    remove_ampersands = OCDFileRenamer.remove_ampersands
+    remove_at_symbols = OCDFileRenamer.remove_at_symbols
+    remove_underscores = OCDFileRenamer.remove_underscores
+    remove_commas = OCDFileRenamer.remove_commas
+    remove_single_quotes = OCDFileRenamer.remove_single_quotes
+    remove_double_quotes = OCDFileRenamer.remove_double_quotes
+    remove_colons = OCDFileRenamer.remove_colons
+    remove_semicolons = OCDFileRenamer.remove_semicolons
+    remove_percents = OCDFileRenamer.remove_percents
+    remove_carets = OCDFileRenamer.remove_carets
+    remove_parenthesis = OCDFileRenamer.remove_parenthesis
+    remove_hashtags = OCDFileRenamer.remove_hashtags
+    remove_dollar_signs = OCDFileRenamer.remove_dollar_signs
+    remove_asterisks = OCDFileRenamer.remove_asterisks
+    remove_plus_signs = OCDFileRenamer.remove_plus_signs
+    remove_equal_signs = OCDFileRenamer.remove_equal_signs
+    remove_curly_braces = OCDFileRenamer.remove_curly_braces
+    remove_square_brackets = OCDFileRenamer.remove_square_brackets
+    remove_pipes = OCDFileRenamer.remove_pipes
+    remove_backslashes = OCDFileRenamer.remove_backslashes
+    remove_angle_brackets = OCDFileRenamer.remove_angle_brackets
+    remove_question_marks = OCDFileRenamer.remove_question_marks
+    title_the_name = OCDFileRenamer.title_the_name
+    remove_extra_whitespace = OCDFileRenamer.remove_extra_whitespace
+    get_artist_file_signature = OCDFileRenamer.get_artist_file_signature
+    load_artist_list = OCDFileRenamer.load_artist_list
+    artist_identifier = OCDFileRenamer.artist_identifier
+    add_prefix = OCDFileRenamer.add_prefix
+    add_suffix = OCDFileRenamer.add_suffix
+    remove_word_duplicates_from_filename = OCDFileRenamer.remove_word_duplicates_from_filename
+    remove_artist_duplicates_from_filename = OCDFileRenamer.remove_artist_duplicates_from_filename
+
+    def __init__(self, flags: dict = None, entries: dict = None, file_extensions: list = None,
+                 custom_text_to_replace: dict = None, artist_file: str = "list_of_artists.txt",
+                 title_exceptions: list = None):
+        flags = flags or {}
+        entries = entries or {}
+
+        # Freeze the checkbox states and entry texts
+        for flag_name in self.FLAG_NAMES:
+            setattr(self, flag_name, SnapshotValue(bool(flags.get(flag_name, False))))
+        for entry_name in self.ENTRY_NAMES:
+            setattr(self, entry_name, SnapshotValue(entries.get(entry_name, "")))
+
+        # Dictionaries and files
+        self.file_extensions = list(file_extensions or [])
+        self.custom_text_to_replace = dict(custom_text_to_replace or {})
+        self.artist_file = artist_file
+        self.title_exceptions = list(title_exceptions or [])
+        self.title_caser = TitleCaser(self.title_exceptions)
+
+        # Compiled custom_text_to_replace rules (the snapshot's dictionaries never change)
+        self.dictionary_version = 0
+        self.custom_text_replacer = None
+        self.custom_text_replacer_key = None
+
+        # Artist list cache used by load_artist_list
+        self.artist_file_signature = None
+        self.cached_artist_list = []
+        self.cached_artist_patterns = []
+
+    @classmethod
+    def from_app(cls, app):
+        """Take a snapshot of the current Name Normalizer settings of the application.
+
+        Args:
+            app (OCDFileRenamer): The running application. Must be called from the main thread.
+
+        Returns:
+            NameNormalizerSnapshot: The snapshot.
+        """
+        return cls(flags={flag_name: getattr(app, flag_name).get() for flag_name in cls.FLAG_NAMES},
+                   entries={entry_name: getattr(app, entry_name).get() for entry_name in cls.ENTRY_NAMES},
+                   file_extensions=app.file_extensions, custom_text_to_replace=app.custom_text_to_replace,
+                   artist_file=app.artist_file, title_exceptions=app.title_exceptions)
+
+    def normalize_paths(self, file_paths: list) -> list:
+        """Compute the Name Normalizer targets of a chunk of files, without touching the disk for conflicts.
+
+        Picklable as a bound method, so chunks can be computed in worker processes.
+
+        Args:
+            file_paths (list): The paths of the files.
+
+        Returns:
+            list: The proposed path of each file, or None if the file is ignored or needs no changes.
+        """
+        return [self.construct_nn_name(file_path, quiet=True, resolve_conflicts=False) for file_path in file_paths]
+
+    @staticmethod
+    def log_and_show(message, create_messagebox=False, error=False, not_logging=False):
+        """Log a message from the pipeline. There is no GUI to show it in, so create_messagebox is ignored.
+
+        Args:
+            message (str): The message to log.
+            create_messagebox (bool): Ignored.
+            error (bool): Log the message as an error. Default is False.
+            not_logging (bool): Skip logging the message. Default is False.
+        """
+        if not not_logging:
+            if error:
+                logging.error(message)
+            else:
+                logging.info(message)
+
+
 if __name__ == "__main__":
     # Create an instance of the OCDFileRenamer application and start the main loop
     app = OCDFileRenamer()